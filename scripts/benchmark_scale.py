@@ -0,0 +1,672 @@
+#!/usr/bin/env python3
+"""Benchmark worker selection, status, gc, and reconcile on synthetic stores.
+
+The benchmark runs fully offline. Beads commands are served by the in-memory
+backend from ``atelier.testing.beads``, git talks to a local bare ``origin``
+repository, and a fake ``gh`` reports that no pull requests exist. Every
+operation reports wall-clock timings plus the number of external commands it
+issued, grouped by program, so regressions in either show up before a project
+grows to thousands of changesets.
+
+Command counts are deterministic for a given profile. Use ``--baseline`` to
+fail when any operation issues more commands than a previously saved
+``--json`` report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from atelier import config, messages, prs
+from atelier import exec as exec_util
+from atelier.commands.gc import gc as gc_command
+from atelier.commands.status import status as status_command
+from atelier.lib.beads import (
+    BeadsCommandRequest,
+    BeadsCommandResult,
+    BeadsTransport,
+    SubprocessBeadsTransport,
+)
+from atelier.testing.beads import (
+    DEFAULT_PRIME_OUTPUT,
+    CommandEnvelope,
+    InMemoryBeadsBackend,
+    IssueFixtureBuilder,
+    normalize_invocation,
+    patch_in_memory_beads,
+)
+from atelier.worker import review as worker_review
+from atelier.worker import store_adapter as worker_store
+from atelier.worker import work_finalization_reconcile, work_startup_runtime
+
+_REPO_SLUG = "bench/atelier"
+_ORIGIN = f"https://github.com/{_REPO_SLUG}"
+_GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Atelier Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.invalid",
+    "GIT_COMMITTER_NAME": "Atelier Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.invalid",
+}
+_FAKE_GH = '''#!{python}
+"""Offline gh stand-in: no pull requests exist for any branch."""
+import json
+import sys
+
+args = sys.argv[1:]
+if args[:2] == ["pr", "view"]:
+    sys.stderr.write("no pull requests found\\n")
+    raise SystemExit(1)
+if args[:1] == ["api"] and "--include" in args:
+    sys.stdout.write('HTTP/2.0 200 OK\\r\\netag: "bench"\\r\\n\\r\\n[]')
+    raise SystemExit(0)
+if args[:2] == ["api", "graphql"]:
+    heads = [value.split("=", 1)[0] for flag, value in zip(args, args[1:]) if flag == "-f"]
+    empty = {{"nodes": [], "pageInfo": {{"hasNextPage": False}}}}
+    repository = {{alias: empty for alias in heads if alias[:1] == "h" and alias[1:].isdigit()}}
+    json.dump({{"data": {{"repository": repository}}}}, sys.stdout)
+    raise SystemExit(0)
+sys.stdout.write("[]")
+'''
+
+
+@dataclass(frozen=True)
+class ScaleProfile:
+    """Shape of one synthetic project.
+
+    Args:
+        epics: Number of epics.
+        changesets_per_epic: Changesets created under each epic.
+        messages: Message beads spread across the agents' inboxes.
+        agents: Worker agent beads, each hooked to one epic.
+    """
+
+    epics: int = 20
+    changesets_per_epic: int = 10
+    messages: int = 50
+    agents: int = 4
+
+
+@dataclass
+class OperationResult:
+    """Timings and command counts observed for one benchmarked operation.
+
+    Args:
+        name: Operation name.
+        seconds: Wall-clock duration of every repetition.
+        commands: External commands issued per repetition, keyed by program.
+    """
+
+    name: str
+    seconds: list[float] = field(default_factory=list)
+    commands: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def best_seconds(self) -> float:
+        """Return the fastest repetition."""
+
+        return min(self.seconds) if self.seconds else 0.0
+
+    def to_payload(self) -> dict[str, object]:
+        """Return a JSON-serializable report row."""
+
+        return {
+            "name": self.name,
+            "best_seconds": round(self.best_seconds, 6),
+            "seconds": [round(value, 6) for value in self.seconds],
+            "commands": dict(sorted(self.commands.items())),
+        }
+
+
+class CountingCommandRunner:
+    """Command runner that counts requests by program before delegating.
+
+    ``bd`` requests are answered by the in-memory runner; everything else is
+    executed for real with :class:`atelier.exec.SubprocessCommandRunner`.
+
+    Args:
+        beads_runner: Runner that serves ``bd`` requests in memory.
+    """
+
+    def __init__(self, beads_runner: exec_util.CommandRunner) -> None:
+        self.counts: Counter[str] = Counter()
+        self._beads_runner = beads_runner
+        self._subprocess_runner = exec_util.SubprocessCommandRunner()
+
+    def record(self, argv: Sequence[str]) -> None:
+        """Count one command invocation.
+
+        Args:
+            argv: Command argv whose program name is counted.
+        """
+
+        self.counts[Path(argv[0]).name if argv else "<empty>"] += 1
+
+    def run(self, request: exec_util.CommandRequest) -> exec_util.CommandResult | None:
+        self.record(request.argv)
+        result = self._beads_runner.run(request)
+        if result is not None:
+            return result
+        return self._subprocess_runner.run(request)
+
+
+class _BenchmarkBeadsBackend(InMemoryBeadsBackend):
+    """In-memory backend that also answers ``bd prime`` like a primed store."""
+
+    def run(
+        self,
+        argv: Sequence[str],
+        *,
+        cwd: Path | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        invocation = normalize_invocation(argv, cwd=cwd, env=env)
+        if invocation.command_tokens[:1] == ("prime",):
+            return CommandEnvelope(stdout=DEFAULT_PRIME_OUTPUT).bind(invocation.argv)
+        return super().run(argv, cwd=cwd, env=env)
+
+
+class _InMemoryBeadsTransport(BeadsTransport):
+    """Typed-client transport that replays ``bd`` argv against the backend."""
+
+    def __init__(self, backend: InMemoryBeadsBackend, runner: CountingCommandRunner) -> None:
+        self._backend = backend
+        self._runner = runner
+
+    async def execute(self, request: BeadsCommandRequest) -> BeadsCommandResult:
+        self._runner.record(request.argv)
+        completed = self._backend.run(request.argv, cwd=request.cwd, env=request.env)
+        return BeadsCommandResult(
+            argv=request.argv,
+            returncode=completed.returncode,
+            stdout=completed.stdout if isinstance(completed.stdout, str) else "",
+            stderr=completed.stderr if isinstance(completed.stderr, str) else "",
+        )
+
+
+@dataclass(frozen=True)
+class BenchmarkEnvironment:
+    """Paths and state shared by the benchmarked operations.
+
+    Args:
+        project_root: Synthetic project data directory.
+        repo_root: Clone of the local bare ``origin`` repository.
+        beads_root: Beads directory resolved for the project.
+        project_config: Project configuration pointing at the fake GitHub repo.
+        backend: Seeded in-memory Beads backend.
+        runner: Command runner that counts every external command.
+    """
+
+    project_root: Path
+    repo_root: Path
+    beads_root: Path
+    project_config: config.ProjectConfig
+    backend: InMemoryBeadsBackend
+    runner: CountingCommandRunner
+
+
+def _epic_id(epic: int) -> str:
+    return f"at-{epic}"
+
+
+def _root_branch(epic: int) -> str:
+    return f"bench/epic-{epic}"
+
+
+def _changeset_dependencies(index: int) -> tuple[int, ...]:
+    """Return earlier changesets that ``index`` depends on within its epic.
+
+    Most changesets extend the previous one, every fourth starts a new chain,
+    and later changesets also join back onto an earlier node, which yields a
+    DAG with both chains and fan-in.
+    """
+
+    dependencies: set[int] = set()
+    if index % 4 != 1:
+        dependencies.add(index - 1)
+    if index >= 4:
+        dependencies.add(index // 2)
+    return tuple(sorted(dependency for dependency in dependencies if dependency >= 1))
+
+
+def _changeset_state(index: int, total: int) -> tuple[str, str | None]:
+    """Return the status and PR state for changeset ``index`` of ``total``."""
+
+    if index <= total // 3:
+        return "closed", "merged"
+    if index <= total // 2:
+        return "in_progress", "draft-pr"
+    return "open", None
+
+
+def build_synthetic_issues(
+    profile: ScaleProfile,
+) -> tuple[list[dict[str, object]], dict[str, dict[str, str]]]:
+    """Build deterministic issue payloads and hook slots for one profile.
+
+    Args:
+        profile: Synthetic project shape.
+
+    Returns:
+        Tuple of ``(issues, slots)`` ready to seed an in-memory backend.
+    """
+
+    builder = IssueFixtureBuilder()
+    issues: list[dict[str, object]] = []
+    slots: dict[str, dict[str, str]] = {}
+    for epic in range(1, profile.epics + 1):
+        epic_id = _epic_id(epic)
+        issues.append(
+            builder.issue(
+                epic_id,
+                title=f"Epic {epic}",
+                issue_type="epic",
+                status="in_progress" if epic <= profile.agents else "open",
+                labels=("at:epic",),
+                description=f"workspace.root_branch: {_root_branch(epic)}\n",
+            )
+        )
+        total = profile.changesets_per_epic
+        for index in range(1, total + 1):
+            changeset_id = f"{epic_id}.{index}"
+            status, pr_state = _changeset_state(index, total)
+            description = (
+                f"changeset.root_branch: {_root_branch(epic)}\n"
+                "changeset.parent_branch: main\n"
+                f"changeset.work_branch: {_root_branch(epic)}-{changeset_id}\n"
+            )
+            if pr_state is not None:
+                description += f"pr_state: {pr_state}\n"
+            issues.append(
+                builder.issue(
+                    changeset_id,
+                    title=f"Changeset {changeset_id}",
+                    status=status,
+                    parent=epic_id,
+                    dependencies=tuple(
+                        f"{epic_id}.{dependency}" for dependency in _changeset_dependencies(index)
+                    ),
+                    description=description,
+                )
+            )
+    agent_ids: list[str] = []
+    for agent in range(1, profile.agents + 1):
+        agent_id = f"atelier/worker/codex/p{agent}"
+        agent_bead_id = f"at-agent-{agent}"
+        agent_ids.append(agent_id)
+        issues.append(
+            builder.issue(
+                agent_bead_id,
+                title=agent_id,
+                issue_type="agent",
+                labels=("at:agent",),
+                description=f"agent_id: {agent_id}\nrole_type: worker\n",
+            )
+        )
+        if agent <= profile.epics:
+            slots[agent_bead_id] = {"hook": _epic_id(agent)}
+    for message in range(1, profile.messages + 1):
+        assignee = agent_ids[message % len(agent_ids)] if agent_ids else None
+        metadata = messages.normalize_message_metadata(
+            {"from": "atelier/planner/codex/p1", "thread": _epic_id(1 + message % profile.epics)},
+            assignee=assignee,
+        )
+        issues.append(
+            builder.issue(
+                f"at-msg-{message}",
+                title=f"Message {message}",
+                issue_type="task",
+                labels=("at:message", "at:unread"),
+                assignee=assignee,
+                description=messages.render_message(metadata, f"Synthetic message {message}."),
+            )
+        )
+    return issues, slots
+
+
+def _git(*args: str, cwd: Path) -> None:
+    """Run one setup-only git command that is not counted by the benchmark."""
+
+    subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        env={**os.environ, **_GIT_IDENTITY},
+    )
+
+
+def _init_git_repo(workspace: Path, profile: ScaleProfile) -> Path:
+    """Create a bare ``origin`` and a clone with one root branch per epic.
+
+    Args:
+        workspace: Scratch directory for the benchmark.
+        profile: Synthetic project shape.
+
+    Returns:
+        Path to the clone used as the repository root.
+    """
+
+    origin = workspace / "origin.git"
+    repo_root = workspace / "repo"
+    _git("init", "--quiet", "--bare", "--initial-branch=main", str(origin), cwd=workspace)
+    _git("clone", "--quiet", str(origin), str(repo_root), cwd=workspace)
+    (repo_root / "README.md").write_text("Synthetic benchmark repository.\n", encoding="utf-8")
+    _git("add", "README.md", cwd=repo_root)
+    _git("commit", "--quiet", "-m", "Initial commit", cwd=repo_root)
+    _git("branch", "-M", "main", cwd=repo_root)
+    for epic in range(1, profile.epics + 1):
+        _git("branch", _root_branch(epic), cwd=repo_root)
+    _git("push", "--quiet", "origin", "--all", cwd=repo_root)
+    _git("remote", "set-url", "--push", "origin", _ORIGIN, cwd=repo_root)
+    return repo_root
+
+
+def _write_fake_gh(bin_dir: Path) -> None:
+    """Install an offline ``gh`` executable into ``bin_dir``."""
+
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    gh_path = bin_dir / "gh"
+    gh_path.write_text(_FAKE_GH.format(python=sys.executable), encoding="utf-8")
+    gh_path.chmod(0o755)
+
+
+@contextlib.contextmanager
+def benchmark_environment(workspace: Path, profile: ScaleProfile) -> Iterator[BenchmarkEnvironment]:
+    """Seed a synthetic project and route Atelier's commands to it.
+
+    Args:
+        workspace: Scratch directory for git repositories and project data.
+        profile: Synthetic project shape.
+
+    Yields:
+        Environment shared by the benchmarked operations.
+    """
+
+    issues, slots = build_synthetic_issues(profile)
+    repo_root = _init_git_repo(workspace, profile)
+    project_root = workspace / "project"
+    project_root.mkdir()
+    bin_dir = workspace / "bin"
+    _write_fake_gh(bin_dir)
+    project_config = config.ProjectConfig.model_validate(
+        {"project": {"enlistment": str(repo_root), "origin": _ORIGIN}}
+    )
+    beads_root = config.resolve_beads_root(
+        config.resolve_project_data_dir(project_root, project_config), repo_root
+    )
+    backend = _BenchmarkBeadsBackend(seeded_issues=issues, slots=slots)
+    resolved_project = (project_root, project_config, str(repo_root), repo_root)
+    with patch_in_memory_beads(backend) as beads_runner:
+        runner = CountingCommandRunner(beads_runner)
+        transport = _InMemoryBeadsTransport(backend, runner)
+        with (
+            patch.dict(
+                os.environ,
+                {
+                    "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+                    "XDG_DATA_HOME": str(workspace / "data"),
+                    "XDG_CACHE_HOME": str(workspace / "cache"),
+                },
+            ),
+            patch.object(exec_util, "_DEFAULT_COMMAND_RUNNER", runner),
+            patch.object(
+                SubprocessBeadsTransport,
+                "execute",
+                lambda _self, request: transport.execute(request),
+            ),
+            patch(
+                "atelier.commands.status.resolve_current_project_with_repo_root",
+                return_value=resolved_project,
+            ),
+            patch(
+                "atelier.commands.gc.resolve_current_project_with_repo_root",
+                return_value=resolved_project,
+            ),
+        ):
+            prs.use_persistent_cache(None)
+            worker_store.clear_bundle_cache()
+            try:
+                yield BenchmarkEnvironment(
+                    project_root=project_root,
+                    repo_root=repo_root,
+                    beads_root=beads_root,
+                    project_config=project_config,
+                    backend=backend,
+                    runner=runner,
+                )
+            finally:
+                worker_store.clear_bundle_cache()
+                prs.clear_runtime_cache()
+
+
+def _select_global_startup_candidates(env: BenchmarkEnvironment) -> None:
+    worker_review.select_global_startup_candidates(
+        repo_slug=_REPO_SLUG,
+        beads_root=env.beads_root,
+        repo_root=env.repo_root,
+    )
+
+
+def _next_changeset(env: BenchmarkEnvironment) -> None:
+    work_startup_runtime.next_changeset(
+        epic_id=_epic_id(1),
+        beads_root=env.beads_root,
+        repo_root=env.repo_root,
+        repo_slug=_REPO_SLUG,
+    )
+
+
+def _status(env: BenchmarkEnvironment) -> None:
+    status_command(SimpleNamespace(format="json"))
+
+
+def _gc(env: BenchmarkEnvironment) -> None:
+    gc_command(
+        SimpleNamespace(
+            stale_hours=24.0,
+            stale_if_missing_heartbeat=False,
+            dry_run=True,
+            reconcile=False,
+            yes=False,
+        )
+    )
+
+
+def _reconcile(env: BenchmarkEnvironment) -> None:
+    work_finalization_reconcile.reconcile_blocked_merged_changesets(
+        agent_id="atelier/worker/codex/p1",
+        agent_bead_id="at-agent-1",
+        project_config=env.project_config,
+        project_data_dir=env.project_root,
+        beads_root=env.beads_root,
+        repo_root=env.repo_root,
+        dry_run=True,
+    )
+
+
+OPERATIONS: dict[str, Callable[[BenchmarkEnvironment], None]] = {
+    "select_global_startup_candidates": _select_global_startup_candidates,
+    "next_changeset_service": _next_changeset,
+    "status": _status,
+    "gc": _gc,
+    "reconcile_blocked_merged_changesets": _reconcile,
+}
+
+
+def run_benchmarks(
+    profile: ScaleProfile,
+    *,
+    repeat: int = 3,
+    operations: Sequence[str] | None = None,
+) -> list[OperationResult]:
+    """Time each operation against one freshly seeded synthetic project.
+
+    In-process caches are cleared before every repetition so each one pays for
+    the same external commands; counts are taken from the first repetition.
+
+    Args:
+        profile: Synthetic project shape.
+        repeat: Repetitions per operation.
+        operations: Operation names to run, defaulting to all of ``OPERATIONS``.
+
+    Returns:
+        One result per operation, in the order they ran.
+
+    Raises:
+        ValueError: If an unknown operation is requested.
+    """
+
+    selected = list(operations or OPERATIONS)
+    unknown = sorted(set(selected) - set(OPERATIONS))
+    if unknown:
+        raise ValueError(f"Unknown operations: {', '.join(unknown)}")
+    results: list[OperationResult] = []
+    with tempfile.TemporaryDirectory(prefix="atelier-bench-") as tmp:
+        with benchmark_environment(Path(tmp), profile) as env:
+            for name in selected:
+                result = OperationResult(name=name)
+                for attempt in range(max(repeat, 1)):
+                    prs.clear_runtime_cache()
+                    worker_store.clear_bundle_cache()
+                    env.runner.counts.clear()
+                    started = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        OPERATIONS[name](env)
+                    result.seconds.append(time.perf_counter() - started)
+                    if attempt == 0:
+                        result.commands = dict(env.runner.counts)
+                results.append(result)
+    return results
+
+
+def compare_to_baseline(
+    results: Sequence[OperationResult], baseline: dict[str, object]
+) -> list[str]:
+    """Return command-count regressions relative to a saved JSON report.
+
+    Args:
+        results: Freshly measured operation results.
+        baseline: Report previously written with ``--json``.
+
+    Returns:
+        Human-readable regressions. Empty when no operation issues more
+        commands of any program than the baseline did.
+    """
+
+    rows = baseline.get("operations")
+    baseline_commands: dict[str, dict[str, int]] = {}
+    if isinstance(rows, list):
+        for row in rows:
+            if isinstance(row, dict) and isinstance(row.get("commands"), dict):
+                baseline_commands[str(row.get("name"))] = row["commands"]
+    regressions: list[str] = []
+    for result in results:
+        expected = baseline_commands.get(result.name)
+        if expected is None:
+            continue
+        for program, count in sorted(result.commands.items()):
+            allowed = int(expected.get(program, 0))
+            if count > allowed:
+                regressions.append(
+                    f"{result.name}: {program} commands {count} exceed baseline {allowed}"
+                )
+    return regressions
+
+
+def _render_report(profile: ScaleProfile, results: Sequence[OperationResult]) -> str:
+    """Render benchmark results as a text table."""
+
+    lines = [
+        "Scale benchmark: "
+        f"epics={profile.epics} changesets/epic={profile.changesets_per_epic} "
+        f"messages={profile.messages} agents={profile.agents}",
+        "",
+        "Operation".ljust(40) + "Best (s)".rjust(10) + "  Commands",
+        "-" * 80,
+    ]
+    for result in results:
+        commands = ", ".join(
+            f"{program}={count}" for program, count in sorted(result.commands.items())
+        )
+        lines.append(
+            result.name.ljust(40) + f"{result.best_seconds:10.4f}" + f"  {commands or 'none'}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+
+    defaults = ScaleProfile()
+    parser = argparse.ArgumentParser(
+        description="Benchmark Atelier hot paths against synthetic in-memory projects."
+    )
+    parser.add_argument("--epics", type=int, default=defaults.epics)
+    parser.add_argument("--changesets", type=int, default=defaults.changesets_per_epic)
+    parser.add_argument("--messages", type=int, default=defaults.messages)
+    parser.add_argument("--agents", type=int, default=defaults.agents)
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per operation.")
+    parser.add_argument(
+        "--operation",
+        action="append",
+        choices=sorted(OPERATIONS),
+        help="Operation to run; repeat to select several (defaults to all).",
+    )
+    parser.add_argument("--json", action="store_true", help="Print a JSON report.")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="JSON report to compare against; exit non-zero on command-count regressions.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the CLI entrypoint.
+
+    Returns:
+        Process exit code.
+    """
+
+    args = _parse_args(argv)
+    profile = ScaleProfile(
+        epics=args.epics,
+        changesets_per_epic=args.changesets,
+        messages=args.messages,
+        agents=args.agents,
+    )
+    results = run_benchmarks(profile, repeat=args.repeat, operations=args.operation)
+    if args.json:
+        report = {
+            "profile": asdict(profile),
+            "operations": [result.to_payload() for result in results],
+        }
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print(_render_report(profile, results))
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(results, baseline)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Benchmark ``atelier`` CLI startup for hook and metadata invocations.
+
+Agent runtimes run ``atelier hook`` on every session start, pre-compact, and
+stop, so the CLI's import cost is paid on each of those events. This benchmark
+starts fresh interpreters with ``-X importtime`` and reports wall-clock time,
+total import time, and whether any deferred module was imported.
+
+Deferred modules (Beads, the worker package, pydantic models, interactive
+prompts) must only load once a subcommand actually runs. Importing one during
+``--help`` or ``--version`` is always a regression. Import time is also
+checked against ``--budget-ms`` and, with ``--baseline``, against a previously
+saved ``--json`` report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+INVOCATIONS: dict[str, tuple[str, ...]] = {
+    "hook --help": ("hook", "--help"),
+    "--version": ("--version",),
+}
+DEFERRED_MODULES = (
+    "atelier.beads",
+    "atelier.commands",
+    "atelier.config",
+    "atelier.lib.beads",
+    "atelier.models",
+    "atelier.store",
+    "atelier.worker",
+    "pydantic",
+    "questionary",
+)
+_DEFAULT_BUDGET_MS = 250.0
+_BASELINE_TOLERANCE = 0.25
+
+
+@dataclass
+class StartupResult:
+    """Startup cost observed for one CLI invocation.
+
+    Args:
+        name: Invocation name from ``INVOCATIONS``.
+        seconds: Wall-clock duration of every repetition.
+        import_seconds: Total import time of every repetition.
+        deferred_imports: Deferred modules the invocation imported.
+    """
+
+    name: str
+    seconds: list[float] = field(default_factory=list)
+    import_seconds: list[float] = field(default_factory=list)
+    deferred_imports: list[str] = field(default_factory=list)
+
+    @property
+    def best_seconds(self) -> float:
+        """Return the fastest wall-clock repetition."""
+
+        return min(self.seconds) if self.seconds else 0.0
+
+    @property
+    def best_import_seconds(self) -> float:
+        """Return the fastest import-time repetition."""
+
+        return min(self.import_seconds) if self.import_seconds else 0.0
+
+    def to_payload(self) -> dict[str, object]:
+        """Return a JSON-serializable report row."""
+
+        return {
+            "name": self.name,
+            "best_seconds": round(self.best_seconds, 6),
+            "best_import_seconds": round(self.best_import_seconds, 6),
+            "deferred_imports": list(self.deferred_imports),
+        }
+
+
+def parse_importtime(stderr: str) -> tuple[float, tuple[str, ...]]:
+    """Return total import seconds and imported module names.
+
+    Args:
+        stderr: Standard error of a process run with ``-X importtime``.
+
+    Returns:
+        Sum of every module's self time, and module names in import order.
+
+    Example:
+        >>> parse_importtime(
+        ...     "import time: self [us] | cumulative | imported package\\n"
+        ...     "import time:       100 |        100 |   json.decoder\\n"
+        ...     "import time:        50 |        150 | json\\n"
+        ... )
+        (0.00015, ('json.decoder', 'json'))
+    """
+
+    total_us = 0
+    modules: list[str] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        columns = line[len("import time:") :].split("|")
+        if len(columns) != 3 or not columns[0].strip().isdigit():
+            continue
+        total_us += int(columns[0])
+        modules.append(columns[2].strip())
+    return total_us / 1_000_000, tuple(modules)
+
+
+def deferred_imports(modules: Sequence[str]) -> list[str]:
+    """Return deferred modules, or their submodules, found in ``modules``."""
+
+    found = {
+        deferred
+        for module in modules
+        for deferred in DEFERRED_MODULES
+        if module == deferred or module.startswith(f"{deferred}.")
+    }
+    return sorted(found)
+
+
+def measure_startup(
+    *,
+    repeat: int = 5,
+    invocations: Sequence[str] | None = None,
+) -> list[StartupResult]:
+    """Start the CLI in fresh interpreters and record its startup cost.
+
+    Args:
+        repeat: Interpreter starts per invocation.
+        invocations: Invocation names, defaulting to all of ``INVOCATIONS``.
+
+    Returns:
+        One result per invocation, in the order they ran.
+
+    Raises:
+        ValueError: If an unknown invocation is requested.
+        RuntimeError: If the CLI exits non-zero.
+    """
+
+    selected = list(invocations or INVOCATIONS)
+    unknown = sorted(set(selected) - set(INVOCATIONS))
+    if unknown:
+        raise ValueError(f"Unknown invocations: {', '.join(unknown)}")
+    env = dict(os.environ)
+    env.pop("ATELIER_COMMAND_TRACE", None)
+    results: list[StartupResult] = []
+    for name in selected:
+        result = StartupResult(name=name)
+        argv = [sys.executable, "-X", "importtime", "-m", "atelier.cli", *INVOCATIONS[name]]
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            completed = subprocess.run(argv, capture_output=True, text=True, env=env, check=False)
+            result.seconds.append(time.perf_counter() - started)
+            if completed.returncode != 0:
+                detail = completed.stderr.strip().splitlines()[-1:] or ["no output"]
+                raise RuntimeError(f"atelier {name} exited {completed.returncode}: {detail[0]}")
+            import_seconds, modules = parse_importtime(completed.stderr)
+            result.import_seconds.append(import_seconds)
+            result.deferred_imports = deferred_imports(modules)
+        results.append(result)
+    return results
+
+
+def find_regressions(
+    results: Sequence[StartupResult],
+    *,
+    budget_ms: float = _DEFAULT_BUDGET_MS,
+    baseline: dict[str, object] | None = None,
+) -> list[str]:
+    """Return startup regressions.
+
+    Args:
+        results: Freshly measured startup results.
+        budget_ms: Import-time budget for every invocation, in milliseconds.
+        baseline: Optional report previously written with ``--json``. Import
+            time may exceed the baseline by at most 25%.
+
+    Returns:
+        Human-readable regressions. Empty when every invocation avoids
+        deferred modules and stays within its import-time limits.
+    """
+
+    baseline_seconds: dict[str, float] = {}
+    rows = (baseline or {}).get("invocations")
+    if isinstance(rows, list):
+        for row in rows:
+            if isinstance(row, dict) and isinstance(row.get("best_import_seconds"), int | float):
+                baseline_seconds[str(row.get("name"))] = float(row["best_import_seconds"])
+    regressions: list[str] = []
+    for result in results:
+        if result.deferred_imports:
+            regressions.append(
+                f"{result.name}: imports deferred modules {', '.join(result.deferred_imports)}"
+            )
+        import_ms = result.best_import_seconds * 1000
+        if import_ms > budget_ms:
+            regressions.append(
+                f"{result.name}: import time {import_ms:.1f}ms exceeds budget {budget_ms:.1f}ms"
+            )
+        expected = baseline_seconds.get(result.name)
+        if expected is not None:
+            allowed_ms = expected * 1000 * (1 + _BASELINE_TOLERANCE)
+            if import_ms > allowed_ms:
+                regressions.append(
+                    f"{result.name}: import time {import_ms:.1f}ms exceeds baseline "
+                    f"{expected * 1000:.1f}ms by more than {_BASELINE_TOLERANCE:.0%}"
+                )
+    return regressions
+
+
+def _render_report(results: Sequence[StartupResult]) -> str:
+    """Render startup results as a text table."""
+
+    lines = [
+        "Startup benchmark",
+        "",
+        "Invocation".ljust(20) + "Best (s)".rjust(10) + "Imports (s)".rjust(13) + "  Deferred",
+        "-" * 80,
+    ]
+    for result in results:
+        lines.append(
+            result.name.ljust(20)
+            + f"{result.best_seconds:10.4f}"
+            + f"{result.best_import_seconds:13.4f}"
+            + f"  {', '.join(result.deferred_imports) or 'none'}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+
+    parser = argparse.ArgumentParser(description="Benchmark Atelier CLI startup time.")
+    parser.add_argument("--repeat", type=int, default=5, help="Interpreter starts per run.")
+    parser.add_argument(
+        "--invocation",
+        action="append",
+        choices=sorted(INVOCATIONS),
+        help="Invocation to run; repeat to select several (defaults to all).",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=_DEFAULT_BUDGET_MS,
+        help="Import-time budget per invocation, in milliseconds.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print a JSON report.")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="JSON report to compare against; exit non-zero on import-time regressions.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the CLI entrypoint.
+
+    Returns:
+        Process exit code.
+    """
+
+    args = _parse_args(argv)
+    results = measure_startup(repeat=args.repeat, invocations=args.invocation)
+    if args.json:
+        report = {"invocations": [result.to_payload() for result in results]}
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print(_render_report(results))
+    baseline = None
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = find_regressions(results, budget_ms=args.budget_ms, baseline=baseline)
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
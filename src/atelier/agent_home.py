@@ -7,17 +7,15 @@ import os
 import re
 import shlex
 import shutil
-import subprocess
 import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Iterator, TextIO
 
-from . import paths, templates
+from . import paths, process_table, templates
 from .io import die, warn
 from .models import ProjectConfig
 
@@ -293,25 +291,7 @@ def session_started_ns_from_agent_id(agent_id: str) -> int | None:
 def _pid_started_ns(pid: int) -> int | None:
     if pid <= 0:
         return None
-    result = subprocess.run(
-        ["ps", "-o", "lstart=", "-p", str(pid)],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if result.returncode != 0:
-        return None
-    value = (result.stdout or "").strip()
-    if not value:
-        return None
-    try:
-        started = datetime.strptime(value, "%a %b %d %H:%M:%S %Y")
-    except ValueError:
-        return None
-    local_tz = datetime.now().astimezone().tzinfo
-    if local_tz is not None:
-        started = started.replace(tzinfo=local_tz)
-    return int(started.timestamp() * 1_000_000_000)
+    return process_table.process_started_ns(pid)
 
 
 def is_session_agent_active(agent_id: str) -> bool:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import shutil
 import subprocess
+import threading
 from collections.abc import Callable
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -25,6 +26,8 @@ _LAUNCH_ROLE_ALIASES = {
 }
 _CLAUDE_WORKER_DEFAULT_OPTIONS: tuple[str, ...] = ("--print", "--output-format=stream-json")
 _LONG_FLAGS_ALLOW_SINGLE_DASH_VALUES: frozenset[str] = frozenset({"--append-system-prompt"})
+_AGENT_IDENTITY_ENV_KEYS = ("ATELIER_AGENT_ID", "BD_ACTOR", "BEADS_AGENT_NAME")
+_THREAD_AGENT_IDENTITY = threading.local()
 
 
 @dataclass(frozen=True)
@@ -317,7 +320,7 @@ def _inject_atelier_pythonpath(env: dict[str, str]) -> None:
 @contextmanager
 def scoped_agent_env(agent_id: str) -> Iterator[None]:
     """Temporarily set agent identity environment variables."""
-    keys = ("ATELIER_AGENT_ID", "BD_ACTOR", "BEADS_AGENT_NAME")
+    keys = _AGENT_IDENTITY_ENV_KEYS
     previous = {key: os.environ.get(key) for key in keys}
     if agent_id:
         os.environ["ATELIER_AGENT_ID"] = agent_id
@@ -333,6 +336,35 @@ def scoped_agent_env(agent_id: str) -> Iterator[None]:
                 os.environ[key] = value
 
 
+@contextmanager
+def scoped_thread_agent_env(agent_id: str) -> Iterator[None]:
+    """Temporarily set agent identity for the current thread only.
+
+    Worker pools run several agents in one process, so they cannot share
+    ``os.environ``. Environment builders for ``bd`` subprocesses merge
+    ``thread_agent_env()`` over the process environment instead.
+    """
+    previous = getattr(_THREAD_AGENT_IDENTITY, "agent_id", None)
+    _THREAD_AGENT_IDENTITY.agent_id = agent_id or None
+    try:
+        yield
+    finally:
+        _THREAD_AGENT_IDENTITY.agent_id = previous
+
+
+def thread_agent_env() -> dict[str, str]:
+    """Return agent identity variables scoped to the current thread.
+
+    Returns:
+        Identity variables set by ``scoped_thread_agent_env``, or an empty
+        mapping when the thread has no scoped identity.
+    """
+    agent_id = getattr(_THREAD_AGENT_IDENTITY, "agent_id", None)
+    if not agent_id:
+        return {}
+    return {key: agent_id for key in _AGENT_IDENTITY_ENV_KEYS}
+
+
 def unique_available_agent(available: Iterable[str]) -> str | None:
     names = list(available)
     if len(names) == 1:
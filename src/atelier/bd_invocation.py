@@ -10,6 +10,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Mapping
 
+from . import command_trace
+
 MIN_SUPPORTED_BD_VERSION: tuple[int, int, int] = (0, 56, 1)
 _SEMVER_PATTERN = re.compile(r"\bv?(\d+)\.(\d+)\.(\d+)\b")
 
@@ -27,16 +29,18 @@ def _parse_semver(value: str) -> tuple[int, int, int] | None:
 
 @lru_cache(maxsize=16)
 def _read_bd_version_for_executable(executable: str) -> tuple[int, int, int] | None:
-    try:
-        result = subprocess.run(
-            [executable, "--version"],
-            check=False,
-            capture_output=True,
-            text=True,
-            stdin=subprocess.DEVNULL,
-        )
-    except OSError:
-        return None
+    with command_trace.timed_command((executable, "--version")) as outcome:
+        try:
+            result = subprocess.run(
+                [executable, "--version"],
+                check=False,
+                capture_output=True,
+                text=True,
+                stdin=subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+        outcome.returncode = result.returncode
     output = f"{result.stdout or ''}\n{result.stderr or ''}"
     return _parse_semver(output)
 
@@ -16,7 +16,7 @@ import threading
 import time
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Literal, TextIO
@@ -24,7 +24,19 @@ from urllib.parse import urlparse
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from . import bd_invocation, changesets, config, exec, git, lifecycle, messages, paths, prs
+from . import (
+    agents,
+    bd_invocation,
+    changesets,
+    config,
+    exec,
+    git,
+    lifecycle,
+    messages,
+    paths,
+    process_table,
+    prs,
+)
 from . import log as atelier_log
 from .external_tickets import ExternalTicketRef, external_ticket_payload
 from .io import die, say
@@ -66,6 +78,8 @@ _ISSUE_PREFIX_CACHE: dict[Path, str] = {}
 _STORE_REPAIR_ATTEMPTED: set[Path] = set()
 _EMBEDDED_PANIC_REPAIR_ATTEMPTED: set[Path] = set()
 _DOLT_RUNTIME_NORMALIZED: set[Path] = set()
+_BD_PREFLIGHT_CACHE: dict["_BdPreflightKey", float] = {}
+_BD_PREFLIGHT_CACHE_LOCK = threading.Lock()
 _STORE_REPAIR_ERROR_MARKERS = (
     "no beads database found",
     "database not initialized: issue_prefix config is missing",
@@ -106,11 +120,17 @@ _DOLT_SERVER_PID_FILENAME = "dolt-server.pid"
 _DOLT_SERVER_STARTUP_TIMEOUT_SECONDS = 2.0
 _DOLT_SERVER_STARTUP_POLL_INTERVAL_SECONDS = 0.1
 _DOLT_SERVER_RECOVERY_MAX_ATTEMPTS = 2
+_BD_PREFLIGHT_HEALTHY_TTL_SECONDS = 60.0
 _DESCRIPTION_UPDATE_MAX_ATTEMPTS = 5
 _ISSUE_WRITE_LOCK_DIR = ".atelier-issue-locks"
 _ISSUE_WRITE_LOCK_STATE: dict[tuple[Path, str], tuple[int, TextIO | None, int]] = {}
 _ISSUE_WRITE_LOCAL_LOCKS: dict[tuple[Path, str], threading.RLock] = {}
 _ISSUE_WRITE_LOCK_STATE_GUARD = threading.Lock()
+_ISSUE_UPDATE_BATCH_MAX_IDS = 50
+_THREAD_ISSUE_UPDATE_BATCH = threading.local()
+_THREAD_MESSAGE_INBOX = threading.local()
+_MESSAGE_INBOX_FULL_REFRESH_SECONDS = 300.0
+_MESSAGE_INBOX_CURSOR_OVERLAP = dt.timedelta(seconds=1)
 _EVENT_HISTORY_OVERFLOW_MARKERS = (
     "failed to record event",
     "too large for column 'old_value'",
@@ -356,6 +376,15 @@ class _IssueTypesPayloadModel(BaseModel):
         }
 
 
+@dataclass(frozen=True)
+class IssueUpdateOutcome:
+    """Per-issue result of a grouped ``bd update`` flush."""
+
+    issue_id: str
+    ok: bool
+    detail: str | None = None
+
+
 @dataclass(frozen=True)
 class BeadsIssueRecord:
     """Validated Beads issue payload with both raw and normalized views."""
@@ -557,6 +586,13 @@ class DoltServerRuntime:
     ownership_error: str | None = None
 
 
+@dataclass(frozen=True)
+class _BdPreflightKey:
+    beads_root: Path
+    metadata_mtime_ns: int | None
+    bd_executable: str | None
+
+
 @dataclass(frozen=True)
 class _DoltCommitDecision:
     should_run: bool
@@ -567,6 +603,7 @@ class _DoltCommitDecision:
 def beads_env(beads_root: Path) -> dict[str, str]:
     """Return an environment mapping with BEADS_DIR set."""
     env = os.environ.copy()
+    env.update(agents.thread_agent_env())
     env["BEADS_DIR"] = str(beads_root)
     env["BEADS_DB"] = str(beads_root / "beads.db")
     env.setdefault(_RUNTIME_BEADS_PREFIX_ENV, configured_issue_prefix(beads_root=beads_root))
@@ -2353,34 +2390,16 @@ def _remove_pid_file(pid_path: Path) -> None:
         return
 
 
-def _list_dolt_server_pids_for_port(
-    *,
-    port: int,
-    cwd: Path,
-    env: dict[str, str],
-) -> tuple[int, ...]:
-    snapshot = _run_raw_bd_command(["ps", "-ax", "-o", "pid=,command="], cwd=cwd, env=env)
-    if snapshot is None or snapshot.returncode != 0:
-        return ()
+def _list_dolt_server_pids_for_port(*, port: int) -> tuple[int, ...]:
+    # Recovery starts and stops servers, so always read a fresh table.
     matches: list[int] = []
-    for line in (snapshot.stdout or "").splitlines():
-        entry = line.strip()
-        if not entry:
-            continue
-        parts = entry.split(maxsplit=1)
-        if len(parts) != 2:
-            continue
-        pid_raw, command = parts
+    for process in process_table.read_process_table().processes():
+        command = process.command
         if "dolt sql-server" not in command:
             continue
         if f"--port {port}" not in command and f"--port={port}" not in command:
             continue
-        try:
-            pid = int(pid_raw)
-        except ValueError:
-            continue
-        if pid > 0:
-            matches.append(pid)
+        matches.append(process.pid)
     return tuple(sorted(set(matches)))
 
 
@@ -2411,7 +2430,7 @@ def _stop_dolt_server_processes(
     cwd: Path,
     env: dict[str, str],
 ) -> tuple[int, ...]:
-    target_pids = set(_list_dolt_server_pids_for_port(port=runtime.port, cwd=cwd, env=env))
+    target_pids = set(_list_dolt_server_pids_for_port(port=runtime.port))
     pid_from_file = _read_pid_file(runtime.pid_path)
     if pid_from_file is not None:
         target_pids.add(pid_from_file)
@@ -2522,6 +2541,96 @@ def _restart_dolt_server_with_recovery(
     return False, f"dolt restart did not become healthy ({last_detail})"
 
 
+def _bd_preflight_key(*, beads_root: Path, env: dict[str, str]) -> _BdPreflightKey:
+    try:
+        metadata_mtime_ns: int | None = (beads_root / "metadata.json").stat().st_mtime_ns
+    except OSError:
+        metadata_mtime_ns = None
+    return _BdPreflightKey(
+        beads_root=beads_root.resolve(),
+        metadata_mtime_ns=metadata_mtime_ns,
+        bd_executable=shutil.which("bd", path=env.get("PATH")),
+    )
+
+
+def _bd_preflight_is_fresh(key: _BdPreflightKey) -> bool:
+    with _BD_PREFLIGHT_CACHE_LOCK:
+        verified_at = _BD_PREFLIGHT_CACHE.get(key)
+    if verified_at is None:
+        return False
+    return time.monotonic() - verified_at < _BD_PREFLIGHT_HEALTHY_TTL_SECONDS
+
+
+def _record_bd_preflight_success(key: _BdPreflightKey) -> None:
+    with _BD_PREFLIGHT_CACHE_LOCK:
+        _BD_PREFLIGHT_CACHE[key] = time.monotonic()
+
+
+def _cached_preflight(*, beads_root: Path, env: dict[str, str]) -> _BdPreflightKey | None:
+    """Check the bd version unless a recent preflight for this store passed.
+
+    Returns:
+        Preflight key when the remaining checks must still run, or ``None``
+        when a cached preflight result covers them.
+    """
+    key = _bd_preflight_key(beads_root=beads_root, env=env)
+    if _bd_preflight_is_fresh(key):
+        return None
+    try:
+        bd_invocation.ensure_supported_bd_version(env=env)
+    except RuntimeError as exc:
+        die(str(exc))
+    return key
+
+
+def _cached_dolt_server_preflight(
+    key: _BdPreflightKey | None,
+    *,
+    args: list[str],
+    beads_root: Path,
+    cwd: Path,
+    env: dict[str, str],
+) -> str | None:
+    """Run the dolt server preflight and cache a passing result.
+
+    Args:
+        key: Key returned by :func:`_cached_preflight`; ``None`` skips the
+            preflight because a cached result already covers it.
+        args: ``bd`` arguments of the command about to run.
+        beads_root: Beads store root.
+        cwd: Working directory for probe commands.
+        env: Environment for probe commands.
+
+    Returns:
+        Preflight failure detail, or ``None`` when the server is usable.
+    """
+    if key is None:
+        return None
+    preflight_error = _ensure_dolt_server_preflight(
+        args=args,
+        beads_root=beads_root,
+        cwd=cwd,
+        env=env,
+    )
+    if preflight_error is None and _is_dolt_server_supervision_target(args):
+        _record_bd_preflight_success(key)
+    return preflight_error
+
+
+def _invalidate_bd_preflight(beads_root: Path) -> None:
+    """Drop cached preflight results so the next command re-probes the store."""
+    resolved = beads_root.resolve()
+    with _BD_PREFLIGHT_CACHE_LOCK:
+        for key in [key for key in _BD_PREFLIGHT_CACHE if key.beads_root == resolved]:
+            _BD_PREFLIGHT_CACHE.pop(key, None)
+
+
+def clear_bd_preflight_cache() -> None:
+    """Forget every cached ``bd`` preflight result for this process."""
+    with _BD_PREFLIGHT_CACHE_LOCK:
+        _BD_PREFLIGHT_CACHE.clear()
+
+
 def _ensure_dolt_server_preflight(
     *,
     args: list[str],
@@ -2801,6 +2910,43 @@ def _show_issue_for_gate(
     return payload[0], None
 
 
+def _show_issues_for_gate(
+    issue_ids: tuple[str, ...],
+    *,
+    beads_root: Path,
+    cwd: Path,
+    env: dict[str, str],
+) -> dict[str, dict[str, object]]:
+    """Return gate payloads keyed by id, reading every id in one bd call."""
+    if not issue_ids:
+        return {}
+    payload, error = _raw_bd_json(
+        ["show", *issue_ids],
+        beads_root=beads_root,
+        cwd=cwd,
+        env=env,
+    )
+    issues = {
+        issue_id: issue
+        for issue in payload
+        if isinstance(issue_id := issue.get("id"), str) and issue_id in issue_ids
+    }
+    if error is None and len(issues) == len(set(issue_ids)):
+        return issues
+    for issue_id in issue_ids:
+        if issue_id in issues:
+            continue
+        issue, single_error = _show_issue_for_gate(
+            issue_id,
+            beads_root=beads_root,
+            cwd=cwd,
+            env=env,
+        )
+        if single_error is None and issue is not None:
+            issues[issue_id] = issue
+    return issues
+
+
 def _issue_has_label(issue: dict[str, object], label: str) -> bool:
     labels = issue.get("labels")
     if not isinstance(labels, list):
@@ -2851,14 +2997,15 @@ def _blocking_dependency_states(
     except ValueError as exc:
         return (f"invalid issue payload ({exc})",)
     blockers: list[str] = []
+    dependency_issues = _show_issues_for_gate(
+        boundary.dependency_ids,
+        beads_root=beads_root,
+        cwd=cwd,
+        env=env,
+    )
     for dependency_id in boundary.dependency_ids:
-        dependency_issue, error = _show_issue_for_gate(
-            dependency_id,
-            beads_root=beads_root,
-            cwd=cwd,
-            env=env,
-        )
-        if error or dependency_issue is None:
+        dependency_issue = dependency_issues.get(dependency_id)
+        if dependency_issue is None:
             blockers.append(f"{dependency_id}(unavailable)")
             continue
         status = str(dependency_issue.get("status") or "").strip().lower()
@@ -2948,10 +3095,7 @@ def run_bd_command(
     """
     cmd = ["bd", *args]
     env = beads_env(beads_root)
-    try:
-        bd_invocation.ensure_supported_bd_version(env=env)
-    except RuntimeError as exc:
-        die(str(exc))
+    preflight_key = _cached_preflight(beads_root=beads_root, env=env)
     dolt_commit_decision = _resolve_dolt_commit_decision(
         args=args,
         beads_root=beads_root,
@@ -2970,7 +3114,8 @@ def run_bd_command(
     _normalize_dolt_runtime_metadata_once(beads_root=beads_root)
     if _should_emit_startup_auto_migration_diagnostic(args):
         _emit_startup_auto_migration_diagnostic(beads_root)
-    preflight_error = _ensure_dolt_server_preflight(
+    preflight_error = _cached_dolt_server_preflight(
+        preflight_key,
         args=args,
         beads_root=beads_root,
         cwd=cwd,
@@ -3062,6 +3207,8 @@ def run_bd_command(
                 continue
         break
 
+    if result.returncode != 0:
+        _invalidate_bd_preflight(beads_root)
     if result.returncode != 0 and not allow_failure:
         message = f"command failed: {' '.join(cmd)}"
         if detail:
@@ -3084,6 +3231,146 @@ def run_bd_command(
     )
 
 
+def update_issues(
+    updates: list[tuple[str, tuple[str, ...]]],
+    *,
+    beads_root: Path,
+    cwd: Path,
+) -> tuple[IssueUpdateOutcome, ...]:
+    """Apply many ``bd update`` flag sets in as few bd invocations as needed.
+
+    Updates that share identical flags are grouped into one
+    ``bd update <id>...`` call (one Dolt auto-commit per group). When a grouped
+    call fails, its issues are retried one at a time so a single bad id cannot
+    fail its neighbours. Only use this for idempotent flags (status, label, and
+    field assignments); ``--append-notes`` must not be retried.
+
+    Args:
+        updates: ``(issue_id, flags)`` pairs in the order they were requested.
+        beads_root: Path to the Beads data directory.
+        cwd: Working directory for `bd` invocation.
+
+    Returns:
+        One outcome per requested update, in input order.
+    """
+    groups: dict[tuple[str, ...], list[str]] = {}
+    for issue_id, flags in updates:
+        cleaned_id = issue_id.strip()
+        if not cleaned_id:
+            continue
+        group = groups.setdefault(tuple(flags), [])
+        if cleaned_id not in group:
+            group.append(cleaned_id)
+    outcomes: dict[tuple[str, tuple[str, ...]], IssueUpdateOutcome] = {}
+    for flags, issue_ids in groups.items():
+        for start in range(0, len(issue_ids), _ISSUE_UPDATE_BATCH_MAX_IDS):
+            chunk = issue_ids[start : start + _ISSUE_UPDATE_BATCH_MAX_IDS]
+            result = run_bd_command(
+                ["update", *chunk, *flags],
+                beads_root=beads_root,
+                cwd=cwd,
+                allow_failure=True,
+            )
+            if result.returncode == 0:
+                for issue_id in chunk:
+                    outcomes[(issue_id, flags)] = IssueUpdateOutcome(issue_id=issue_id, ok=True)
+                continue
+            for issue_id in chunk:
+                if len(chunk) > 1:
+                    result = run_bd_command(
+                        ["update", issue_id, *flags],
+                        beads_root=beads_root,
+                        cwd=cwd,
+                        allow_failure=True,
+                    )
+                detail = (result.stderr or result.stdout or "").strip() or None
+                outcomes[(issue_id, flags)] = IssueUpdateOutcome(
+                    issue_id=issue_id,
+                    ok=result.returncode == 0,
+                    detail=None if result.returncode == 0 else detail,
+                )
+    return tuple(
+        outcomes[(issue_id.strip(), tuple(flags))]
+        for issue_id, flags in updates
+        if issue_id.strip()
+    )
+
+
+class IssueUpdateBatch:
+    """Collects ``bd update`` calls made through :func:`update_issue`.
+
+    Pending updates are applied by :meth:`flush`, which groups identical flag
+    sets through :func:`update_issues`. Queuing a second update for the same
+    issue flushes the first, so updates to one issue land in call order.
+    """
+
+    def __init__(self, *, beads_root: Path, cwd: Path) -> None:
+        self.beads_root = beads_root
+        self.cwd = cwd
+        self._pending: list[tuple[str, tuple[str, ...]]] = []
+        self.outcomes: list[IssueUpdateOutcome] = []
+
+    def add(self, issue_id: str, flags: tuple[str, ...]) -> None:
+        """Queue one update for the next flush."""
+        if any(pending_id == issue_id for pending_id, _flags in self._pending):
+            self.flush()
+        self._pending.append((issue_id, flags))
+
+    def flush(self) -> tuple[IssueUpdateOutcome, ...]:
+        """Apply queued updates and return their outcomes."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return ()
+        outcomes = update_issues(pending, beads_root=self.beads_root, cwd=self.cwd)
+        self.outcomes.extend(outcomes)
+        return outcomes
+
+    @property
+    def failures(self) -> tuple[IssueUpdateOutcome, ...]:
+        """Outcomes of flushed updates that bd rejected."""
+        return tuple(outcome for outcome in self.outcomes if not outcome.ok)
+
+
+@contextmanager
+def issue_update_batch(*, beads_root: Path, cwd: Path) -> Iterator[IssueUpdateBatch]:
+    """Defer :func:`update_issue` calls on this thread and flush them on exit.
+
+    Nested batches for the same Beads root reuse the outer batch so the
+    outermost scope owns the flush. Updates still queued when the block
+    raises are discarded.
+    """
+    active = getattr(_THREAD_ISSUE_UPDATE_BATCH, "batch", None)
+    if isinstance(active, IssueUpdateBatch) and active.beads_root == beads_root:
+        yield active
+        return
+    batch = IssueUpdateBatch(beads_root=beads_root, cwd=cwd)
+    _THREAD_ISSUE_UPDATE_BATCH.batch = batch
+    try:
+        yield batch
+    finally:
+        _THREAD_ISSUE_UPDATE_BATCH.batch = active
+    batch.flush()
+
+
+def update_issue(
+    issue_id: str,
+    flags: tuple[str, ...],
+    *,
+    beads_root: Path,
+    cwd: Path,
+) -> None:
+    """Run ``bd update <issue_id> <flags>`` or queue it on the active batch.
+
+    Without an active :func:`issue_update_batch` this behaves like
+    :func:`run_bd_command` and exits on failure.
+    """
+    batch = getattr(_THREAD_ISSUE_UPDATE_BATCH, "batch", None)
+    if isinstance(batch, IssueUpdateBatch) and batch.beads_root == beads_root:
+        batch.add(issue_id, flags)
+        return
+    run_bd_command(["update", issue_id, *flags], beads_root=beads_root, cwd=cwd)
+
+
 def close_issue(
     issue_id: str,
     *,
@@ -4004,6 +4291,149 @@ def list_all_changesets(
     return result
 
 
+@dataclass(frozen=True)
+class IssueSnapshot:
+    """Point-in-time, in-memory index over one full Beads issue listing.
+
+    Read-only views such as ``atelier status`` use the snapshot to answer
+    per-epic child, descendant, and readiness questions without issuing one
+    ``bd list --parent`` chain per epic.
+
+    Args:
+        issues: Every issue payload returned by ``bd list --all``.
+        ready_ids: Ids of issues reported by ``bd ready``.
+    """
+
+    issues: tuple[dict[str, object], ...]
+    ready_ids: frozenset[str] = frozenset()
+    _by_id: dict[str, dict[str, object]] = field(init=False, repr=False, compare=False)
+    _children: dict[str, tuple[dict[str, object], ...]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        by_id: dict[str, dict[str, object]] = {}
+        children: dict[str, list[dict[str, object]]] = {}
+        for issue in self.issues:
+            issue_id = issue.get("id")
+            if not isinstance(issue_id, str) or not issue_id.strip():
+                continue
+            by_id.setdefault(issue_id.strip(), issue)
+            parent_id = _issue_parent_id(issue)
+            if parent_id:
+                children.setdefault(parent_id, []).append(issue)
+        object.__setattr__(self, "_by_id", by_id)
+        object.__setattr__(
+            self,
+            "_children",
+            {parent_id: tuple(items) for parent_id, items in children.items()},
+        )
+
+    def issue(self, issue_id: str) -> dict[str, object] | None:
+        """Return the snapshot payload for one issue id."""
+        return self._by_id.get(issue_id.strip())
+
+    def labeled(self, name: str, *, include_closed: bool = False) -> list[dict[str, object]]:
+        """Return issues labeled with the Atelier ``name`` label."""
+        label = issue_label(name)
+        return [
+            issue
+            for issue in self.issues
+            if label in _issue_labels(issue)
+            and (
+                include_closed
+                or lifecycle.canonical_lifecycle_status(issue.get("status")) != "closed"
+            )
+        ]
+
+    def epics(self) -> list[dict[str, object]]:
+        """Return every epic, matching ``list_epics(include_closed=True)``."""
+        return self.labeled(_LABEL_EPIC, include_closed=True)
+
+    def work_children(self, parent_id: str) -> list[dict[str, object]]:
+        """Return direct child work beads, matching ``list_work_children``."""
+        return [
+            issue
+            for issue in self._children.get(parent_id.strip(), ())
+            if lifecycle.is_work_issue(
+                labels=_issue_labels(issue),
+                issue_type=lifecycle.issue_payload_type(issue),
+            )
+        ]
+
+    def descendant_changesets(self, parent_id: str) -> list[dict[str, object]]:
+        """Return leaf work beads anywhere under a parent."""
+        descendants: list[dict[str, object]] = []
+        seen: set[str] = set()
+        queue = [parent_id.strip()]
+        while queue:
+            current = queue.pop(0)
+            for issue in self.work_children(current):
+                issue_id = issue.get("id")
+                if not isinstance(issue_id, str) or not issue_id.strip():
+                    continue
+                if issue_id.strip() in seen:
+                    continue
+                seen.add(issue_id.strip())
+                if not self.work_children(issue_id.strip()):
+                    descendants.append(issue)
+                queue.append(issue_id.strip())
+        return descendants
+
+    def changesets_for_epic(self, epic: dict[str, object]) -> list[dict[str, object]]:
+        """Return epic changesets; a childless epic is its own changeset."""
+        epic_id = epic.get("id")
+        if not isinstance(epic_id, str) or not epic_id.strip():
+            return []
+        descendants = self.descendant_changesets(epic_id)
+        if descendants:
+            return descendants
+        if self.work_children(epic_id):
+            return []
+        return [self._by_id.get(epic_id.strip(), epic)]
+
+    def ready_descendants(self, parent_id: str) -> list[dict[str, object]]:
+        """Return ready issues anywhere under a parent."""
+        ready: list[dict[str, object]] = []
+        queue = [parent_id.strip()]
+        seen: set[str] = set(queue)
+        while queue:
+            current = queue.pop(0)
+            for issue in self._children.get(current, ()):
+                issue_id = issue.get("id")
+                if not isinstance(issue_id, str) or issue_id.strip() in seen:
+                    continue
+                seen.add(issue_id.strip())
+                if issue_id.strip() in self.ready_ids:
+                    ready.append(issue)
+                queue.append(issue_id.strip())
+        return ready
+
+
+def load_issue_snapshot(*, beads_root: Path, cwd: Path) -> IssueSnapshot:
+    """Load every issue and the ready set with a fixed number of bd calls.
+
+    Args:
+        beads_root: Root directory for the Beads planning store.
+        cwd: Working directory for bd commands.
+
+    Returns:
+        Snapshot built from one ``bd list --all`` and one ``bd ready`` call.
+    """
+    issues = run_bd_json(["list", "--all", "--limit", "0"], beads_root=beads_root, cwd=cwd)
+    ready = run_bd_json(["ready", "--limit", "0"], beads_root=beads_root, cwd=cwd)
+    return IssueSnapshot(
+        issues=tuple(issue for issue in issues if isinstance(issue, dict)),
+        ready_ids=frozenset(
+            issue_id.strip()
+            for issue in ready
+            if isinstance(issue, dict)
+            and isinstance(issue_id := issue.get("id"), str)
+            and issue_id.strip()
+        ),
+    )
+
+
 def _normalize_description(description: str | None) -> str:
     return _normalize_description_text(description)
 
@@ -5270,7 +5700,7 @@ def update_external_tickets(
     client = SubprocessBeadsClient(
         cwd=cwd,
         beads_root=beads_root,
-        env={"BEADS_DIR": str(beads_root)},
+        env={"BEADS_DIR": str(beads_root), **agents.thread_agent_env()},
     )
     store = build_atelier_store(beads=client)
     asyncio.run(
@@ -5903,6 +6333,226 @@ def create_message_bead(
     return issues[0] if issues else {"id": issue_id, "title": subject}
 
 
+@dataclass
+class _MessageInboxScope:
+    issues: dict[str, dict[str, object]] = field(default_factory=dict)
+    cursor: dt.datetime | None = None
+    refreshed_at: float = 0.0
+
+
+class MessageInboxSession:
+    """Incremental message-bead listings shared by inbox and queue checks.
+
+    Each agent inbox and the shared queue listing keep a cursor at the newest
+    ``updated_at`` seen. The first listing fetches every matching message bead;
+    later ones only fetch message beads updated since the cursor and merge them
+    into the cached set. Change listings are not filtered by assignee, so a
+    bead reassigned away from an inbox drops out of it. Parsed message payloads
+    are memoized per bead until its description changes. A full listing runs
+    again every few minutes so deleted beads drop out.
+    """
+
+    def __init__(self, *, beads_root: Path) -> None:
+        self.beads_root = beads_root
+        self._scopes: dict[tuple[str | None, bool, bool], _MessageInboxScope] = {}
+        self._payloads: dict[str, tuple[str, messages.MessagePayload]] = {}
+
+    def message_beads(
+        self,
+        *,
+        cwd: Path,
+        assignee: str | None = None,
+        unread_only: bool = True,
+        match_contract: bool = False,
+    ) -> list[dict[str, object]]:
+        """Return open message beads, fetching only changes since the last call.
+
+        Args:
+            cwd: Working directory for `bd` invocation.
+            assignee: Limit the listing to one agent inbox.
+            unread_only: Whether to keep only beads labeled unread.
+            match_contract: Whether to also match plain or foreign-namespace
+                ``message`` labels and the ``message`` issue type. Full
+                listings then scan every open issue.
+        """
+        key = (assignee, unread_only, match_contract)
+        scope = self._scopes.get(key)
+        now = time.monotonic()
+
+        def keep(issue: dict[str, object]) -> bool:
+            return _message_in_scope(
+                issue, assignee=assignee, unread_only=unread_only, match_contract=match_contract
+            )
+
+        if (
+            scope is None
+            or scope.cursor is None
+            or now - scope.refreshed_at >= _MESSAGE_INBOX_FULL_REFRESH_SECONDS
+        ):
+            issues = run_bd_json(
+                _message_list_args(
+                    assignee=assignee, unread_only=unread_only, match_contract=match_contract
+                ),
+                beads_root=self.beads_root,
+                cwd=cwd,
+            )
+            scope = _MessageInboxScope(refreshed_at=now)
+            self._scopes[key] = scope
+            _merge_message_inbox(scope, issues, keep=keep)
+            return list(scope.issues.values())
+        since = (scope.cursor - _MESSAGE_INBOX_CURSOR_OVERLAP).strftime("%Y-%m-%dT%H:%M:%SZ")
+        args = _message_list_args(assignee=None, unread_only=False, match_contract=match_contract)
+        # The cursor advances past everything merged here, so a capped
+        # listing would silently drop the beads bd did not return.
+        if "--limit" not in args:
+            args.extend(["--limit", "0"])
+        changed = run_bd_json(
+            [*args, "--all", "--updated-after", since],
+            beads_root=self.beads_root,
+            cwd=cwd,
+        )
+        _merge_message_inbox(scope, changed, keep=keep)
+        return list(scope.issues.values())
+
+    def payload(self, issue: dict[str, object]) -> messages.MessagePayload:
+        """Return the parsed message payload, reusing it while unchanged."""
+        issue_id = str(issue.get("id") or "").strip()
+        description = _issue_description(issue)
+        cached = self._payloads.get(issue_id) if issue_id else None
+        if cached is not None and cached[0] == description:
+            return cached[1]
+        payload = messages.parse_message(description)
+        if issue_id:
+            self._payloads[issue_id] = (description, payload)
+        return payload
+
+
+@contextmanager
+def message_inbox_session(*, beads_root: Path) -> Iterator[MessageInboxSession]:
+    """Keep incremental message cursors on this thread for the block.
+
+    Nested sessions for the same Beads root reuse the outer session. Without
+    an active session every inbox and queue check lists all message beads.
+    """
+    active = getattr(_THREAD_MESSAGE_INBOX, "session", None)
+    if isinstance(active, MessageInboxSession) and active.beads_root == beads_root:
+        yield active
+        return
+    session = MessageInboxSession(beads_root=beads_root)
+    _THREAD_MESSAGE_INBOX.session = session
+    try:
+        yield session
+    finally:
+        _THREAD_MESSAGE_INBOX.session = active
+
+
+def _active_message_inbox(beads_root: Path) -> MessageInboxSession | None:
+    session = getattr(_THREAD_MESSAGE_INBOX, "session", None)
+    if isinstance(session, MessageInboxSession) and session.beads_root == beads_root:
+        return session
+    return None
+
+
+def _message_list_args(
+    *, assignee: str | None, unread_only: bool, match_contract: bool = False
+) -> list[str]:
+    if match_contract:
+        # Plain labels and issue types cannot be filtered by bd; list every
+        # open issue and let _message_in_scope match them.
+        return ["list", "--limit", "0"]
+    args = ["list", "--label", issue_label(_LABEL_MESSAGE)]
+    if assignee is not None:
+        args.extend(["--assignee", assignee])
+    if unread_only:
+        args.extend(["--label", issue_label(_LABEL_UNREAD)])
+    return args
+
+
+def _message_in_scope(
+    issue: dict[str, object],
+    *,
+    assignee: str | None,
+    unread_only: bool,
+    match_contract: bool,
+) -> bool:
+    """Return whether an open issue belongs to one message listing scope.
+
+    Contract matching follows the store: plain and namespaced labels of any
+    prefix, or the ``message`` issue type.
+    """
+    if lifecycle.is_closed_status(issue.get("status")):
+        return False
+    if assignee is not None and str(issue.get("assignee") or "").strip() != assignee:
+        return False
+    labels = _issue_labels(issue)
+    if match_contract:
+        issue_type = str(lifecycle.issue_payload_type(issue) or "").strip()
+        if not (_has_contract_label(labels, _LABEL_MESSAGE) or issue_type == _LABEL_MESSAGE):
+            return False
+        return not unread_only or _has_contract_label(labels, _LABEL_UNREAD)
+    if issue_label(_LABEL_MESSAGE) not in labels:
+        return False
+    return not unread_only or issue_label(_LABEL_UNREAD) in labels
+
+
+def _has_contract_label(labels: set[str], label_name: str) -> bool:
+    return label_name in labels or lifecycle.has_namespaced_label(labels, label_name)
+
+
+def _merge_message_inbox(
+    scope: _MessageInboxScope,
+    issues: list[dict[str, object]],
+    *,
+    keep: Callable[[dict[str, object]], bool],
+) -> None:
+    for issue in issues:
+        issue_id = str(issue.get("id") or "").strip()
+        if not issue_id:
+            continue
+        if keep(issue):
+            scope.issues[issue_id] = issue
+        else:
+            scope.issues.pop(issue_id, None)
+        updated_at = _parse_issue_timestamp(issue.get("updated_at"))
+        if updated_at is None:
+            # Without a timestamp the cursor could skip this bead's next change.
+            scope.refreshed_at = 0.0
+        elif scope.cursor is None or updated_at > scope.cursor:
+            scope.cursor = updated_at
+
+
+def list_message_beads(
+    *,
+    beads_root: Path,
+    cwd: Path,
+    unread_only: bool = True,
+    match_contract: bool = False,
+) -> list[dict[str, object]]:
+    """List open message beads.
+
+    Inside :func:`message_inbox_session` only beads changed since the previous
+    listing are fetched. See :meth:`MessageInboxSession.message_beads` for
+    ``match_contract``.
+    """
+    session = _active_message_inbox(beads_root)
+    if session is not None:
+        return session.message_beads(
+            cwd=cwd, unread_only=unread_only, match_contract=match_contract
+        )
+    issues = run_bd_json(
+        _message_list_args(assignee=None, unread_only=unread_only, match_contract=match_contract),
+        beads_root=beads_root,
+        cwd=cwd,
+    )
+    if not match_contract:
+        return issues
+    return [
+        issue
+        for issue in issues
+        if _message_in_scope(issue, assignee=None, unread_only=unread_only, match_contract=True)
+    ]
+
+
 def list_inbox_messages(
     agent_id: str,
     *,
@@ -5911,17 +6561,24 @@ def list_inbox_messages(
     unread_only: bool = True,
 ) -> list[dict[str, object]]:
     """List message beads assigned to the agent."""
-    args = ["list", "--label", issue_label(_LABEL_MESSAGE), "--assignee", agent_id]
-    if unread_only:
-        args.extend(["--label", issue_label(_LABEL_UNREAD)])
-    messages_for_agent = run_bd_json(args, beads_root=beads_root, cwd=cwd)
+    session = _active_message_inbox(beads_root)
+    if session is not None:
+        messages_for_agent = session.message_beads(
+            cwd=cwd, assignee=agent_id, unread_only=unread_only
+        )
+    else:
+        messages_for_agent = run_bd_json(
+            _message_list_args(assignee=agent_id, unread_only=unread_only),
+            beads_root=beads_root,
+            cwd=cwd,
+        )
     matches: list[dict[str, object]] = []
     thread_issue_cache: dict[str, dict[str, object] | None] = {}
     repo_slug_cache: dict[str, str | None] = {}
     stale_reasons: dict[str, str] = {}
     for issue in messages_for_agent:
         issue_id = str(issue.get("id") or "").strip()
-        thread_id = _message_thread_id(issue)
+        thread_id = _message_thread_id(issue, session=session)
         reason_key = _needs_decision_reason_key(issue.get("title"), thread_id=thread_id)
         stale_reason = _needs_decision_stale_reason(
             reason_key,
@@ -5954,10 +6611,8 @@ def list_queue_messages(
     unread_only: bool = True,
 ) -> list[dict[str, object]]:
     """List queued message beads, optionally filtered by queue name."""
-    args = ["list", "--label", issue_label(_LABEL_MESSAGE)]
-    if unread_only:
-        args.extend(["--label", issue_label(_LABEL_UNREAD)])
-    issues = run_bd_json(args, beads_root=beads_root, cwd=cwd)
+    session = _active_message_inbox(beads_root)
+    issues = list_message_beads(beads_root=beads_root, cwd=cwd, unread_only=unread_only)
     matches: list[dict[str, object]] = []
     duplicate_groups: dict[tuple[str, str], dict[str, object]] = {}
     duplicate_replaced_ids: set[str] = set()
@@ -5968,7 +6623,9 @@ def list_queue_messages(
         description = issue.get("description")
         if not isinstance(description, str):
             continue
-        payload = messages.parse_message(description)
+        payload = (
+            session.payload(issue) if session is not None else messages.parse_message(description)
+        )
         queue_name = payload.metadata.get("queue")
         if not isinstance(queue_name, str) or not queue_name.strip():
             continue
@@ -6093,8 +6750,15 @@ def _needs_decision_reason_key(subject: object, *, thread_id: str | None) -> str
     return normalized_subject.lower()
 
 
-def _message_thread_id(issue: dict[str, object]) -> str | None:
-    payload = messages.parse_message(_issue_description(issue))
+def _message_thread_id(
+    issue: dict[str, object],
+    *,
+    session: MessageInboxSession | None = None,
+) -> str | None:
+    if session is not None:
+        payload = session.payload(issue)
+    else:
+        payload = messages.parse_message(_issue_description(issue))
     thread_value = payload.metadata.get("thread")
     if not isinstance(thread_value, str):
         return None
@@ -6277,6 +6941,7 @@ def _resolve_stale_messages_best_effort(
     cwd: Path,
 ) -> None:
     unread_label = issue_label(_LABEL_UNREAD, beads_root=beads_root)
+    closed_ids: list[str] = []
     for message_id in sorted(stale_reasons):
         cleaned_id = message_id.strip()
         if not cleaned_id:
@@ -6317,12 +6982,12 @@ def _resolve_stale_messages_best_effort(
                 refreshed_issue = refreshed_issue_payload[0] if refreshed_issue_payload else {}
                 status = lifecycle.canonical_lifecycle_status(refreshed_issue.get("status"))
             if status == "closed":
-                run_bd_command(
-                    ["update", cleaned_id, "--remove-label", unread_label],
-                    beads_root=beads_root,
-                    cwd=cwd,
-                    allow_failure=True,
-                )
+                closed_ids.append(cleaned_id)
+    update_issues(
+        [(message_id, ("--remove-label", unread_label)) for message_id in closed_ids],
+        beads_root=beads_root,
+        cwd=cwd,
+    )
 
 
 def _mark_messages_read_best_effort(
@@ -6332,16 +6997,11 @@ def _mark_messages_read_best_effort(
     cwd: Path,
 ) -> None:
     unread_label = issue_label(_LABEL_UNREAD, beads_root=beads_root)
-    for message_id in sorted(message_ids):
-        cleaned_id = message_id.strip()
-        if not cleaned_id:
-            continue
-        run_bd_command(
-            ["update", cleaned_id, "--remove-label", unread_label],
-            beads_root=beads_root,
-            cwd=cwd,
-            allow_failure=True,
-        )
+    update_issues(
+        [(message_id, ("--remove-label", unread_label)) for message_id in sorted(message_ids)],
+        beads_root=beads_root,
+        cwd=cwd,
+    )
 
 
 def claim_queue_message(
@@ -6508,7 +7168,7 @@ def update_changeset_review(
     client = SubprocessBeadsClient(
         cwd=cwd,
         beads_root=beads_root,
-        env={"BEADS_DIR": str(beads_root)},
+        env={"BEADS_DIR": str(beads_root), **agents.thread_agent_env()},
     )
     store = build_atelier_store(beads=client)
     asyncio.run(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 _FIELDS = ("pr_url", "pr_number", "pr_state", "review_owner")
 
@@ -43,8 +44,12 @@ def _set_field(description: str, key: str, value: str | None) -> str:
     return "\n".join(updated).rstrip("\n") + "\n"
 
 
+@lru_cache(maxsize=2048)
 def parse_review_metadata(description: str) -> ReviewMetadata:
-    """Parse review metadata fields from a description."""
+    """Parse review metadata fields from a description.
+
+    Results are immutable and memoized by description.
+    """
     values: dict[str, str | None] = {field: None for field in _FIELDS}
     for line in description.splitlines():
         if ":" not in line:
@@ -7,12 +7,13 @@ Example:
     $ atelier --help
 """
 
+import importlib
 import json
 import os
 import sys
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Annotated, Callable, cast
+from typing import TYPE_CHECKING, Annotated, Any, Callable, cast
 
 import click
 import typer
@@ -22,33 +23,62 @@ try:
 except ImportError:  # pragma: no cover - legacy Click fallback
     from click.parser import split_arg_string
 
-from . import __version__, bd_invocation, beads, config, git, lifecycle, paths
+from . import __version__, command_trace
 from . import log as atelier_log
-from .commands import config as config_cmd
-from .commands import doctor as doctor_cmd
-from .commands import edit as edit_cmd
-from .commands import gc as gc_cmd
-from .commands import hook as hook_cmd
-from .commands import init as init_cmd
-from .commands import list as list_cmd
-from .commands import new as new_cmd
-from .commands import open as open_cmd
-from .commands import plan as plan_cmd
-from .commands import policy as policy_cmd
-from .commands import remove as remove_cmd
-from .commands import repair_event_history as repair_event_history_cmd
-from .commands import status as status_cmd
-from .commands import work as work_cmd
-from .exec import try_run_command
-from .models import (
+from .model_values import (
     BRANCH_HISTORY_VALUES,
     BRANCH_PR_MODE_VALUES,
     BRANCH_SQUASH_MESSAGE_VALUES,
     WORKER_SELECT_VALUES,
 )
 
+if TYPE_CHECKING:
+    from . import config
+
+# Subcommand implementations pull in Beads, the worker package, pydantic
+# models, and interactive prompts. They are imported on first use so hooks,
+# ``--help``, and ``--version`` stay cheap. ``None`` means the module itself.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "config_cmd": (".commands.config", None),
+    "doctor_cmd": (".commands.doctor", "doctor"),
+    "edit_cmd": (".commands.edit", None),
+    "gc_cmd": (".commands.gc", None),
+    "hook_cmd": (".commands.hook", None),
+    "init_cmd": (".commands.init", None),
+    "list_cmd": (".commands.list", None),
+    "new_cmd": (".commands.new", None),
+    "open_cmd": (".commands.open", None),
+    "plan_cmd": (".commands.plan", None),
+    "policy_cmd": (".commands.policy", None),
+    "remove_cmd": (".commands.remove", None),
+    "repair_event_history_cmd": (".commands.repair_event_history", None),
+    "status_cmd": (".commands.status", "status"),
+    "work_cmd": (".commands.work", None),
+    "try_run_command": (".exec", "try_run_command"),
+}
+
 _split_arg_string = cast(Callable[[str], list[str]], split_arg_string)
 
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily loaded subcommand implementation on attribute access."""
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    module = importlib.import_module(module_name, __package__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily loaded attribute, preferring one already bound here."""
+    if name in globals():
+        return globals()[name]
+    return __getattr__(name)
+
+
 app = typer.Typer(
     add_completion=True,
     help=(
@@ -119,7 +149,9 @@ def _ensure_completion_env() -> None:
 
 def _resolve_completion_project(
     cwd: Path | None = None,
-) -> tuple[Path, Path, config.ProjectConfig, str | None] | None:
+) -> "tuple[Path, Path, config.ProjectConfig, str | None] | None":
+    from . import config, git, paths
+
     try:
         repo_root, enlistment_path, _, origin = git.resolve_repo_enlistment(cwd or Path.cwd())
     except SystemExit:
@@ -139,6 +171,8 @@ def _resolve_completion_project(
 
 
 def _collect_workspace_root_branches(repo_root: Path, *, beads_root: Path) -> list[str]:
+    from . import bd_invocation, beads, lifecycle
+
     env = beads.beads_env(beads_root)
     cmd = bd_invocation.with_bd_mode(
         "list",
@@ -148,7 +182,7 @@ def _collect_workspace_root_branches(repo_root: Path, *, beads_root: Path) -> li
         beads_dir=str(beads_root),
         env=env,
     )
-    result = try_run_command(cmd, cwd=repo_root, env=env)
+    result = _lazy("try_run_command")(cmd, cwd=repo_root, env=env)
     if not result or result.returncode != 0:
         return []
     raw = result.stdout.strip() if result.stdout else ""
@@ -196,11 +230,16 @@ def _filter_completion_candidates(values: list[str], incomplete: str) -> list[st
 
 
 def _workspace_only_shell_complete(
-    _ctx: click.Context, _args: list[str], incomplete: str
+    ctx: click.Context, args: list[str], incomplete: str
 ) -> list[str]:
+    # Typer matches completion parameters by name when it cannot match the
+    # annotation, which happens when it ships its own Click.
+    del ctx, args
     resolved = _resolve_completion_project()
     if not resolved:
         return []
+    from . import config
+
     repo_root, project_root, config_payload, _git_path = resolved
     project_data_dir = config.resolve_project_data_dir(project_root, config_payload)
     beads_root = config.resolve_beads_root(project_data_dir, repo_root)
@@ -362,6 +401,7 @@ def init_command(
     Example:
         $ atelier init --branch-prefix scott/ --branch-history rebase
     """
+    init_cmd = _lazy("init_cmd")
     init_cmd.init_project(
         init_cmd.InitProjectArgs(
             branch_prefix=branch_prefix,
@@ -458,7 +498,7 @@ def new_command(
     Example:
         $ atelier new ~/code/greenfield
     """
-    new_cmd.new_project(
+    _lazy("new_cmd").new_project(
         SimpleNamespace(
             path=path,
             branch_prefix=branch_prefix,
@@ -507,7 +547,7 @@ def open_command(
     ] = False,
 ) -> None:
     """Open a shell or run a command in a worktree."""
-    open_cmd.open_worktree(
+    _lazy("open_cmd").open_worktree(
         SimpleNamespace(
             workspace_name=workspace_name,
             command=command or [],
@@ -563,7 +603,7 @@ def plan_command(
     ] = False,
 ) -> None:
     """Start a planner session."""
-    plan_cmd.run_planner(
+    _lazy("plan_cmd").run_planner(
         SimpleNamespace(
             epic_id=epic_id,
             reconcile=reconcile,
@@ -586,7 +626,7 @@ def hook_command(
     ] = None,
 ) -> None:
     """Run a hook command for agent integrations."""
-    hook_cmd.run_hook(SimpleNamespace(event=event))
+    _lazy("hook_cmd").run_hook(SimpleNamespace(event=event))
 
 
 @app.command(
@@ -648,6 +688,16 @@ def work_command(
             help="watch polling interval in seconds (default: 60)",
         ),
     ] = None,
+    pool: Annotated[
+        int | None,
+        typer.Option(
+            "--pool",
+            help=(
+                "run N worker sessions in one process with a shared scheduler "
+                "(auto mode, requires --yes)"
+            ),
+        ),
+    ] = None,
     queue: Annotated[
         bool,
         typer.Option(
@@ -693,7 +743,7 @@ def work_command(
         resolved_restart_on_update = True
     elif no_restart_on_update:
         resolved_restart_on_update = False
-    work_cmd.start_worker(
+    _lazy("work_cmd").start_worker(
         SimpleNamespace(
             epic_id=epic_id,
             mode=mode,
@@ -701,6 +751,7 @@ def work_command(
             run_mode=run_mode,
             restart_on_update=resolved_restart_on_update,
             watch_interval=watch_interval,
+            pool=pool,
             queue=queue,
             dry_run=dry_run,
             yes=yes,
@@ -720,7 +771,7 @@ def list_command() -> None:
     Example:
         $ atelier list
     """
-    list_cmd.list_workspaces(SimpleNamespace())
+    _lazy("list_cmd").list_workspaces(SimpleNamespace())
 
 
 @app.command("status", help="Show epics, hooks, and changeset status.")
@@ -735,7 +786,7 @@ def status_command(
     ] = "table",
 ) -> None:
     """Show project status for epics, hooks, and changesets."""
-    status_cmd(SimpleNamespace(format=format))
+    _lazy("status_cmd")(SimpleNamespace(format=format))
 
 
 @app.command(
@@ -767,7 +818,7 @@ def doctor_command(
     ] = False,
 ) -> None:
     """Run migration-health diagnostics and optional prefix-drift repair."""
-    doctor_cmd(SimpleNamespace(format=format, fix=fix, force=force))
+    _lazy("doctor_cmd")(SimpleNamespace(format=format, fix=fix, force=force))
 
 
 @app.command(
@@ -804,15 +855,34 @@ def gc_command(
         bool,
         typer.Option("--yes", help="apply without confirmation"),
     ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="check only changesets changed since the last run's checkpoint",
+        ),
+    ] = False,
+    budget: Annotated[
+        str | None,
+        typer.Option(
+            "--budget",
+            help=(
+                "bound changeset checks per run: a count (200) or duration (90s, 5m); "
+                "implies --incremental"
+            ),
+        ),
+    ] = None,
 ) -> None:
     """Garbage collect stale hooks and orphaned worktrees."""
-    gc_cmd.gc(
+    _lazy("gc_cmd").gc(
         SimpleNamespace(
             stale_hours=stale_hours,
             stale_if_missing_heartbeat=stale_if_missing_heartbeat,
             dry_run=dry_run,
             reconcile=reconcile,
             yes=yes,
+            incremental=incremental,
+            budget=budget,
         )
     )
 
@@ -836,7 +906,7 @@ def repair_event_history_overflow_command(
     ] = "table",
 ) -> None:
     """Repair a Beads issue whose event history overflowed."""
-    repair_event_history_cmd.repair_event_history_overflow(
+    _lazy("repair_event_history_cmd").repair_event_history_overflow(
         SimpleNamespace(issue_id=issue_id, format=format)
     )
 
@@ -877,7 +947,7 @@ def remove_command(
     ] = False,
 ) -> None:
     """Remove Atelier project data for the current repository."""
-    remove_cmd.remove_project(
+    _lazy("remove_cmd").remove_project(
         SimpleNamespace(
             yes=yes,
             dry_run=dry_run,
@@ -908,7 +978,7 @@ def config_command(
     ] = False,
 ) -> None:
     """Show or update Atelier configuration."""
-    config_cmd.show_config(
+    _lazy("config_cmd").show_config(
         SimpleNamespace(
             installed=installed,
             prompt=prompt,
@@ -936,9 +1006,9 @@ def policy_command(
     """Show policy by default; edit with --edit."""
     args = SimpleNamespace(role=role)
     if edit:
-        policy_cmd.edit_policy(args)
+        _lazy("policy_cmd").edit_policy(args)
         return
-    policy_cmd.show_policy(args)
+    _lazy("policy_cmd").show_policy(args)
 
 
 @app.command("edit", help="Open the workspace repo in the work editor.")
@@ -967,7 +1037,7 @@ def edit_command(
     ] = False,
 ) -> None:
     """Open the workspace repo in the configured work editor."""
-    edit_cmd.open_workspace_editor(
+    _lazy("edit_cmd").open_workspace_editor(
         SimpleNamespace(
             workspace_name=workspace_name,
             raw=raw,
@@ -989,7 +1059,8 @@ def main() -> None:
         True
     """
     _ensure_completion_env()
-    app()
+    with command_trace.trace_file_from_env():
+        app()
 
 
 if __name__ == "__main__":
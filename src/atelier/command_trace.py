@@ -0,0 +1,465 @@
+"""Accounting and tracing for external commands.
+
+Commands run through :mod:`atelier.exec` and the async ``bd`` transport are
+reported here while a recorder is active. Each record carries the command
+category (``bd``, ``git``, ``gh``, ``dolt``, or ``other``), wall time, exit
+code, and the caller stage set by :func:`command_stage`. Worker telemetry
+steps set the stage automatically.
+
+Set ``ATELIER_COMMAND_TRACE`` to a file path to record every command of one
+CLI run. Paths ending in ``.jsonl`` get one JSON record per line. Any other
+path gets Chrome trace-event JSON, which ``chrome://tracing`` and Perfetto
+can load.
+
+Independently of recording, every finished ``bd`` command that may write is
+counted per process and per thread. Read caches compare
+:func:`bd_write_count` values to notice that Beads data changed under them.
+:func:`bd_write_hooks` runs callbacks around the calling thread's own ``bd``
+writes, so change watchers can tell them apart from everyone else's.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+TRACE_FILE_ENV = "ATELIER_COMMAND_TRACE"
+_CATEGORIES = frozenset({"bd", "git", "gh", "dolt"})
+_TRACE_ARG_MAX_CHARS = 200
+_RECORDERS: list[CommandRecorder] = []
+_RECORDERS_LOCK = threading.Lock()
+_THREAD_STAGE = threading.local()
+_RECORDING_SCOPES: contextvars.ContextVar[tuple[object, ...]] = contextvars.ContextVar(
+    "atelier_command_recording_scopes", default=()
+)
+_BD_READ_COMMANDS = frozenset(
+    {"blocked", "count", "info", "list", "prime", "ready", "search", "show", "stats", "where"}
+)
+_BD_READ_SUBCOMMANDS = {
+    "comments": frozenset({"list"}),
+    "config": frozenset({"get", "list"}),
+    "dep": frozenset({"list", "tree"}),
+    "dolt": frozenset({"show"}),
+    "label": frozenset({"list", "list-all"}),
+    "slot": frozenset({"show"}),
+    "vc": frozenset({"log", "status"}),
+}
+_BD_VALUE_FLAGS = frozenset({"--actor", "--db"})
+_BD_WRITES_LOCK = threading.Lock()
+_BD_WRITES = [0]
+_THREAD_BD_WRITES = threading.local()
+_THREAD_BD_WRITE_HOOKS = threading.local()
+
+
+@dataclass(frozen=True)
+class CommandRecord:
+    """One finished external command.
+
+    Args:
+        category: Command family derived from the executable name.
+        argv: Command argv as executed.
+        stage: Caller stage active when the command ran, if any.
+        started_ns: Start time in epoch nanoseconds.
+        duration_seconds: Wall-clock duration.
+        returncode: Exit code, or ``None`` when the executable was missing.
+        timed_out: Whether the command hit its timeout.
+        thread_id: Identifier of the thread that ran the command.
+    """
+
+    category: str
+    argv: tuple[str, ...]
+    stage: str | None
+    started_ns: int
+    duration_seconds: float
+    returncode: int | None
+    timed_out: bool = False
+    thread_id: int = 0
+
+    @property
+    def failed(self) -> bool:
+        """Return whether the command was missing, failed, or timed out."""
+        return self.returncode != 0 or self.timed_out
+
+
+@dataclass(frozen=True)
+class BdWriteCount:
+    """Number of finished ``bd`` commands that may have written.
+
+    Args:
+        process: Count across every thread of this process.
+        thread: Count for the calling thread only.
+    """
+
+    process: int
+    thread: int
+
+
+@dataclass(frozen=True)
+class CommandCategorySummary:
+    """Aggregated command statistics for one category."""
+
+    category: str
+    count: int
+    failures: int
+    total_seconds: float
+    max_seconds: float
+
+
+class CommandRecorder:
+    """Thread-safe collector for command records.
+
+    Args:
+        scope: Marker that limits the recorder to commands run in a context
+            carrying it. ``None`` accepts commands from every thread.
+    """
+
+    def __init__(self, *, scope: object | None = None) -> None:
+        self._lock = threading.Lock()
+        self._records: list[CommandRecord] = []
+        self.scope = scope
+
+    def add(self, record: CommandRecord) -> None:
+        """Store one finished command."""
+        with self._lock:
+            self._records.append(record)
+
+    def records(self) -> tuple[CommandRecord, ...]:
+        """Return every recorded command in completion order."""
+        with self._lock:
+            return tuple(self._records)
+
+    def summary(self) -> tuple[CommandCategorySummary, ...]:
+        """Return per-category totals, slowest category first."""
+        grouped: dict[str, list[CommandRecord]] = {}
+        for record in self.records():
+            grouped.setdefault(record.category, []).append(record)
+        summaries = [
+            CommandCategorySummary(
+                category=category,
+                count=len(records),
+                failures=sum(1 for record in records if record.failed),
+                total_seconds=sum(record.duration_seconds for record in records),
+                max_seconds=max(record.duration_seconds for record in records),
+            )
+            for category, records in grouped.items()
+        ]
+        return tuple(sorted(summaries, key=lambda item: (-item.total_seconds, item.category)))
+
+    def write_trace(self, path: Path) -> None:
+        """Write recorded commands as JSONL or Chrome trace-event JSON.
+
+        Args:
+            path: Destination file. A ``.jsonl`` suffix selects JSONL output.
+        """
+        records = self.records()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".jsonl":
+            lines = [json.dumps(_trace_payload(record), sort_keys=True) for record in records]
+            path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+            return
+        pid = os.getpid()
+        events = [
+            {
+                "name": " ".join(_trace_argv(record.argv)[:2]),
+                "cat": record.category,
+                "ph": "X",
+                "ts": record.started_ns // 1_000,
+                "dur": int(record.duration_seconds * 1_000_000),
+                "pid": pid,
+                "tid": record.thread_id,
+                "args": {
+                    "argv": list(_trace_argv(record.argv)),
+                    "returncode": record.returncode,
+                    "stage": record.stage,
+                    "timed_out": record.timed_out,
+                },
+            }
+            for record in records
+        ]
+        path.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, indent=1),
+            encoding="utf-8",
+        )
+
+
+def command_category(argv: Sequence[str]) -> str:
+    """Return the accounting category for a command argv."""
+    if not argv:
+        return "other"
+    name = Path(argv[0]).name
+    return name if name in _CATEGORIES else "other"
+
+
+def bd_command_may_write(argv: Sequence[str]) -> bool:
+    """Return whether a ``bd`` argv may change Beads data.
+
+    Unknown subcommands count as writes, so callers stay conservative.
+
+    Example:
+        >>> bd_command_may_write(("bd", "--db", "/tmp/b.db", "show", "at-1"))
+        False
+        >>> bd_command_may_write(("bd", "update", "at-1", "--status", "closed"))
+        True
+    """
+    words: list[str] = []
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if token == "--readonly":
+            return False
+        if token in _BD_VALUE_FLAGS:
+            next(tokens, None)
+            continue
+        if token.startswith("-"):
+            continue
+        words.append(token)
+        if len(words) == 2:
+            break
+    if not words:
+        return False
+    if words[0] in _BD_READ_COMMANDS:
+        return False
+    readers = _BD_READ_SUBCOMMANDS.get(words[0])
+    return readers is None or len(words) < 2 or words[1] not in readers
+
+
+def bd_write_count() -> BdWriteCount:
+    """Return how many ``bd`` commands that may write have finished."""
+    return BdWriteCount(
+        process=_BD_WRITES[0],
+        thread=getattr(_THREAD_BD_WRITES, "count", 0),
+    )
+
+
+def recording_active() -> bool:
+    """Return whether any recorder is collecting commands."""
+    return bool(_RECORDERS)
+
+
+@contextmanager
+def recording(*, scoped: bool = False) -> Iterator[CommandRecorder]:
+    """Collect external commands while active.
+
+    Recorders may nest or overlap. Each one receives every command that
+    finishes while it is active. A ``scoped`` recorder only receives
+    commands run by the calling thread, or by code running in a copy of its
+    context (``contextvars.copy_context().run``). Pool workers use it to
+    keep each member's summary apart.
+
+    Args:
+        scoped: Whether to ignore commands from unrelated threads.
+
+    Example:
+        >>> with recording() as recorder:
+        ...     record_command(
+        ...         ("git", "status"),
+        ...         started_ns=0,
+        ...         duration_seconds=0.1,
+        ...         returncode=0,
+        ...     )
+        >>> [summary.category for summary in recorder.summary()]
+        ['git']
+    """
+    recorder = CommandRecorder(scope=object() if scoped else None)
+    scope_token = None
+    if recorder.scope is not None:
+        scope_token = _RECORDING_SCOPES.set((*_RECORDING_SCOPES.get(), recorder.scope))
+    with _RECORDERS_LOCK:
+        _RECORDERS.append(recorder)
+    try:
+        yield recorder
+    finally:
+        with _RECORDERS_LOCK:
+            _RECORDERS.remove(recorder)
+        if scope_token is not None:
+            _RECORDING_SCOPES.reset(scope_token)
+
+
+@contextmanager
+def bd_write_hooks(
+    *,
+    before: Callable[[], None],
+    after: Callable[[], None],
+) -> Iterator[None]:
+    """Run callbacks around each ``bd`` write the calling thread runs.
+
+    Only commands that :func:`bd_command_may_write` accepts trigger the
+    hooks, and only on the thread that registered them.
+
+    Args:
+        before: Called just before the command starts.
+        after: Called once the command finished, even when it failed.
+    """
+    hooks = _thread_bd_write_hooks()
+    _THREAD_BD_WRITE_HOOKS.hooks = (*hooks, _BdWriteHook(before=before, after=after))
+    try:
+        yield
+    finally:
+        _THREAD_BD_WRITE_HOOKS.hooks = hooks
+
+
+@contextmanager
+def trace_file_from_env() -> Iterator[None]:
+    """Record commands to the ``ATELIER_COMMAND_TRACE`` file, when set."""
+    target = os.environ.get(TRACE_FILE_ENV, "").strip()
+    if not target:
+        yield
+        return
+    with recording() as recorder:
+        try:
+            yield
+        finally:
+            try:
+                recorder.write_trace(Path(target).expanduser())
+            except OSError:
+                pass
+
+
+def current_stage() -> str | None:
+    """Return the caller stage active on this thread."""
+    stage = getattr(_THREAD_STAGE, "stage", None)
+    return stage if isinstance(stage, str) else None
+
+
+def enter_stage(label: str) -> str | None:
+    """Set the caller stage for this thread and return the previous one.
+
+    Pass the returned value to :func:`exit_stage` when the stage finishes.
+    """
+    previous = current_stage()
+    _THREAD_STAGE.stage = label
+    return previous
+
+
+def exit_stage(label: str, previous: str | None) -> None:
+    """Restore the stage before ``label`` if ``label`` is still current."""
+    if current_stage() == label:
+        _THREAD_STAGE.stage = previous
+
+
+@contextmanager
+def command_stage(label: str) -> Iterator[None]:
+    """Attribute commands run inside the block to ``label``."""
+    previous = enter_stage(label)
+    try:
+        yield
+    finally:
+        exit_stage(label, previous)
+
+
+def record_command(
+    argv: Sequence[str],
+    *,
+    started_ns: int,
+    duration_seconds: float,
+    returncode: int | None,
+    timed_out: bool = False,
+) -> None:
+    """Report one finished command to every active recorder in scope.
+
+    Args:
+        argv: Command argv as executed.
+        started_ns: Start time in epoch nanoseconds.
+        duration_seconds: Wall-clock duration.
+        returncode: Exit code, or ``None`` when the executable was missing.
+        timed_out: Whether the command hit its timeout.
+    """
+    recorders = tuple(_RECORDERS)
+    if not recorders:
+        return
+    record = CommandRecord(
+        category=command_category(argv),
+        argv=tuple(str(token) for token in argv),
+        stage=current_stage(),
+        started_ns=started_ns,
+        duration_seconds=duration_seconds,
+        returncode=returncode,
+        timed_out=timed_out,
+        thread_id=threading.get_ident(),
+    )
+    scopes = _RECORDING_SCOPES.get()
+    for recorder in recorders:
+        if recorder.scope is None or recorder.scope in scopes:
+            recorder.add(record)
+
+
+@contextmanager
+def timed_command(argv: Sequence[str]) -> Iterator[_CommandOutcome]:
+    """Time a command run outside :mod:`atelier.exec` and record it.
+
+    Set ``returncode`` (and ``timed_out``) on the yielded outcome once the
+    command finishes. It is recorded as missing (``None``) when left unset.
+    ``bd`` commands that may write are counted even when nothing records.
+    """
+    outcome = _CommandOutcome()
+    write_hooks = _write_hooks_for(argv)
+    for hook in write_hooks:
+        hook.before()
+    recording = bool(_RECORDERS)
+    started_ns = time.time_ns() if recording else 0
+    started = time.perf_counter() if recording else 0.0
+    try:
+        yield outcome
+    finally:
+        _count_bd_write(argv)
+        for hook in reversed(write_hooks):
+            hook.after()
+        if recording:
+            record_command(
+                argv,
+                started_ns=started_ns,
+                duration_seconds=time.perf_counter() - started,
+                returncode=outcome.returncode,
+                timed_out=outcome.timed_out,
+            )
+
+
+@dataclass
+class _CommandOutcome:
+    returncode: int | None = None
+    timed_out: bool = False
+
+
+@dataclass(frozen=True)
+class _BdWriteHook:
+    before: Callable[[], None]
+    after: Callable[[], None]
+
+
+def _thread_bd_write_hooks() -> tuple[_BdWriteHook, ...]:
+    hooks = getattr(_THREAD_BD_WRITE_HOOKS, "hooks", ())
+    return hooks if isinstance(hooks, tuple) else ()
+
+
+def _write_hooks_for(argv: Sequence[str]) -> tuple[_BdWriteHook, ...]:
+    hooks = _thread_bd_write_hooks()
+    if not hooks or command_category(argv) != "bd" or not bd_command_may_write(argv):
+        return ()
+    return hooks
+
+
+def _count_bd_write(argv: Sequence[str]) -> None:
+    if command_category(argv) != "bd" or not bd_command_may_write(argv):
+        return
+    with _BD_WRITES_LOCK:
+        _BD_WRITES[0] += 1
+    _THREAD_BD_WRITES.count = getattr(_THREAD_BD_WRITES, "count", 0) + 1
+
+
+def _trace_argv(argv: Sequence[str]) -> tuple[str, ...]:
+    return tuple(
+        token if len(token) <= _TRACE_ARG_MAX_CHARS else f"{token[:_TRACE_ARG_MAX_CHARS]}..."
+        for token in argv
+    )
+
+
+def _trace_payload(record: CommandRecord) -> dict[str, object]:
+    payload = asdict(record)
+    payload["argv"] = list(_trace_argv(record.argv))
+    return payload
@@ -1,16 +1,63 @@
-"""Command implementations exposed by the Atelier CLI."""
-
-from .config import show_config
-from .doctor import doctor
-from .init import InitProjectArgs, init_project
-from .list import list_workspaces
-from .new import new_project
-from .open import open_worktree
-from .plan import run_planner
-from .policy import edit_policy
-from .repair_event_history import repair_event_history_overflow
-from .status import status
-from .work import start_worker
+"""Command implementations exposed by the Atelier CLI.
+
+Exports resolve on first access so importing one command module does not
+import every other command's dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import show_config
+    from .doctor import doctor
+    from .init import InitProjectArgs, init_project
+    from .list import list_workspaces
+    from .new import new_project
+    from .open import open_worktree
+    from .plan import run_planner
+    from .policy import edit_policy
+    from .repair_event_history import repair_event_history_overflow
+    from .status import status
+    from .work import start_worker
+
+_EXPORTS: dict[str, str] = {
+    "InitProjectArgs": ".init",
+    "doctor": ".doctor",
+    "edit_policy": ".policy",
+    "init_project": ".init",
+    "list_workspaces": ".list",
+    "new_project": ".new",
+    "open_worktree": ".open",
+    "repair_event_history_overflow": ".repair_event_history",
+    "run_planner": ".plan",
+    "show_config": ".config",
+    "start_worker": ".work",
+    "status": ".status",
+}
+
+
+class _CommandsModule(types.ModuleType):
+    def __setattr__(self, name: str, value: object) -> None:
+        # Importing ``atelier.commands.status`` binds the submodule over the
+        # ``status`` export of the same name; keep exporting the function.
+        if isinstance(value, types.ModuleType) and _EXPORTS.get(name) == f".{name}":
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
+
+
+sys.modules[__name__].__class__ = _CommandsModule
+
 
 __all__ = [
     "InitProjectArgs",
@@ -20,6 +20,7 @@ from .. import (
     config,
     lifecycle,
     prefix_migration_drift,
+    process_table,
     prs,
     worktrees,
 )
@@ -137,6 +138,12 @@ class _DoctorContext:
 
 def doctor(args: object) -> None:
     """Run project health diagnostics with optional prefix-drift repair."""
+    # Hook-blocker and runtime liveness checks share one process table.
+    with process_table.process_table_session():
+        _doctor(args)
+
+
+def _doctor(args: object) -> None:
     format_value = str(getattr(args, "format", "table") or "table").lower()
     if format_value not in _FORMATS:
         die(f"unsupported format: {format_value}")
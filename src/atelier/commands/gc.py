@@ -2,23 +2,36 @@
 
 from __future__ import annotations
 
-from .. import beads, config
+import datetime as dt
+from pathlib import Path
+
+from .. import beads, config, git, process_table
 from ..gc import GcAction
 from ..gc import agents as gc_agents
 from ..gc import hooks as gc_hooks
+from ..gc import incremental as gc_incremental
 from ..gc import labels as gc_labels
 from ..gc import messages as gc_messages
 from ..gc import reconcile as gc_reconcile
 from ..gc import worktrees as gc_worktrees
 from ..gc.common import log_debug
-from ..io import confirm, say, warn
+from ..io import confirm, die, say, warn
+from ..worker.models_boundary import issue_boundary_session
 from . import work as work_cmd
-from .resolve import resolve_current_project_with_repo_root
+from .resolve import enable_pr_lookup_cache, resolve_current_project_with_repo_root
 
 
 def gc(args: object) -> None:
     """Garbage collect stale hooks and orphaned worktrees."""
+    # Agent liveness checks across every collector share one process table,
+    # and issue payloads re-read by several collectors are validated once.
+    with process_table.process_table_session(), issue_boundary_session():
+        _gc(args)
+
+
+def _gc(args: object) -> None:
     project_root, project_config, _enlistment, repo_root = resolve_current_project_with_repo_root()
+    enable_pr_lookup_cache(project_root, project_config)
     project_data_dir = config.resolve_project_data_dir(project_root, project_config)
     beads_root = config.resolve_beads_root(project_data_dir, repo_root)
     beads.run_bd_command(["prime"], beads_root=beads_root, cwd=repo_root)
@@ -36,10 +49,19 @@ def gc(args: object) -> None:
     yes = bool(getattr(args, "yes", False))
     reconcile = bool(getattr(args, "reconcile", False))
     include_missing_heartbeat = bool(getattr(args, "stale_if_missing_heartbeat", False))
+    budget_value = getattr(args, "budget", None)
+    budget = None
+    if budget_value is not None:
+        try:
+            budget = gc_incremental.parse_budget(str(budget_value))
+        except ValueError as exc:
+            die(str(exc))
+    incremental = bool(getattr(args, "incremental", False)) or budget is not None
     log_debug(
         "gc start "
         f"dry_run={dry_run} yes={yes} reconcile={reconcile} "
-        f"stale_hours={stale_hours} include_missing_heartbeat={include_missing_heartbeat}"
+        f"stale_hours={stale_hours} include_missing_heartbeat={include_missing_heartbeat} "
+        f"incremental={incremental} budget={budget_value}"
     )
 
     if reconcile:
@@ -170,11 +192,35 @@ def gc(args: object) -> None:
                 f"reconciled={total_reconciled} failed={total_failed}"
             )
 
+    # Incremental runs check changed and still-pending changesets, and limit
+    # the label and epic status migrations to changed issues. Worktree
+    # mapping resolution and the clock-driven collectors always run in full.
+    checkpoint = None
+    changesets = None
+    changed = None
+    scan_started = dt.datetime.now(tz=dt.timezone.utc)
+    if incremental:
+        checkpoint = gc_incremental.load_checkpoint(project_data_dir)
+        changed = gc_incremental.changed_issues(
+            checkpoint,
+            beads_root=beads_root,
+            repo_root=repo_root,
+            now=scan_started,
+        )
+        changesets = gc_incremental.changeset_candidates(
+            checkpoint,
+            beads_root=beads_root,
+            repo_root=repo_root,
+            now=scan_started,
+            changed=changed,
+        )
+
     actions: list[GcAction] = []
     actions.extend(
         gc_labels.collect_normalize_changeset_labels(
             beads_root=beads_root,
             repo_root=repo_root,
+            issues=changesets,
         )
     )
     for label_name, detail in [
@@ -190,6 +236,7 @@ def gc(args: object) -> None:
                 detail=detail,
                 beads_root=beads_root,
                 repo_root=repo_root,
+                issues=changed,
             )
         )
     for label, detail in [
@@ -204,12 +251,14 @@ def gc(args: object) -> None:
                 detail=detail,
                 beads_root=beads_root,
                 repo_root=repo_root,
+                issues=changed,
             )
         )
     actions.extend(
         gc_labels.collect_normalize_epic_labels(
             beads_root=beads_root,
             repo_root=repo_root,
+            issues=changed,
         )
     )
     actions.extend(
@@ -226,33 +275,40 @@ def gc(args: object) -> None:
             include_missing_heartbeat=include_missing_heartbeat,
         )
     )
-    actions.extend(
-        gc_worktrees.collect_orphan_worktrees(
-            project_dir=project_data_dir,
-            beads_root=beads_root,
-            repo_root=repo_root,
-            git_path=config.resolve_git_path(project_config),
-            assume_yes=yes,
+    git_path = config.resolve_git_path(project_config)
+    # Branch integration checks share one target-tip reachability index, and
+    # both mapping collectors share one epic lookup index.
+    with git.git_query_session(repo_root, git_path=git_path), gc_worktrees.mapping_lookup_session():
+        actions.extend(
+            gc_worktrees.collect_orphan_worktrees(
+                project_dir=project_data_dir,
+                beads_root=beads_root,
+                repo_root=repo_root,
+                git_path=git_path,
+                assume_yes=yes,
+            )
         )
-    )
-    actions.extend(
-        gc_worktrees.collect_resolved_epic_artifacts(
-            project_dir=project_data_dir,
-            beads_root=beads_root,
-            repo_root=repo_root,
-            git_path=config.resolve_git_path(project_config),
-            assume_yes=yes,
+        actions.extend(
+            gc_worktrees.collect_resolved_epic_artifacts(
+                project_dir=project_data_dir,
+                beads_root=beads_root,
+                repo_root=repo_root,
+                git_path=git_path,
+                assume_yes=yes,
+            )
         )
-    )
-    actions.extend(
-        gc_worktrees.collect_closed_workspace_branches_without_mapping(
-            project_dir=project_data_dir,
-            beads_root=beads_root,
-            repo_root=repo_root,
-            git_path=config.resolve_git_path(project_config),
-            dry_run=dry_run,
+        actions.extend(
+            gc_worktrees.collect_closed_workspace_branches_without_mapping(
+                project_dir=project_data_dir,
+                beads_root=beads_root,
+                repo_root=repo_root,
+                git_path=git_path,
+                dry_run=dry_run,
+                issues=changesets,
+                checkpoint=checkpoint,
+                budget=budget,
+            )
         )
-    )
     actions.extend(
         gc_messages.collect_message_claims(
             beads_root=beads_root,
@@ -277,29 +333,84 @@ def gc(args: object) -> None:
     if not actions:
         say("No GC actions needed.")
         log_debug("gc no actions")
+        if checkpoint is not None and not dry_run:
+            checkpoint.scanned_at = scan_started
+            gc_incremental.save_checkpoint(project_data_dir, checkpoint)
         return
 
-    for action in actions:
-        log_debug(f"gc action queued description={action.description}")
-        say(f"GC action: {action.description}")
-        for detail in action.details:
-            say(f"- {detail}")
-        if dry_run:
-            prefix = "Report" if action.report_only else "Would"
-            say(f"{prefix}: {action.description}")
-            log_mode = "report-only" if action.report_only else "dry-run"
-            log_debug(f"gc action {log_mode} description={action.description}")
-            continue
-        if action.report_only:
-            say(f"Skipped: {action.description}")
-            log_debug(f"gc action report-only description={action.description}")
-            continue
-        if yes or confirm(f"{action.description}?", default=False):
+    skipped = _apply_actions(
+        actions,
+        dry_run=dry_run,
+        yes=yes,
+        beads_root=beads_root,
+        repo_root=repo_root,
+    )
+    if checkpoint is not None and not dry_run:
+        # Declined actions are offered again: keep the old cursor so the next
+        # run rescans the same window.
+        if not skipped:
+            checkpoint.scanned_at = scan_started
+        gc_incremental.save_checkpoint(project_data_dir, checkpoint)
+
+
+def _apply_actions(
+    actions: list[GcAction],
+    *,
+    dry_run: bool,
+    yes: bool,
+    beads_root: Path,
+    repo_root: Path,
+) -> bool:
+    """Run GC actions and return whether the user declined any of them.
+
+    Label and status normalizations queue on an update batch and are applied
+    as grouped ``bd update`` calls. Queued updates are flushed before any
+    action that writes directly, so later writes are never overwritten.
+    """
+    skipped = False
+    queued: list[GcAction] = []
+    with beads.issue_update_batch(beads_root=beads_root, cwd=repo_root) as update_batch:
+        for action in actions:
+            log_debug(f"gc action queued description={action.description}")
+            say(f"GC action: {action.description}")
+            for detail in action.details:
+                say(f"- {detail}")
+            if dry_run:
+                prefix = "Report" if action.report_only else "Would"
+                say(f"{prefix}: {action.description}")
+                log_mode = "report-only" if action.report_only else "dry-run"
+                log_debug(f"gc action {log_mode} description={action.description}")
+                continue
+            if action.report_only:
+                say(f"Skipped: {action.description}")
+                log_debug(f"gc action report-only description={action.description}")
+                continue
+            if not (yes or confirm(f"{action.description}?", default=False)):
+                skipped = True
+                say(f"Skipped: {action.description}")
+                log_debug(f"gc action skipped description={action.description}")
+                continue
+            if not action.queues_issue_updates:
+                _flush_queued_actions(update_batch, queued)
             say(f"Running: {action.description}")
             log_debug(f"gc action run description={action.description}")
             action.apply()
+            if action.queues_issue_updates:
+                queued.append(action)
+                continue
             say(f"Done: {action.description}")
             log_debug(f"gc action done description={action.description}")
-        else:
-            say(f"Skipped: {action.description}")
-            log_debug(f"gc action skipped description={action.description}")
+        _flush_queued_actions(update_batch, queued)
+    return skipped
+
+
+def _flush_queued_actions(update_batch: beads.IssueUpdateBatch, queued: list[GcAction]) -> None:
+    """Apply queued updates, exiting on the first rejected one."""
+    for failure in update_batch.flush():
+        if not failure.ok:
+            log_debug(f"gc batched update failed issue={failure.issue_id}")
+            die(f"GC update failed for {failure.issue_id}: {failure.detail or 'bd update failed'}")
+    for action in queued:
+        say(f"Done: {action.description}")
+        log_debug(f"gc action done description={action.description}")
+    queued.clear()
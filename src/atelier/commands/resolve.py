@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .. import config, git, paths
+from .. import config, git, paths, prs
 from ..io import die
 
 
@@ -23,6 +23,12 @@ def resolve_project_for_enlistment(
     return project_root, config_payload, enlistment_path
 
 
+def enable_pr_lookup_cache(project_root: Path, project_config: config.ProjectConfig) -> None:
+    """Share GitHub PR lookups with other Atelier processes of this project."""
+    project_data_dir = config.resolve_project_data_dir(project_root, project_config)
+    prs.use_persistent_cache(paths.project_pr_cache_path(project_data_dir))
+
+
 def resolve_current_project() -> tuple[Path, config.ProjectConfig, str]:
     """Resolve the current project from the working directory."""
     cwd = Path.cwd()
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import os
 from pathlib import Path
-from typing import Mapping
+from typing import Iterable, Mapping
 
 from rich import box
 from rich.console import Console
@@ -13,6 +14,7 @@ from rich.table import Table
 
 from .. import (
     beads,
+    changeset_fields,
     config,
     git,
     lifecycle,
@@ -21,10 +23,12 @@ from .. import (
     prs,
     worktrees,
 )
+from .. import log as atelier_log
 from ..io import die, say
 from ..worker import selection as worker_selection
 from ..worker.finalization import pr_gate as worker_pr_gate
-from .resolve import resolve_current_project_with_repo_root
+from ..worker.models_boundary import issue_boundary_session
+from .resolve import enable_pr_lookup_cache, resolve_current_project_with_repo_root
 
 _FORMATS = {"table", "json"}
 
@@ -34,20 +38,23 @@ def status(args: object) -> None:
     format_value = str(getattr(args, "format", "table") or "table").lower()
     if format_value not in _FORMATS:
         die(f"unsupported format: {format_value}")
+    # Every status section re-reads the same issue payloads.
+    with issue_boundary_session():
+        _status(format_value=format_value)
 
+
+def _status(*, format_value: str) -> None:
     project_root, project_config, _enlistment, repo_root = resolve_current_project_with_repo_root()
+    enable_pr_lookup_cache(project_root, project_config)
     project_data_dir = config.resolve_project_data_dir(project_root, project_config)
     beads_root = config.resolve_beads_root(project_data_dir, repo_root)
     git_path = config.resolve_git_path(project_config)
 
     beads.run_bd_command(["prime"], beads_root=beads_root, cwd=repo_root)
 
-    epic_issues = beads.list_epics(beads_root=beads_root, cwd=repo_root, include_closed=True)
-    agent_issues = beads.run_bd_json(
-        ["list", "--label", beads.issue_label("agent", beads_root=beads_root)],
-        beads_root=beads_root,
-        cwd=repo_root,
-    )
+    snapshot = beads.load_issue_snapshot(beads_root=beads_root, cwd=repo_root)
+    epic_issues = snapshot.epics()
+    agent_issues = snapshot.labeled("agent")
 
     agents, hook_map, agent_index = _build_agent_payloads(
         agent_issues, beads_root=beads_root, repo_root=repo_root
@@ -56,6 +63,7 @@ def status(args: object) -> None:
     repo_slug = prs.github_repo_slug(origin)
     epics = _build_epic_payloads(
         epic_issues,
+        snapshot=snapshot,
         hook_map=hook_map,
         project_data_dir=project_data_dir,
         beads_root=beads_root,
@@ -63,17 +71,16 @@ def status(args: object) -> None:
         repo_slug=repo_slug,
         agent_index=agent_index,
     )
-    queues = _build_queue_payloads(
-        beads_root=beads_root,
-        repo_root=repo_root,
-    )
-    drift_report = prefix_migration_drift.scan_prefix_migration_drift(
-        project_data_dir=project_data_dir,
-        beads_root=beads_root,
-        repo_root=repo_root,
-        repo_slug=repo_slug,
-        git_path=git_path,
-    )
+    queues = _build_queue_payloads(snapshot)
+    with git.git_query_session(repo_root, git_path=git_path):
+        drift_report = prefix_migration_drift.scan_prefix_migration_drift(
+            project_data_dir=project_data_dir,
+            beads_root=beads_root,
+            repo_root=repo_root,
+            repo_slug=repo_slug,
+            git_path=git_path,
+            issue_snapshot=snapshot,
+        )
 
     epics = sorted(
         epics,
@@ -173,6 +180,7 @@ def _build_agent_payloads(
 def _build_epic_payloads(
     issues: list[dict[str, object]],
     *,
+    snapshot: beads.IssueSnapshot,
     hook_map: dict[str, list[str]],
     project_data_dir: Path,
     beads_root: Path,
@@ -181,15 +189,37 @@ def _build_epic_payloads(
     agent_index: dict[str, dict[str, object]],
 ) -> list[dict[str, object]]:
     payloads: list[dict[str, object]] = []
+    epics: list[tuple[str, dict[str, object], worktrees.WorktreeMapping | None]] = []
+    changesets_by_epic: dict[str, list[dict[str, object]]] = {}
     for issue in issues:
         epic_id = issue.get("id")
         if not isinstance(epic_id, str) or not epic_id:
             continue
+        mapping = worktrees.load_mapping(worktrees.mapping_path(project_data_dir, epic_id))
+        epics.append((epic_id, issue, mapping))
+        changesets_by_epic[epic_id] = snapshot.changesets_for_epic(issue)
+    pr_lookups = _PrPayloadLookups()
+    if repo_slug:
+        mapped_branches = (
+            branch
+            for epic_id, _issue, mapping in epics
+            if mapping is not None
+            for changeset in changesets_by_epic[epic_id]
+            if (branch := mapping.changesets.get(str(changeset.get("id") or "")))
+        )
+        # The PR gate resolves dependency and sibling lifecycles through
+        # ``changeset.work_branch``, so warm those heads in the same batch.
+        work_branches = (
+            branch for issue in snapshot.issues if (branch := changeset_fields.work_branch(issue))
+        )
+        pr_lookups.prefetch(
+            (repo_slug, branch) for branch in itertools.chain(mapped_branches, work_branches)
+        )
+    for epic_id, issue, mapping in epics:
         description = issue.get("description")
         fields = beads.parse_description_fields(description if isinstance(description, str) else "")
         labels = _issue_labels(issue)
         root_branch = beads.extract_workspace_root_branch(issue) or None
-        mapping = worktrees.load_mapping(worktrees.mapping_path(project_data_dir, epic_id))
         worktree_relpath = beads.extract_worktree_path(issue)
         if not worktree_relpath and mapping:
             worktree_relpath = mapping.worktree_path
@@ -199,17 +229,17 @@ def _build_epic_payloads(
             worktree_path = (
                 str(candidate) if candidate.is_absolute() else str(project_data_dir / candidate)
             )
-        changesets = _list_changesets(epic_id, beads_root=beads_root, repo_root=repo_root)
+        changesets = changesets_by_epic[epic_id]
         changeset_details = _build_changeset_details(
             changesets,
             mapping=mapping,
             beads_root=beads_root,
             repo_root=repo_root,
             repo_slug=repo_slug,
+            pr_lookups=pr_lookups,
+            snapshot=snapshot,
         )
-        ready_changesets = _list_ready_changesets(
-            epic_id, beads_root=beads_root, repo_root=repo_root
-        )
+        ready_changesets = snapshot.ready_descendants(epic_id)
         summary = beads.summarize_changesets(changesets, ready=ready_changesets)
         changeset_counts = summary.as_dict()
         assignee = _normalize_assignee(issue.get("assignee"))
@@ -255,36 +285,20 @@ def _build_changeset_details(
     beads_root: Path,
     repo_root: Path,
     repo_slug: str | None,
+    pr_lookups: _PrPayloadLookups | None = None,
+    snapshot: beads.IssueSnapshot | None = None,
 ) -> list[dict[str, object]]:
     details: list[dict[str, object]] = []
     changesets_by_id: dict[str, dict[str, object]] = {}
-    payload_by_repo_branch: dict[tuple[str, str], dict[str, object] | None] = {}
-    payload_errors_by_repo_branch: dict[tuple[str, str], str | None] = {}
+    lookups = pr_lookups if pr_lookups is not None else _PrPayloadLookups()
+    lookup_pr_payload = lookups.payload
+    lookup_pr_payload_diagnostic = lookups.diagnostic
 
-    def lookup_pr_payload(branch_repo_slug: str | None, branch: str) -> dict[str, object] | None:
-        if not branch_repo_slug:
-            return None
-        cache_key = (branch_repo_slug, branch)
-        if cache_key in payload_by_repo_branch:
-            return payload_by_repo_branch[cache_key]
-        lookup = prs.lookup_github_pr_status(branch_repo_slug, branch)
-        payload = lookup.payload if lookup.found else None
-        error: str | None = None
-        if lookup.failed:
-            error = lookup.error or "unknown gh error"
-            if error.startswith("missing required command: gh"):
-                error = None
-        payload_by_repo_branch[cache_key] = payload
-        payload_errors_by_repo_branch[cache_key] = error
-        return payload
-
-    def lookup_pr_payload_diagnostic(
-        branch_repo_slug: str | None, branch: str
-    ) -> tuple[dict[str, object] | None, str | None]:
-        if not branch_repo_slug:
-            return None, None
-        payload = lookup_pr_payload(branch_repo_slug, branch)
-        return payload, payload_errors_by_repo_branch.get((branch_repo_slug, branch))
+    def lookup_dependency_issue(issue_id: str) -> dict[str, object] | None:
+        issue = changesets_by_id.get(issue_id)
+        if issue is None and snapshot is not None:
+            issue = snapshot.issue(issue_id)
+        return issue
 
     for issue in changesets:
         issue_id = issue.get("id")
@@ -337,7 +351,12 @@ def _build_changeset_details(
             beads_root=beads_root,
             lookup_pr_payload=lookup_pr_payload,
             lookup_pr_payload_diagnostic=lookup_pr_payload_diagnostic,
-            lookup_dependency_issue=changesets_by_id.get,
+            lookup_dependency_issue=lookup_dependency_issue,
+            list_epic_changesets=(snapshot.descendant_changesets if snapshot is not None else None),
+            prefetch_pr_payloads=lookups.prefetch_branches,
+            # Status reports the gate reason per changeset; keep the worker's
+            # operator log line out of its output.
+            log_blocked=atelier_log.debug,
         )
         detail["pr_allowed"] = decision.allow_pr
         detail["pr_gate_reason"] = decision.reason
@@ -349,6 +368,54 @@ def _build_changeset_details(
     return details
 
 
+class _PrPayloadLookups:
+    """Share PR lookups across every changeset rendered by one status call."""
+
+    def __init__(self) -> None:
+        self._payloads: dict[tuple[str, str], dict[str, object] | None] = {}
+        self._errors: dict[tuple[str, str], str | None] = {}
+
+    def prefetch(self, keys: Iterable[tuple[str, str]]) -> None:
+        """Resolve uncached ``(repo_slug, branch)`` lookups, batched by repo."""
+        pending: dict[str, list[str]] = {}
+        for repo_slug, branch in dict.fromkeys(keys):
+            if (repo_slug, branch) not in self._payloads:
+                pending.setdefault(repo_slug, []).append(branch)
+        for repo_slug, branches in pending.items():
+            lookups = prs.lookup_github_pr_statuses(repo_slug, branches)
+            for branch in branches:
+                self._record((repo_slug, branch), lookups[branch])
+
+    def prefetch_branches(self, repo_slug: str, branches: list[str]) -> None:
+        """Resolve uncached branches for one repo in a single batch."""
+        self.prefetch((repo_slug, branch) for branch in branches)
+
+    def payload(self, repo_slug: str | None, branch: str) -> dict[str, object] | None:
+        if not repo_slug:
+            return None
+        cache_key = (repo_slug, branch)
+        if cache_key not in self._payloads:
+            self._record(cache_key, prs.lookup_github_pr_status(repo_slug, branch))
+        return self._payloads[cache_key]
+
+    def diagnostic(
+        self, repo_slug: str | None, branch: str
+    ) -> tuple[dict[str, object] | None, str | None]:
+        if not repo_slug:
+            return None, None
+        payload = self.payload(repo_slug, branch)
+        return payload, self._errors.get((repo_slug, branch))
+
+    def _record(self, cache_key: tuple[str, str], lookup: prs.GithubPrLookup) -> None:
+        error: str | None = None
+        if lookup.failed:
+            error = lookup.error or "unknown gh error"
+            if error.startswith("missing required command: gh"):
+                error = None
+        self._payloads[cache_key] = lookup.payload if lookup.found else None
+        self._errors[cache_key] = error
+
+
 def _summarize_pr(payload: dict[str, object] | None) -> dict[str, object] | None:
     if not payload:
         return None
@@ -364,36 +431,6 @@ def _summarize_pr(payload: dict[str, object] | None) -> dict[str, object] | None
     }
 
 
-def _list_changesets(epic_id: str, *, beads_root: Path, repo_root: Path) -> list[dict[str, object]]:
-    descendants = beads.list_descendant_changesets(
-        epic_id,
-        beads_root=beads_root,
-        cwd=repo_root,
-        include_closed=True,
-    )
-    if not descendants:
-        work_children = beads.list_work_children(
-            epic_id,
-            beads_root=beads_root,
-            cwd=repo_root,
-            include_closed=True,
-        )
-        if not work_children:
-            epic_issues = beads.run_bd_json(["show", epic_id], beads_root=beads_root, cwd=repo_root)
-            return epic_issues if epic_issues else []
-    return descendants
-
-
-def _list_ready_changesets(
-    epic_id: str, *, beads_root: Path, repo_root: Path
-) -> list[dict[str, object]]:
-    return beads.run_bd_json(
-        ["ready", "--parent", epic_id],
-        beads_root=beads_root,
-        cwd=repo_root,
-    )
-
-
 def _normalize_assignee(value: object) -> str | None:
     if isinstance(value, str):
         return value or None
@@ -522,12 +559,8 @@ def _status_counts(
     }
 
 
-def _build_queue_payloads(*, beads_root: Path, repo_root: Path) -> list[dict[str, object]]:
-    issues = beads.run_bd_json(
-        ["list", "--label", beads.issue_label("message", beads_root=beads_root)],
-        beads_root=beads_root,
-        cwd=repo_root,
-    )
+def _build_queue_payloads(snapshot: beads.IssueSnapshot) -> list[dict[str, object]]:
+    issues = snapshot.labeled("message")
     queues: dict[str, dict[str, int]] = {}
     for issue in issues:
         description = issue.get("description")
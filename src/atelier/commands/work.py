@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
+import copy
+import functools
 import time
+from collections.abc import Callable
 from pathlib import Path
 
-from .. import agent_home, agent_teardown, beads, cli_defaults, config
+from .. import agent_home, agent_teardown, beads, cli_defaults, command_trace, config, hooks
 from ..io import confirm, die, say
 from ..worker import models as worker_models
+from ..worker import pool as worker_pool
 from ..worker import restart_runtime as worker_restart_runtime
 from ..worker import runtime as worker_runtime
+from ..worker import telemetry as worker_telemetry
+from ..worker import watch as worker_watch
 from ..worker.context import WorkerRunContext
 from ..worker.session import runner as worker_session_runner
 from ..worker.work_command_helpers import (
@@ -22,9 +29,11 @@ from ..worker.work_command_helpers import (
     report_translated_cli_default,
     report_worker_summary,
     root_branch,
+    trace_enabled,
     watch_interval_seconds,
+    worker_pool_size,
 )
-from .resolve import resolve_current_project_with_repo_root
+from .resolve import enable_pr_lookup_cache, resolve_current_project_with_repo_root
 
 __all__ = [
     "ReconcileResult",
@@ -37,32 +46,96 @@ __all__ = [
 ReconcileResult = worker_models.ReconcileResult
 
 
+def _resolve_worker_project() -> tuple[Path, config.ProjectConfig, str, Path]:
+    # Worker ticks share PR lookups with other workers and `atelier status`.
+    project_root, project_config, enlistment, repo_root = resolve_current_project_with_repo_root()
+    enable_pr_lookup_cache(project_root, project_config)
+    return project_root, project_config, enlistment, repo_root
+
+
 def _run_worker_once(
-    args: object, *, mode: str, dry_run: bool, session_key: str
+    args: object,
+    *,
+    mode: str,
+    dry_run: bool,
+    session_key: str,
+    scheduler: worker_pool.WorkerPoolScheduler | None = None,
+    emit: Callable[[str], None] = say,
 ) -> worker_models.WorkerRunSummary:
     """Start a single worker session by selecting an epic and changeset."""
+    if not trace_enabled():
+        return _run_worker_session(
+            args,
+            mode=mode,
+            dry_run=dry_run,
+            session_key=session_key,
+            scheduler=scheduler,
+            emit=emit,
+        )
+    # Trace mode also accounts for every bd/git/gh command the session ran.
+    # The recorder is scoped so pool members do not count each other's calls.
+    with command_trace.recording(scoped=True) as recorder:
+        try:
+            return _run_worker_session(
+                args,
+                mode=mode,
+                dry_run=dry_run,
+                session_key=session_key,
+                scheduler=scheduler,
+                emit=emit,
+            )
+        finally:
+            worker_telemetry.report_command_summary(recorder.summary(), say=emit)
+
+
+def _run_worker_session(
+    args: object,
+    *,
+    mode: str,
+    dry_run: bool,
+    session_key: str,
+    scheduler: worker_pool.WorkerPoolScheduler | None,
+    emit: Callable[[str], None],
+) -> worker_models.WorkerRunSummary:
     runner_deps = worker_runtime.build_worker_runtime_dependencies(
-        resolve_current_project_with_repo_root=resolve_current_project_with_repo_root,
+        resolve_current_project_with_repo_root=_resolve_worker_project,
         confirm_fn=confirm,
         die_fn=die,
-        emit=say,
-    )
-    return worker_session_runner.run_worker_once(
-        args,
-        run_context=WorkerRunContext(mode=mode, dry_run=dry_run, session_key=session_key),
-        deps=runner_deps,
+        emit=emit,
     )
+    if scheduler is None:
+        return worker_session_runner.run_worker_once(
+            args,
+            run_context=WorkerRunContext(mode=mode, dry_run=dry_run, session_key=session_key),
+            deps=runner_deps,
+        )
+    try:
+        return worker_session_runner.run_worker_once(
+            args,
+            run_context=WorkerRunContext(mode=mode, dry_run=dry_run, session_key=session_key),
+            deps=worker_pool.pool_member_dependencies(
+                runner_deps, scheduler=scheduler, member=session_key
+            ),
+        )
+    finally:
+        scheduler.release(session_key)
 
 
 def start_worker(args: object) -> None:
     """Start worker sessions based on the configured run mode."""
     yes_default = cli_defaults.resolve_work_yes_default(bool(getattr(args, "yes", False)))
     report_translated_cli_default(yes_default)
+    pool_size = worker_pool_size(getattr(args, "pool", None))
     setattr(args, "yes", yes_default.value)
     setattr(args, "startup_runtime", worker_restart_runtime.capture_worker_startup_runtime())
     mode = normalize_mode(getattr(args, "mode", None))
     run_mode = normalize_run_mode(getattr(args, "run_mode", None))
     explicit_restart_on_update = getattr(args, "restart_on_update", None)
+    if pool_size is not None:
+        _validate_pool_args(args, mode=mode, explicit_restart_on_update=explicit_restart_on_update)
+        # Relaunching re-execs the whole process, which would kill every
+        # other member's session.
+        explicit_restart_on_update = False
     restart_on_update = (
         bool(explicit_restart_on_update)
         if explicit_restart_on_update is not None
@@ -71,6 +144,58 @@ def start_worker(args: object) -> None:
     setattr(args, "restart_on_update", restart_on_update)
     watch_interval = watch_interval_seconds(getattr(args, "watch_interval", None))
     dry_run = bool(getattr(args, "dry_run", False))
+    if pool_size is None:
+        _run_worker_member(
+            args, mode=mode, run_mode=run_mode, watch_interval=watch_interval, dry_run=dry_run
+        )
+        return
+
+    def run_member(index: int, scheduler: worker_pool.WorkerPoolScheduler) -> None:
+        label = f"[worker {index}/{pool_size}]"
+        _run_worker_member(
+            copy.copy(args),
+            mode=mode,
+            run_mode=run_mode,
+            watch_interval=watch_interval,
+            dry_run=dry_run,
+            scheduler=scheduler,
+            emit=lambda message: say(f"{label} {message}"),
+        )
+
+    say(f"Starting worker pool with {pool_size} members.")
+    result = worker_pool.run_worker_pool(pool_size, run_member=run_member)
+    if not result.success:
+        failed = ", ".join(str(index) for index in result.failed_members)
+        die(f"worker pool members failed: {failed}")
+
+
+def _validate_pool_args(
+    args: object, *, mode: str, explicit_restart_on_update: object | None
+) -> None:
+    if mode != "auto":
+        die("--pool requires --mode auto")
+    if getattr(args, "queue", False):
+        die("--pool cannot be combined with --queue")
+    epic_id = getattr(args, "epic_id", None)
+    if isinstance(epic_id, str) and epic_id.strip():
+        die("--pool cannot be combined with an explicit epic id")
+    if explicit_restart_on_update:
+        die("--pool cannot be combined with --restart-on-update")
+    # Pool members share one terminal, so they cannot answer prompts.
+    if not getattr(args, "yes", False):
+        die("--pool requires --yes (pool members cannot answer prompts)")
+
+
+def _run_worker_member(
+    args: object,
+    *,
+    mode: str,
+    run_mode: str,
+    watch_interval: int,
+    dry_run: bool,
+    scheduler: worker_pool.WorkerPoolScheduler | None = None,
+    emit: Callable[[str], None] = say,
+) -> None:
     session_key = agent_home.generate_session_key()
     cleanup_agent: agent_home.AgentHome | None = None
     cleanup_project_dir: Path | None = None
@@ -111,22 +236,44 @@ def start_worker(args: object) -> None:
         configured_default=configured_select_default,
     )
     setattr(args, "select", select)
-    try:
-        worker_runtime.run_worker_sessions(
-            args=args,
-            mode=mode,
-            run_mode=run_mode,
-            dry_run=dry_run,
-            session_key=session_key,
-            run_worker_once=_run_worker_once,
-            report_worker_summary=lambda summary, is_dry_run: report_worker_summary(
-                summary, dry_run=is_dry_run
-            ),
-            watch_interval_seconds=lambda: watch_interval,
-            dry_run_log=dry_run_log,
-            emit=say,
-            sleep_fn=time.sleep,
+    run_worker_once: worker_runtime.RunWorkerOnceFn = _run_worker_once
+    if scheduler is not None:
+        run_worker_once = functools.partial(_run_worker_once, scheduler=scheduler, emit=emit)
+    watcher = None
+    if run_mode == "watch" and cleanup_beads_root is not None and cleanup_agent is not None:
+        watched_beads_root = cleanup_beads_root
+        hooks_dir = hooks.hooks_path(cleanup_agent).parent
+        # Resolved per fingerprint so Dolt databases created later are watched.
+        watcher = worker_watch.ChangeWatcher(
+            lambda: (*worker_watch.beads_watch_paths(watched_beads_root), hooks_dir)
         )
+    # Inbox and queue checks in every session of this member share message
+    # cursors, so each check only fetches message beads that changed.
+    inbox_session = (
+        beads.message_inbox_session(beads_root=cleanup_beads_root)
+        if cleanup_beads_root is not None
+        else contextlib.nullcontext()
+    )
+    own_writes = watcher.ignoring_own_writes() if watcher is not None else contextlib.nullcontext()
+    try:
+        with inbox_session, own_writes:
+            worker_runtime.run_worker_sessions(
+                args=args,
+                mode=mode,
+                run_mode=run_mode,
+                dry_run=dry_run,
+                session_key=session_key,
+                run_worker_once=run_worker_once,
+                report_worker_summary=lambda summary, is_dry_run: report_worker_summary(
+                    summary, dry_run=is_dry_run
+                ),
+                watch_interval_seconds=lambda: watch_interval,
+                dry_run_log=dry_run_log,
+                emit=emit,
+                sleep_fn=time.sleep,
+                wait_for_change=watcher.wait if watcher is not None else None,
+                mark_change_baseline=watcher.mark if watcher is not None else None,
+            )
     finally:
         if (
             cleanup_agent is not None
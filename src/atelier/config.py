@@ -24,11 +24,13 @@ from . import __version__, agents, paths
 from . import command as command_util
 from .editor import system_editor_default
 from .io import die, prompt, select
-from .models import (
+from .model_values import (
     BRANCH_HISTORY_VALUES,
     BRANCH_PR_MODE_VALUES,
     BRANCH_SQUASH_MESSAGE_VALUES,
     UPGRADE_POLICY_VALUES,
+)
+from .models import (
     AgentConfig,
     AtelierSection,
     AtelierUserSection,
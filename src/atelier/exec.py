@@ -8,6 +8,7 @@ from typing import Callable, Generic, Mapping, Protocol, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
+from . import command_trace
 from .io import die
 
 ParsedT = TypeVar("ParsedT")
@@ -121,9 +122,18 @@ class CommandParseError(RuntimeError):
 def run_with_runner(
     request: CommandRequest, *, runner: CommandRunner | None = None
 ) -> CommandResult | None:
-    """Execute a typed command request with the given runner."""
+    """Execute a typed command request with the given runner.
+
+    Every request is reported to :mod:`atelier.command_trace` while a
+    recorder is active, whichever runner executes it.
+    """
     active_runner = runner or _DEFAULT_COMMAND_RUNNER
-    return active_runner.run(request)
+    with command_trace.timed_command(request.argv) as outcome:
+        result = active_runner.run(request)
+        if result is not None:
+            outcome.returncode = result.returncode
+            outcome.timed_out = result.timed_out
+    return result
 
 
 def _missing_command_detail(request: CommandRequest) -> str:
@@ -319,10 +329,15 @@ def try_run_command(
         >>> isinstance(try_run_command(["true"]), subprocess.CompletedProcess)
         True
     """
-    try:
-        return subprocess.run(cmd, cwd=cwd, env=env, capture_output=True, text=True, check=False)
-    except FileNotFoundError:
-        return None
+    with command_trace.timed_command(cmd) as outcome:
+        try:
+            completed = subprocess.run(
+                cmd, cwd=cwd, env=env, capture_output=True, text=True, check=False
+            )
+        except FileNotFoundError:
+            return None
+        outcome.returncode = completed.returncode
+    return completed
 
 
 def run_command_detached(
@@ -0,0 +1,413 @@
+"""Persisted scan state and per-run budgets for incremental GC.
+
+Two collectors walk the whole changeset history. One normalizes changeset
+lifecycle status. The other prunes closed workspace branches. An incremental
+run lists only changesets updated since the checkpoint, plus changesets a
+previous run left pending. A changeset stays pending while its cleanup could
+still change without a Beads update. Examples are an existing worktree
+mapping, a branch not yet integrated, or a cleanup action that has not been
+verified. A budget defers whatever it cuts off to the next run. The same
+listing of changed issues also scopes the epic status and deprecated-label
+migrations, since any edit to an issue bumps its ``updated_at``.
+
+Branch tips proven integrated into a target are remembered, so unchanged
+branches skip the integration check. A full changeset scan still runs once a
+day, which catches Beads updates synced in with older timestamps.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .. import agent_home, beads, git, lifecycle
+from ..lib.beads import ShowManyIssuesRequest, build_sync_beads_client
+from .common import branch_integrated_into_target, branch_lookup_ref, log_debug, parse_rfc3339
+
+CHECKPOINT_FILENAME = "gc-checkpoint.json"
+_CHECKPOINT_VERSION = 1
+_CURSOR_OVERLAP = dt.timedelta(minutes=2)
+_FULL_SCAN_INTERVAL = dt.timedelta(days=1)
+_BUDGET_PATTERN = re.compile(r"^(?P<amount>\d+(?:\.\d+)?)(?P<unit>[sm]?)$")
+
+
+@dataclass
+class GcCheckpoint:
+    """Incremental GC state persisted between runs.
+
+    Args:
+        scanned_at: Start of the last run whose changeset window was fully
+            handled. ``None`` forces a full scan.
+        full_scan_at: Start of the last run that listed every changeset.
+        pending_changesets: Changesets to re-check on the next run.
+        integrated_branches: Branch tips proven integrated, keyed by
+            integration target and then by branch name.
+    """
+
+    scanned_at: dt.datetime | None = None
+    full_scan_at: dt.datetime | None = None
+    pending_changesets: set[str] = field(default_factory=set)
+    integrated_branches: dict[str, dict[str, list[str]]] = field(default_factory=dict)
+
+    def needs_full_scan(self, now: dt.datetime) -> bool:
+        """Return whether the next changeset listing must be a full scan."""
+        if self.scanned_at is None or self.full_scan_at is None:
+            return True
+        return now - self.full_scan_at >= _FULL_SCAN_INTERVAL
+
+    def branch_integrated(
+        self,
+        repo_root: Path,
+        *,
+        branch: str,
+        target_ref: str,
+        git_path: str,
+    ) -> bool:
+        """Check branch integration, skipping tips already proven integrated."""
+        tips = _branch_tips(repo_root, branch, git_path=git_path)
+        proven = self.integrated_branches.get(target_ref, {})
+        if tips and proven.get(branch) == tips:
+            return True
+        integrated = branch_integrated_into_target(
+            repo_root,
+            branch=branch,
+            target_ref=target_ref,
+            git_path=git_path,
+        )
+        if integrated and tips:
+            self.integrated_branches.setdefault(target_ref, {})[branch] = tips
+        return integrated
+
+    def resolve_changeset(
+        self,
+        issue_id: str,
+        *,
+        target_ref: str | None = None,
+        branches: tuple[str, ...] = (),
+    ) -> None:
+        """Stop tracking a changeset whose cleanup needs nothing more."""
+        self.pending_changesets.discard(issue_id)
+        if target_ref is None:
+            return
+        proven = self.integrated_branches.get(target_ref)
+        if proven is None:
+            return
+        for branch in branches:
+            proven.pop(branch, None)
+        if not proven:
+            del self.integrated_branches[target_ref]
+
+
+@dataclass
+class GcBudget:
+    """Bound on the changesets one GC run checks against git.
+
+    Args:
+        seconds: Wall-clock limit measured from the start of the run.
+        items: Maximum number of changesets checked.
+    """
+
+    seconds: float | None = None
+    items: int | None = None
+    started_at: float = field(default_factory=time.monotonic)
+    used_items: int = 0
+
+    def take(self) -> bool:
+        """Claim one changeset check, or return ``False`` once spent."""
+        if self.items is not None and self.used_items >= self.items:
+            return False
+        if self.seconds is not None and time.monotonic() - self.started_at >= self.seconds:
+            return False
+        self.used_items += 1
+        return True
+
+
+def parse_budget(value: str) -> GcBudget:
+    """Parse a ``--budget`` value.
+
+    Args:
+        value: A changeset count such as ``200``, or a duration in seconds or
+            minutes such as ``90s`` or ``5m``.
+
+    Returns:
+        Budget for one GC run.
+
+    Raises:
+        ValueError: If the value is not a positive count or duration.
+
+    Example:
+        >>> parse_budget("200").items
+        200
+        >>> parse_budget("5m").seconds
+        300.0
+    """
+    match = _BUDGET_PATTERN.match(value.strip().lower())
+    if match is None:
+        raise ValueError(f"invalid --budget value {value!r}; use a count or a duration like 90s")
+    amount = float(match.group("amount"))
+    unit = match.group("unit")
+    if amount <= 0:
+        raise ValueError(f"invalid --budget value {value!r}; budget must be positive")
+    if unit == "s":
+        return GcBudget(seconds=amount)
+    if unit == "m":
+        return GcBudget(seconds=amount * 60)
+    if not amount.is_integer():
+        raise ValueError(f"invalid --budget value {value!r}; item budgets must be whole numbers")
+    return GcBudget(items=int(amount))
+
+
+def checkpoint_path(project_dir: Path) -> Path:
+    """Return the GC checkpoint path inside the project data directory."""
+    return project_dir / CHECKPOINT_FILENAME
+
+
+def load_checkpoint(project_dir: Path) -> GcCheckpoint:
+    """Load the GC checkpoint, or an empty one when missing or unreadable."""
+    path = checkpoint_path(project_dir)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return GcCheckpoint()
+    if not isinstance(payload, dict) or payload.get("version") != _CHECKPOINT_VERSION:
+        log_debug(f"gc checkpoint ignored path={path} reason=unsupported version")
+        return GcCheckpoint()
+    changesets = payload.get("changesets")
+    if not isinstance(changesets, dict):
+        changesets = {}
+    pending = changesets.get("pending")
+    integrated = payload.get("integrated_branches")
+    return GcCheckpoint(
+        scanned_at=_parse_timestamp(changesets.get("scanned_at")),
+        full_scan_at=_parse_timestamp(changesets.get("full_scan_at")),
+        pending_changesets=(
+            {item for item in pending if isinstance(item, str) and item}
+            if isinstance(pending, list)
+            else set()
+        ),
+        integrated_branches=_integrated_branches(integrated),
+    )
+
+
+def save_checkpoint(project_dir: Path, checkpoint: GcCheckpoint) -> None:
+    """Atomically persist the GC checkpoint."""
+    payload = {
+        "version": _CHECKPOINT_VERSION,
+        "changesets": {
+            "scanned_at": _format_timestamp(checkpoint.scanned_at),
+            "full_scan_at": _format_timestamp(checkpoint.full_scan_at),
+            "pending": sorted(checkpoint.pending_changesets),
+        },
+        "integrated_branches": checkpoint.integrated_branches,
+    }
+    agent_home.write_text_atomic(
+        checkpoint_path(project_dir),
+        json.dumps(payload, indent=2, sort_keys=True) + "\n",
+    )
+
+
+def changed_issues(
+    checkpoint: GcCheckpoint,
+    *,
+    beads_root: Path,
+    repo_root: Path,
+    now: dt.datetime,
+) -> list[dict[str, object]] | None:
+    """List every issue updated since the checkpoint cursor.
+
+    Args:
+        checkpoint: Checkpoint loaded for this run.
+        beads_root: Beads root for ``bd`` invocations.
+        repo_root: Working directory for ``bd`` invocations.
+        now: Start of this run.
+
+    Returns:
+        Changed issues of any type, or ``None`` when a full scan is due and
+        collectors should list their whole history instead.
+    """
+    if checkpoint.scanned_at is None or checkpoint.needs_full_scan(now):
+        return None
+    since = _cursor_since(checkpoint.scanned_at)
+    changed = beads.run_bd_json(
+        ["list", "--all", "--updated-after", since, "--limit", "0"],
+        beads_root=beads_root,
+        cwd=repo_root,
+    )
+    log_debug(f"gc incremental since={since} changed issues={len(changed)}")
+    return changed
+
+
+def changeset_candidates(
+    checkpoint: GcCheckpoint,
+    *,
+    beads_root: Path,
+    repo_root: Path,
+    now: dt.datetime,
+    changed: list[dict[str, object]] | None = None,
+) -> list[dict[str, object]]:
+    """List the changesets an incremental GC run must check.
+
+    Args:
+        checkpoint: Checkpoint loaded for this run. Pending changesets that
+            no longer exist are dropped from it, and a full scan records
+            ``now`` as its ``full_scan_at``.
+        beads_root: Beads root for ``bd`` invocations.
+        repo_root: Working directory for ``bd`` invocations.
+        now: Start of this run.
+        changed: Result of :func:`changed_issues` for this run, when the
+            caller already listed it.
+
+    Returns:
+        Pending changesets first, so budgeted runs make progress, then
+        changesets updated since the checkpoint. Every changeset is returned
+        when a full scan is due.
+    """
+    scanned_at = checkpoint.scanned_at
+    if scanned_at is None or checkpoint.needs_full_scan(now):
+        checkpoint.full_scan_at = now
+        changed = beads.list_all_changesets(
+            beads_root=beads_root, cwd=repo_root, include_closed=True
+        )
+        pending = [issue for issue in changed if _issue_id(issue) in checkpoint.pending_changesets]
+        log_debug(f"gc incremental full scan changesets={len(changed)}")
+    else:
+        since = _cursor_since(scanned_at)
+        if changed is None:
+            changed = beads.run_bd_json(
+                ["list", "--all", "--updated-after", since, "--limit", "0"],
+                beads_root=beads_root,
+                cwd=repo_root,
+            )
+        changed = _changed_changesets(
+            changed,
+            checkpoint=checkpoint,
+            beads_root=beads_root,
+            repo_root=repo_root,
+        )
+        pending = _show_issues(
+            tuple(sorted(checkpoint.pending_changesets)),
+            beads_root=beads_root,
+            repo_root=repo_root,
+        )
+        log_debug(
+            f"gc incremental since={since} changed={len(changed)} "
+            f"pending={len(checkpoint.pending_changesets)}"
+        )
+    candidates: dict[str, dict[str, object]] = {}
+    for issue in [*pending, *changed]:
+        issue_id = _issue_id(issue)
+        if issue_id is not None:
+            candidates.setdefault(issue_id, issue)
+    for issue_id in checkpoint.pending_changesets - candidates.keys():
+        log_debug(f"gc incremental dropped missing pending changeset={issue_id}")
+    checkpoint.pending_changesets &= candidates.keys()
+    return list(candidates.values())
+
+
+def _cursor_since(scanned_at: dt.datetime) -> str:
+    return (scanned_at - _CURSOR_OVERLAP).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _changed_changesets(
+    changed: list[dict[str, object]],
+    *,
+    checkpoint: GcCheckpoint,
+    beads_root: Path,
+    repo_root: Path,
+) -> list[dict[str, object]]:
+    work = [
+        issue
+        for issue in changed
+        if _issue_id(issue) is not None
+        and _issue_id(issue) not in checkpoint.pending_changesets
+        and lifecycle.is_work_issue(
+            labels=_issue_labels(issue),
+            issue_type=lifecycle.issue_payload_type(issue),
+        )
+    ]
+    if not work:
+        return []
+    # Work issues with work children are epics or containers, not changesets.
+    # A changed child already proves its parent is one; every other changed
+    # issue costs one child listing scoped to its id, never a full history.
+    changed_snapshot = beads.IssueSnapshot(issues=tuple(changed))
+    changesets: list[dict[str, object]] = []
+    for issue in work:
+        issue_id = _issue_id(issue) or ""
+        if changed_snapshot.work_children(issue_id):
+            continue
+        if beads.list_work_children(
+            issue_id, beads_root=beads_root, cwd=repo_root, include_closed=True
+        ):
+            continue
+        changesets.append(issue)
+    return changesets
+
+
+def _show_issues(
+    issue_ids: tuple[str, ...], *, beads_root: Path, repo_root: Path
+) -> list[dict[str, object]]:
+    if not issue_ids:
+        return []
+    client = build_sync_beads_client(beads_root=beads_root, cwd=repo_root)
+    # Missing ids (deleted changesets) are skipped by the bulk show.
+    return [
+        issue.model_dump(mode="json", by_alias=True, exclude_none=True)
+        for issue in client.show_many(ShowManyIssuesRequest(issue_ids=issue_ids))
+    ]
+
+
+def _branch_tips(repo_root: Path, branch: str, *, git_path: str) -> list[str]:
+    refs = [ref for ref in branch_lookup_ref(repo_root, branch, git_path=git_path) if ref]
+    tips = [git.git_rev_parse(repo_root, ref, git_path=git_path) for ref in refs]
+    if not tips or any(tip is None for tip in tips):
+        return []
+    return [tip for tip in tips if tip is not None]
+
+
+def _integrated_branches(value: object) -> dict[str, dict[str, list[str]]]:
+    if not isinstance(value, dict):
+        return {}
+    result: dict[str, dict[str, list[str]]] = {}
+    for target_ref, branches in value.items():
+        if not isinstance(target_ref, str) or not isinstance(branches, dict):
+            continue
+        proven = {
+            branch: list(tips)
+            for branch, tips in branches.items()
+            if isinstance(branch, str)
+            and isinstance(tips, list)
+            and tips
+            and all(isinstance(tip, str) and tip for tip in tips)
+        }
+        if proven:
+            result[target_ref] = proven
+    return result
+
+
+def _issue_id(issue: dict[str, object]) -> str | None:
+    issue_id = issue.get("id")
+    if not isinstance(issue_id, str) or not issue_id.strip():
+        return None
+    return issue_id.strip()
+
+
+def _issue_labels(issue: dict[str, object]) -> set[str]:
+    labels = issue.get("labels")
+    if not isinstance(labels, (list, tuple)):
+        return set()
+    return {str(label) for label in labels if label}
+
+
+def _parse_timestamp(value: object) -> dt.datetime | None:
+    return parse_rfc3339(value if isinstance(value, str) else None)
+
+
+def _format_timestamp(value: dt.datetime | None) -> str | None:
+    if value is None:
+        return None
+    return value.astimezone(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
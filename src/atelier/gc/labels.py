@@ -77,13 +77,15 @@ def collect_normalize_changeset_labels(
     *,
     beads_root: Path,
     repo_root: Path,
+    issues: list[dict[str, object]] | None = None,
 ) -> list[GcAction]:
     actions: list[GcAction] = []
-    issues = beads.list_all_changesets(
-        beads_root=beads_root,
-        cwd=repo_root,
-        include_closed=True,
-    )
+    if issues is None:
+        issues = beads.list_all_changesets(
+            beads_root=beads_root,
+            cwd=repo_root,
+            include_closed=True,
+        )
     for issue in sorted(issues, key=_issue_sort_key):
         issue_id = issue.get("id")
         if not isinstance(issue_id, str) or not issue_id.strip():
@@ -101,8 +103,9 @@ def collect_normalize_changeset_labels(
             bead_id: str = issue_id,
             status_value: str = status_value,
         ) -> None:
-            beads.run_bd_command(
-                ["update", bead_id, "--status", status_value],
+            beads.update_issue(
+                bead_id,
+                ("--status", status_value),
                 beads_root=beads_root,
                 cwd=repo_root,
             )
@@ -112,6 +115,7 @@ def collect_normalize_changeset_labels(
                 description=f"Normalize lifecycle status for changeset {issue_id}",
                 apply=_apply_normalize,
                 details=tuple(details),
+                queues_issue_updates=True,
             )
         )
     return actions
@@ -123,14 +127,22 @@ def collect_remove_deprecated_label(
     detail: str,
     beads_root: Path,
     repo_root: Path,
+    issues: list[dict[str, object]] | None = None,
 ) -> list[GcAction]:
-    """Remove deprecated label; state is inferred from bead status or graph."""
+    """Remove deprecated label; state is inferred from bead status or graph.
+
+    ``issues`` limits the check to the given payloads; by default every
+    issue carrying ``label`` is listed.
+    """
     actions: list[GcAction] = []
-    issues = beads.run_bd_json(
-        ["list", "--label", label, "--all"],
-        beads_root=beads_root,
-        cwd=repo_root,
-    )
+    if issues is None:
+        issues = beads.run_bd_json(
+            ["list", "--label", label, "--all"],
+            beads_root=beads_root,
+            cwd=repo_root,
+        )
+    else:
+        issues = [issue for issue in issues if label in _issue_labels(issue)]
     for issue in sorted(issues, key=_issue_sort_key):
         issue_id = issue.get("id")
         if not isinstance(issue_id, str) or not issue_id.strip():
@@ -141,8 +153,9 @@ def collect_remove_deprecated_label(
             bead_id: str = issue_id,
             lbl: str = label,
         ) -> None:
-            beads.run_bd_command(
-                ["update", bead_id, "--remove-label", lbl],
+            beads.update_issue(
+                bead_id,
+                ("--remove-label", lbl),
                 beads_root=beads_root,
                 cwd=repo_root,
             )
@@ -152,6 +165,7 @@ def collect_remove_deprecated_label(
                 description=f"Remove deprecated {label} label from {issue_id}",
                 apply=_apply_remove,
                 details=(detail,),
+                queues_issue_updates=True,
             )
         )
     return actions
@@ -161,9 +175,11 @@ def collect_normalize_epic_labels(
     *,
     beads_root: Path,
     repo_root: Path,
+    issues: list[dict[str, object]] | None = None,
 ) -> list[GcAction]:
     actions: list[GcAction] = []
-    issues = beads.list_epics(beads_root=beads_root, cwd=repo_root, include_closed=True)
+    if issues is None:
+        issues = beads.list_epics(beads_root=beads_root, cwd=repo_root, include_closed=True)
     for issue in sorted(issues, key=_issue_sort_key):
         issue_id = issue.get("id")
         if not isinstance(issue_id, str) or not issue_id.strip():
@@ -184,8 +200,9 @@ def collect_normalize_epic_labels(
             bead_id: str = issue_id,
             status_value: str = status_value,
         ) -> None:
-            beads.run_bd_command(
-                ["update", bead_id, "--status", status_value],
+            beads.update_issue(
+                bead_id,
+                ("--status", status_value),
                 beads_root=beads_root,
                 cwd=repo_root,
             )
@@ -195,6 +212,7 @@ def collect_normalize_epic_labels(
                 description=f"Normalize lifecycle status for epic {issue_id}",
                 details=tuple(details),
                 apply=_apply_normalize,
+                queues_issue_updates=True,
             )
         )
     return actions
@@ -8,9 +8,15 @@ from typing import Callable
 
 @dataclass(frozen=True)
 class GcAction:
-    """A single garbage-collection action with description and apply callback."""
+    """A single garbage-collection action with description and apply callback.
+
+    Actions with ``queues_issue_updates`` only queue ``bd update`` calls on the
+    active issue update batch; GC flushes them before the next action that
+    writes directly.
+    """
 
     description: str
     apply: Callable[[], None]
     details: tuple[str, ...] = ()
     report_only: bool = False
+    queues_issue_updates: bool = False
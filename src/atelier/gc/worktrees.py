@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import threading
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -19,9 +22,11 @@ from .common import (
     try_show_issue,
     workspace_branch_from_labels,
 )
+from .incremental import GcBudget, GcCheckpoint
 from .models import GcAction
 
 ABANDONED_EPIC_CLEANUP_LABELS = {"cs:abandoned", "cs:superseded"}
+_THREAD_LOOKUP_INDEXES = threading.local()
 
 
 def _noop_gc_action() -> None:
@@ -169,6 +174,55 @@ def _build_mapping_issue_lookup_index(
     )
 
 
+@contextmanager
+def mapping_lookup_session() -> Iterator[None]:
+    """Share one mapping lookup index across collectors on this thread.
+
+    The index lists every epic and its changesets. Collectors only read
+    Beads, so one index stays valid until the run applies its actions.
+    Nested sessions reuse the outer indexes.
+    """
+    active = getattr(_THREAD_LOOKUP_INDEXES, "indexes", None)
+    if isinstance(active, dict):
+        yield
+        return
+    _THREAD_LOOKUP_INDEXES.indexes = {}
+    try:
+        yield
+    finally:
+        _THREAD_LOOKUP_INDEXES.indexes = None
+
+
+def _mapping_lookup_index(
+    *,
+    project_dir: Path,
+    beads_root: Path,
+    repo_root: Path,
+) -> _MappingIssueLookupIndex:
+    indexes = getattr(_THREAD_LOOKUP_INDEXES, "indexes", None)
+    if not isinstance(indexes, dict):
+        return _build_mapping_issue_lookup_index(
+            project_dir=project_dir, beads_root=beads_root, repo_root=repo_root
+        )
+    key = (project_dir, beads_root, repo_root)
+    index = indexes.get(key)
+    if index is None:
+        index = _build_mapping_issue_lookup_index(
+            project_dir=project_dir, beads_root=beads_root, repo_root=repo_root
+        )
+        indexes[key] = index
+    return index
+
+
+def _load_epic_mappings(meta_dir: Path) -> list[tuple[Path, worktrees.WorktreeMapping]]:
+    mappings: list[tuple[Path, worktrees.WorktreeMapping]] = []
+    for path in meta_dir.glob("*.json"):
+        mapping = worktrees.load_mapping(path)
+        if mapping and mapping.epic_id:
+            mappings.append((path, mapping))
+    return mappings
+
+
 def _is_non_bead_mapping(
     *, mapping: worktrees.WorktreeMapping, index: _MappingIssueLookupIndex
 ) -> bool:
@@ -283,20 +337,18 @@ def collect_resolved_epic_artifacts(
     meta_dir = worktrees.worktrees_root(project_dir) / worktrees.METADATA_DIRNAME
     if not meta_dir.exists():
         return actions
-    lookup_index = _build_mapping_issue_lookup_index(
+    mappings = _load_epic_mappings(meta_dir)
+    if not mappings:
+        return actions
+    lookup_index = _mapping_lookup_index(
         project_dir=project_dir,
         beads_root=beads_root,
         repo_root=repo_root,
     )
     client = build_sync_beads_client(beads_root=beads_root, cwd=repo_root)
     default_branch = git.git_default_branch(repo_root, git_path=git_path) or ""
-    for path in meta_dir.glob("*.json"):
-        mapping = worktrees.load_mapping(path)
-        if not mapping:
-            continue
+    for path, mapping in mappings:
         mapping_epic_id = mapping.epic_id
-        if not mapping_epic_id:
-            continue
         lookup = _resolve_mapping_issue(
             mapping=mapping,
             index=lookup_index,
@@ -519,27 +571,46 @@ def collect_closed_workspace_branches_without_mapping(
     repo_root: Path,
     git_path: str,
     dry_run: bool = False,
+    issues: list[dict[str, object]] | None = None,
+    checkpoint: GcCheckpoint | None = None,
+    budget: GcBudget | None = None,
 ) -> list[GcAction]:
+    """Collect cleanup for merged changesets whose worktree mapping is gone.
+
+    Incremental runs pass the changed ``issues`` and a ``checkpoint`` that
+    keeps unresolved changesets pending; ``budget`` bounds the git checks.
+    """
     actions: list[GcAction] = []
     default_branch = git.git_default_branch(repo_root, git_path=git_path) or ""
-    issues = beads.list_all_changesets(
-        beads_root=beads_root,
-        cwd=repo_root,
-        include_closed=True,
+    if issues is None:
+        issues = beads.list_all_changesets(
+            beads_root=beads_root,
+            cwd=repo_root,
+            include_closed=True,
+        )
+    integrated = (
+        branch_integrated_into_target if checkpoint is None else checkpoint.branch_integrated
     )
     for issue in issues:
         issue_id = issue.get("id")
         if not isinstance(issue_id, str) or not issue_id.strip():
             continue
+        issue_key = issue_id.strip()
         status = str(issue.get("status") or "").strip().lower()
-        if status not in {"closed", "done"}:
+        if status not in {"closed", "done"} or not _is_merged_closed_changeset(issue):
+            # Closing or merging a changeset updates it, so it is listed again.
+            if checkpoint is not None:
+                checkpoint.resolve_changeset(issue_key)
             continue
-        if not _is_merged_closed_changeset(issue):
-            continue
-        issue_key = issue_id.strip()
+        if checkpoint is not None:
+            # Pending until proven resolved below.
+            checkpoint.pending_changesets.add(issue_key)
         mapping_path = worktrees.mapping_path(project_dir, issue_key)
         if mapping_path.exists():
             continue
+        if budget is not None and not budget.take():
+            log_debug(f"closed workspace cleanup deferred by budget changeset={issue_key}")
+            continue
         changeset_worktree_relpath = worktrees.changeset_worktree_relpath(issue_key)
         changeset_worktree = project_dir / changeset_worktree_relpath
         has_conventional_worktree = (
@@ -583,11 +654,11 @@ def collect_closed_workspace_branches_without_mapping(
             if branch and branch != parent_branch and branch != default_branch
         }
         if not prunable_branches:
+            if checkpoint is not None:
+                checkpoint.resolve_changeset(issue_key)
             continue
         if any(
-            not branch_integrated_into_target(
-                repo_root, branch=branch, target_ref=target_ref, git_path=git_path
-            )
+            not integrated(repo_root, branch=branch, target_ref=target_ref, git_path=git_path)
             for branch in prunable_branches
         ):
             continue
@@ -599,6 +670,10 @@ def collect_closed_workspace_branches_without_mapping(
                 has_prunable_branch_ref = True
                 break
         if not has_conventional_worktree and not has_prunable_branch_ref:
+            if checkpoint is not None:
+                checkpoint.resolve_changeset(
+                    issue_key, target_ref=target_ref, branches=tuple(prunable_branches)
+                )
             if dry_run:
                 actions.append(
                     GcAction(
@@ -687,19 +762,17 @@ def collect_orphan_worktrees(
     meta_dir = worktrees.worktrees_root(project_dir) / worktrees.METADATA_DIRNAME
     if not meta_dir.exists():
         return actions
-    lookup_index = _build_mapping_issue_lookup_index(
+    mappings = _load_epic_mappings(meta_dir)
+    if not mappings:
+        return actions
+    lookup_index = _mapping_lookup_index(
         project_dir=project_dir,
         beads_root=beads_root,
         repo_root=repo_root,
     )
     client = build_sync_beads_client(beads_root=beads_root, cwd=repo_root)
-    for path in meta_dir.glob("*.json"):
-        mapping = worktrees.load_mapping(path)
-        if not mapping:
-            continue
+    for path, mapping in mappings:
         epic_id = mapping.epic_id
-        if not epic_id:
-            continue
         lookup = _resolve_mapping_issue(
             mapping=mapping,
             index=lookup_index,
@@ -4,6 +4,9 @@ import json
 import re
 import shutil
 import subprocess
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -66,6 +69,221 @@ def git_command(args: list[str], *, git_path: str | None = None) -> list[str]:
     return [resolved, *args]
 
 
+_THREAD_QUERY_SESSION = threading.local()
+_GIT_OBJECT_TYPES = frozenset({"commit", "tree", "blob", "tag"})
+_FULL_OBJECT_NAME = re.compile(r"[0-9a-fA-F]{40}|[0-9a-fA-F]{64}")
+_REACHABILITY_INDEX_MIN_QUERIES = 3
+_REACHABILITY_INDEX_LIMIT = 8
+
+
+class GitQuerySession:
+    """Answer many ref and ancestry questions for one repo per process.
+
+    Ref and revision lookups go through a long-lived ``git cat-file
+    --batch-check`` co-process, so each lookup is a pipe round trip rather
+    than a ``git`` spawn. Lookups always read live refs; only answers keyed
+    by resolved object names (ancestry and ``git cherry`` results) are
+    memoized, since those cannot change. A tip that keeps being asked about
+    gets a reachability index from one ``git rev-list`` traversal, so later
+    "is X contained in tip" checks are set lookups. A moved ref resolves to a
+    new tip and therefore a new index. When the co-process cannot be started
+    or dies, queries fall back to one-shot ``git`` commands.
+    """
+
+    def __init__(self, repo_dir: Path, *, git_path: str | None = None) -> None:
+        self.repo_dir = repo_dir
+        self.git_path = git_path
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen[str] | None = None
+        self._broken = False
+        self._ancestry: dict[tuple[str, str], bool] = {}
+        self._applied: dict[tuple[str, str], bool] = {}
+        self._tip_queries: dict[str, int] = {}
+        self._reachable: dict[str, frozenset[str] | None] = {}
+
+    def matches(self, repo_dir: Path, git_path: str | None) -> bool:
+        """Return whether this session serves ``repo_dir`` with ``git_path``."""
+        return repo_dir == self.repo_dir and git_path == self.git_path
+
+    def close(self) -> None:
+        """Stop the co-process, if one was started."""
+        with self._lock:
+            process = self._process
+            self._process = None
+        if process is None:
+            return
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            if process.stdout is not None:
+                process.stdout.close()
+
+    def _ensure_process(self) -> subprocess.Popen[str] | None:
+        if self._broken:
+            return None
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        try:
+            self._process = subprocess.Popen(
+                git_command(
+                    [
+                        "-C",
+                        str(self.repo_dir),
+                        "cat-file",
+                        "--batch-check=%(objectname) %(objecttype)",
+                    ],
+                    git_path=self.git_path,
+                ),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError:
+            self._broken = True
+            self._process = None
+        return self._process
+
+    def lookup(self, rev: str) -> tuple[bool, str | None]:
+        """Resolve ``rev`` to an object name through the co-process.
+
+        Returns ``(answered, object_name)``. ``answered`` is ``False`` when the
+        co-process cannot give a rev-parse-equivalent answer, so callers fall
+        back to a one-shot ``git`` command.
+        """
+        answered, object_name, _object_type = self._resolve(rev)
+        return answered, object_name
+
+    def _resolve(self, rev: str) -> tuple[bool, str | None, str | None]:
+        if not rev or rev.startswith("-") or any(char.isspace() for char in rev):
+            return False, None, None
+        with self._lock:
+            process = self._ensure_process()
+            if process is None or process.stdin is None or process.stdout is None:
+                return False, None, None
+            try:
+                process.stdin.write(f"{rev}\n")
+                process.stdin.flush()
+                line = process.stdout.readline()
+            except OSError:
+                line = ""
+            if not line:
+                self._broken = True
+                return False, None, None
+        parts = line.split()
+        if len(parts) != 2:
+            return False, None, None
+        if parts[1] == "missing":
+            # rev-parse echoes full object names without checking existence.
+            if _FULL_OBJECT_NAME.fullmatch(rev):
+                return False, None, None
+            return True, None, None
+        if parts[1] in _GIT_OBJECT_TYPES:
+            return True, parts[0], parts[1]
+        # Ambiguous short names keep rev-parse error semantics.
+        return False, None, None
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> tuple[bool, bool | None]:
+        """Return ``(answered, is_ancestor)`` memoized by object names."""
+        answered_ancestor, ancestor_name, ancestor_type = self._resolve(ancestor)
+        answered_descendant, descendant_name = self.lookup(descendant)
+        if not answered_ancestor or not answered_descendant:
+            return False, None
+        if ancestor_name is None or descendant_name is None:
+            return True, None
+        if ancestor_name == descendant_name:
+            return True, True
+        key = (ancestor_name, descendant_name)
+        cached = self._ancestry.get(key)
+        if cached is not None:
+            return True, cached
+        reachable = self._reachable_from(descendant_name)
+        if reachable is not None and ancestor_type == "commit":
+            result = ancestor_name in reachable
+            self._ancestry[key] = result
+            return True, result
+        result = _git_is_ancestor_uncached(
+            self.repo_dir, ancestor_name, descendant_name, git_path=self.git_path
+        )
+        if result is not None:
+            self._ancestry[key] = result
+        return True, result
+
+    def _reachable_from(self, tip: str) -> frozenset[str] | None:
+        if tip in self._reachable:
+            return self._reachable[tip]
+        queries = self._tip_queries.get(tip, 0) + 1
+        self._tip_queries[tip] = queries
+        if queries < _REACHABILITY_INDEX_MIN_QUERIES:
+            return None
+        # rev-list walks the commit-graph file on its own when one exists.
+        result = _run_git_or_die(
+            git_command(["-C", str(self.repo_dir), "rev-list", tip], git_path=self.git_path)
+        )
+        reachable = frozenset(result.stdout.split()) if result.returncode == 0 else None
+        while len(self._reachable) >= _REACHABILITY_INDEX_LIMIT:
+            self._reachable.pop(next(iter(self._reachable)))
+        self._reachable[tip] = reachable
+        return reachable
+
+    def fully_applied(self, upstream: str, head: str) -> tuple[bool, bool | None]:
+        """Return ``(answered, fully_applied)`` memoized by object names."""
+        _answered_upstream, upstream_name = self.lookup(upstream)
+        _answered_head, head_name = self.lookup(head)
+        if upstream_name is None or head_name is None:
+            return False, None
+        key = (upstream_name, head_name)
+        cached = self._applied.get(key)
+        if cached is not None:
+            return True, cached
+        result = _git_branch_fully_applied_uncached(
+            self.repo_dir, upstream_name, head_name, git_path=self.git_path
+        )
+        if result is not None:
+            self._applied[key] = result
+        return True, result
+
+
+def _active_query_session(repo_dir: Path, git_path: str | None) -> GitQuerySession | None:
+    session = getattr(_THREAD_QUERY_SESSION, "session", None)
+    if isinstance(session, GitQuerySession) and session.matches(repo_dir, git_path):
+        return session
+    return None
+
+
+@contextmanager
+def git_query_session(repo_dir: Path, *, git_path: str | None = None) -> Iterator[GitQuerySession]:
+    """Route ref and ancestry helpers for ``repo_dir`` through one session.
+
+    While the context is active on the current thread, ``git_rev_parse``,
+    ``git_ref_exists``, ``git_is_ancestor`` and ``git_branch_fully_applied``
+    calls for the same repo and git executable reuse the session. Nested
+    contexts for the same repo share the outer session.
+
+    Example:
+        >>> with git_query_session(Path(".")) as session:
+        ...     isinstance(session, GitQuerySession)
+        True
+    """
+    existing = _active_query_session(repo_dir, git_path)
+    if existing is not None:
+        yield existing
+        return
+    previous = getattr(_THREAD_QUERY_SESSION, "session", None)
+    session = GitQuerySession(repo_dir, git_path=git_path)
+    _THREAD_QUERY_SESSION.session = session
+    try:
+        yield session
+    finally:
+        _THREAD_QUERY_SESSION.session = previous
+        session.close()
+
+
 def normalize_origin_url(value: str) -> str:
     """Normalize a Git origin URL to a stable identifier string.
 
@@ -508,6 +726,11 @@ def git_ref_exists(repo_dir: Path, ref: str, *, git_path: str | None = None) ->
         >>> git_ref_exists(Path("."), "refs/heads/main") in {True, False}
         True
     """
+    session = _active_query_session(repo_dir, git_path)
+    if session is not None and ref.startswith("refs/"):
+        answered, object_name = session.lookup(ref)
+        if answered:
+            return object_name is not None
     result = _run_git_or_die(
         git_command(
             ["-C", str(repo_dir), "show-ref", "--verify", "--quiet", ref],
@@ -550,6 +773,11 @@ def git_rev_parse(repo_dir: Path, ref: str, *, git_path: str | None = None) -> s
         >>> git_rev_parse(Path("."), "HEAD") is None or True
         True
     """
+    session = _active_query_session(repo_dir, git_path)
+    if session is not None:
+        answered, object_name = session.lookup(ref)
+        if answered:
+            return object_name
     result = _run_git_or_die(
         git_command(["-C", str(repo_dir), "rev-parse", ref], git_path=git_path)
     )
@@ -805,6 +1033,21 @@ def git_is_ancestor(
     Returns ``True``/``False`` for git's explicit status codes, or ``None`` when
     git fails for another reason (missing ref, invalid repo, etc.).
     """
+    session = _active_query_session(repo_dir, git_path)
+    if session is not None:
+        answered, is_ancestor = session.is_ancestor(ancestor, descendant)
+        if answered:
+            return is_ancestor
+    return _git_is_ancestor_uncached(repo_dir, ancestor, descendant, git_path=git_path)
+
+
+def _git_is_ancestor_uncached(
+    repo_dir: Path,
+    ancestor: str,
+    descendant: str,
+    *,
+    git_path: str | None = None,
+) -> bool | None:
     result = _run_git_or_die(
         git_command(
             [
@@ -838,6 +1081,21 @@ def git_branch_fully_applied(
     ``head`` is not yet applied to ``upstream``. A ``-`` line means the commit
     is equivalent/applied.
     """
+    session = _active_query_session(repo_dir, git_path)
+    if session is not None:
+        answered, fully_applied = session.fully_applied(upstream, head)
+        if answered:
+            return fully_applied
+    return _git_branch_fully_applied_uncached(repo_dir, upstream, head, git_path=git_path)
+
+
+def _git_branch_fully_applied_uncached(
+    repo_dir: Path,
+    upstream: str,
+    head: str,
+    *,
+    git_path: str | None = None,
+) -> bool | None:
     result = _run_git_or_die(
         git_command(
             ["-C", str(repo_dir), "cherry", upstream, head],
@@ -30,15 +30,19 @@ from .models import (
     DependencyMutationRequest,
     IssueRecord,
     IssueReference,
+    IssueUpdateResult,
     ListIssuesRequest,
     OperationOutputMode,
     ReadyIssuesRequest,
     SemanticVersion,
     ShowIssueRequest,
+    ShowManyIssuesRequest,
     SupportedOperation,
     UpdateIssueRequest,
+    UpdateManyIssuesRequest,
 )
 from .process import (
+    BatchingBeadsTransport,
     SubprocessBeadsClient,
     SubprocessBeadsTransport,
     decode_help_output,
@@ -51,6 +55,7 @@ __all__ = [
     "DEFAULT_COMPATIBILITY_POLICY",
     "DEFAULT_MINIMUM_BD_VERSION",
     "AsyncBeadsClient",
+    "BatchingBeadsTransport",
     "BeadError",
     "Beads",
     "BeadsCapability",
@@ -72,6 +77,7 @@ __all__ = [
     "DependencyMutationRequest",
     "IssueRecord",
     "IssueReference",
+    "IssueUpdateResult",
     "ListIssuesRequest",
     "OperationContract",
     "OperationOutputMode",
@@ -80,6 +86,7 @@ __all__ = [
     "ScriptedBeadsTransport",
     "SemanticVersion",
     "ShowIssueRequest",
+    "ShowManyIssuesRequest",
     "SubprocessBeadsClient",
     "SubprocessBeadsTransport",
     "SupportedOperation",
@@ -88,6 +95,7 @@ __all__ = [
     "UnsupportedOperationError",
     "UnsupportedVersionError",
     "UpdateIssueRequest",
+    "UpdateManyIssuesRequest",
     "build_sync_beads_client",
     "decode_help_output",
     "decode_version_output",
@@ -14,10 +14,13 @@ from .models import (
     CreateIssueRequest,
     DependencyMutationRequest,
     IssueRecord,
+    IssueUpdateResult,
     ListIssuesRequest,
     ReadyIssuesRequest,
     ShowIssueRequest,
+    ShowManyIssuesRequest,
     UpdateIssueRequest,
+    UpdateManyIssuesRequest,
 )
 
 
@@ -41,6 +44,8 @@ class Beads(Protocol):
 
     async def show(self, request: ShowIssueRequest) -> IssueRecord: ...
 
+    async def show_many(self, request: ShowManyIssuesRequest) -> tuple[IssueRecord, ...]: ...
+
     async def list(self, request: ListIssuesRequest) -> tuple[IssueRecord, ...]: ...
 
     async def ready(self, request: ReadyIssuesRequest) -> tuple[IssueRecord, ...]: ...
@@ -49,6 +54,10 @@ class Beads(Protocol):
 
     async def update(self, request: UpdateIssueRequest) -> IssueRecord: ...
 
+    async def update_many(
+        self, request: UpdateManyIssuesRequest
+    ) -> tuple[IssueUpdateResult, ...]: ...
+
     async def close(self, request: CloseIssueRequest) -> IssueRecord: ...
 
     async def add_dependency(self, request: DependencyMutationRequest) -> IssueRecord: ...
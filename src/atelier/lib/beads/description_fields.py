@@ -1,12 +1,19 @@
-"""Read-only helpers for parsing bead description metadata."""
+"""Read-only helpers for parsing bead description metadata.
+
+Parses are memoized by description text, so the same description is split
+and decoded once per process no matter how many callers read it. Every call
+still returns a fresh container that callers may mutate.
+"""
 
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 
 from atelier.external_tickets import ExternalTicketRef, normalize_external_ticket_entry
 
 EXTERNAL_TICKETS_KEY = "external_tickets"
+_PARSE_CACHE_SIZE = 2048
 
 
 def normalize_description(description: str | None) -> str:
@@ -20,9 +27,14 @@ def normalize_description(description: str | None) -> str:
 def parse_description_fields(description: str | None) -> dict[str, str]:
     """Parse colon-delimited key/value fields from a bead description."""
 
-    fields: dict[str, str] = {}
     if not description:
-        return fields
+        return {}
+    return _parsed_fields(description).copy()
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parsed_fields(description: str) -> dict[str, str]:
+    fields: dict[str, str] = {}
     for line in description.splitlines():
         if ":" not in line:
             continue
@@ -50,16 +62,21 @@ def parse_external_tickets(description: str | None) -> list[ExternalTicketRef]:
 
     if not description:
         return []
-    fields = parse_description_fields(description)
+    return list(_parsed_external_tickets(description))
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parsed_external_tickets(description: str) -> tuple[ExternalTicketRef, ...]:
+    fields = _parsed_fields(description)
     tickets_raw = fields.get(EXTERNAL_TICKETS_KEY)
     if not tickets_raw or tickets_raw.lower() == "null":
-        return []
+        return ()
     try:
         payload = json.loads(tickets_raw)
     except json.JSONDecodeError:
-        return []
+        return ()
     if not isinstance(payload, list):
-        return []
+        return ()
     tickets: list[ExternalTicketRef] = []
     for entry in payload:
         if not isinstance(entry, dict):
@@ -68,4 +85,4 @@ def parse_external_tickets(description: str | None) -> list[ExternalTicketRef]:
         if normalized is None:
             continue
         tickets.append(normalized)
-    return tickets
+    return tuple(tickets)
@@ -258,6 +258,17 @@ class ShowIssueRequest(BeadsModel):
     issue_id: NonBlankStr
 
 
+class ShowManyIssuesRequest(BeadsModel):
+    """Request model for bulk show operations."""
+
+    issue_ids: tuple[NonBlankStr, ...]
+
+    @field_validator("issue_ids")
+    @classmethod
+    def _dedupe_issue_ids(cls, value: tuple[str, ...]) -> tuple[str, ...]:
+        return _dedupe_strings(value)
+
+
 class ListIssuesRequest(BeadsModel):
     """Request model for list operations."""
 
@@ -339,6 +350,26 @@ class UpdateIssueRequest(BeadsModel):
         return self
 
 
+class UpdateManyIssuesRequest(BeadsModel):
+    """Request model for applying many update operations in one batch."""
+
+    updates: tuple[UpdateIssueRequest, ...]
+
+
+class IssueUpdateResult(BeadsModel):
+    """Per-issue outcome of a batched update."""
+
+    issue_id: NonBlankStr
+    issue: IssueRecord | None = None
+    error: StrictStr | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the update was applied."""
+
+        return self.issue is not None and self.error is None
+
+
 class CloseIssueRequest(BeadsModel):
     """Request model for close operations."""
 
@@ -13,9 +13,12 @@ from typing import Protocol, cast
 
 from pydantic import ValidationError
 
+from atelier import command_trace
+
 from .client import Beads, BeadsTransport
 from .compatibility import DEFAULT_COMPATIBILITY_POLICY, CompatibilityPolicy
 from .errors import (
+    BeadError,
     BeadsCommandError,
     BeadsParseError,
     BeadsTimeoutError,
@@ -32,12 +35,15 @@ from .models import (
     CreateIssueRequest,
     DependencyMutationRequest,
     IssueRecord,
+    IssueUpdateResult,
     ListIssuesRequest,
     ReadyIssuesRequest,
     SemanticVersion,
     ShowIssueRequest,
+    ShowManyIssuesRequest,
     SupportedOperation,
     UpdateIssueRequest,
+    UpdateManyIssuesRequest,
 )
 
 _SEMVER_SEARCH: Pattern[str] = compile(r"\bv?(\d+)\.(\d+)\.(\d+)\b")
@@ -107,6 +113,16 @@ class SubprocessBeadsTransport(BeadsTransport):
         self._spawn = spawn
 
     async def execute(self, request: BeadsCommandRequest) -> BeadsCommandResult:
+        with command_trace.timed_command(request.argv) as outcome:
+            try:
+                result = await self._execute(request)
+            except BeadsTimeoutError:
+                outcome.timed_out = True
+                raise
+            outcome.returncode = result.returncode
+        return result
+
+    async def _execute(self, request: BeadsCommandRequest) -> BeadsCommandResult:
         env = dict(os.environ)
         if request.env:
             env.update(request.env)
@@ -145,6 +161,187 @@ class SubprocessBeadsTransport(BeadsTransport):
         )
 
 
+_BatchKey = tuple[object, ...]
+_DEFAULT_SHOW_BATCH_SIZE = 50
+_MISSING_ISSUE_MARKERS = ("no issue found", "no issues found")
+_COALESCED_READ_OPERATIONS = frozenset(
+    {SupportedOperation.SHOW, SupportedOperation.LIST, SupportedOperation.READY}
+)
+
+
+def _request_scope(request: BeadsCommandRequest) -> _BatchKey:
+    env_items = tuple(sorted((request.env or {}).items()))
+    return (request.cwd, env_items, request.timeout_seconds)
+
+
+def _batchable_show_issue_id(request: BeadsCommandRequest) -> str | None:
+    argv = request.argv
+    if request.operation is not SupportedOperation.SHOW or len(argv) < 4:
+        return None
+    if argv[-3] != "show" or argv[-1] != _JSON_FLAG or argv[-2].startswith("-"):
+        return None
+    return argv[-2]
+
+
+class BatchingBeadsTransport(BeadsTransport):
+    """Merge concurrent read requests into fewer ``bd`` process invocations.
+
+    Concurrent ``show <id> --json`` requests issued from the same event loop
+    are folded into a single ``show <id> <id> ... --json`` invocation, and
+    identical in-flight ``show``/``list``/``ready`` requests share one
+    execution. Mutations always pass straight through to the inner
+    transport and start a new write generation, so a read issued after a
+    write never joins a read that began before it.
+
+    Args:
+        transport: Transport that runs the merged commands. Defaults to a
+            subprocess transport.
+        max_show_batch: Upper bound on issue ids per merged ``show`` call.
+    """
+
+    def __init__(
+        self,
+        transport: BeadsTransport | None = None,
+        *,
+        max_show_batch: int = _DEFAULT_SHOW_BATCH_SIZE,
+    ) -> None:
+        if max_show_batch < 1:
+            raise ValueError("max_show_batch must be at least 1")
+        self._transport = transport or SubprocessBeadsTransport()
+        self._max_show_batch = max_show_batch
+        self._pending_shows: dict[
+            _BatchKey,
+            list[tuple[str, BeadsCommandRequest, asyncio.Future[BeadsCommandResult]]],
+        ] = {}
+        self._in_flight: dict[_BatchKey, asyncio.Future[BeadsCommandResult]] = {}
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        self._write_generation = 0
+
+    async def execute(self, request: BeadsCommandRequest) -> BeadsCommandResult:
+        if request.operation not in _COALESCED_READ_OPERATIONS:
+            # Bump on both sides of the write: reads issued while it runs
+            # must not be shared with reads issued after it completes.
+            self._write_generation += 1
+            try:
+                return await self._transport.execute(request)
+            finally:
+                self._write_generation += 1
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), self._write_generation, request.argv, *_request_scope(request))
+        shared = self._in_flight.get(flight_key)
+        if shared is not None:
+            return await asyncio.shield(shared)
+        future: asyncio.Future[BeadsCommandResult] = loop.create_future()
+        self._in_flight[flight_key] = future
+        try:
+            result = await self._execute_read(request, loop=loop)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so waiter-free failures do not warn on GC.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._in_flight.pop(flight_key, None)
+
+    async def _execute_read(
+        self,
+        request: BeadsCommandRequest,
+        *,
+        loop: asyncio.AbstractEventLoop,
+    ) -> BeadsCommandResult:
+        issue_id = _batchable_show_issue_id(request)
+        if issue_id is None:
+            return await self._transport.execute(request)
+        batch_key = (
+            id(loop),
+            self._write_generation,
+            request.argv[:-3],
+            *_request_scope(request),
+        )
+        future: asyncio.Future[BeadsCommandResult] = loop.create_future()
+        pending = self._pending_shows.get(batch_key)
+        if pending is None:
+            pending = []
+            self._pending_shows[batch_key] = pending
+            task = loop.create_task(self._flush_shows(batch_key))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        pending.append((issue_id, request, future))
+        return await future
+
+    async def _flush_shows(self, batch_key: _BatchKey) -> None:
+        await asyncio.sleep(0)
+        pending = self._pending_shows.pop(batch_key, [])
+        for start in range(0, len(pending), self._max_show_batch):
+            chunk = pending[start : start + self._max_show_batch]
+            try:
+                results = await self._execute_show_chunk(chunk)
+            except asyncio.CancelledError:
+                for _issue_id, _request, future in pending[start:]:
+                    future.cancel()
+                raise
+            except Exception as exc:
+                for _issue_id, _request, future in chunk:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_issue_id, _request, future), result in zip(chunk, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _execute_show_chunk(
+        self,
+        chunk: list[tuple[str, BeadsCommandRequest, asyncio.Future[BeadsCommandResult]]],
+    ) -> list[BeadsCommandResult]:
+        if len(chunk) == 1:
+            return [await self._transport.execute(chunk[0][1])]
+        template = chunk[0][1]
+        issue_ids = tuple(issue_id for issue_id, _request, _future in chunk)
+        merged = template.model_copy(update={"argv": (*template.argv[:-2], *issue_ids, _JSON_FLAG)})
+        result = await self._transport.execute(merged)
+        payloads = _split_show_payload(result, issue_ids=issue_ids)
+        if payloads is None:
+            # Fall back to one request per issue so per-issue failures keep
+            # their original error detail.
+            return [await self._transport.execute(request) for _id, request, _f in chunk]
+        return [
+            BeadsCommandResult(
+                argv=request.argv,
+                returncode=0,
+                stdout=json.dumps([payloads[issue_id]]),
+                stderr=result.stderr,
+            )
+            for issue_id, request, _future in chunk
+        ]
+
+
+def _split_show_payload(
+    result: BeadsCommandResult,
+    *,
+    issue_ids: tuple[str, ...],
+) -> dict[str, object] | None:
+    if result.returncode != 0 or result.timed_out:
+        return None
+    try:
+        payload = json.loads(result.stdout.strip() or "null")
+    except json.JSONDecodeError:
+        return None
+    items = payload if isinstance(payload, list) else [payload]
+    by_id: dict[str, object] = {}
+    for item in items:
+        if isinstance(item, dict) and isinstance(item.get("id"), str):
+            by_id[item["id"]] = item
+    if any(issue_id not in by_id for issue_id in issue_ids):
+        return None
+    return by_id
+
+
 def _extend_optional_args(argv: list[str], *items: tuple[str, object | None]) -> None:
     for flag, value in items:
         if value is not None:
@@ -395,6 +592,34 @@ class SubprocessBeadsClient(Beads):
         )
         return _parse_single_issue(result, operation=SupportedOperation.SHOW)
 
+    async def show_many(self, request: ShowManyIssuesRequest) -> tuple[IssueRecord, ...]:
+        await self._ensure_environment_supports(SupportedOperation.SHOW)
+        issues: list[IssueRecord] = []
+        issue_ids = request.issue_ids
+        for start in range(0, len(issue_ids), _DEFAULT_SHOW_BATCH_SIZE):
+            chunk = issue_ids[start : start + _DEFAULT_SHOW_BATCH_SIZE]
+            result = await self._execute_raw(
+                ("show", *chunk, _JSON_FLAG),
+                operation=SupportedOperation.SHOW,
+            )
+            if result.returncode == 0:
+                issues.extend(_parse_issue_list(result, operation=SupportedOperation.SHOW))
+                continue
+            if not _is_missing_issue_failure(result):
+                raise _command_error(result)
+            # One missing id fails the whole bulk call; retry per id so the
+            # remaining issues are still returned.
+            for issue_id in chunk:
+                single = await self._execute_raw(
+                    ("show", issue_id, _JSON_FLAG),
+                    operation=SupportedOperation.SHOW,
+                )
+                if single.returncode == 0:
+                    issues.extend(_parse_issue_list(single, operation=SupportedOperation.SHOW))
+                elif not _is_missing_issue_failure(single):
+                    raise _command_error(single)
+        return tuple(issues)
+
     async def list(self, request: ListIssuesRequest) -> tuple[IssueRecord, ...]:
         await self._ensure_environment_supports(SupportedOperation.LIST)
         argv = ["list", "--json"]
@@ -457,30 +682,46 @@ class SubprocessBeadsClient(Beads):
 
     async def update(self, request: UpdateIssueRequest) -> IssueRecord:
         await self._ensure_environment_supports(SupportedOperation.UPDATE)
-        if request.labels == ():
-            raise UnsupportedOperationError(
-                "bd update label clearing is not supported by this client"
-            )
-
-        argv = ["update", request.issue_id, "--json"]
-        _extend_optional_args(
-            argv,
-            ("--title", request.title),
-            ("--description", request.description),
-            ("--design", request.design),
-            ("--acceptance", request.acceptance_criteria),
-            ("--status", request.status),
-            ("--assignee", request.assignee),
-            ("--priority", request.priority),
-            ("--estimate", request.estimate),
-        )
-        if request.labels:
-            for label in request.labels:
-                argv.extend(["--set-labels", label])
-
+        argv = ["update", request.issue_id, "--json", *_update_flags(request)]
         result = await self._execute(SupportedOperation.UPDATE, *argv)
         return _parse_single_issue(result, operation=SupportedOperation.UPDATE)
 
+    async def update_many(self, request: UpdateManyIssuesRequest) -> tuple[IssueUpdateResult, ...]:
+        await self._ensure_environment_supports(SupportedOperation.UPDATE)
+        results: dict[int, IssueUpdateResult] = {}
+        groups: dict[tuple[str, ...], list[int]] = {}
+        for index, update in enumerate(request.updates):
+            try:
+                flags = tuple(_update_flags(update))
+            except BeadError as exc:
+                results[index] = IssueUpdateResult(issue_id=update.issue_id, error=str(exc))
+                continue
+            groups.setdefault(flags, []).append(index)
+        for flags, indexes in groups.items():
+            for start in range(0, len(indexes), _DEFAULT_SHOW_BATCH_SIZE):
+                chunk = indexes[start : start + _DEFAULT_SHOW_BATCH_SIZE]
+                issue_ids = [request.updates[index].issue_id for index in chunk]
+                batch = await self._execute_raw(
+                    ("update", *issue_ids, _JSON_FLAG, *flags),
+                    operation=SupportedOperation.UPDATE,
+                )
+                updated = _issues_by_id(batch) if batch.returncode == 0 else {}
+                for index in chunk:
+                    update = request.updates[index]
+                    issue = updated.get(update.issue_id)
+                    if issue is not None:
+                        results[index] = IssueUpdateResult(issue_id=update.issue_id, issue=issue)
+                        continue
+                    # A failed or partial batch is retried per issue so each
+                    # update reports its own outcome.
+                    try:
+                        issue = await self.update(update)
+                    except BeadError as exc:
+                        results[index] = IssueUpdateResult(issue_id=update.issue_id, error=str(exc))
+                    else:
+                        results[index] = IssueUpdateResult(issue_id=update.issue_id, issue=issue)
+        return tuple(results[index] for index in range(len(request.updates)))
+
     async def close(self, request: CloseIssueRequest) -> IssueRecord:
         await self._ensure_environment_supports(SupportedOperation.CLOSE)
         argv = ["close", request.issue_id, "--json"]
@@ -616,12 +857,7 @@ class SubprocessBeadsClient(Beads):
     async def _execute(self, operation: SupportedOperation, *argv: str) -> BeadsCommandResult:
         result = await self._execute_raw(argv, operation=operation)
         if result.returncode != 0:
-            command_text = " ".join(result.argv)
-            detail = result.stderr.strip() or result.stdout.strip()
-            message = f"bd command failed ({result.returncode}): {command_text}"
-            if detail:
-                message = f"{message}\n{detail}"
-            raise BeadsCommandError(message)
+            raise _command_error(result)
         return result
 
     async def _execute_raw(
@@ -642,6 +878,20 @@ class SubprocessBeadsClient(Beads):
         )
 
 
+def _command_error(result: BeadsCommandResult) -> BeadsCommandError:
+    command_text = " ".join(result.argv)
+    detail = result.stderr.strip() or result.stdout.strip()
+    message = f"bd command failed ({result.returncode}): {command_text}"
+    if detail:
+        message = f"{message}\n{detail}"
+    return BeadsCommandError(message)
+
+
+def _is_missing_issue_failure(result: BeadsCommandResult) -> bool:
+    detail = f"{result.stderr}\n{result.stdout}".lower()
+    return any(marker in detail for marker in _MISSING_ISSUE_MARKERS)
+
+
 def _parse_version(result: BeadsCommandResult) -> SemanticVersion:
     return decode_version_output(result)
 
@@ -696,6 +946,35 @@ def decode_help_output(result: BeadsCommandResult) -> BeadsCommandHelp:
     )
 
 
+def _update_flags(request: UpdateIssueRequest) -> list[str]:
+    if request.labels == ():
+        raise UnsupportedOperationError("bd update label clearing is not supported by this client")
+    flags: list[str] = []
+    _extend_optional_args(
+        flags,
+        ("--title", request.title),
+        ("--description", request.description),
+        ("--design", request.design),
+        ("--acceptance", request.acceptance_criteria),
+        ("--status", request.status),
+        ("--assignee", request.assignee),
+        ("--priority", request.priority),
+        ("--estimate", request.estimate),
+    )
+    if request.labels:
+        for label in request.labels:
+            flags.extend(["--set-labels", label])
+    return flags
+
+
+def _issues_by_id(result: BeadsCommandResult) -> dict[str, IssueRecord]:
+    try:
+        issues = _parse_issue_list(result, operation=SupportedOperation.UPDATE)
+    except BeadsParseError:
+        return {}
+    return {issue.id: issue for issue in issues}
+
+
 def _parse_single_issue(
     result: BeadsCommandResult,
     *,
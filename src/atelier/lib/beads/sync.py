@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Coroutine, Mapping
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Any, Protocol, TypeVar, cast, runtime_checkable
 
-from .client import Beads
+from .client import Beads, BeadsTransport
 from .compatibility import CompatibilityPolicy
 from .models import (
     BeadsEnvironment,
@@ -15,13 +16,19 @@ from .models import (
     CreateIssueRequest,
     DependencyMutationRequest,
     IssueRecord,
+    IssueUpdateResult,
     ListIssuesRequest,
     ReadyIssuesRequest,
     ShowIssueRequest,
+    ShowManyIssuesRequest,
     UpdateIssueRequest,
+    UpdateManyIssuesRequest,
 )
 from .process import SubprocessBeadsClient
 
+_T = TypeVar("_T")
+_CoroutineRunner = Callable[[Coroutine[Any, Any, Any]], Any]
+
 
 @runtime_checkable
 class SyncBeadsProtocol(Protocol):
@@ -33,6 +40,8 @@ class SyncBeadsProtocol(Protocol):
 
     def show(self, request: ShowIssueRequest) -> IssueRecord: ...
 
+    def show_many(self, request: ShowManyIssuesRequest) -> tuple[IssueRecord, ...]: ...
+
     def list(self, request: ListIssuesRequest) -> tuple[IssueRecord, ...]: ...
 
     def ready(self, request: ReadyIssuesRequest) -> tuple[IssueRecord, ...]: ...
@@ -41,6 +50,8 @@ class SyncBeadsProtocol(Protocol):
 
     def update(self, request: UpdateIssueRequest) -> IssueRecord: ...
 
+    def update_many(self, request: UpdateManyIssuesRequest) -> tuple[IssueUpdateResult, ...]: ...
+
     def close(self, request: CloseIssueRequest) -> IssueRecord: ...
 
     def add_dependency(self, request: DependencyMutationRequest) -> IssueRecord: ...
@@ -53,48 +64,60 @@ class SyncBeadsClient:
 
     Args:
         async_client: Async-first Beads client to execute.
+        runner: Callable that drives one coroutine to completion. Defaults to
+            ``asyncio.run``, which builds a new event loop per call.
 
     Raises:
         RuntimeError: Raised by ``asyncio.run`` when called from an active
             event loop.
     """
 
-    def __init__(self, async_client: Beads) -> None:
+    def __init__(self, async_client: Beads, *, runner: _CoroutineRunner | None = None) -> None:
         self._async_client = async_client
+        self._runner: _CoroutineRunner = runner or asyncio.run
+
+    def _run(self, coroutine: Coroutine[Any, Any, _T]) -> _T:
+        return cast(_T, self._runner(coroutine))
 
     @property
     def compatibility_policy(self) -> CompatibilityPolicy:
         return self._async_client.compatibility_policy
 
     def inspect_environment(self) -> BeadsEnvironment:
-        return asyncio.run(self._async_client.inspect_environment())
+        return self._run(self._async_client.inspect_environment())
 
     def inspect_startup_state(self) -> BeadsStartupState:
-        return asyncio.run(self._async_client.inspect_startup_state())
+        return self._run(self._async_client.inspect_startup_state())
 
     def show(self, request: ShowIssueRequest) -> IssueRecord:
-        return asyncio.run(self._async_client.show(request))
+        return self._run(self._async_client.show(request))
+
+    def show_many(self, request: ShowManyIssuesRequest) -> tuple[IssueRecord, ...]:
+        return self._run(self._async_client.show_many(request))
 
     def list(self, request: ListIssuesRequest) -> tuple[IssueRecord, ...]:
-        return asyncio.run(self._async_client.list(request))
+        return self._run(self._async_client.list(request))
 
     def ready(self, request: ReadyIssuesRequest) -> tuple[IssueRecord, ...]:
-        return asyncio.run(self._async_client.ready(request))
+        return self._run(self._async_client.ready(request))
 
     def create(self, request: CreateIssueRequest) -> IssueRecord:
-        return asyncio.run(self._async_client.create(request))
+        return self._run(self._async_client.create(request))
 
     def update(self, request: UpdateIssueRequest) -> IssueRecord:
-        return asyncio.run(self._async_client.update(request))
+        return self._run(self._async_client.update(request))
+
+    def update_many(self, request: UpdateManyIssuesRequest) -> tuple[IssueUpdateResult, ...]:
+        return self._run(self._async_client.update_many(request))
 
     def close(self, request: CloseIssueRequest) -> IssueRecord:
-        return asyncio.run(self._async_client.close(request))
+        return self._run(self._async_client.close(request))
 
     def add_dependency(self, request: DependencyMutationRequest) -> IssueRecord:
-        return asyncio.run(self._async_client.add_dependency(request))
+        return self._run(self._async_client.add_dependency(request))
 
     def remove_dependency(self, request: DependencyMutationRequest) -> IssueRecord:
-        return asyncio.run(self._async_client.remove_dependency(request))
+        return self._run(self._async_client.remove_dependency(request))
 
 
 def build_sync_beads_client(
@@ -102,6 +125,9 @@ def build_sync_beads_client(
     cwd: Path,
     beads_root: Path,
     readonly: bool = False,
+    transport: BeadsTransport | None = None,
+    env: Mapping[str, str] | None = None,
+    runner: _CoroutineRunner | None = None,
 ) -> SyncBeadsClient:
     """Build a sync Beads client for low-level boundary helpers.
 
@@ -109,6 +135,11 @@ def build_sync_beads_client(
         cwd: Repository-local working directory for ``bd`` subprocesses.
         beads_root: Root of the Beads store to target.
         readonly: Whether to prepend ``--readonly`` to every ``bd`` command.
+        transport: Optional transport shared with other clients, such as a
+            ``BatchingBeadsTransport`` reused across one CLI run.
+        env: Optional extra environment for every ``bd`` subprocess.
+        runner: Optional coroutine runner, such as one that reuses a
+            long-lived event loop. Defaults to ``asyncio.run``.
 
     Returns:
         A synchronous facade over the subprocess-backed Beads client.
@@ -117,9 +148,11 @@ def build_sync_beads_client(
     global_args: tuple[str, ...] = ("--readonly",) if readonly else ()
     return SyncBeadsClient(
         SubprocessBeadsClient(
+            transport=transport,
             cwd=cwd,
             beads_root=beads_root,
-            env={"BEADS_DIR": str(beads_root)},
+            env={**(env or {}), "BEADS_DIR": str(beads_root)},
             global_args=global_args,
-        )
+        ),
+        runner=runner,
     )
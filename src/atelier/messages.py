@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Final, Literal
 
 FRONTMATTER_DELIMITER = "---"
@@ -30,6 +31,7 @@ _MESSAGE_KEY_ORDER = (
 _RUNTIME_ROLE_ORDER: Final[tuple[str, ...]] = ("worker", "planner", "operator")
 _RUNTIME_ROLES: Final[frozenset[str]] = frozenset(_RUNTIME_ROLE_ORDER)
 _NEEDS_DECISION_SUBJECT_PREFIX: Final[str] = "NEEDS-DECISION:"
+_PARSE_CACHE_SIZE = 2048
 
 MessageDelivery = Literal["work-threaded", "agent-addressed"]
 MessageThreadKind = Literal["changeset", "epic", "work"]
@@ -165,8 +167,22 @@ def parse_message(description: str) -> MessagePayload:
     Returns:
         Parsed metadata/body pair. If frontmatter is absent or malformed, the
         original description is returned as the body with empty metadata.
+        Parses are memoized by description; the metadata mapping is a copy.
     """
 
+    parsed = _parsed_message(description)
+    # Callers fill in claim metadata, so never hand out the memoized mapping.
+    return MessagePayload(
+        metadata={
+            key: list(value) if isinstance(value, list) else value
+            for key, value in parsed.metadata.items()
+        },
+        body=parsed.body,
+    )
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parsed_message(description: str) -> MessagePayload:
     raw = description.strip("\n")
     if not raw.startswith(FRONTMATTER_DELIMITER):
         return MessagePayload(metadata={}, body=description)
@@ -0,0 +1,15 @@
+"""Allowed values for constrained configuration fields.
+
+Kept free of pydantic so the CLI can build option choices without importing
+:mod:`atelier.models`.
+"""
+
+from __future__ import annotations
+
+BRANCH_HISTORY_VALUES = ("manual", "squash", "merge", "rebase")
+BRANCH_SQUASH_MESSAGE_VALUES = ("deterministic", "agent")
+BRANCH_PR_MODE_VALUES = ("none", "draft", "ready")
+WORKER_SELECT_VALUES = ("first-eligible", "oldest-feedback")
+UPGRADE_POLICY_VALUES = ("always", "ask", "manual")
+BEADS_LOCATION_VALUES = ("repo", "project")
+BEADS_RUNTIME_MODE_VALUES = ("dolt-server",)
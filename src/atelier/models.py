@@ -8,22 +8,19 @@ from typing import Literal
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from . import agents
+from .model_values import (
+    BEADS_RUNTIME_MODE_VALUES,
+    BRANCH_PR_MODE_VALUES,
+    BRANCH_SQUASH_MESSAGE_VALUES,
+    WORKER_SELECT_VALUES,
+)
 
-BRANCH_HISTORY_VALUES = ("manual", "squash", "merge", "rebase")
 BranchHistory = Literal["manual", "squash", "merge", "rebase"]
-BRANCH_SQUASH_MESSAGE_VALUES = ("deterministic", "agent")
 BranchSquashMessage = Literal["deterministic", "agent"]
-BRANCH_PR_MODE_VALUES = ("none", "draft", "ready")
 BranchPrMode = Literal["none", "draft", "ready"]
-WORKER_SELECT_VALUES = ("first-eligible", "oldest-feedback")
 WorkerSelectMode = Literal["first-eligible", "oldest-feedback"]
-
-UPGRADE_POLICY_VALUES = ("always", "ask", "manual")
 UpgradePolicy = Literal["always", "ask", "manual"]
-
-BEADS_LOCATION_VALUES = ("repo", "project")
 BeadsLocation = Literal["repo", "project"]
-BEADS_RUNTIME_MODE_VALUES = ("dolt-server",)
 BeadsRuntimeMode = Literal["dolt-server"]
 BEADS_PREFIX_PATTERN = re.compile(r"^[a-z][a-z0-9]{0,15}$")
 
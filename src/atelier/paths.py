@@ -12,6 +12,9 @@ WORKTREES_DIRNAME = "worktrees"
 TEMPLATES_DIRNAME = "templates"
 SKILLS_DIRNAME = "skills"
 AGENTS_DIRNAME = "agents"
+CACHE_DIRNAME = "cache"
+PR_CACHE_FILENAME = "github-prs.json"
+CODEX_SESSION_INDEX_FILENAME = "codex-sessions.json"
 BEADS_DIRNAME = ".beads"
 LEGACY_CONFIG_FILENAME = "config.json"
 PROJECT_CONFIG_SYS_FILENAME = "config.sys.json"
@@ -95,6 +98,16 @@ def project_agents_dir(project_dir: Path) -> Path:
     return project_dir / AGENTS_DIRNAME
 
 
+def codex_session_index_path() -> Path:
+    """Return the incremental Codex session index file."""
+    return atelier_data_dir() / CACHE_DIRNAME / CODEX_SESSION_INDEX_FILENAME
+
+
+def project_pr_cache_path(project_dir: Path) -> Path:
+    """Return the persistent GitHub PR lookup cache file for a project."""
+    return project_dir / CACHE_DIRNAME / PR_CACHE_FILENAME
+
+
 def installed_legacy_config_path() -> Path:
     """Return the legacy installed defaults config path."""
     return atelier_data_dir() / LEGACY_CONFIG_FILENAME
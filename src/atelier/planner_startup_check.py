@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, TypeVar
 
 from . import beads, lifecycle, messages
-from .lib.beads import Beads, SubprocessBeadsClient
+from .lib.beads import BatchingBeadsTransport, Beads, SubprocessBeadsClient
 from .store import (
     ChangesetQuery,
     EpicQuery,
@@ -20,6 +21,10 @@ from .store import (
 _SUPPORTED_LIST_FLAGS = frozenset({"--label", "--assignee", "--all", "--limit", "--parent"})
 _LIST_FLAGS_REQUIRING_VALUE = frozenset({"--label", "--assignee", "--limit", "--parent"})
 _FORBIDDEN_INVOCATION_PREFIXES = ("--db", "--db=", "--beads-dir", "--beads-dir=")
+_ACTIVE_EPIC_STATUSES = frozenset({"open", "in_progress", "blocked"})
+DEFAULT_DEFERRED_EPIC_SCAN_LIMIT = 25
+
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True)
@@ -37,6 +42,22 @@ class StartupCommandStep:
     output: str
 
 
+@dataclass(frozen=True)
+class StartupDeferredScan:
+    """Deferred changesets found under the active epics startup scanned.
+
+    Attributes:
+        groups: Active epics paired with their deferred descendant
+            changesets, both sorted by issue id.
+        scan_limit: Maximum number of active epics scanned.
+        skipped_epics: Active epics left unscanned because of the limit.
+    """
+
+    groups: list[tuple[dict[str, object], list[dict[str, object]]]] = field(default_factory=list)
+    scan_limit: int = 0
+    skipped_epics: int = 0
+
+
 @dataclass(frozen=True)
 class StartupCommandResult:
     """Structured outputs from the canonical startup command plan."""
@@ -45,6 +66,7 @@ class StartupCommandResult:
     queued_messages: list[dict[str, object]]
     epics: list[dict[str, object]]
     parity_report: object
+    deferred_scan: StartupDeferredScan = field(default_factory=StartupDeferredScan)
 
 
 @dataclass(frozen=True)
@@ -146,6 +168,7 @@ def _build_store(*, beads_root: Path, cwd: Path, beads_client: Beads | None = No
 
 def _build_beads_client(*, beads_root: Path, cwd: Path) -> Beads:
     return SubprocessBeadsClient(
+        transport=BatchingBeadsTransport(),
         cwd=cwd,
         beads_root=beads_root,
         env={"BEADS_DIR": str(beads_root)},
@@ -525,12 +548,19 @@ _STARTUP_COMMAND_PLAN: tuple[StartupCommandStep, ...] = (
         inputs=("epics",),
         output="parity_report",
     ),
+    StartupCommandStep(
+        name="group_deferred_changesets",
+        inputs=("epics",),
+        output="deferred_scan",
+    ),
 )
 
 
 def startup_command_plan() -> tuple[StartupCommandStep, ...]:
     """Return the canonical planner-startup command plan in execution order.
 
+    Steps whose inputs are all available run concurrently.
+
     Returns:
         Ordered startup command steps with explicit input and output contracts.
     """
@@ -601,7 +631,63 @@ class StartupBeadsInvocationHelper:
     ) -> list[dict[str, object]]:
         """List planner inbox messages via store-native message projections."""
 
-        issues = self._list_startup_messages(unread_only=unread_only)
+        return asyncio.run(self._inbox_messages(agent_id, unread_only=unread_only))
+
+    def list_queue_messages(
+        self,
+        *,
+        queue: str | None = None,
+        unclaimed_only: bool = True,
+        unread_only: bool = True,
+    ) -> list[dict[str, object]]:
+        """List queued message beads from store-backed message queries."""
+
+        return asyncio.run(
+            self._queue_messages(
+                queue=queue,
+                unclaimed_only=unclaimed_only,
+                unread_only=unread_only,
+            )
+        )
+
+    def list_epics(self, *, include_closed: bool = False) -> list[dict[str, object]]:
+        """List indexed epics through the Atelier store."""
+
+        return asyncio.run(self._epics(include_closed=include_closed))
+
+    def list_descendant_changesets(
+        self,
+        parent_id: str,
+        *,
+        include_closed: bool = False,
+    ) -> list[dict[str, object]]:
+        """List descendant changesets (leaf work beads under a parent)."""
+
+        return asyncio.run(self._descendant_changesets(parent_id, include_closed=include_closed))
+
+    def epic_discovery_parity_report(self) -> object:
+        """Return startup epic discovery parity diagnostics."""
+
+        return asyncio.run(self._store().epic_discovery_parity())
+
+    def run_in_read_session(self, pending: Coroutine[Any, Any, _T]) -> _T:
+        """Run ``pending`` on one event loop inside one store read session.
+
+        Every store call made by ``pending`` shares the same issue snapshot,
+        and concurrent calls share reads that are still in flight.
+        """
+
+        with self._store().read_session():
+            return asyncio.run(pending)
+
+    async def _inbox_messages(
+        self,
+        agent_id: str,
+        *,
+        unread_only: bool,
+    ) -> list[dict[str, object]]:
+        del agent_id
+        issues = await self._startup_messages(unread_only=unread_only)
         matches: list[dict[str, object]] = []
         seen_ids: set[str] = set()
         for issue in issues:
@@ -624,16 +710,14 @@ class StartupBeadsInvocationHelper:
             matches.append({"id": issue.id, "title": title})
         return matches
 
-    def list_queue_messages(
+    async def _queue_messages(
         self,
         *,
-        queue: str | None = None,
-        unclaimed_only: bool = True,
-        unread_only: bool = True,
+        queue: str | None,
+        unclaimed_only: bool,
+        unread_only: bool,
     ) -> list[dict[str, object]]:
-        """List queued message beads from store-backed message queries."""
-
-        issues = self._list_startup_messages(queue=queue, unread_only=unread_only)
+        issues = await self._startup_messages(queue=queue, unread_only=unread_only)
         matches: list[dict[str, object]] = []
         for issue in issues:
             normalized_claim = issue.claimed_by
@@ -649,90 +733,159 @@ class StartupBeadsInvocationHelper:
             )
         return matches
 
-    def _list_startup_messages(
+    async def _startup_messages(
         self,
         *,
         queue: str | None = None,
         unread_only: bool,
     ) -> tuple[StartupMessageRecord, ...]:
-        store = self._store()
         query = MessageQuery(queue=queue, unread_only=unread_only)
-        return asyncio.run(store.list_startup_messages(query))
-
-    def list_epics(self, *, include_closed: bool = False) -> list[dict[str, object]]:
-        """List indexed epics through the Atelier store."""
+        return await self._store().list_startup_messages(query)
 
-        epics = asyncio.run(
-            self._store().list_epics(
-                EpicQuery(include_closed=include_closed, include_changesets=False)
-            )
+    async def _epics(self, *, include_closed: bool) -> list[dict[str, object]]:
+        epics = await self._store().list_epics(
+            EpicQuery(include_closed=include_closed, include_changesets=False)
         )
         return [_epic_issue_payload(epic) for epic in epics]
 
-    def list_descendant_changesets(
+    async def _descendant_changesets(
         self,
         parent_id: str,
         *,
-        include_closed: bool = False,
+        include_closed: bool,
     ) -> list[dict[str, object]]:
-        """List descendant changesets (leaf work beads under a parent)."""
-
-        changesets = asyncio.run(
-            self._store().list_changesets(
-                ChangesetQuery(epic_id=parent_id, include_closed=include_closed)
-            )
+        changesets = await self._store().list_changesets(
+            ChangesetQuery(epic_id=parent_id, include_closed=include_closed)
         )
         return [_changeset_issue_payload(changeset) for changeset in changesets]
 
-    def epic_discovery_parity_report(self) -> object:
-        """Return startup epic discovery parity diagnostics."""
-
-        return asyncio.run(self._store().epic_discovery_parity())
+    async def _deferred_scan(
+        self,
+        epics: list[dict[str, object]],
+        *,
+        scan_limit: int,
+    ) -> StartupDeferredScan:
+        active_epics = [
+            epic
+            for epic in sorted(epics, key=_issue_sort_key)
+            if lifecycle.canonical_lifecycle_status(epic.get("status")) in _ACTIVE_EPIC_STATUSES
+            and str(epic.get("id") or "").strip()
+        ]
+        scanned_epics = active_epics[:scan_limit]
+        if scanned_epics:
+            # One full scan answers every descendant listing below.
+            await self._store().preload_issues()
+        descendants = await asyncio.gather(
+            *(
+                self._descendant_changesets(
+                    str(epic.get("id") or "").strip(),
+                    include_closed=False,
+                )
+                for epic in scanned_epics
+            )
+        )
+        groups: list[tuple[dict[str, object], list[dict[str, object]]]] = []
+        for epic, changesets in zip(scanned_epics, descendants, strict=True):
+            deferred = [
+                issue
+                for issue in changesets
+                if lifecycle.canonical_lifecycle_status(issue.get("status")) == "deferred"
+            ]
+            if deferred:
+                groups.append((epic, sorted(deferred, key=_issue_sort_key)))
+        return StartupDeferredScan(
+            groups=groups,
+            scan_limit=scan_limit,
+            skipped_epics=len(active_epics) - len(scanned_epics),
+        )
 
 
 def execute_startup_command_plan(
     agent_id: str,
     *,
     helper: StartupBeadsInvocationHelper,
+    deferred_scan_limit: int = DEFAULT_DEFERRED_EPIC_SCAN_LIMIT,
 ) -> StartupCommandResult:
-    """Execute the canonical startup command plan in fixed order.
+    """Execute the canonical startup command plan against one issue snapshot.
+
+    Every step runs on one event loop inside one store read session. Steps
+    whose inputs are ready run concurrently and share the same Beads scan.
 
     Args:
         agent_id: Planner agent id used for inbox lookup.
         helper: Shared Beads invocation helper bound to beads root + repo cwd.
+        deferred_scan_limit: Maximum number of active epics searched for
+            deferred changesets.
 
     Returns:
         Structured startup command outputs.
 
     Raises:
-        RuntimeError: If the plan contains an unknown step.
+        RuntimeError: If the plan contains an unknown step or a step whose
+            inputs no other step produces.
     """
 
-    inbox_messages: list[dict[str, object]] = []
-    queued_messages: list[dict[str, object]] = []
-    epics: list[dict[str, object]] = []
-    parity_report: object | None = None
-
-    for step in startup_command_plan():
-        if step.name == "list_inbox_unread_messages":
-            inbox_messages = helper.list_inbox_messages(agent_id, unread_only=True)
-            continue
-        if step.name == "list_queue_unread_messages":
-            queued_messages = helper.list_queue_messages(unclaimed_only=False, unread_only=True)
-            continue
-        if step.name == "list_indexed_epics":
-            epics = helper.list_epics(include_closed=False)
-            continue
-        if step.name == "compute_epic_discovery_parity":
-            parity_report = helper.epic_discovery_parity_report()
-            continue
-        raise RuntimeError(f"unknown startup command step: {step.name}")
-
-    if parity_report is None:
-        parity_report = helper.epic_discovery_parity_report()
+    outputs = helper.run_in_read_session(
+        _run_startup_command_plan(
+            agent_id,
+            helper=helper,
+            deferred_scan_limit=max(0, deferred_scan_limit),
+        )
+    )
     return StartupCommandResult(
-        inbox_messages=inbox_messages,
-        queued_messages=queued_messages,
-        epics=epics,
-        parity_report=parity_report,
+        inbox_messages=outputs["inbox_messages"],
+        queued_messages=outputs["queued_messages"],
+        epics=outputs["epics"],
+        parity_report=outputs["parity_report"],
+        deferred_scan=outputs["deferred_scan"],
     )
+
+
+async def _run_startup_command_plan(
+    agent_id: str,
+    *,
+    helper: StartupBeadsInvocationHelper,
+    deferred_scan_limit: int,
+) -> dict[str, Any]:
+    values: dict[str, Any] = {"agent_id": agent_id}
+    pending = list(startup_command_plan())
+    while pending:
+        ready = [step for step in pending if all(name in values for name in step.inputs)]
+        if not ready:
+            names = ", ".join(step.name for step in pending)
+            raise RuntimeError(f"startup command steps have unmet inputs: {names}")
+        results = await asyncio.gather(
+            *(
+                _run_startup_command_step(
+                    step,
+                    values,
+                    helper=helper,
+                    deferred_scan_limit=deferred_scan_limit,
+                )
+                for step in ready
+            )
+        )
+        for step, result in zip(ready, results, strict=True):
+            values[step.output] = result
+        pending = [step for step in pending if step not in ready]
+    return values
+
+
+async def _run_startup_command_step(
+    step: StartupCommandStep,
+    values: dict[str, Any],
+    *,
+    helper: StartupBeadsInvocationHelper,
+    deferred_scan_limit: int,
+) -> object:
+    if step.name == "list_inbox_unread_messages":
+        return await helper._inbox_messages(values["agent_id"], unread_only=True)
+    if step.name == "list_queue_unread_messages":
+        return await helper._queue_messages(queue=None, unclaimed_only=False, unread_only=True)
+    if step.name == "list_indexed_epics":
+        return await helper._epics(include_closed=False)
+    if step.name == "compute_epic_discovery_parity":
+        return await helper._store().epic_discovery_parity()
+    if step.name == "group_deferred_changesets":
+        return await helper._deferred_scan(values["epics"], scan_limit=deferred_scan_limit)
+    raise RuntimeError(f"unknown startup command step: {step.name}")
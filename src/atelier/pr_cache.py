@@ -0,0 +1,188 @@
+"""Persistent cross-process cache for GitHub PR lookups."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+_CACHE_VERSION = 1
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_SIGNAL_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 1024
+
+
+@dataclass(frozen=True)
+class CachedValue:
+    """One persisted cache entry."""
+
+    value: object
+    stored_at: float
+    etag: str | None = None
+
+    def fresh(self, ttl_seconds: float, *, now: float | None = None) -> bool:
+        """Return whether the entry is younger than ``ttl_seconds``."""
+        current = time.time() if now is None else now
+        return 0 <= current - self.stored_at < ttl_seconds
+
+
+def _stored_at(entry: dict[str, Any]) -> float:
+    stored_at = entry.get("stored_at")
+    return float(stored_at) if isinstance(stored_at, (int, float)) else 0.0
+
+
+def cache_key(*parts: object) -> str:
+    """Return the stable string key used for one cache entry."""
+    return json.dumps([str(part) for part in parts])
+
+
+class PrLookupDiskCache:
+    """JSON-file cache shared by every Atelier process of one project.
+
+    The file is rewritten atomically and reloaded when another process
+    changes it. Concurrent writers can drop each other's newest entries;
+    that only costs a refetch, never a wrong answer.
+
+    Args:
+        path: JSON file backing the cache.
+        ttl_seconds: Age after which PR lookups must be revalidated.
+        signal_ttl_seconds: Age after which review-thread signals expire.
+        max_entries: Entry bound; the oldest entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        signal_ttl_seconds: float = DEFAULT_SIGNAL_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if ttl_seconds < 0 or signal_ttl_seconds < 0:
+            raise ValueError("PR cache TTLs must be non-negative")
+        if max_entries < 1:
+            raise ValueError("PR cache max_entries must be at least 1")
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.signal_ttl_seconds = signal_ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._loaded_mtime_ns: int | None = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedValue | None:
+        """Return the stored entry for ``key`` regardless of its age."""
+        with self._lock:
+            self._reload()
+            raw = self._entries.get(key)
+        if raw is None:
+            return None
+        stored_at = raw.get("stored_at")
+        if not isinstance(stored_at, (int, float)):
+            return None
+        etag = raw.get("etag")
+        return CachedValue(
+            value=raw.get("value"),
+            stored_at=float(stored_at),
+            etag=etag if isinstance(etag, str) and etag else None,
+        )
+
+    def put(self, key: str, value: object, *, etag: str | None = None) -> None:
+        """Store ``value`` for ``key`` and persist the cache file."""
+        with self._lock:
+            self._reload()
+            entry: dict[str, Any] = {"value": value, "stored_at": time.time()}
+            if etag:
+                entry["etag"] = etag
+            self._entries[key] = entry
+            self._write()
+
+    def touch(self, key: str, *, etag: str | None = None) -> None:
+        """Mark a revalidated entry fresh again, optionally with a new ETag."""
+        with self._lock:
+            self._reload()
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry["stored_at"] = time.time()
+            if etag:
+                entry["etag"] = etag
+            self._write()
+
+    def invalidate(self, *prefix: object) -> None:
+        """Drop every entry whose key starts with the given parts."""
+        expected = [str(part) for part in prefix]
+        with self._lock:
+            self._reload()
+            stale = [key for key in self._entries if json.loads(key)[: len(expected)] == expected]
+            if not stale:
+                return
+            for key in stale:
+                del self._entries[key]
+            self._write()
+
+    def clear(self) -> None:
+        """Remove every entry from the cache file."""
+        with self._lock:
+            self._entries = {}
+            self._write()
+
+    def _reload(self) -> None:
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:
+            self._entries = {}
+            self._loaded_mtime_ns = None
+            return
+        if mtime_ns == self._loaded_mtime_ns:
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = None
+        entries: object = None
+        if isinstance(payload, dict) and payload.get("version") == _CACHE_VERSION:
+            entries = payload.get("entries")
+        if not isinstance(entries, dict):
+            entries = {}
+        self._entries = {
+            key: value
+            for key, value in entries.items()
+            if isinstance(key, str) and isinstance(value, dict)
+        }
+        self._loaded_mtime_ns = mtime_ns
+
+    def _write(self) -> None:
+        if len(self._entries) > self.max_entries:
+            ordered = sorted(
+                self._entries.items(),
+                key=lambda item: _stored_at(item[1]),
+            )
+            self._entries = dict(ordered[-self.max_entries :])
+        payload = json.dumps({"version": _CACHE_VERSION, "entries": self._entries})
+        temp_path: Path | None = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.path.parent,
+                prefix=f".{self.path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                handle.write(payload)
+                temp_path = Path(handle.name)
+            os.replace(temp_path, self.path)
+            temp_path = None
+            self._loaded_mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:
+            self._loaded_mtime_ns = None
+        finally:
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
@@ -1384,6 +1384,7 @@ def scan_prefix_migration_drift(
     lookup_pr_status: PrLookupStatus = prs.lookup_github_pr_status,
     target_epic_id: str | None = None,
     target_changeset_ids: Collection[str] | None = None,
+    issue_snapshot: beads.IssueSnapshot | None = None,
 ) -> list[dict[str, object]]:
     """Scan for changeset drift caused by post-migration metadata split-brain.
 
@@ -1397,6 +1398,9 @@ def scan_prefix_migration_drift(
         target_epic_id: Optional epic id to scan. When omitted, scans all epics.
         target_changeset_ids: Optional changeset ids to scan within
             ``target_epic_id``. When omitted, scans all changesets for each epic.
+        issue_snapshot: Optional issue snapshot already loaded by the caller.
+            When provided, epics and their changesets are read from it instead
+            of re-listing them through bd.
 
     Returns:
         Deterministically ordered drift records.
@@ -1414,7 +1418,20 @@ def scan_prefix_migration_drift(
         )
         if normalized is not None
     }
-    if scoped_epic_id is None:
+
+    def changesets_for(epic_id: str, epic: dict[str, object]) -> list[dict[str, object]]:
+        if issue_snapshot is not None:
+            return issue_snapshot.changesets_for_epic(epic)
+        return _changesets_for_epic(
+            epic_id,
+            epic_issue=epic,
+            beads_root=beads_root,
+            repo_root=repo_root,
+        )
+
+    if scoped_epic_id is None and issue_snapshot is not None:
+        epics = issue_snapshot.epics()
+    elif scoped_epic_id is None:
         epics = beads.list_epics(beads_root=beads_root, cwd=repo_root, include_closed=True)
     else:
         try:
@@ -1450,12 +1467,7 @@ def scan_prefix_migration_drift(
                 normalized
                 for normalized in (
                     _normalize_text(changeset.get("id"))
-                    for changeset in _changesets_for_epic(
-                        epic_id,
-                        epic_issue=epic,
-                        beads_root=beads_root,
-                        repo_root=repo_root,
-                    )
+                    for changeset in changesets_for(epic_id, epic)
                 )
                 if normalized is not None
             }
@@ -1489,12 +1501,7 @@ def scan_prefix_migration_drift(
                         continue
                     changesets.append(issue)
         else:
-            changesets = _changesets_for_epic(
-                epic_id,
-                epic_issue=epic,
-                beads_root=beads_root,
-                repo_root=repo_root,
-            )
+            changesets = changesets_for(epic_id, epic)
         for changeset in sorted(changesets, key=lambda issue: str(issue.get("id") or "")):
             changeset_id = _normalize_text(changeset.get("id"))
             if changeset_id is None:
@@ -0,0 +1,200 @@
+"""Process-table snapshots shared by agent liveness checks.
+
+On Linux the table is read straight from ``/proc`` without spawning a
+process. Other platforms take one ``ps`` snapshot for the whole table, instead
+of one ``ps`` call per checked pid.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from . import exec
+
+_PROC_ROOT = Path("/proc")
+_PS_LSTART_FORMAT = "%a %b %d %H:%M:%S %Y"
+_PS_LSTART_FIELDS = 5
+_THREAD_PROCESS_TABLE = threading.local()
+
+
+@dataclass(frozen=True)
+class ProcessInfo:
+    """One running process as seen by a snapshot."""
+
+    pid: int
+    started_ns: int | None
+    command: str
+
+
+class ProcessTable:
+    """Lazily loaded, point-in-time view of running processes keyed by pid.
+
+    The full table is read on first use. Pids that are missing from the
+    snapshot, such as processes started after it was taken, are looked up
+    individually and cached.
+    """
+
+    def __init__(self) -> None:
+        self._processes: dict[int, ProcessInfo | None] | None = None
+
+    def _loaded(self) -> dict[int, ProcessInfo | None]:
+        if self._processes is None:
+            self._processes = {info.pid: info for info in _read_all_processes()}
+        return self._processes
+
+    def processes(self) -> tuple[ProcessInfo, ...]:
+        """Return every process captured by the snapshot, ordered by pid."""
+        return tuple(info for _pid, info in sorted(self._loaded().items()) if info is not None)
+
+    def get(self, pid: int) -> ProcessInfo | None:
+        """Return the process for ``pid`` or ``None`` when it is not running."""
+        if pid <= 0:
+            return None
+        processes = self._loaded()
+        if pid not in processes:
+            processes[pid] = _read_process(pid)
+        return processes[pid]
+
+    def started_ns(self, pid: int) -> int | None:
+        """Return the start time of ``pid`` in epoch nanoseconds, when known."""
+        info = self.get(pid)
+        return info.started_ns if info is not None else None
+
+
+def read_process_table() -> ProcessTable:
+    """Return a fresh process table that is not shared with other callers."""
+    return ProcessTable()
+
+
+@contextmanager
+def process_table_session() -> Iterator[ProcessTable]:
+    """Share one process table across liveness checks on this thread.
+
+    Nested sessions reuse the outer table. Outside a session,
+    :func:`process_started_ns` looks up single pids instead of reading the
+    whole table.
+
+    Example:
+        >>> with process_table_session() as table:
+        ...     isinstance(table, ProcessTable)
+        True
+    """
+    active = getattr(_THREAD_PROCESS_TABLE, "table", None)
+    if isinstance(active, ProcessTable):
+        yield active
+        return
+    table = ProcessTable()
+    _THREAD_PROCESS_TABLE.table = table
+    try:
+        yield table
+    finally:
+        _THREAD_PROCESS_TABLE.table = None
+
+
+def process_started_ns(pid: int) -> int | None:
+    """Return when ``pid`` started, in epoch nanoseconds, or ``None``."""
+    table = getattr(_THREAD_PROCESS_TABLE, "table", None)
+    if isinstance(table, ProcessTable):
+        return table.started_ns(pid)
+    if pid <= 0:
+        return None
+    info = _read_process(pid)
+    return info.started_ns if info is not None else None
+
+
+def _proc_available() -> bool:
+    return (_PROC_ROOT / "stat").is_file() and (_PROC_ROOT / "self" / "stat").is_file()
+
+
+def _read_all_processes() -> list[ProcessInfo]:
+    if _proc_available():
+        boot_ns = _proc_boot_ns()
+        processes: list[ProcessInfo] = []
+        for entry in os.scandir(_PROC_ROOT):
+            if not entry.name.isdigit():
+                continue
+            info = _read_proc_process(int(entry.name), boot_ns=boot_ns)
+            if info is not None:
+                processes.append(info)
+        return processes
+    return _read_ps_processes(())
+
+
+def _read_process(pid: int) -> ProcessInfo | None:
+    if _proc_available():
+        return _read_proc_process(pid, boot_ns=_proc_boot_ns())
+    processes = _read_ps_processes((pid,))
+    return processes[0] if processes else None
+
+
+def _proc_boot_ns() -> int | None:
+    try:
+        lines = (_PROC_ROOT / "stat").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    for line in lines:
+        if line.startswith("btime "):
+            value = line.split()[1]
+            return int(value) * 1_000_000_000 if value.isdigit() else None
+    return None
+
+
+def _read_proc_process(pid: int, *, boot_ns: int | None) -> ProcessInfo | None:
+    process_dir = _PROC_ROOT / str(pid)
+    try:
+        stat = (process_dir / "stat").read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    started_ns: int | None = None
+    # The command name field may contain spaces and parentheses, so fields are
+    # counted from the last closing parenthesis; starttime is field 22.
+    fields = stat.rpartition(")")[2].split()
+    if boot_ns is not None and len(fields) > 19 and fields[19].isdigit():
+        ticks_per_second = os.sysconf("SC_CLK_TCK")
+        started_ns = boot_ns + int(fields[19]) * 1_000_000_000 // ticks_per_second
+    try:
+        raw_command = (process_dir / "cmdline").read_bytes()
+    except OSError:
+        raw_command = b""
+    command = raw_command.replace(b"\0", b" ").decode("utf-8", errors="replace").strip()
+    return ProcessInfo(pid=pid, started_ns=started_ns, command=command)
+
+
+def _read_ps_processes(pids: tuple[int, ...]) -> list[ProcessInfo]:
+    argv = ["ps", "-o", "pid=,lstart=,command="]
+    argv.extend(["-p", ",".join(str(pid) for pid in pids)] if pids else ["-ax"])
+    result = exec.run_with_runner(
+        exec.CommandRequest(
+            argv=tuple(argv),
+            env={**os.environ, "LC_ALL": "C"},
+            stdin=subprocess.DEVNULL,
+        )
+    )
+    if result is None or result.returncode != 0:
+        return []
+    local_tz = datetime.now().astimezone().tzinfo
+    processes: list[ProcessInfo] = []
+    for line in (result.stdout or "").splitlines():
+        parts = line.split(maxsplit=_PS_LSTART_FIELDS + 1)
+        if len(parts) <= _PS_LSTART_FIELDS or not parts[0].isdigit():
+            continue
+        try:
+            started = datetime.strptime(
+                " ".join(parts[1 : _PS_LSTART_FIELDS + 1]), _PS_LSTART_FORMAT
+            )
+        except ValueError:
+            started_ns = None
+        else:
+            if local_tz is not None:
+                started = started.replace(tzinfo=local_tz)
+            started_ns = int(started.timestamp() * 1_000_000_000)
+        command = parts[_PS_LSTART_FIELDS + 1] if len(parts) > _PS_LSTART_FIELDS + 1 else ""
+        processes.append(ProcessInfo(pid=int(parts[0]), started_ns=started_ns, command=command))
+    return processes
@@ -5,12 +5,14 @@ from __future__ import annotations
 import json
 import shutil
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Literal
 
 from . import exec as exec_util
-from . import git
+from . import git, pr_cache
 from .worker.models_boundary import parse_pr_boundary
 
 _GH_TIMEOUT_SECONDS = 20.0
@@ -38,6 +40,11 @@ _MERGEABLE_UNKNOWN = {"UNKNOWN"}
 _PR_LOOKUP_CACHE: dict[tuple[str, str], GithubPrLookup] = {}
 _INLINE_FEEDBACK_CACHE: dict[tuple[str, int], str | None] = {}
 _UNRESOLVED_THREADS_CACHE: dict[tuple[str, int], int | None] = {}
+_PERSISTENT_CACHE: pr_cache.PrLookupDiskCache | None = None
+# A push to the base branch changes these without touching the PR's updatedAt,
+# so they are persisted apart from the lookup and expire on the lookup TTL
+# without ETag revalidation.
+_LIVE_MERGE_FIELDS = ("mergeable", "mergeStateStatus")
 
 
 @dataclass(frozen=True)
@@ -119,6 +126,201 @@ def clear_runtime_cache() -> None:
     _UNRESOLVED_THREADS_CACHE.clear()
 
 
+def use_persistent_cache(path: Path | None) -> None:
+    """Share PR lookups across Atelier processes through a cache file.
+
+    Lookups younger than the cache TTL are served without calling ``gh``.
+    Older lookups are revalidated with a conditional request and reused when
+    the PR's ETag or ``updatedAt`` is unchanged.
+
+    Args:
+        path: Cache file location, or ``None`` to disable persistence.
+    """
+    global _PERSISTENT_CACHE
+    if path is None:
+        _PERSISTENT_CACHE = None
+        return
+    if _PERSISTENT_CACHE is not None and _PERSISTENT_CACHE.path == path:
+        return
+    _PERSISTENT_CACHE = pr_cache.PrLookupDiskCache(path)
+
+
+def invalidate_pr_lookup(repo: str, head: str) -> None:
+    """Drop cached PR state for a branch whose PR Atelier just changed.
+
+    Args:
+        repo: GitHub owner/repo slug.
+        head: Head branch whose PR was published or retargeted.
+    """
+    numbers: set[int] = set()
+    cached = _PR_LOOKUP_CACHE.pop((repo, head), None)
+    if cached is not None:
+        numbers.add(_lookup_pr_number(cached))
+    disk = _PERSISTENT_CACHE
+    if disk is not None:
+        persisted = _persisted_lookup(disk.get(pr_cache.cache_key("lookup", repo, head)))
+        if persisted is not None:
+            numbers.add(_lookup_pr_number(persisted))
+        disk.invalidate("lookup", repo, head)
+    for number in numbers - {0}:
+        _INLINE_FEEDBACK_CACHE.pop((repo, number), None)
+        _UNRESOLVED_THREADS_CACHE.pop((repo, number), None)
+        if disk is not None:
+            disk.invalidate("inline", repo, number)
+            disk.invalidate("threads", repo, number)
+            disk.invalidate("merge", repo, number)
+
+
+def _lookup_pr_number(lookup: GithubPrLookup) -> int:
+    number = lookup.payload.get("number") if lookup.found and lookup.payload else None
+    return number if isinstance(number, int) else 0
+
+
+def _persisted_lookup(entry: pr_cache.CachedValue | None) -> GithubPrLookup | None:
+    if entry is None or not isinstance(entry.value, dict):
+        return None
+    outcome = entry.value.get("outcome")
+    payload = entry.value.get("payload")
+    if outcome == "found" and isinstance(payload, dict):
+        return GithubPrLookup(outcome="found", payload=payload)
+    if outcome == "not_found":
+        return GithubPrLookup(outcome="not_found")
+    return None
+
+
+def _persist_lookup(
+    repo: str, head: str, result: GithubPrLookup, *, etag: str | None = None
+) -> None:
+    disk = _PERSISTENT_CACHE
+    if disk is None or result.failed:
+        return
+    key = pr_cache.cache_key("lookup", repo, head)
+    previous = _persisted_lookup(disk.get(key))
+    payload = (
+        None
+        if result.payload is None
+        else {
+            field: value
+            for field, value in result.payload.items()
+            if field not in _LIVE_MERGE_FIELDS
+        }
+    )
+    disk.put(key, {"outcome": result.outcome, "payload": payload}, etag=etag)
+    if result.payload is not None:
+        _persist_merge_state(repo, _lookup_pr_number(result), result.payload)
+    if previous is None or not previous.found or previous.payload is None:
+        return
+    if (
+        result.found
+        and result.payload is not None
+        and previous.payload.get("updatedAt") == result.payload.get("updatedAt")
+    ):
+        return
+    number = _lookup_pr_number(previous)
+    if number:
+        disk.invalidate("inline", repo, number)
+        disk.invalidate("threads", repo, number)
+
+
+def _fresh_persisted_lookup(repo: str, head: str) -> GithubPrLookup | None:
+    disk = _PERSISTENT_CACHE
+    if disk is None:
+        return None
+    entry = disk.get(pr_cache.cache_key("lookup", repo, head))
+    if entry is None or not entry.fresh(disk.ttl_seconds):
+        return None
+    cached = _persisted_lookup(entry)
+    if cached is None:
+        return None
+    return _with_persisted_merge_state(repo, cached)
+
+
+def _persist_merge_state(repo: str, number: int, payload: dict[str, object]) -> None:
+    disk = _PERSISTENT_CACHE
+    if disk is None or not number:
+        return
+    merge_state = {field: payload[field] for field in _LIVE_MERGE_FIELDS if field in payload}
+    if merge_state:
+        disk.put(pr_cache.cache_key("merge", repo, number), merge_state)
+
+
+def _with_persisted_merge_state(repo: str, lookup: GithubPrLookup) -> GithubPrLookup | None:
+    """Overlay fresh persisted merge state; ``None`` when it needs a refetch."""
+    if not _needs_live_merge_state(lookup) or lookup.payload is None:
+        return lookup
+    disk = _PERSISTENT_CACHE
+    if disk is None:
+        return None
+    entry = disk.get(pr_cache.cache_key("merge", repo, _lookup_pr_number(lookup)))
+    if entry is None or not entry.fresh(disk.ttl_seconds) or not isinstance(entry.value, dict):
+        return None
+    payload = dict(lookup.payload)
+    payload.update(
+        {field: entry.value[field] for field in _LIVE_MERGE_FIELDS if field in entry.value}
+    )
+    return GithubPrLookup(outcome="found", payload=payload)
+
+
+def _needs_live_merge_state(lookup: GithubPrLookup) -> bool:
+    if not lookup.found or lookup.payload is None:
+        return False
+    state = lookup.payload.get("state")
+    return isinstance(state, str) and state.strip().upper() == "OPEN"
+
+
+def _with_live_merge_state(repo: str, lookup: GithubPrLookup) -> GithubPrLookup | None:
+    """Overlay current merge state on a persisted lookup; ``None`` on error.
+
+    Merge state persisted within the lookup TTL is reused, so only open PRs
+    whose merge state has expired cost a ``gh`` call.
+    """
+    cached = _with_persisted_merge_state(repo, lookup)
+    if cached is not None:
+        return cached
+    if lookup.payload is None:
+        return None
+    if not _gh_available():
+        return None
+    try:
+        merge_state = _run_json(
+            [
+                "gh",
+                "pr",
+                "view",
+                str(_lookup_pr_number(lookup)),
+                "--repo",
+                repo,
+                "--json",
+                ",".join(_LIVE_MERGE_FIELDS),
+            ]
+        )
+    except (RuntimeError, json.JSONDecodeError):
+        return None
+    if not isinstance(merge_state, dict):
+        return None
+    _persist_merge_state(repo, _lookup_pr_number(lookup), merge_state)
+    payload = dict(lookup.payload)
+    payload.update(
+        {field: merge_state[field] for field in _LIVE_MERGE_FIELDS if field in merge_state}
+    )
+    return GithubPrLookup(outcome="found", payload=payload)
+
+
+def _persisted_signal(kind: str, repo: str, number: int) -> tuple[bool, object]:
+    disk = _PERSISTENT_CACHE
+    if disk is None:
+        return False, None
+    entry = disk.get(pr_cache.cache_key(kind, repo, number))
+    if entry is None or not entry.fresh(disk.signal_ttl_seconds):
+        return False, None
+    return True, entry.value
+
+
+def _persist_signal(kind: str, repo: str, number: int, value: object) -> None:
+    if _PERSISTENT_CACHE is not None:
+        _PERSISTENT_CACHE.put(pr_cache.cache_key(kind, repo, number), value)
+
+
 def parse_timestamp(value: object) -> datetime | None:
     """Parse ISO-8601 timestamps used by GitHub APIs."""
     if not isinstance(value, str):
@@ -238,7 +440,10 @@ def _candidate_sort_key(candidate: _HeadBranchPrCandidate) -> tuple[int, datetim
 
 
 def _find_latest_pr_number(repo: str, head: str) -> int | None:
-    candidates = _list_head_branch_pr_candidates(repo, head)
+    return _select_pr_number(head, _list_head_branch_pr_candidates(repo, head))
+
+
+def _select_pr_number(head: str, candidates: list[_HeadBranchPrCandidate]) -> int | None:
     if not candidates:
         return None
     open_candidates = sorted(
@@ -256,6 +461,133 @@ def _find_latest_pr_number(repo: str, head: str) -> int | None:
     return candidates[-1].number
 
 
+def _split_http_response(raw: str) -> tuple[int | None, dict[str, str], str]:
+    head, sep, body = raw.replace("\r\n", "\n").partition("\n\n")
+    if not sep:
+        return None, {}, raw
+    lines = head.split("\n")
+    parts = lines[0].split()
+    status = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else None
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        name, colon, value = line.partition(":")
+        if colon:
+            headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+def _rest_head_branch_candidate(entry: object) -> _HeadBranchPrCandidate | None:
+    if not isinstance(entry, dict):
+        return None
+    state = entry.get("state")
+    if entry.get("merged_at"):
+        state = "MERGED"
+    return _parse_head_branch_candidate(
+        {
+            "number": entry.get("number"),
+            "state": state,
+            "updatedAt": entry.get("updated_at"),
+            "closedAt": entry.get("closed_at"),
+            "mergedAt": entry.get("merged_at"),
+        }
+    )
+
+
+def _conditional_head_branch_candidates(
+    repo: str, head: str, *, etag: str | None
+) -> tuple[bool, str | None, list[_HeadBranchPrCandidate]]:
+    """List head-branch PRs with a conditional REST request.
+
+    Returns:
+        ``(not_modified, etag, candidates)``. A ``304`` answer is free against
+        the GitHub rate limit and carries no candidates.
+    """
+    owner, _name = _split_repo_slug(repo)
+    cmd = [
+        "gh",
+        "api",
+        "--include",
+        "--method",
+        "GET",
+        f"repos/{repo}/pulls",
+        "-f",
+        f"head={owner}:{head}",
+        "-f",
+        "state=all",
+        "-f",
+        "per_page=100",
+    ]
+    if etag:
+        cmd.extend(["-H", f"If-None-Match: {etag}"])
+    result = exec_util.run_with_runner(
+        exec_util.CommandRequest(
+            argv=tuple(cmd),
+            capture_output=True,
+            text=True,
+            timeout_seconds=_DEFAULT_GITHUB_CLIENT.timeout_seconds,
+        )
+    )
+    if result is None:
+        raise RuntimeError("missing required command: gh")
+    status, headers, body = _split_http_response(result.stdout or "")
+    if status == 304:
+        return True, headers.get("etag") or etag, []
+    if result.returncode != 0 or status != 200:
+        message = (result.stderr or "").strip()
+        raise RuntimeError(message or f"Command failed: {' '.join(cmd)}")
+    payload = json.loads(body) if body.strip() else []
+    if not isinstance(payload, list):
+        raise RuntimeError("Unexpected gh output for PR revalidation")
+    candidates = [
+        candidate
+        for candidate in (_rest_head_branch_candidate(entry) for entry in payload)
+        if candidate is not None
+    ]
+    return False, headers.get("etag"), candidates
+
+
+def _lookup_matches_candidates(
+    head: str, cached: GithubPrLookup, candidates: list[_HeadBranchPrCandidate]
+) -> bool:
+    try:
+        number = _select_pr_number(head, candidates)
+    except RuntimeError:
+        return False
+    if not cached.found or cached.payload is None:
+        return number is None
+    if number is None or number != _lookup_pr_number(cached):
+        return False
+    selected = next(candidate for candidate in candidates if candidate.number == number)
+    cached_updated_at = parse_timestamp(cached.payload.get("updatedAt"))
+    return selected.updated_at is not None and selected.updated_at == cached_updated_at
+
+
+def _cached_lookup(repo: str, head: str) -> tuple[GithubPrLookup | None, str | None]:
+    """Return a fresh or revalidated persisted lookup, plus any new ETag."""
+    disk = _PERSISTENT_CACHE
+    if disk is None:
+        return None, None
+    key = pr_cache.cache_key("lookup", repo, head)
+    entry = disk.get(key)
+    cached = _persisted_lookup(entry)
+    if entry is None or cached is None:
+        return None, None
+    if entry.fresh(disk.ttl_seconds):
+        return _with_live_merge_state(repo, cached), None
+    if not _gh_available():
+        return None, None
+    try:
+        not_modified, etag, candidates = _conditional_head_branch_candidates(
+            repo, head, etag=entry.etag
+        )
+    except (RuntimeError, json.JSONDecodeError):
+        return None, None
+    if not_modified or _lookup_matches_candidates(head, cached, candidates):
+        disk.touch(key, etag=etag)
+        return _with_live_merge_state(repo, cached), etag
+    return None, etag
+
+
 def lookup_github_pr_status(repo: str, head: str, *, refresh: bool = False) -> GithubPrLookup:
     """Return explicit GitHub PR lookup outcome for a head branch.
 
@@ -273,6 +605,12 @@ def lookup_github_pr_status(repo: str, head: str, *, refresh: bool = False) -> G
     cached = _PR_LOOKUP_CACHE.get(cache_key)
     if cached is not None:
         return cached
+    etag: str | None = None
+    if not refresh:
+        persisted, etag = _cached_lookup(repo, head)
+        if persisted is not None:
+            _PR_LOOKUP_CACHE[cache_key] = persisted
+            return persisted
     if not _gh_available():
         result = GithubPrLookup(outcome="error", error="missing required command: gh")
         _PR_LOOKUP_CACHE[cache_key] = result
@@ -286,6 +624,7 @@ def lookup_github_pr_status(repo: str, head: str, *, refresh: bool = False) -> G
     if number is None:
         result = GithubPrLookup(outcome="not_found")
         _PR_LOOKUP_CACHE[cache_key] = result
+        _persist_lookup(repo, head, result, etag=etag)
         return result
     try:
         payload = _run_json(
@@ -319,6 +658,7 @@ def lookup_github_pr_status(repo: str, head: str, *, refresh: bool = False) -> G
         return result
     result = GithubPrLookup(outcome="found", payload=payload)
     _PR_LOOKUP_CACHE[cache_key] = result
+    _persist_lookup(repo, head, result, etag=etag)
     return result
 
 
@@ -341,6 +681,280 @@ def read_github_pr_status(
     return None
 
 
+_GRAPHQL_HEAD_BATCH_SIZE = 50
+_GRAPHQL_PRS_PER_HEAD = 5
+_GRAPHQL_REVIEW_THREADS_PER_PR = 50
+_GRAPHQL_THREAD_COMMENTS = 10
+_GRAPHQL_TIMELINE_ENTRIES = 50
+_GRAPHQL_PR_FIELDS = f"""
+fragment AtelierPrFields on PullRequest {{
+  number url state baseRefName headRefName title body isDraft
+  mergedAt mergeCommit {{ oid }} closedAt updatedAt reviewDecision
+  mergeable mergeStateStatus
+  labels(first: 20) {{ nodes {{ name }} }}
+  reviewRequests(first: 20) {{
+    nodes {{
+      requestedReviewer {{
+        __typename
+        ... on User {{ login }}
+        ... on Bot {{ login }}
+        ... on Team {{ slug }}
+      }}
+    }}
+  }}
+  comments(last: {_GRAPHQL_TIMELINE_ENTRIES}) {{
+    nodes {{ author {{ login __typename }} createdAt updatedAt }}
+    pageInfo {{ hasPreviousPage }}
+  }}
+  reviews(last: {_GRAPHQL_TIMELINE_ENTRIES}) {{
+    nodes {{ author {{ login __typename }} state createdAt updatedAt submittedAt }}
+    pageInfo {{ hasPreviousPage }}
+  }}
+  reviewThreads(first: {_GRAPHQL_REVIEW_THREADS_PER_PR}) {{
+    nodes {{
+      isResolved
+      comments(last: {_GRAPHQL_THREAD_COMMENTS}) {{
+        nodes {{ author {{ login __typename }} createdAt updatedAt }}
+        pageInfo {{ hasPreviousPage }}
+      }}
+    }}
+    pageInfo {{ hasNextPage }}
+  }}
+}}
+""".strip()
+
+
+def _head_batch_query(count: int) -> str:
+    variables = "".join(f", $h{index}: String!" for index in range(count))
+    selections = "\n".join(
+        f"    h{index}: pullRequests(headRefName: $h{index}, "
+        f"states: [OPEN, CLOSED, MERGED], first: {_GRAPHQL_PRS_PER_HEAD}, "
+        "orderBy: {field: UPDATED_AT, direction: DESC}) {\n"
+        "      nodes { ...AtelierPrFields }\n"
+        "      pageInfo { hasNextPage }\n"
+        "    }"
+        for index in range(count)
+    )
+    return (
+        f"query($owner: String!, $name: String!{variables}) {{\n"
+        "  repository(owner: $owner, name: $name) {\n"
+        f"{selections}\n"
+        "  }\n"
+        "}\n"
+        f"{_GRAPHQL_PR_FIELDS}"
+    )
+
+
+def _graphql_nodes(connection: object) -> list[dict[str, object]]:
+    if not isinstance(connection, dict):
+        return []
+    nodes = connection.get("nodes")
+    if not isinstance(nodes, list):
+        return []
+    return [node for node in nodes if isinstance(node, dict)]
+
+
+def _graphql_page_flag(connection: object, flag: str) -> bool:
+    if not isinstance(connection, dict):
+        return False
+    page_info = connection.get("pageInfo")
+    return isinstance(page_info, dict) and bool(page_info.get(flag))
+
+
+def _graphql_author(author: object) -> dict[str, object] | None:
+    if not isinstance(author, dict):
+        return None
+    normalized: dict[str, object] = {
+        key: value for key, value in author.items() if key != "__typename"
+    }
+    typename = author.get("__typename")
+    if isinstance(typename, str):
+        normalized["type"] = typename
+    return normalized
+
+
+def _graphql_timeline_entries(connection: object) -> list[dict[str, object]]:
+    entries: list[dict[str, object]] = []
+    for node in _graphql_nodes(connection):
+        entry = dict(node)
+        entry["author"] = _graphql_author(node.get("author"))
+        entries.append(entry)
+    return entries
+
+
+def _graphql_pr_payload(node: dict[str, object]) -> dict[str, object]:
+    """Shape one GraphQL PR node like ``gh pr view --json`` output."""
+    payload = {
+        key: value
+        for key, value in node.items()
+        if key not in {"labels", "reviewRequests", "comments", "reviews", "reviewThreads"}
+    }
+    payload["labels"] = _graphql_nodes(node.get("labels"))
+    payload["reviewRequests"] = [
+        {"requestedReviewer": _graphql_author(entry.get("requestedReviewer"))}
+        for entry in _graphql_nodes(node.get("reviewRequests"))
+    ]
+    payload["comments"] = _graphql_timeline_entries(node.get("comments"))
+    payload["reviews"] = _graphql_timeline_entries(node.get("reviews"))
+    return payload
+
+
+def _graphql_pr_is_truncated(node: dict[str, object]) -> bool:
+    return _graphql_page_flag(node.get("comments"), "hasPreviousPage") or _graphql_page_flag(
+        node.get("reviews"), "hasPreviousPage"
+    )
+
+
+def _cache_review_thread_signals(repo: str, node: dict[str, object]) -> None:
+    """Seed thread caches from a PR node whose threads are complete."""
+    number = node.get("number")
+    if not isinstance(number, int):
+        return
+    review_threads = node.get("reviewThreads")
+    if not isinstance(review_threads, dict) or _graphql_page_flag(review_threads, "hasNextPage"):
+        return
+    threads = _graphql_nodes(review_threads)
+    unresolved = sum(1 for thread in threads if not bool(thread.get("isResolved")))
+    _UNRESOLVED_THREADS_CACHE[(repo, number)] = unresolved
+    _persist_signal("threads", repo, number, unresolved)
+    latest: datetime | None = None
+    for thread in threads:
+        comments = thread.get("comments")
+        if _graphql_page_flag(comments, "hasPreviousPage"):
+            return
+        for comment in _graphql_timeline_entries(comments):
+            if _is_bot_author(comment.get("author")):
+                continue
+            for key in ("updatedAt", "createdAt"):
+                parsed = parse_timestamp(comment.get(key))
+                if parsed is not None and (latest is None or parsed > latest):
+                    latest = parsed
+    formatted = _format_timestamp(latest) if latest is not None else None
+    _INLINE_FEEDBACK_CACHE[(repo, number)] = formatted
+    _persist_signal("inline", repo, number, formatted)
+
+
+def _resolve_head_batch_lookup(repo: str, head: str, connection: object) -> GithubPrLookup | None:
+    """Resolve one aliased head, or ``None`` when it needs a direct lookup."""
+    if not isinstance(connection, dict) or _graphql_page_flag(connection, "hasNextPage"):
+        return None
+    nodes_by_number: dict[int, dict[str, object]] = {}
+    candidates: list[_HeadBranchPrCandidate] = []
+    for node in _graphql_nodes(connection):
+        candidate = _parse_head_branch_candidate(node)
+        if candidate is None:
+            continue
+        nodes_by_number[candidate.number] = node
+        candidates.append(candidate)
+    try:
+        number = _select_pr_number(head, candidates)
+    except RuntimeError as exc:
+        return GithubPrLookup(outcome="error", error=str(exc))
+    if number is None:
+        result = GithubPrLookup(outcome="not_found")
+        _persist_lookup(repo, head, result)
+        return result
+    node = nodes_by_number[number]
+    if _graphql_pr_is_truncated(node):
+        return None
+    payload = _graphql_pr_payload(node)
+    try:
+        parse_pr_boundary(payload, source=f"{repo}:{head}")
+    except ValueError as exc:
+        return GithubPrLookup(outcome="error", error=str(exc))
+    result = GithubPrLookup(outcome="found", payload=payload)
+    _persist_lookup(repo, head, result)
+    _cache_review_thread_signals(repo, node)
+    return result
+
+
+def _lookup_head_batch(repo: str, owner: str, name: str, heads: list[str]) -> None:
+    cmd = [
+        "gh",
+        "api",
+        "graphql",
+        "-f",
+        f"query={_head_batch_query(len(heads))}",
+        "-F",
+        f"owner={owner}",
+        "-F",
+        f"name={name}",
+    ]
+    for index, head in enumerate(heads):
+        cmd.extend(["-f", f"h{index}={head}"])
+    try:
+        payload = _run_json(cmd)
+    except (RuntimeError, json.JSONDecodeError) as exc:
+        for head in heads:
+            _PR_LOOKUP_CACHE[(repo, head)] = GithubPrLookup(outcome="error", error=str(exc))
+        return
+    data = payload.get("data") if isinstance(payload, dict) else None
+    repository = data.get("repository") if isinstance(data, dict) else None
+    if not isinstance(repository, dict):
+        for head in heads:
+            _PR_LOOKUP_CACHE[(repo, head)] = GithubPrLookup(
+                outcome="error", error="Unexpected gh output for PR batch lookup"
+            )
+        return
+    for index, head in enumerate(heads):
+        result = _resolve_head_batch_lookup(repo, head, repository.get(f"h{index}"))
+        if result is None:
+            result = lookup_github_pr_status(repo, head, refresh=True)
+        _PR_LOOKUP_CACHE[(repo, head)] = result
+
+
+def lookup_github_pr_statuses(
+    repo: str, heads: Iterable[str], *, refresh: bool = False
+) -> dict[str, GithubPrLookup]:
+    """Return GitHub PR lookup outcomes for many head branches of one repo.
+
+    Uncached heads are resolved with one ``gh api graphql`` query per
+    ``_GRAPHQL_HEAD_BATCH_SIZE`` branches. The same query seeds the review
+    thread and inline comment caches, so later per-PR signal reads are free.
+    Heads whose batched data is truncated fall back to
+    ``lookup_github_pr_status``. Persisted open PRs whose merge state has
+    expired are re-read in the same query rather than one call per PR.
+
+    Args:
+        repo: GitHub owner/repo slug.
+        heads: Head branch names used for lookup.
+        refresh: When ``True``, bypass any cached lookups for these branches.
+
+    Returns:
+        Lookup outcome keyed by head branch.
+    """
+    requested = list(dict.fromkeys(head for head in heads if head))
+    if refresh:
+        for head in requested:
+            _PR_LOOKUP_CACHE.pop((repo, head), None)
+    pending: list[str] = []
+    for head in requested:
+        if (repo, head) in _PR_LOOKUP_CACHE:
+            continue
+        persisted = None if refresh else _fresh_persisted_lookup(repo, head)
+        if persisted is not None:
+            _PR_LOOKUP_CACHE[(repo, head)] = persisted
+        else:
+            pending.append(head)
+    if pending:
+        if not _gh_available():
+            for head in pending:
+                _PR_LOOKUP_CACHE[(repo, head)] = GithubPrLookup(
+                    outcome="error", error="missing required command: gh"
+                )
+        else:
+            try:
+                owner, name = _split_repo_slug(repo)
+            except RuntimeError as exc:
+                for head in pending:
+                    _PR_LOOKUP_CACHE[(repo, head)] = GithubPrLookup(outcome="error", error=str(exc))
+            else:
+                for start in range(0, len(pending), _GRAPHQL_HEAD_BATCH_SIZE):
+                    batch = pending[start : start + _GRAPHQL_HEAD_BATCH_SIZE]
+                    _lookup_head_batch(repo, owner, name, batch)
+    return {head: _PR_LOOKUP_CACHE[(repo, head)] for head in requested}
+
+
 def has_review_requests(payload: dict[str, object] | None) -> bool:
     """Return True if the PR has any review requests."""
     boundary = parse_pr_boundary(payload, source="has_review_requests")
@@ -412,6 +1026,10 @@ def _latest_inline_review_comment_timestamp(repo: str, pr_number: int) -> str |
     cache_key = (repo, pr_number)
     if cache_key in _INLINE_FEEDBACK_CACHE:
         return _INLINE_FEEDBACK_CACHE[cache_key]
+    persisted, value = _persisted_signal("inline", repo, pr_number)
+    if persisted and (value is None or isinstance(value, str)):
+        _INLINE_FEEDBACK_CACHE[cache_key] = value
+        return value
     try:
         review_comments = _run_json(
             [
@@ -440,11 +1058,9 @@ def _latest_inline_review_comment_timestamp(repo: str, pr_number: int) -> str |
                 continue
             if latest is None or parsed > latest:
                 latest = parsed
-    if latest is None:
-        _INLINE_FEEDBACK_CACHE[cache_key] = None
-        return None
-    formatted = _format_timestamp(latest)
+    formatted = _format_timestamp(latest) if latest is not None else None
     _INLINE_FEEDBACK_CACHE[cache_key] = formatted
+    _persist_signal("inline", repo, pr_number, formatted)
     return formatted
 
 
@@ -470,6 +1086,10 @@ def unresolved_review_thread_count(repo: str, pr_number: int) -> int | None:
     cache_key = (repo, pr_number)
     if cache_key in _UNRESOLVED_THREADS_CACHE:
         return _UNRESOLVED_THREADS_CACHE[cache_key]
+    persisted, value = _persisted_signal("threads", repo, pr_number)
+    if persisted and isinstance(value, int):
+        _UNRESOLVED_THREADS_CACHE[cache_key] = value
+        return value
     if not _gh_available():
         _UNRESOLVED_THREADS_CACHE[cache_key] = None
         return None
@@ -545,12 +1165,10 @@ query($owner: String!, $name: String!, $number: Int!, $cursor: String) {
                 raw_cursor = page_info.get("endCursor")
                 if isinstance(raw_cursor, str) and raw_cursor.strip():
                     next_cursor = raw_cursor.strip()
-            if not has_next:
-                _UNRESOLVED_THREADS_CACHE[cache_key] = unresolved
-                return unresolved
             cursor = next_cursor
-            if not cursor:
+            if not has_next or not cursor:
                 _UNRESOLVED_THREADS_CACHE[cache_key] = unresolved
+                _persist_signal("threads", repo, pr_number, unresolved)
                 return unresolved
     except (RuntimeError, json.JSONDecodeError):
         _UNRESOLVED_THREADS_CACHE[cache_key] = None
@@ -48,6 +48,7 @@ USER_DEFAULT_ENV_KEYS: frozenset[str] = frozenset(
         "ATELIER_LOG_LEVEL",
         "ATELIER_NO_COLOR",
         "ATELIER_STARTUP_DEFERRED_EPIC_SCAN_LIMIT",
+        "ATELIER_SKILL_EXECUTOR",
     }
 )
 
@@ -1,12 +1,21 @@
 """Codex session discovery helpers."""
 
 import json
+import os
+import tempfile
 from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TextIO
 
+from . import paths
 from .workspace import workspace_session_identifier
 
+_SESSION_SUFFIXES = frozenset({".json", ".jsonl"})
+_SESSION_HEAD_MAX_CHARS = 1024 * 1024
+_SESSION_INDEX_VERSION = 1
+_WORKSPACE_IDENTIFIER_PREFIX = "atelier:"
+
 
 @dataclass(frozen=True)
 class CodexSessionMatch:
@@ -17,6 +26,59 @@ class CodexSessionMatch:
     modified_at: float
 
 
+@dataclass(frozen=True)
+class _SessionIndexEntry:
+    """Cached transcript head facts, keyed by the file's mtime and size."""
+
+    mtime_ns: int
+    size: int
+    session_id: str
+    identifiers: tuple[str, ...]
+
+    @classmethod
+    def from_payload(cls, payload: object) -> "_SessionIndexEntry | None":
+        if not isinstance(payload, dict):
+            return None
+        mtime_ns = payload.get("mtime_ns")
+        size = payload.get("size")
+        session_id = payload.get("session_id")
+        identifiers = payload.get("identifiers")
+        if (
+            not isinstance(mtime_ns, int)
+            or not isinstance(size, int)
+            or not isinstance(session_id, str)
+            or not isinstance(identifiers, list)
+        ):
+            return None
+        return cls(
+            mtime_ns=mtime_ns,
+            size=size,
+            session_id=session_id,
+            identifiers=tuple(item for item in identifiers if isinstance(item, str)),
+        )
+
+    def to_payload(self) -> dict[str, object]:
+        return {
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "session_id": self.session_id,
+            "identifiers": list(self.identifiers),
+        }
+
+
+def _iter_head_lines(handle: TextIO) -> Iterator[str]:
+    """Yield complete lines from the bounded head of a transcript."""
+    remaining = _SESSION_HEAD_MAX_CHARS
+    while remaining > 0:
+        line = handle.readline(remaining)
+        if not line:
+            return
+        remaining -= len(line)
+        if not line.endswith("\n") and remaining <= 0:
+            return
+        yield line
+
+
 def read_first_user_message(path: Path) -> str | None:
     """Read the first command-line user message from a session transcript file.
 
@@ -37,7 +99,7 @@ def read_first_user_message(path: Path) -> str | None:
             fallback_instructions: str | None = None
             fallback_message: str | None = None
             with path.open("r", encoding="utf-8") as handle:
-                for line in handle:
+                for line in _iter_head_lines(handle):
                     if not line.strip():
                         continue
                     try:
@@ -103,7 +165,7 @@ def read_session_id(path: Path) -> str | None:
     if path.suffix == ".jsonl":
         try:
             with path.open("r", encoding="utf-8") as handle:
-                for line in handle:
+                for line in _iter_head_lines(handle):
                     if not line.strip():
                         continue
                     try:
@@ -309,17 +371,105 @@ def find_codex_sessions(
     if not sessions_root.exists():
         return ()
     target = workspace_session_identifier(project_enlistment, workspace_branch, workspace_uid)
+    index = _load_session_index()
+    root_key = str(sessions_root)
+    previous = index.get(root_key, {})
+    current: dict[str, _SessionIndexEntry] = {}
     matches: list[CodexSessionMatch] = []
-    for path in sessions_root.rglob("*"):
-        if path.suffix not in {".json", ".jsonl"}:
-            continue
-        if not session_contains_target(path, target):
-            continue
-        try:
-            mtime = path.stat().st_mtime
-        except OSError:
-            continue
-        session_id = read_session_id(path) or path.stem
-        matches.append(CodexSessionMatch(session_id=session_id, path=path, modified_at=mtime))
+    for path, stat in _iter_session_files(sessions_root):
+        key = str(path.relative_to(sessions_root))
+        entry = previous.get(key)
+        if entry is None or entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+            entry = _session_index_entry(path, stat)
+        current[key] = entry
+        if target in entry.identifiers:
+            matches.append(
+                CodexSessionMatch(
+                    session_id=entry.session_id,
+                    path=path,
+                    modified_at=stat.st_mtime,
+                )
+            )
+    if current != previous:
+        index[root_key] = current
+        _save_session_index(index)
     matches.sort(key=lambda item: (-item.modified_at, str(item.path)))
     return tuple(matches)
+
+
+def _iter_session_files(root: Path) -> Iterator[tuple[Path, os.stat_result]]:
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            if path.suffix not in _SESSION_SUFFIXES:
+                continue
+            try:
+                yield path, path.stat()
+            except OSError:
+                continue
+
+
+def _session_index_entry(path: Path, stat: os.stat_result) -> _SessionIndexEntry:
+    """Read one transcript head into its index entry."""
+    message = read_first_user_message(path) or ""
+    identifiers = sorted(
+        {token for token in message.split() if token.startswith(_WORKSPACE_IDENTIFIER_PREFIX)}
+    )
+    return _SessionIndexEntry(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        session_id=read_session_id(path) or path.stem,
+        identifiers=tuple(identifiers),
+    )
+
+
+def _load_session_index() -> dict[str, dict[str, _SessionIndexEntry]]:
+    try:
+        payload = json.loads(paths.codex_session_index_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _SESSION_INDEX_VERSION:
+        return {}
+    roots = payload.get("roots")
+    if not isinstance(roots, dict):
+        return {}
+    index: dict[str, dict[str, _SessionIndexEntry]] = {}
+    for root, entries in roots.items():
+        if not isinstance(entries, dict):
+            continue
+        index[root] = {}
+        for key, raw_entry in entries.items():
+            entry = _SessionIndexEntry.from_payload(raw_entry)
+            if entry is not None:
+                index[root][key] = entry
+    return index
+
+
+def _save_session_index(index: dict[str, dict[str, _SessionIndexEntry]]) -> None:
+    """Write the index atomically, dropping session roots that are gone."""
+    roots = {
+        root: {key: entry.to_payload() for key, entry in entries.items()}
+        for root, entries in index.items()
+        if Path(root).is_dir()
+    }
+    path = paths.codex_session_index_path()
+    temp_path: Path | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as handle:
+            json.dump({"version": _SESSION_INDEX_VERSION, "roots": roots}, handle)
+            temp_path = Path(handle.name)
+        os.replace(temp_path, path)
+        temp_path = None
+    except OSError:
+        return
+    finally:
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
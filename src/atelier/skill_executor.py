@@ -0,0 +1,480 @@
+"""Resident executor that runs projected skill scripts in a warm interpreter.
+
+Each projected skill script normally starts a new interpreter. It selects the
+repo runtime and imports pydantic and ``atelier`` before doing any work. The
+executor does that once per project. It then listens on a Unix socket and
+forks one child per request. The child takes over the caller's stdin, stdout,
+stderr, working directory, environment and argv, and runs the script as
+``__main__``. The caller forwards SIGINT, SIGTERM and SIGHUP over the socket,
+and the child is terminated if the caller disconnects before it finishes.
+
+``projected_bootstrap`` connects to the executor when one is running for
+``ATELIER_PROJECT``. It falls back to a normal cold start when the socket is
+missing, the executor refuses the request, or the executor was started from a
+different repo source tree. Requests also carry the caller's ``atelier``
+version and package source fingerprint. An executor whose own source changed
+since it started refuses the request and exits, so an upgrade or source edit
+never runs against stale imported modules. Set ``ATELIER_SKILL_EXECUTOR=0`` to
+always cold start.
+
+Start an executor from an agent home with::
+
+    python skills/shared/scripts/skill_executor.py --project "$ATELIER_PROJECT"
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import re
+import runpy
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import traceback
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+PROTOCOL_VERSION = 2
+DISABLE_ENV = "ATELIER_SKILL_EXECUTOR"
+CHILD_ENV = "ATELIER_SKILL_EXECUTOR_CHILD"
+_PROJECT_ENV = "ATELIER_PROJECT"
+_PROJECTED_RUNTIME_SELECTED_ENV = "ATELIER_PROJECTED_RUNTIME_SELECTED"
+_DEFAULT_IDLE_SECONDS = 1800.0
+_MAX_REQUEST_BYTES = 1 << 20
+_LISTEN_BACKLOG = 32
+_STDIO_FDS = (0, 1, 2)
+_SOURCE_MISMATCH = "source mismatch"
+_FORWARDED_SIGNALS = frozenset({signal.SIGINT, signal.SIGTERM, signal.SIGHUP})
+_VERSION_PATTERN = re.compile(
+    r"""^__version__\s*=\s*(?:version\s*=\s*)?['"]([^'"]+)['"]""", re.MULTILINE
+)
+_WARM_MODULES = (
+    "pydantic",
+    "atelier.runtime_env",
+    "atelier.lib.beads",
+    "atelier.store",
+    "atelier.beads",
+    "atelier.beads_context",
+)
+
+
+def socket_path(project: str) -> Path:
+    """Return the executor socket path for one project enlistment.
+
+    ``projected_bootstrap`` computes the same path without importing
+    ``atelier``; keep the two in sync.
+
+    Args:
+        project: Project enlistment, as exported in ``ATELIER_PROJECT``.
+
+    Returns:
+        Socket path inside a per-user directory under the temp root.
+    """
+    digest = hashlib.sha256(project.encode("utf-8")).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"atelier-{os.getuid()}" / f"skills-{digest}.sock"
+
+
+def package_fingerprint(package_dir: Path) -> str:
+    """Return a digest of the path, mtime and size of every package module.
+
+    ``projected_bootstrap`` computes the same digest without importing
+    ``atelier``; keep the two in sync.
+
+    Args:
+        package_dir: Directory of the ``atelier`` package.
+
+    Returns:
+        Short hex digest that changes whenever a module is edited, added,
+        removed or replaced by an upgrade.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        try:
+            details = path.stat()
+        except OSError:
+            continue
+        relative = path.relative_to(package_dir).as_posix()
+        digest.update(f"{relative}\0{details.st_mtime_ns}\0{details.st_size}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def package_version(package_dir: Path) -> str:
+    """Return the ``atelier`` version without importing the package.
+
+    Mirrors ``atelier.__version__``: the generated ``_version.py`` wins, then
+    installed distribution metadata. ``projected_bootstrap`` reads the version
+    the same way; keep the two in sync.
+
+    Args:
+        package_dir: Directory of the ``atelier`` package.
+
+    Returns:
+        Package version string, ``"0.0.0"`` when none can be resolved.
+    """
+    try:
+        text = (package_dir / "_version.py").read_text(encoding="utf-8")
+    except OSError:
+        text = ""
+    match = _VERSION_PATTERN.search(text)
+    if match is not None:
+        return match.group(1)
+    try:
+        from importlib.metadata import version
+
+        return version("atelier")
+    except Exception:
+        return "0.0.0"
+
+
+def serve(
+    *,
+    project: str,
+    repo_root: Path | None,
+    idle_seconds: float = _DEFAULT_IDLE_SECONDS,
+    path: Path | None = None,
+) -> None:
+    """Serve skill-script requests until the executor has been idle too long.
+
+    Args:
+        project: Project enlistment the executor serves.
+        repo_root: Repo source root the executor imported ``atelier`` from, or
+            ``None`` when it runs an installed ``atelier``. Requests from
+            scripts that resolved a different root are refused.
+        idle_seconds: Exit after this many seconds without a request. Zero
+            or less serves forever.
+        path: Socket path override. Defaults to :func:`socket_path`.
+
+    Raises:
+        RuntimeError: If another executor already serves the socket.
+    """
+    for module in _WARM_MODULES:
+        importlib.import_module(module)
+    package_dir = Path(importlib.import_module("atelier").__file__ or "").resolve().parent
+    source = _ServedSource(
+        package_dir=package_dir,
+        version=package_version(package_dir),
+        digest=package_fingerprint(package_dir),
+    )
+    target = path or socket_path(project)
+    _prepare_socket_dir(target.parent)
+    if target.exists() or target.is_symlink():
+        if _socket_accepts(target):
+            raise RuntimeError(f"skill executor already running at {target}")
+        target.unlink()
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(target))
+    os.chmod(target, 0o600)
+    listener.listen(_LISTEN_BACKLOG)
+    listener.settimeout(idle_seconds if idle_seconds > 0 else None)
+    bound_inode = target.stat().st_ino
+    # Children report their own exit status to the caller; let the kernel
+    # reap them so the accept loop never waits.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _exit_on_signal)
+    try:
+        while True:
+            try:
+                connection, _address = listener.accept()
+            except TimeoutError:
+                return
+            with connection:
+                if not _dispatch(connection, listener=listener, repo_root=repo_root, source=source):
+                    return
+    finally:
+        listener.close()
+        try:
+            if target.stat().st_ino == bound_inode:
+                target.unlink()
+        except OSError:
+            pass
+
+
+def main(argv: Sequence[str] | None = None, *, repo_root: Path | None = None) -> None:
+    """Run the executor from the command line.
+
+    Args:
+        argv: Command-line arguments. Defaults to ``sys.argv[1:]``.
+        repo_root: Repo source root selected by the launcher's bootstrap.
+    """
+    parser = argparse.ArgumentParser(description="Serve projected skill scripts warm.")
+    parser.add_argument(
+        "--project",
+        default=os.environ.get(_PROJECT_ENV, ""),
+        help="project enlistment to serve (defaults to $ATELIER_PROJECT)",
+    )
+    parser.add_argument(
+        "--idle-seconds",
+        type=float,
+        default=_DEFAULT_IDLE_SECONDS,
+        help="exit after this many idle seconds (0 serves forever)",
+    )
+    args = parser.parse_args(argv)
+    project = str(args.project).strip()
+    if not project:
+        parser.error("--project is required when ATELIER_PROJECT is not set")
+    try:
+        serve(project=project, repo_root=repo_root, idle_seconds=args.idle_seconds)
+    except RuntimeError as exc:
+        parser.exit(1, f"error: {exc}\n")
+
+
+def _prepare_socket_dir(directory: Path) -> None:
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    details = directory.stat()
+    if details.st_uid != os.getuid() or details.st_mode & 0o077:
+        raise RuntimeError(f"unsafe skill executor directory: {directory}")
+
+
+def _socket_accepts(path: Path) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+@dataclass(frozen=True)
+class _ServedSource:
+    """The ``atelier`` package the executor imported when it started."""
+
+    package_dir: Path
+    version: str
+    digest: str
+
+    def stale(self) -> bool:
+        return (
+            package_version(self.package_dir) != self.version
+            or package_fingerprint(self.package_dir) != self.digest
+        )
+
+
+def _dispatch(
+    connection: socket.socket,
+    *,
+    listener: socket.socket,
+    repo_root: Path | None,
+    source: _ServedSource,
+) -> bool:
+    """Handle one request; return ``False`` once the executor must stop."""
+    try:
+        request, fds = _receive_request(connection)
+    except (OSError, ValueError) as exc:
+        _send_event(connection, {"event": "fallback", "reason": str(exc)})
+        return True
+    reason = _refusal_reason(request, fds=fds, repo_root=repo_root, source=source)
+    if reason is not None:
+        for fd in fds:
+            os.close(fd)
+        _send_event(connection, {"event": "fallback", "reason": reason})
+        # A caller that sees newer source only stops the executor when the
+        # executor's own package changed under it, never on the caller's word.
+        return not (reason.startswith(_SOURCE_MISMATCH) and source.stale())
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 1
+        try:
+            listener.close()
+            exit_code = _run_request(connection, request, fds=fds)
+        finally:
+            os._exit(exit_code)
+    for fd in fds:
+        os.close(fd)
+    return True
+
+
+def _receive_request(connection: socket.socket) -> tuple[dict[str, object], list[int]]:
+    chunk, fds, _flags, _address = socket.recv_fds(connection, 65536, len(_STDIO_FDS))
+    buffer = bytearray(chunk)
+    try:
+        if len(buffer) < 4:
+            raise ValueError("truncated request header")
+        size = int.from_bytes(buffer[:4], "big")
+        if size > _MAX_REQUEST_BYTES:
+            raise ValueError("request too large")
+        while len(buffer) < size + 4:
+            more = connection.recv(size + 4 - len(buffer))
+            if not more:
+                raise ValueError("truncated request body")
+            buffer.extend(more)
+        payload = json.loads(bytes(buffer[4 : size + 4]).decode("utf-8"))
+        if not isinstance(payload, dict):
+            raise ValueError("request must be a JSON object")
+    except (ValueError, OSError):
+        for fd in fds:
+            os.close(fd)
+        raise
+    return payload, list(fds)
+
+
+def _refusal_reason(
+    request: Mapping[str, object],
+    *,
+    fds: Sequence[int],
+    repo_root: Path | None,
+    source: _ServedSource,
+) -> str | None:
+    if request.get("protocol") != PROTOCOL_VERSION:
+        return "protocol mismatch"
+    if len(fds) != len(_STDIO_FDS):
+        return "stdio descriptors missing"
+    script = request.get("script")
+    if not isinstance(script, str) or not script.endswith(".py") or not Path(script).is_file():
+        return "script not found"
+    if not isinstance(request.get("argv"), list) or not isinstance(request.get("env"), dict):
+        return "malformed request"
+    requested_root = request.get("repo_root")
+    if requested_root is not None and not isinstance(requested_root, str):
+        return "malformed request"
+    served_root = None if repo_root is None else str(repo_root.resolve())
+    if requested_root is not None:
+        requested_root = str(Path(requested_root).resolve())
+    if requested_root != served_root:
+        return f"executor serves repo root {served_root!r}, script resolved {requested_root!r}"
+    requested_version = request.get("version")
+    if requested_version != source.version:
+        return (
+            f"{_SOURCE_MISMATCH}: executor serves atelier {source.version!r}, "
+            f"script resolved {requested_version!r}"
+        )
+    if request.get("source_digest") != source.digest:
+        return f"{_SOURCE_MISMATCH}: atelier source changed since the executor started"
+    return None
+
+
+def _run_request(
+    connection: socket.socket,
+    request: Mapping[str, object],
+    *,
+    fds: Sequence[int],
+) -> int:
+    try:
+        script = _prepare_child(request, fds=fds)
+    except Exception as exc:
+        _send_event(connection, {"event": "fallback", "reason": f"child setup failed: {exc}"})
+        return 1
+    _send_event(connection, {"event": "started"})
+    finished = threading.Event()
+    threading.Thread(
+        target=_watch_caller,
+        args=(connection, finished),
+        name="skill-executor-caller",
+        daemon=True,
+    ).start()
+    try:
+        runpy.run_path(script, run_name="__main__")
+        exit_code = 0
+    except SystemExit as exc:
+        exit_code = _system_exit_code(exc)
+    except KeyboardInterrupt:
+        traceback.print_exc()
+        exit_code = 128 + signal.SIGINT
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finished.set()
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+    _send_event(connection, {"event": "exit", "code": exit_code})
+    return exit_code
+
+
+def _watch_caller(connection: socket.socket, finished: threading.Event) -> None:
+    """Deliver signals the caller forwards, and stop when the caller is gone.
+
+    A child outliving its caller would keep running with nobody to report
+    to, so a closed connection terminates the child like a forwarded SIGTERM.
+    """
+    events = connection.makefile("rb")
+    while True:
+        try:
+            line = events.readline()
+        except (OSError, ValueError):
+            line = b""
+        if finished.is_set():
+            return
+        if not line:
+            os.kill(os.getpid(), signal.SIGTERM)
+            return
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(event, dict) or event.get("event") != "signal":
+            continue
+        signum = event.get("signum")
+        if isinstance(signum, int) and signum in _FORWARDED_SIGNALS:
+            os.kill(os.getpid(), signum)
+
+
+def _exit_on_signal(signum: int, _frame: object) -> None:
+    raise SystemExit(128 + signum)
+
+
+def _prepare_child(request: Mapping[str, object], *, fds: Sequence[int]) -> str:
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    for target_fd, received_fd in zip(_STDIO_FDS, fds, strict=True):
+        os.dup2(received_fd, target_fd)
+        os.close(received_fd)
+    sys.stdin = open(0, closefd=False)
+    sys.stdout = open(1, "w", buffering=1 if os.isatty(1) else -1, closefd=False)
+    sys.stderr = open(2, "w", buffering=1, closefd=False)
+
+    script = str(request["script"])
+    raw_env = request.get("env")
+    raw_argv = request.get("argv")
+    if not isinstance(raw_env, dict) or not isinstance(raw_argv, list):
+        raise ValueError("malformed request")
+    env = {str(key): str(value) for key, value in raw_env.items()}
+    env[_PROJECTED_RUNTIME_SELECTED_ENV] = "1"
+    env[CHILD_ENV] = str(os.getpid())
+    os.environ.clear()
+    os.environ.update(env)
+    cwd = request.get("cwd")
+    if isinstance(cwd, str) and cwd:
+        os.chdir(cwd)
+    sys.argv = [script, *(str(arg) for arg in raw_argv)]
+    sys.path.insert(0, str(Path(script).parent))
+    return script
+
+
+def _system_exit_code(exc: SystemExit) -> int:
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _send_event(connection: socket.socket, event: Mapping[str, object]) -> None:
+    try:
+        connection.sendall(json.dumps(event).encode("utf-8") + b"\n")
+    except OSError:
+        pass
+
+
+__all__ = [
+    "CHILD_ENV",
+    "DISABLE_ENV",
+    "PROTOCOL_VERSION",
+    "main",
+    "package_fingerprint",
+    "package_version",
+    "serve",
+    "socket_path",
+]
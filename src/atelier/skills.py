@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 import shutil
 import threading
@@ -12,6 +13,7 @@ from dataclasses import dataclass
 from importlib import resources
 from importlib.abc import Traversable
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 from typing import Callable
 
 from . import __version__, paths
@@ -26,6 +28,10 @@ _SKILLS_LOCK_FILENAME = "skills-sync.lock"
 _SKILLS_LOCK_GUARD = threading.Lock()
 _SKILLS_LOCAL_LOCKS: dict[str, threading.RLock] = {}
 _PACKAGED_SUPPORT_TREE_NAMES = frozenset({"shared"})
+_SKILLS_MANIFEST_FILENAME = ".skills-manifest.json"
+_SKILLS_MANIFEST_VERSION = 1
+_PACKAGED_DEFINITIONS_CACHE: dict[tuple[str, str], dict[str, SkillDefinition]] = {}
+_PACKAGED_DEFINITIONS_GUARD = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -191,17 +197,26 @@ def _load_definition(name: str, root: Traversable) -> SkillDefinition:
 
 
 def _packaged_skill_tree_definitions() -> dict[str, SkillDefinition]:
-    """Return packaged skill trees, including internal support directories."""
+    """Return packaged skill trees, including internal support directories.
+
+    Packaged skills only change with the installed atelier version, so the
+    trees are read and hashed once per version and skills root.
+    """
     root = _skills_root()
-    definitions: dict[str, SkillDefinition] = {}
-    for entry in root.iterdir():
-        if not entry.is_dir():
-            continue
-        is_user_skill = entry.joinpath("SKILL.md").is_file()
-        if not is_user_skill and entry.name not in _PACKAGED_SUPPORT_TREE_NAMES:
-            continue
-        definitions[entry.name] = _load_definition(entry.name, entry)
-    return definitions
+    cache_key = (__version__, str(root))
+    with _PACKAGED_DEFINITIONS_GUARD:
+        cached = _PACKAGED_DEFINITIONS_CACHE.get(cache_key)
+        if cached is None:
+            cached = {}
+            for entry in root.iterdir():
+                if not entry.is_dir():
+                    continue
+                is_user_skill = entry.joinpath("SKILL.md").is_file()
+                if not is_user_skill and entry.name not in _PACKAGED_SUPPORT_TREE_NAMES:
+                    continue
+                cached[entry.name] = _load_definition(entry.name, entry)
+            _PACKAGED_DEFINITIONS_CACHE[cache_key] = cached
+    return dict(cached)
 
 
 def list_packaged_skills() -> list[str]:
@@ -266,6 +281,81 @@ def _hash_dir(root: Path) -> str:
     return _hash_files(files)
 
 
+def _dir_file_stats(root: Path) -> list[list[object]]:
+    """Return ``[relpath, size, mtime_ns]`` for every file below ``root``."""
+    stats: list[list[object]] = []
+    for path in sorted(root.rglob("*")):
+        if not path.is_file():
+            continue
+        stat = path.stat()
+        stats.append([path.relative_to(root).as_posix(), stat.st_size, stat.st_mtime_ns])
+    return stats
+
+
+class _SkillManifest:
+    """Persisted per-workspace skill digests keyed by file stat fingerprints.
+
+    A skill directory is re-hashed only when the size or mtime of one of its
+    files changed, or when files were added or removed. The digest is the same
+    whole-directory digest :func:`_hash_dir` computes.
+    """
+
+    def __init__(self, workspace_dir: Path) -> None:
+        self._path = workspace_dir / _SKILLS_MANIFEST_FILENAME
+        self._entries: dict[str, dict[str, object]] = {}
+        self._dirty = False
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _SKILLS_MANIFEST_VERSION:
+            return
+        entries = payload.get("skills")
+        if isinstance(entries, dict):
+            self._entries = {
+                str(name): entry for name, entry in entries.items() if isinstance(entry, dict)
+            }
+
+    def digest(self, name: str, skill_dir: Path) -> str:
+        """Return the ``skill_dir`` digest, re-hashing only on stat changes."""
+        stats = _dir_file_stats(skill_dir)
+        entry = self._entries.get(name)
+        if entry is not None and entry.get("files") == stats:
+            digest = entry.get("digest")
+            if isinstance(digest, str):
+                return digest
+        digest = _hash_dir(skill_dir)
+        self.record(name, digest=digest, stats=stats)
+        return digest
+
+    def record(self, name: str, *, digest: str, stats: list[list[object]]) -> None:
+        """Remember ``digest`` for a skill directory with these file stats."""
+        entry = {"digest": digest, "files": stats}
+        if self._entries.get(name) != entry:
+            self._entries[name] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the manifest if it changed; unwritable workspaces skip it."""
+        if not self._dirty:
+            return
+        payload = {"version": _SKILLS_MANIFEST_VERSION, "skills": self._entries}
+        try:
+            with NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self._path.parent,
+                prefix=f"{self._path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                json.dump(payload, handle, sort_keys=True)
+            os.replace(handle.name, self._path)
+        except OSError:
+            return
+        self._dirty = False
+
+
 def workspace_skill_state(
     workspace_dir: Path,
     stored_metadata: dict[str, object] | None,
@@ -311,12 +401,13 @@ def workspace_skill_state(
     unmodified = True
     needs_install = False
 
+    manifest = _SkillManifest(workspace_dir)
     for name, definition in definitions.items():
         skill_dir = skills_dir / name
         if not skill_dir.exists():
             needs_install = True
             continue
-        actual_hash = _hash_dir(skill_dir)
+        actual_hash = manifest.digest(name, skill_dir)
         packaged_hash = definition.digest
         stored_entry = stored.get(name)
         stored_hash = stored_entry.get("hash") if stored_entry else None
@@ -331,6 +422,8 @@ def workspace_skill_state(
                 unmodified = False
                 modified.append(name)
 
+    manifest.save()
+
     if extra:
         needs_install = True
         unmodified = False
@@ -362,6 +455,16 @@ def install_workspace_skills(workspace_dir: Path) -> dict[str, dict[str, str]]:
             staging_dir,
             definitions,
         )
+        # The install was verified against the packaged digests, so seed the
+        # manifest and let the next state check skip re-hashing.
+        manifest = _SkillManifest(workspace_dir)
+        for name, definition in definitions.items():
+            manifest.record(
+                name,
+                digest=definition.digest,
+                stats=_dir_file_stats(skills_dir / name),
+            )
+        manifest.save()
     return {
         name: {"version": __version__, "hash": definition.digest}
         for name, definition in definitions.items()
@@ -24,12 +24,13 @@ _BOOTSTRAP_REPO_ROOT = bootstrap_projected_atelier_script(
     require_runtime_health=__name__ == "__main__",
 )
 
-from atelier import lifecycle, planner_overview  # noqa: E402
+from atelier import planner_overview  # noqa: E402
 from atelier.beads_context import (  # noqa: E402
     resolve_runtime_repo_dir_hint,
     resolve_skill_beads_context,
 )
 from atelier.planner_startup_check import (  # noqa: E402
+    DEFAULT_DEFERRED_EPIC_SCAN_LIMIT,
     StartupBeadsInvocationHelper,
     StartupCommandResult,
     StartupRuntimePreflight,
@@ -39,7 +40,6 @@ from atelier.planner_startup_check import (  # noqa: E402
     render_startup_triage_markdown,
 )
 
-DEFAULT_DEFERRED_EPIC_SCAN_LIMIT = 25
 _RUNTIME_CHECK_TIMEOUT_SECONDS = 10
 
 
@@ -65,49 +65,6 @@ _RUNTIME_PREFLIGHT_SPECS: tuple[_RuntimePreflightSpec, ...] = (
 )
 
 
-def _issue_sort_key(issue: dict[str, object]) -> tuple[str, str]:
-    issue_id = str(issue.get("id") or "").strip()
-    title = str(issue.get("title") or "").strip()
-    return (issue_id, title)
-
-
-def _deferred_descendant_changesets(
-    epics: list[dict[str, object]],
-    *,
-    helper: StartupBeadsInvocationHelper,
-) -> tuple[list[tuple[dict[str, object], list[dict[str, object]]]], int, int]:
-    scan_limit = _deferred_epic_scan_limit()
-    groups: list[tuple[dict[str, object], list[dict[str, object]]]] = []
-    active_epics = []
-    for epic in sorted(epics, key=_issue_sort_key):
-        if lifecycle.canonical_lifecycle_status(epic.get("status")) not in {
-            "open",
-            "in_progress",
-            "blocked",
-        }:
-            continue
-        if not str(epic.get("id") or "").strip():
-            continue
-        active_epics.append(epic)
-
-    scanned_epics = active_epics[:scan_limit]
-    skipped_epics = max(0, len(active_epics) - len(scanned_epics))
-    for epic in scanned_epics:
-        epic_id = str(epic.get("id") or "").strip()
-        descendants = helper.list_descendant_changesets(
-            epic_id,
-            include_closed=False,
-        )
-        deferred = [
-            issue
-            for issue in descendants
-            if lifecycle.canonical_lifecycle_status(issue.get("status")) == "deferred"
-        ]
-        if deferred:
-            groups.append((epic, sorted(deferred, key=_issue_sort_key)))
-    return groups, skipped_epics, scan_limit
-
-
 def _deferred_epic_scan_limit() -> int:
     raw_value = os.environ.get("ATELIER_STARTUP_DEFERRED_EPIC_SCAN_LIMIT", "").strip()
     if not raw_value:
@@ -220,17 +177,15 @@ def _render_startup_overview(agent_id: str, *, beads_root: Path, repo_root: Path
         command_result: StartupCommandResult = execute_startup_command_plan(
             agent_id,
             helper=helper,
+            deferred_scan_limit=_deferred_epic_scan_limit(),
         )
-        deferred_groups, skipped_epics, scan_limit = _deferred_descendant_changesets(
-            command_result.epics,
-            helper=helper,
-        )
+        deferred_scan = command_result.deferred_scan
         triage_model = build_startup_triage_model(
             beads_root=beads_root,
             command_result=command_result,
-            deferred_groups=deferred_groups,
-            deferred_scan_limit=scan_limit,
-            deferred_scan_skipped_epics=skipped_epics,
+            deferred_groups=deferred_scan.groups,
+            deferred_scan_limit=deferred_scan.scan_limit,
+            deferred_scan_skipped_epics=deferred_scan.skipped_epics,
             runtime_preflight=runtime_preflight,
             epic_list_markdown=planner_overview.render_epics(
                 command_result.epics, show_drafts=True
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import sys
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import socket
 
 _DEFAULT_REPO_DIR_ENV_VARS: tuple[str, ...] = (
     "ATELIER_PLANNER_WORKTREE",
     "ATELIER_WORKSPACE_DIR",
     "ATELIER_PROJECT",
 )
+# Mirrors ``atelier.skill_executor``; this module must not import ``atelier``
+# before it knows whether the warm executor will run the script.
+_EXECUTOR_PROTOCOL_VERSION = 2
+_EXECUTOR_DISABLE_ENV = "ATELIER_SKILL_EXECUTOR"
+_EXECUTOR_CHILD_ENV = "ATELIER_SKILL_EXECUTOR_CHILD"
+_EXECUTOR_DISABLED_VALUES = frozenset({"0", "false", "no", "off"})
+_EXECUTOR_CONNECT_TIMEOUT_SECONDS = 1.0
+_EXECUTOR_START_TIMEOUT_SECONDS = 5.0
+_EXECUTOR_FORWARDED_SIGNALS = ("SIGINT", "SIGTERM", "SIGHUP")
+_EXECUTOR_VERSION_PATTERN = r"""^__version__\s*=\s*(?:version\s*=\s*)?['"]([^'"]+)['"]"""
 
 
 def _repo_dir_from_argv(argv: Sequence[str]) -> Path | None:
@@ -72,6 +87,200 @@ def _bootstrap_source_import(
     return None
 
 
+def _executor_socket_path(project: str) -> Path:
+    """Return the warm executor socket path for one project enlistment.
+
+    Keep in sync with ``atelier.skill_executor.socket_path``.
+    """
+    import tempfile
+
+    digest = hashlib.sha256(project.encode("utf-8")).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"atelier-{os.getuid()}" / f"skills-{digest}.sock"
+
+
+def _executor_package_dir() -> Path | None:
+    """Return the ``atelier`` package directory a cold start would import."""
+    import importlib.util
+
+    try:
+        spec = importlib.util.find_spec("atelier")
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return Path(next(iter(spec.submodule_search_locations))).resolve()
+
+
+def _executor_package_fingerprint(package_dir: Path) -> str:
+    """Return the package source digest the executor compares against.
+
+    Keep in sync with ``atelier.skill_executor.package_fingerprint``.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        try:
+            details = path.stat()
+        except OSError:
+            continue
+        relative = path.relative_to(package_dir).as_posix()
+        digest.update(f"{relative}\0{details.st_mtime_ns}\0{details.st_size}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def _executor_package_version(package_dir: Path) -> str:
+    """Return the ``atelier`` version without importing the package.
+
+    Keep in sync with ``atelier.skill_executor.package_version``.
+    """
+    import re
+
+    try:
+        text = (package_dir / "_version.py").read_text(encoding="utf-8")
+    except OSError:
+        text = ""
+    match = re.search(_EXECUTOR_VERSION_PATTERN, text, re.MULTILINE)
+    if match is not None:
+        return match.group(1)
+    try:
+        from importlib.metadata import version
+
+        return version("atelier")
+    except Exception:
+        return "0.0.0"
+
+
+def _run_in_warm_executor(
+    *,
+    script_path: Path,
+    argv: Sequence[str],
+    env: Mapping[str, str],
+    repo_root: Path | None,
+) -> int | None:
+    """Run the script in the project's warm executor when one is listening.
+
+    Args:
+        script_path: Concrete projected script file path.
+        argv: Command-line arguments excluding interpreter and script.
+        env: Environment the script should run with.
+        repo_root: Repo root resolved by the source bootstrap, if any.
+
+    Returns:
+        Script exit code when the executor ran it, or ``None`` when the
+        caller should continue with the cold bootstrap.
+    """
+    import socket
+
+    if not hasattr(socket, "AF_UNIX") or not hasattr(socket, "send_fds"):
+        return None
+    if str(env.get(_EXECUTOR_DISABLE_ENV, "")).strip().lower() in _EXECUTOR_DISABLED_VALUES:
+        return None
+    if env.get(_EXECUTOR_CHILD_ENV) == str(os.getpid()):
+        return None
+    project = str(env.get("ATELIER_PROJECT", "")).strip()
+    if not project:
+        return None
+    path = _executor_socket_path(project)
+    if not path.exists():
+        return None
+    package_dir = _executor_package_dir()
+    if package_dir is None:
+        return None
+
+    import json
+
+    payload = json.dumps(
+        {
+            "protocol": _EXECUTOR_PROTOCOL_VERSION,
+            "script": str(script_path.resolve()),
+            "argv": list(argv),
+            "env": dict(env),
+            "cwd": os.getcwd(),
+            "repo_root": None if repo_root is None else str(repo_root),
+            "version": _executor_package_version(package_dir),
+            "source_digest": _executor_package_fingerprint(package_dir),
+        }
+    ).encode("utf-8")
+    frame = len(payload).to_bytes(4, "big") + payload
+    for stream in (sys.stdout, sys.stderr):
+        stream.flush()
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with connection:
+        try:
+            connection.settimeout(_EXECUTOR_CONNECT_TIMEOUT_SECONDS)
+            connection.connect(str(path))
+            sent = socket.send_fds(connection, [frame], [0, 1, 2])
+            connection.sendall(frame[sent:])
+            connection.settimeout(_EXECUTOR_START_TIMEOUT_SECONDS)
+            events = connection.makefile("rb")
+            started = json.loads(events.readline() or b"{}")
+        except (OSError, ValueError):
+            return None
+        if started.get("event") != "started":
+            return None
+        # The script now owns this process's stdio; only its exit code is
+        # left to relay, however long it runs. Signals sent to this process
+        # are passed on so the script sees them as a cold start would.
+        forwarded: list[int] = []
+        restore = _forward_signals(connection, forwarded)
+        try:
+            connection.settimeout(None)
+            finished = json.loads(events.readline() or b"{}")
+        except (OSError, ValueError):
+            finished = {}
+        finally:
+            restore()
+    code = finished.get("code") if finished.get("event") == "exit" else None
+    if isinstance(code, int):
+        return code
+    if forwarded:
+        # The script died of the forwarded signal; die of it here too.
+        import signal
+
+        signal.signal(forwarded[-1], signal.SIG_DFL)
+        os.kill(os.getpid(), forwarded[-1])
+        return 128 + forwarded[-1]
+    print("error: warm skill executor exited before the script finished", file=sys.stderr)
+    return 1
+
+
+def _forward_signals(connection: socket.socket, forwarded: list[int]) -> Callable[[], None]:
+    """Relay caller signals to the executor child until the returned undo runs.
+
+    Args:
+        connection: Connected executor socket.
+        forwarded: Receives each signal number that was relayed.
+
+    Returns:
+        Callable that restores the previous signal handlers.
+    """
+    import json
+    import signal
+
+    def _relay(signum: int, _frame: object) -> None:
+        forwarded.append(signum)
+        try:
+            connection.sendall(json.dumps({"event": "signal", "signum": signum}).encode() + b"\n")
+        except OSError:
+            pass
+
+    previous = {}
+    for name in _EXECUTOR_FORWARDED_SIGNALS:
+        signum = getattr(signal, name, None)
+        if signum is None:
+            continue
+        try:
+            previous[signum] = signal.signal(signum, _relay)
+        except ValueError:
+            # Handlers can only be installed from the main thread.
+            break
+
+    def _restore() -> None:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+    return _restore
+
+
 def bootstrap_projected_atelier_script(
     *,
     script_path: Path,
@@ -79,6 +288,7 @@ def bootstrap_projected_atelier_script(
     env: Mapping[str, str] | None = None,
     repo_dir_env_vars: Sequence[str] = _DEFAULT_REPO_DIR_ENV_VARS,
     require_runtime_health: bool = True,
+    use_warm_executor: bool = True,
 ) -> Path | None:
     """Prepare a projected skill script to import repo ``atelier`` code safely.
 
@@ -96,9 +306,15 @@ def bootstrap_projected_atelier_script(
         require_runtime_health: When true, re-exec into the repo runtime when
             required and fail closed if the selected interpreter cannot import
             compiled runtime dependencies.
+        use_warm_executor: When true and ``require_runtime_health`` is set,
+            hand the script to the project's warm skill executor if one is
+            listening, and exit with its status instead of returning.
 
     Returns:
         Resolved repo root when source bootstrap succeeds, otherwise ``None``.
+
+    Raises:
+        SystemExit: When the warm skill executor ran the script.
     """
     resolved_env = dict(os.environ if env is None else env)
     resolved_argv = tuple(sys.argv[1:] if argv is None else argv)
@@ -108,6 +324,15 @@ def bootstrap_projected_atelier_script(
         env=resolved_env,
         repo_dir_env_vars=repo_dir_env_vars,
     )
+    if require_runtime_health and use_warm_executor:
+        warm_exit_code = _run_in_warm_executor(
+            script_path=script_path,
+            argv=resolved_argv,
+            env=resolved_env,
+            repo_root=repo_root,
+        )
+        if warm_exit_code is not None:
+            raise SystemExit(warm_exit_code)
 
     from atelier.runtime_env import (
         ProjectedRuntimeMode,
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Serve this project's projected skill scripts from a warm interpreter."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_SHARED_SCRIPTS_ROOT = Path(__file__).resolve().parent
+if str(_SHARED_SCRIPTS_ROOT) not in sys.path:
+    sys.path.insert(0, str(_SHARED_SCRIPTS_ROOT))
+
+from projected_bootstrap import (  # noqa: E402  # pyright: ignore[reportMissingImports]
+    bootstrap_projected_atelier_script,
+)
+
+_BOOTSTRAP_REPO_ROOT = bootstrap_projected_atelier_script(
+    script_path=Path(__file__).resolve(),
+    argv=sys.argv[1:],
+    require_runtime_health=__name__ == "__main__",
+    use_warm_executor=False,
+)
+
+from atelier import skill_executor  # noqa: E402
+
+if __name__ == "__main__":
+    skill_executor.main(repo_root=_BOOTSTRAP_REPO_ROOT)
@@ -32,6 +32,7 @@ from .models import (
     HookRecord,
     LifecycleStatus,
     LifecycleTransition,
+    LifecycleTransitionOutcome,
     MessageDelivery,
     MessageRecord,
     MessageThreadKind,
@@ -64,6 +65,7 @@ __all__ = [
     "HookRecord",
     "LifecycleStatus",
     "LifecycleTransition",
+    "LifecycleTransitionOutcome",
     "LifecycleTransitionRequest",
     "MarkMessageReadRequest",
     "MessageDelivery",
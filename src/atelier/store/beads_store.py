@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import json
-from collections.abc import Awaitable, Callable
+import os
+import threading
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import cast
+from typing import Any, TypeVar, cast
 
-from atelier import changesets, lifecycle, messages
+from atelier import changesets, command_trace, lifecycle, messages
+from atelier import log as atelier_log
 from atelier.external_tickets import external_ticket_payload
 from atelier.lib.beads import (
     BeadError,
@@ -21,8 +26,10 @@ from atelier.lib.beads import (
     IssueRecord,
     ListIssuesRequest,
     ShowIssueRequest,
+    ShowManyIssuesRequest,
     SupportedOperation,
     UpdateIssueRequest,
+    UpdateManyIssuesRequest,
 )
 from atelier.lib.beads import description_fields as bead_fields
 
@@ -57,6 +64,7 @@ from .models import (
     HookRecord,
     LifecycleStatus,
     LifecycleTransition,
+    LifecycleTransitionOutcome,
     MessageDelivery,
     MessageRecord,
     MessageThreadKind,
@@ -68,6 +76,8 @@ from .models import (
 )
 
 _DEFAULT_SCAN_LIMIT = 10_000
+_DEFAULT_READ_CONCURRENCY = 8
+_READ_CONCURRENCY_ENV = "ATELIER_STORE_READ_CONCURRENCY"
 _MAX_UPDATE_ATTEMPTS = 5
 _FAIL_CLOSED_REASON = "automatic fail-closed: unable to set deferred status after create"
 _MESSAGE_LABELS = ("at:message", "at:unread")
@@ -94,6 +104,9 @@ _REVIEW_STATE_MAP = {
     ReviewState.CLOSED.value: ReviewState.CLOSED,
 }
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 def _clean_text(value: object) -> str | None:
     return value.strip() or None if isinstance(value, str) else None
@@ -112,6 +125,22 @@ def _is_missing_issue_error(exc: BeadError) -> bool:
     return any(marker in detail for marker in _ISSUE_NOT_FOUND_ERROR_MARKERS)
 
 
+async def _await_all(tasks: Sequence[asyncio.Future[Any]]) -> None:
+    """Wait for every task; on the first failure cancel and reap the rest.
+
+    Unlike a bare ``asyncio.gather``, no sibling read keeps running in the
+    background, and their later exceptions are always retrieved.
+    """
+
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def _read_issue_slots(beads: Beads, issue_id: str) -> dict[str, str]:
     issue_store = getattr(beads, "_issue_store", None)
     if issue_store is not None and hasattr(issue_store, "show_slots"):
@@ -149,6 +178,10 @@ def _parent_id(issue: IssueRecord) -> str | None:
     return _clean_text(issue.parent.id) if issue.parent is not None else None
 
 
+def _dependency_ids(issues: tuple[IssueRecord, ...]) -> tuple[str, ...]:
+    return tuple(dependency.id for issue in issues for dependency in issue.dependencies)
+
+
 def _canonical_status(issue: IssueRecord) -> LifecycleStatus:
     status = lifecycle.canonical_lifecycle_status(issue.status)
     if status is None:
@@ -287,33 +320,219 @@ def _description_ends_with_notes(description: str, *, notes: tuple[str, ...]) ->
     return tuple(lines[-len(notes) :]) == notes
 
 
+@dataclass
+class _ReadSnapshot:
+    """Read caches shared by every store call inside one read session."""
+
+    writes: command_trace.BdWriteCount
+    issue_cache: dict[str, IssueRecord] = field(default_factory=dict)
+    child_cache: dict[tuple[str, bool], tuple[IssueRecord, ...]] = field(default_factory=dict)
+    scan_cache: dict[bool, tuple[IssueRecord, ...]] = field(default_factory=dict)
+    child_index: dict[bool, dict[str, tuple[IssueRecord, ...]]] = field(default_factory=dict)
+    in_flight: dict[tuple[object, ...], asyncio.Future[Any]] = field(default_factory=dict)
+    waiters: dict[asyncio.Future[Any], int] = field(default_factory=dict)
+    loop: asyncio.AbstractEventLoop | None = None
+
+    def clear(self) -> None:
+        self.issue_cache.clear()
+        self.child_cache.clear()
+        self.scan_cache.clear()
+        self.child_index.clear()
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Share in-flight reads only between calls on the same event loop."""
+
+        if self.loop is not loop:
+            self.loop = loop
+            self.in_flight = {}
+            self.waiters = {}
+
+    def sync_writes(self) -> None:
+        """Drop all cached reads after any ``bd`` write since the last check."""
+
+        current = command_trace.bd_write_count()
+        if current.process != self.writes.process:
+            self.clear()
+        self.writes = current
+
+    def absorb_writes(self, before: command_trace.BdWriteCount) -> None:
+        """Keep the caches across writes this thread made since ``before``.
+
+        The caller evicts what its own writes touched. A write from another
+        thread in the same window still drops everything.
+        """
+
+        current = command_trace.bd_write_count()
+        if current.process - before.process != current.thread - before.thread:
+            self.clear()
+        self.writes = current
+
+    def forget(self, issue_ids: Iterable[str], *, parent_ids: Iterable[str] = ()) -> None:
+        """Evict issues and every listing that may contain them."""
+
+        parents = set(parent_ids)
+        for issue_id in issue_ids:
+            cached = self.issue_cache.pop(issue_id, None)
+            parent_id = None if cached is None else _parent_id(cached)
+            if parent_id is not None:
+                parents.add(parent_id)
+        for key in [key for key in self.child_cache if key[0] in parents]:
+            del self.child_cache[key]
+        self.scan_cache.clear()
+        self.child_index.clear()
+
+
 @dataclass
 class _ReadState:
     store: "AtelierStore"
     issue_cache: dict[str, IssueRecord] = field(default_factory=dict)
     child_cache: dict[tuple[str, bool], tuple[IssueRecord, ...]] = field(default_factory=dict)
     scan_cache: dict[bool, tuple[IssueRecord, ...]] = field(default_factory=dict)
+    child_index: dict[bool, dict[str, tuple[IssueRecord, ...]]] = field(default_factory=dict)
+    in_flight: dict[tuple[object, ...], asyncio.Future[Any]] = field(default_factory=dict)
+    waiters: dict[asyncio.Future[Any], int] = field(default_factory=dict)
+    semaphore: asyncio.Semaphore = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(self.store.read_concurrency)
+        snapshot = self.store._read_snapshot()
+        if snapshot is None:
+            return
+        snapshot.sync_writes()
+        snapshot.bind_loop(asyncio.get_running_loop())
+        snapshot.issue_cache.update(self.issue_cache)
+        self.issue_cache = snapshot.issue_cache
+        self.child_cache = snapshot.child_cache
+        self.scan_cache = snapshot.scan_cache
+        self.child_index = snapshot.child_index
+        self.in_flight = snapshot.in_flight
+        self.waiters = snapshot.waiters
+
+    async def gather(
+        self,
+        items: Iterable[_T],
+        load: Callable[[_T], Awaitable[_R]],
+    ) -> list[_R]:
+        """Run ``load`` for every item concurrently and keep the input order.
+
+        Backend reads issued by ``load`` are bounded by the store's read
+        concurrency, so nested fan-out cannot exceed that limit. When one
+        load fails, the others are cancelled before the error propagates.
+        """
+
+        tasks = [asyncio.ensure_future(load(item)) for item in items]
+        await _await_all(tasks)
+        return [task.result() for task in tasks]
+
+    def _track(
+        self,
+        keys: tuple[tuple[object, ...], ...],
+        load: Callable[[], Awaitable[_R]],
+    ) -> asyncio.Future[_R]:
+        pending = asyncio.ensure_future(load())
+        for key in keys:
+            self.in_flight[key] = pending
+
+        def release(_future: asyncio.Future[_R]) -> None:
+            for key in keys:
+                if self.in_flight.get(key) is pending:
+                    del self.in_flight[key]
+
+        pending.add_done_callback(release)
+        return pending
+
+    async def _shared(
+        self,
+        key: tuple[object, ...],
+        load: Callable[[], Awaitable[_R]],
+    ) -> _R:
+        pending = self.in_flight.get(key)
+        if pending is None:
+            pending = self._track((key,), load)
+        self.waiters[pending] = self.waiters.get(pending, 0) + 1
+        try:
+            return cast(_R, await asyncio.shield(pending))
+        finally:
+            remaining = self.waiters.pop(pending, 1) - 1
+            if remaining:
+                self.waiters[pending] = remaining
+            elif not pending.done():
+                # Every caller was cancelled, so nobody needs this read.
+                pending.cancel()
+
+    async def _bounded(self, load: Callable[[], Awaitable[_R]]) -> _R:
+        async with self.semaphore:
+            return await load()
 
     async def get_issue(self, issue_id: str) -> IssueRecord:
-        if issue_id not in self.issue_cache:
-            self.issue_cache[issue_id] = await self.store._show_issue(issue_id)
-        return self.issue_cache[issue_id]
+        cached = self.issue_cache.get(issue_id)
+        if cached is not None:
+            return cached
+        prefetch = self.in_flight.get(("prefetch", issue_id))
+        if prefetch is not None:
+            try:
+                await asyncio.shield(prefetch)
+            except BeadError:
+                pass
+            cached = self.issue_cache.get(issue_id)
+            if cached is not None:
+                return cached
+
+        async def load() -> IssueRecord:
+            issue = await self._bounded(lambda: self.store._show_issue(issue_id))
+            return self.issue_cache.setdefault(issue_id, issue)
+
+        return await self._shared(("show", issue_id), load)
+
+    async def prefetch_issues(self, issue_ids: tuple[str, ...]) -> None:
+        """Load every uncached issue id in one bulk show call.
+
+        Ids already being fetched by a concurrent read are skipped, and
+        concurrent ``get_issue`` calls for the prefetched ids wait on the bulk
+        read instead of issuing their own show.
+        """
+
+        missing = tuple(
+            issue_id
+            for issue_id in dict.fromkeys(issue_ids)
+            if issue_id not in self.issue_cache
+            and ("show", issue_id) not in self.in_flight
+            and ("prefetch", issue_id) not in self.in_flight
+        )
+        if len(missing) < 2:
+            return
+
+        async def load() -> None:
+            issues = await self._bounded(
+                lambda: self.store._beads.show_many(ShowManyIssuesRequest(issue_ids=missing))
+            )
+            for issue in issues:
+                self.issue_cache.setdefault(issue.id, issue)
+
+        await self._track(tuple(("prefetch", issue_id) for issue_id in missing), load)
 
     async def scan_issues(
         self,
         *,
         include_closed: bool,
     ) -> tuple[IssueRecord, ...]:
-        if include_closed not in self.scan_cache:
-            self.scan_cache[include_closed] = await self.store._beads.list(
-                ListIssuesRequest(
-                    include_closed=include_closed,
-                    limit=self.store.scan_limit,
+        if include_closed in self.scan_cache:
+            return self.scan_cache[include_closed]
+
+        async def load() -> tuple[IssueRecord, ...]:
+            issues = await self._bounded(
+                lambda: self.store._beads.list(
+                    ListIssuesRequest(
+                        include_closed=include_closed,
+                        limit=self.store.scan_limit,
+                    )
                 )
             )
-            for issue in self.scan_cache[include_closed]:
+            for issue in issues:
                 self.issue_cache.setdefault(issue.id, issue)
-        return self.scan_cache[include_closed]
+            return self.scan_cache.setdefault(include_closed, issues)
+
+        return await self._shared(("scan", include_closed), load)
 
     async def child_issues(
         self,
@@ -322,17 +541,53 @@ class _ReadState:
         include_closed: bool,
     ) -> tuple[IssueRecord, ...]:
         key = (parent_id, include_closed)
-        if key not in self.child_cache:
-            self.child_cache[key] = await self.store._beads.list(
-                ListIssuesRequest(
-                    parent_id=parent_id,
-                    include_closed=include_closed,
-                    limit=self.store.scan_limit,
+        if key in self.child_cache:
+            return self.child_cache[key]
+        scanned = self._scanned_children(parent_id, include_closed=include_closed)
+        if scanned is not None:
+            return scanned
+
+        async def load() -> tuple[IssueRecord, ...]:
+            children = await self._bounded(
+                lambda: self.store._beads.list(
+                    ListIssuesRequest(
+                        parent_id=parent_id,
+                        include_closed=include_closed,
+                        limit=self.store.scan_limit,
+                    )
                 )
             )
-            for issue in self.child_cache[key]:
+            for issue in children:
                 self.issue_cache.setdefault(issue.id, issue)
-        return self.child_cache[key]
+            return self.child_cache.setdefault(key, children)
+
+        return await self._shared(("children", *key), load)
+
+    def _scanned_children(
+        self,
+        parent_id: str,
+        *,
+        include_closed: bool,
+    ) -> tuple[IssueRecord, ...] | None:
+        """Answer a child listing from a complete scan with the same filter.
+
+        Returns ``None`` when no such scan is cached or the scan stopped at
+        the store's scan limit, so it may be missing children.
+        """
+
+        index = self.child_index.get(include_closed)
+        if index is None:
+            issues = self.scan_cache.get(include_closed)
+            if issues is None or (self.store.scan_limit and len(issues) >= self.store.scan_limit):
+                return None
+            grouped: dict[str, list[IssueRecord]] = {}
+            for issue in issues:
+                issue_parent = _parent_id(issue)
+                if issue_parent is not None:
+                    grouped.setdefault(issue_parent, []).append(issue)
+            index = {parent: tuple(children) for parent, children in grouped.items()}
+            self.child_index[include_closed] = index
+        return index.get(parent_id, ())
 
     async def work_children(
         self,
@@ -359,11 +614,82 @@ class AtelierStore:
         scan_limit: Upper bound used when the store must scan issues through the
             Beads list contract because the published client does not expose an
             unlimited listing mode.
+        read_concurrency: Maximum number of Beads reads one store call keeps in
+            flight while fanning out over epics, descendants, and dependencies.
+
+    Raises:
+        ValueError: If ``read_concurrency`` is less than one.
+
+    Each store call reads through its own caches unless the calling thread
+    holds a :meth:`read_session`, which shares them across calls.
     """
 
-    def __init__(self, *, beads: Beads, scan_limit: int = _DEFAULT_SCAN_LIMIT) -> None:
+    def __init__(
+        self,
+        *,
+        beads: Beads,
+        scan_limit: int = _DEFAULT_SCAN_LIMIT,
+        read_concurrency: int = _DEFAULT_READ_CONCURRENCY,
+    ) -> None:
+        if read_concurrency < 1:
+            raise ValueError("read_concurrency must be at least 1")
         self._beads = beads
         self.scan_limit = scan_limit
+        self.read_concurrency = read_concurrency
+        self._sessions = threading.local()
+
+    @contextmanager
+    def read_session(self) -> Iterator[None]:
+        """Share issue, child-listing, and scan reads across store calls.
+
+        The session belongs to the calling thread; nested sessions reuse the
+        outer one. Concurrent store calls on one event loop also share reads
+        that are still in flight. Store mutations evict the issues they touch
+        and their parent listings. Any other ``bd`` write in this process
+        drops every cached read. Writes from other processes are not observed,
+        so keep sessions short and never hold one across an agent run.
+        """
+
+        if self._read_snapshot() is not None:
+            yield
+            return
+        self._sessions.snapshot = _ReadSnapshot(writes=command_trace.bd_write_count())
+        try:
+            yield
+        finally:
+            self._sessions.snapshot = None
+
+    async def preload_issues(self) -> None:
+        """Scan every issue, closed ones included, into the read session.
+
+        Child listings later in the same session answer from this scan
+        instead of listing each parent, unless it stopped at ``scan_limit``.
+        Outside a read session the scan is discarded when the call returns.
+        """
+
+        await _ReadState(self).scan_issues(include_closed=True)
+
+    def _read_snapshot(self) -> _ReadSnapshot | None:
+        snapshot = getattr(self._sessions, "snapshot", None)
+        return snapshot if isinstance(snapshot, _ReadSnapshot) else None
+
+    async def _write(
+        self,
+        pending: Awaitable[_T],
+        *,
+        issue_ids: Iterable[str] = (),
+        parent_ids: Iterable[str] = (),
+    ) -> _T:
+        snapshot = self._read_snapshot()
+        if snapshot is None:
+            return await pending
+        snapshot.sync_writes()
+        before = snapshot.writes
+        try:
+            return await pending
+        finally:
+            snapshot.absorb_writes(before)
+            snapshot.forget(issue_ids, parent_ids=parent_ids)
 
     async def get_epic(self, epic_id: str) -> EpicRecord:
         state = _ReadState(self)
@@ -378,7 +704,7 @@ class AtelierStore:
     ) -> tuple[EpicRecord, ...]:
         state = _ReadState(self)
         issues = await state.scan_issues(include_closed=query.include_closed)
-        records: list[EpicRecord] = []
+        epics: list[IssueRecord] = []
         for issue in issues:
             record_status = _canonical_status(issue)
             if not query.include_closed and record_status is LifecycleStatus.CLOSED:
@@ -386,13 +712,15 @@ class AtelierStore:
             if query.assignee is not None and issue.assignee != query.assignee:
                 continue
             if await self._is_indexed_epic(issue, state=state):
-                records.append(
-                    await self._epic_record(
-                        issue,
-                        state=state,
-                        include_changesets=query.include_changesets,
-                    )
-                )
+                epics.append(issue)
+        records = await state.gather(
+            epics,
+            lambda issue: self._epic_record(
+                issue,
+                state=state,
+                include_changesets=query.include_changesets,
+            ),
+        )
         return tuple(records)
 
     async def epic_discovery_parity(self) -> EpicDiscoveryParity:
@@ -477,7 +805,11 @@ class AtelierStore:
     ) -> tuple[ChangesetRecord, ...]:
         state = _ReadState(self)
         issues = await self._candidate_changesets(query=query, state=state)
-        records = [await self._changeset_record(issue, state=state) for issue in issues]
+        await state.prefetch_issues(_dependency_ids(issues))
+        records = await state.gather(
+            issues,
+            lambda issue: self._changeset_record(issue, state=state),
+        )
         return tuple(records)
 
     async def list_ready_changesets(
@@ -490,8 +822,12 @@ class AtelierStore:
             query=ChangesetQuery(epic_id=query.epic_id),
             state=state,
         )
-        for issue in changesets:
-            record = await self._changeset_record(issue, state=state)
+        await state.prefetch_issues(_dependency_ids(changesets))
+        records = await state.gather(
+            changesets,
+            lambda issue: self._changeset_record(issue, state=state),
+        )
+        for record in records:
             if record.lifecycle not in {
                 LifecycleStatus.OPEN,
                 LifecycleStatus.IN_PROGRESS,
@@ -596,11 +932,14 @@ class AtelierStore:
                 state=state,
             )
         await state.get_issue(mutation.depends_on_id)
-        updated_issue = await self._beads.add_dependency(
-            DependencyMutationRequest(
-                issue_id=mutation.issue_id,
-                dependency_id=mutation.depends_on_id,
-            )
+        updated_issue = await self._write(
+            self._beads.add_dependency(
+                DependencyMutationRequest(
+                    issue_id=mutation.issue_id,
+                    dependency_id=mutation.depends_on_id,
+                )
+            ),
+            issue_ids=(mutation.issue_id,),
         )
         updated_state = _ReadState(self, issue_cache={updated_issue.id: updated_issue})
         return await self._dependency_record(
@@ -625,11 +964,14 @@ class AtelierStore:
             requires_integrated_state=mutation.requires_integrated_state,
             state=state,
         )
-        updated_issue = await self._beads.remove_dependency(
-            DependencyMutationRequest(
-                issue_id=mutation.issue_id,
-                dependency_id=mutation.depends_on_id,
-            )
+        updated_issue = await self._write(
+            self._beads.remove_dependency(
+                DependencyMutationRequest(
+                    issue_id=mutation.issue_id,
+                    dependency_id=mutation.depends_on_id,
+                )
+            ),
+            issue_ids=(mutation.issue_id,),
         )
         if any(
             dependency.id == mutation.depends_on_id for dependency in updated_issue.dependencies
@@ -638,14 +980,16 @@ class AtelierStore:
         return removed
 
     async def create_epic(self, request: CreateEpicRequest) -> EpicRecord:
-        created = await self._beads.create(
-            CreateIssueRequest(
-                title=request.title,
-                type=WorkItemKind.EPIC.value,
-                description=request.description,
-                design=request.design,
-                acceptance_criteria=request.acceptance_criteria,
-                labels=("at:epic", *request.labels),
+        created = await self._write(
+            self._beads.create(
+                CreateIssueRequest(
+                    title=request.title,
+                    type=WorkItemKind.EPIC.value,
+                    description=request.description,
+                    design=request.design,
+                    acceptance_criteria=request.acceptance_criteria,
+                    labels=("at:epic", *request.labels),
+                )
             )
         )
         try:
@@ -674,15 +1018,18 @@ class AtelierStore:
         if not (await self._role(epic, state=state)).is_epic:
             raise LookupError(f"epic not found: {request.epic_id}")
 
-        created = await self._beads.create(
-            CreateIssueRequest(
-                title=request.title,
-                type="task",
-                description=request.description,
-                acceptance_criteria=request.acceptance_criteria,
-                parent_id=request.epic_id,
-                labels=request.labels,
-            )
+        created = await self._write(
+            self._beads.create(
+                CreateIssueRequest(
+                    title=request.title,
+                    type="task",
+                    description=request.description,
+                    acceptance_criteria=request.acceptance_criteria,
+                    parent_id=request.epic_id,
+                    labels=request.labels,
+                )
+            ),
+            parent_ids=(request.epic_id,),
         )
         try:
             if request.initial_status is not LifecycleStatus.OPEN:
@@ -726,12 +1073,14 @@ class AtelierStore:
             }
         )
         description = messages.render_message(normalized_metadata, request.body)
-        created = await self._beads.create(
-            CreateIssueRequest(
-                title=request.title,
-                type="task",
-                description=description,
-                labels=_MESSAGE_LABELS,
+        created = await self._write(
+            self._beads.create(
+                CreateIssueRequest(
+                    title=request.title,
+                    type="task",
+                    description=description,
+                    labels=_MESSAGE_LABELS,
+                )
             )
         )
         verified = await self._show_issue(created.id)
@@ -1193,8 +1542,11 @@ class AtelierStore:
                 reason=request.reason,
             )
         if request.target_status is LifecycleStatus.CLOSED:
-            updated = await self._beads.close(
-                CloseIssueRequest(issue_id=request.issue_id, reason=request.reason)
+            updated = await self._write(
+                self._beads.close(
+                    CloseIssueRequest(issue_id=request.issue_id, reason=request.reason)
+                ),
+                issue_ids=(request.issue_id,),
             )
             if lifecycle.canonical_lifecycle_status(updated.status) != LifecycleStatus.CLOSED.value:
                 refreshed = await self._show_issue(request.issue_id)
@@ -1239,6 +1591,94 @@ class AtelierStore:
             reason=request.reason,
         )
 
+    async def transition_lifecycle_many(
+        self,
+        requests: Sequence[LifecycleTransitionRequest],
+    ) -> tuple[LifecycleTransitionOutcome, ...]:
+        """Apply many lifecycle transitions and report each result.
+
+        Issues are read with one bulk show and status updates are sent as one
+        batched backend update. Closes, and any update the batch could not
+        verify, fall back to :meth:`transition_lifecycle` for that issue.
+        """
+
+        state = _ReadState(self)
+        await state.prefetch_issues(tuple(request.issue_id for request in requests))
+        outcomes: dict[int, LifecycleTransitionOutcome] = {}
+        pending: dict[int, LifecycleTransition] = {}
+        for index, request in enumerate(requests):
+            if request.target_status is LifecycleStatus.CLOSED:
+                continue
+            try:
+                issue = await state.get_issue(request.issue_id)
+                issue_kind = await self._transition_issue_kind(issue, state=state)
+            except (BeadError, LookupError, ValueError):
+                continue
+            current_status = _canonical_status(issue)
+            if (
+                request.expected_current is not None
+                and current_status is not request.expected_current
+            ):
+                outcomes[index] = LifecycleTransitionOutcome(
+                    issue_id=request.issue_id,
+                    error=(
+                        f"lifecycle mismatch for {request.issue_id}: expected "
+                        f"{request.expected_current.value!r}, got {current_status.value!r}"
+                    ),
+                )
+                continue
+            transition = LifecycleTransition(
+                issue_id=request.issue_id,
+                issue_kind=issue_kind,
+                from_status=current_status,
+                to_status=request.target_status,
+                reason=request.reason,
+            )
+            if current_status is request.target_status:
+                outcomes[index] = LifecycleTransitionOutcome(
+                    issue_id=request.issue_id, transition=transition
+                )
+                continue
+            pending[index] = transition
+        if pending:
+            results = await self._write(
+                self._beads.update_many(
+                    UpdateManyIssuesRequest(
+                        updates=tuple(
+                            UpdateIssueRequest(
+                                issue_id=requests[index].issue_id,
+                                status=requests[index].target_status.value,
+                            )
+                            for index in pending
+                        )
+                    )
+                ),
+                issue_ids=tuple(requests[index].issue_id for index in pending),
+            )
+            for (index, transition), result in zip(pending.items(), results, strict=True):
+                if (
+                    result.issue is not None
+                    and lifecycle.canonical_lifecycle_status(result.issue.status)
+                    == transition.to_status.value
+                ):
+                    outcomes[index] = LifecycleTransitionOutcome(
+                        issue_id=transition.issue_id, transition=transition
+                    )
+        for index, request in enumerate(requests):
+            if index in outcomes:
+                continue
+            try:
+                transition = await self.transition_lifecycle(request)
+            except (BeadError, LookupError, RuntimeError, ValueError) as exc:
+                outcomes[index] = LifecycleTransitionOutcome(
+                    issue_id=request.issue_id, error=str(exc)
+                )
+            else:
+                outcomes[index] = LifecycleTransitionOutcome(
+                    issue_id=request.issue_id, transition=transition
+                )
+        return tuple(outcomes[index] for index in range(len(requests)))
+
     async def _show_issue(self, issue_id: str) -> IssueRecord:
         try:
             return await self._beads.show(ShowIssueRequest(issue_id=issue_id))
@@ -1261,7 +1701,7 @@ class AtelierStore:
             if verify(current):
                 return current
             request = build_request(current)
-            updated = await self._beads.update(request)
+            updated = await self._write(self._beads.update(request), issue_ids=(issue_id,))
             if verify(updated):
                 return updated
             refreshed = await self._show_issue(issue_id)
@@ -1278,8 +1718,9 @@ class AtelierStore:
     ) -> None:
         transition_detail = str(transition_error).strip() or "status update failed"
         try:
-            closed = await self._beads.close(
-                CloseIssueRequest(issue_id=issue_id, reason=_FAIL_CLOSED_REASON)
+            closed = await self._write(
+                self._beads.close(CloseIssueRequest(issue_id=issue_id, reason=_FAIL_CLOSED_REASON)),
+                issue_ids=(issue_id,),
             )
         except Exception as close_error:
             close_detail = str(close_error).strip() or "close command failed"
@@ -1419,17 +1860,20 @@ class AtelierStore:
                 raise LookupError(f"epic not found: {query.epic_id}")
             issues = await self._descendant_changesets(epic, state=state, include_closed=True)
         else:
-            issues = []
-            for epic in await state.scan_issues(include_closed=query.include_closed):
-                if not await self._is_indexed_epic(epic, state=state):
-                    continue
-                issues.extend(
-                    await self._descendant_changesets(
-                        epic,
-                        state=state,
-                        include_closed=True,
-                    )
-                )
+            epics = [
+                epic
+                for epic in await state.scan_issues(include_closed=query.include_closed)
+                if await self._is_indexed_epic(epic, state=state)
+            ]
+            descendants = await state.gather(
+                epics,
+                lambda epic: self._descendant_changesets(
+                    epic,
+                    state=state,
+                    include_closed=True,
+                ),
+            )
+            issues = [issue for group in descendants for issue in group]
         filtered: list[IssueRecord] = []
         for issue in issues:
             if query.assignee is not None and issue.assignee != query.assignee:
@@ -1451,24 +1895,29 @@ class AtelierStore:
     ) -> tuple[IssueRecord, ...]:
         descendants: list[IssueRecord] = []
         seen: set[str] = set()
-        queue = [epic.id]
-        while queue:
-            current_id = queue.pop(0)
-            work_children = await state.work_children(
-                current_id,
-                include_closed=include_closed,
+        level = [epic.id]
+        while level:
+            children_by_parent = await state.gather(
+                level,
+                lambda parent_id: state.work_children(parent_id, include_closed=include_closed),
             )
-            for issue in work_children:
-                if issue.id in seen:
-                    continue
-                seen.add(issue.id)
-                grandchild_work = await state.work_children(
-                    issue.id,
-                    include_closed=include_closed,
-                )
-                if not grandchild_work:
-                    descendants.append(issue)
-                queue.append(issue.id)
+            discovered: list[IssueRecord] = []
+            for work_children in children_by_parent:
+                for issue in work_children:
+                    if issue.id in seen:
+                        continue
+                    seen.add(issue.id)
+                    discovered.append(issue)
+            grandchildren = await state.gather(
+                discovered,
+                lambda issue: state.work_children(issue.id, include_closed=include_closed),
+            )
+            descendants.extend(
+                issue
+                for issue, grandchild_work in zip(discovered, grandchildren, strict=True)
+                if not grandchild_work
+            )
+            level = [issue.id for issue in discovered]
         if descendants:
             return tuple(descendants)
         if (await self._role(epic, state=state)).is_changeset:
@@ -1482,17 +1931,23 @@ class AtelierStore:
         state: _ReadState,
         include_changesets: bool = True,
     ) -> EpicRecord:
-        changesets: tuple[WorkRef, ...] = ()
-        if include_changesets:
+        async def load_changesets() -> tuple[WorkRef, ...]:
+            if not include_changesets:
+                return ()
             descendant_changesets = await self._descendant_changesets(
                 issue,
                 state=state,
                 include_closed=True,
             )
-            changesets = tuple(
+            return tuple(
                 WorkRef(id=changeset.id, title=changeset.title, kind=WorkItemKind.CHANGESET)
                 for changeset in descendant_changesets
             )
+
+        changesets_task = asyncio.ensure_future(load_changesets())
+        dependencies_task = asyncio.ensure_future(self._dependencies(issue, state=state))
+        await _await_all((changesets_task, dependencies_task))
+        changesets, dependencies = changesets_task.result(), dependencies_task.result()
         return EpicRecord(
             id=issue.id,
             title=issue.title or issue.id,
@@ -1501,7 +1956,7 @@ class AtelierStore:
             root_branch=_epic_root_branch(issue),
             labels=issue.labels,
             changesets=changesets,
-            dependencies=await self._dependencies(issue, state=state),
+            dependencies=dependencies,
         )
 
     async def _changeset_record(
@@ -1528,16 +1983,16 @@ class AtelierStore:
         *,
         state: _ReadState,
     ) -> tuple[DependencyRecord, ...]:
-        dependencies: list[DependencyRecord] = []
-        for dependency in issue.dependencies:
-            dependencies.append(
-                await self._dependency_record(
-                    issue,
-                    depends_on_id=dependency.id,
-                    requires_integrated_state=True,
-                    state=state,
-                )
-            )
+        await state.prefetch_issues(tuple(dependency.id for dependency in issue.dependencies))
+        dependencies = await state.gather(
+            issue.dependencies,
+            lambda dependency: self._dependency_record(
+                issue,
+                depends_on_id=dependency.id,
+                requires_integrated_state=True,
+                state=state,
+            ),
+        )
         return tuple(dependencies)
 
     async def _dependency_record(
@@ -1681,10 +2136,43 @@ class AtelierStore:
         )
 
 
-def build_atelier_store(*, beads: Beads) -> AtelierStore:
-    """Build the published Atelier store on top of one Beads backend."""
+def build_atelier_store(
+    *,
+    beads: Beads,
+    read_concurrency: int | None = None,
+) -> AtelierStore:
+    """Build the published Atelier store on top of one Beads backend.
 
-    return AtelierStore(beads=beads)
+    Args:
+        beads: Typed Beads client used as the only backend boundary.
+        read_concurrency: Fan-out read bound. Defaults to
+            ``ATELIER_STORE_READ_CONCURRENCY`` when set, otherwise 8.
+
+    Raises:
+        ValueError: If the bound or its environment value is not a positive
+            integer.
+    """
+
+    if read_concurrency is None:
+        read_concurrency = _read_concurrency_from_env()
+    return AtelierStore(beads=beads, read_concurrency=read_concurrency)
+
+
+def _read_concurrency_from_env() -> int:
+    raw = os.environ.get(_READ_CONCURRENCY_ENV, "").strip()
+    if not raw:
+        return _DEFAULT_READ_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        atelier_log.warning(
+            f"Ignoring {_READ_CONCURRENCY_ENV}={raw!r}: expected a positive integer; "
+            f"using {_DEFAULT_READ_CONCURRENCY}"
+        )
+        return _DEFAULT_READ_CONCURRENCY
+    return value
 
 
 __all__ = ["AtelierStore", "build_atelier_store"]
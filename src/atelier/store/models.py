@@ -376,6 +376,18 @@ class LifecycleTransition(StoreModel):
     reason: Identifier | None = None
 
 
+class LifecycleTransitionOutcome(StoreModel):
+    """Per-issue result of a batched lifecycle transition."""
+
+    issue_id: Identifier
+    transition: LifecycleTransition | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.transition is not None and self.error is None
+
+
 class EpicIdentityViolation(StoreModel):
     """Active top-level work missing executable epic identity metadata."""
 
@@ -418,6 +430,7 @@ __all__ = [
     "Identifier",
     "LifecycleStatus",
     "LifecycleTransition",
+    "LifecycleTransitionOutcome",
     "MessageDelivery",
     "MessageRecord",
     "MessageThreadKind",
@@ -15,14 +15,17 @@ from atelier.lib.beads import (
     CreateIssueRequest,
     DependencyMutationRequest,
     IssueRecord,
+    IssueUpdateResult,
     ListIssuesRequest,
     OperationContract,
     ReadyIssuesRequest,
     SemanticVersion,
     ShowIssueRequest,
+    ShowManyIssuesRequest,
     SupportedOperation,
     UnsupportedOperationError,
     UpdateIssueRequest,
+    UpdateManyIssuesRequest,
 )
 
 from .contract import IN_MEMORY_BEADS_VERSION
@@ -117,6 +120,13 @@ class InMemoryBeadsClient(Beads):
         await self._ensure_operation_supported(SupportedOperation.SHOW)
         return IssueRecord.model_validate(self._issue_store.show(request.issue_id))
 
+    async def show_many(self, request: ShowManyIssuesRequest) -> tuple[IssueRecord, ...]:
+        await self._ensure_operation_supported(SupportedOperation.SHOW)
+        return tuple(
+            IssueRecord.model_validate(payload)
+            for payload in self._issue_store.show_many(request.issue_ids)
+        )
+
     async def list(self, request: ListIssuesRequest) -> tuple[IssueRecord, ...]:
         await self._ensure_operation_supported(SupportedOperation.LIST)
         return tuple(
@@ -181,6 +191,18 @@ class InMemoryBeadsClient(Beads):
             )
         )
 
+    async def update_many(self, request: UpdateManyIssuesRequest) -> tuple[IssueUpdateResult, ...]:
+        await self._ensure_operation_supported(SupportedOperation.UPDATE)
+        results: list[IssueUpdateResult] = []
+        for update in request.updates:
+            try:
+                issue = await self.update(update)
+            except (KeyError, ValueError, UnsupportedOperationError) as exc:
+                results.append(IssueUpdateResult(issue_id=update.issue_id, error=str(exc)))
+            else:
+                results.append(IssueUpdateResult(issue_id=update.issue_id, issue=issue))
+        return tuple(results)
+
     async def close(self, request: CloseIssueRequest) -> IssueRecord:
         await self._ensure_operation_supported(SupportedOperation.CLOSE)
         return IssueRecord.model_validate(
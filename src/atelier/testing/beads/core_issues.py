@@ -75,13 +75,9 @@ class InMemoryCoreIssuesHandler:
         return CommandEnvelope.not_implemented(route)
 
     def _show(self, tokens: Sequence[str]) -> CommandEnvelope:
-        if len(tokens) != 1:
-            raise ValueError("show requires exactly one issue id")
-        try:
-            payload = self._store.show(tokens[0])
-        except KeyError:
-            return CommandEnvelope.json_payload([])
-        return CommandEnvelope.json_payload([payload])
+        if not tokens:
+            raise ValueError("show requires at least one issue id")
+        return CommandEnvelope.json_payload(self._store.show_many(tokens))
 
     def _list(self, tokens: Sequence[str]) -> CommandEnvelope:
         parent_id: str | None = None
@@ -92,6 +88,7 @@ class InMemoryCoreIssuesHandler:
         labels: list[str] = []
         include_closed = False
         limit: int | None = None
+        updated_after: str | None = None
         index = 0
         while index < len(tokens):
             token = tokens[index]
@@ -107,6 +104,7 @@ class InMemoryCoreIssuesHandler:
                 "--title-contains",
                 "--label",
                 "--limit",
+                "--updated-after",
             }:
                 if index + 1 >= len(tokens):
                     raise ValueError(f"{token} requires a value")
@@ -127,6 +125,8 @@ class InMemoryCoreIssuesHandler:
                     limit = _parse_int(value, flag="--limit")
                     if limit < 0:
                         raise ValueError("--limit must be >= 0")
+                elif token == "--updated-after":
+                    updated_after = value
                 index += 2
                 continue
             raise ValueError(f"unsupported list flag: {token}")
@@ -140,21 +140,30 @@ class InMemoryCoreIssuesHandler:
                 labels=tuple(labels),
                 include_closed=include_closed,
                 limit=limit,
+                updated_after=updated_after,
             )
         )
 
     def _ready(self, tokens: Sequence[str]) -> CommandEnvelope:
         parent_id: str | None = None
+        limit: int | None = None
         index = 0
         while index < len(tokens):
             token = tokens[index]
-            if token != "--parent":
+            if token not in {"--parent", "--limit"}:
                 raise ValueError(f"unsupported ready flag: {token}")
             if index + 1 >= len(tokens):
-                raise ValueError("--parent requires a value")
-            parent_id = tokens[index + 1]
+                raise ValueError(f"{token} requires a value")
+            value = tokens[index + 1]
+            if token == "--parent":
+                parent_id = value
+            else:
+                limit = _parse_int(value, flag="--limit")
+                if limit < 0:
+                    raise ValueError("--limit must be >= 0")
             index += 2
-        return CommandEnvelope.json_payload(self._store.ready(parent_id=parent_id))
+        ready = self._store.ready(parent_id=parent_id)
+        return CommandEnvelope.json_payload(ready[:limit] if limit else ready)
 
     def _create(self, tokens: Sequence[str]) -> CommandEnvelope:
         title: str | None = None
@@ -239,9 +248,13 @@ class InMemoryCoreIssuesHandler:
         tokens: Sequence[str],
         invocation: CommandInvocation,
     ) -> CommandEnvelope:
-        if not tokens:
+        issue_ids: list[str] = []
+        for token in tokens:
+            if token.startswith("--"):
+                break
+            issue_ids.append(token)
+        if not issue_ids:
             raise ValueError("update requires an issue id")
-        issue_id = tokens[0]
         title: str | None = None
         description: str | None = None
         design: str | None = None
@@ -257,7 +270,7 @@ class InMemoryCoreIssuesHandler:
         append_notes: list[str] = []
         body_file: str | None = None
         claim = False
-        index = 1
+        index = len(issue_ids)
         while index < len(tokens):
             token = tokens[index]
             if token not in {
@@ -319,7 +332,8 @@ class InMemoryCoreIssuesHandler:
             if actor is None:
                 raise ValueError("claim requires --actor or BD_ACTOR")
             try:
-                self._store.claim(issue_id, actor=actor)
+                for issue_id in issue_ids:
+                    self._store.claim(issue_id, actor=actor)
             except ValueError as exc:
                 return CommandEnvelope(returncode=1, stderr=str(exc))
         if body_file is not None:
@@ -355,6 +369,7 @@ class InMemoryCoreIssuesHandler:
                     remove_labels=tuple(remove_labels),
                     append_notes=tuple(append_notes),
                 )
+                for issue_id in issue_ids
             ]
         )
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import datetime as dt
 import threading
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
@@ -33,6 +35,16 @@ def _timestamp_for_event(value: int) -> str:
     return f"2025-01-01T{hours:02d}:{minutes:02d}:{seconds:02d}Z"
 
 
+def _parse_timestamp(value: object) -> dt.datetime | None:
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        parsed = dt.datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=dt.timezone.utc)
+
+
 def _issue_ref(issue_id: str, *, title: str | None = None) -> dict[str, object]:
     payload: dict[str, object] = {"id": issue_id}
     if title is not None:
@@ -97,6 +109,12 @@ class StoredIssue:
 class InMemoryIssueStore:
     """Stateful in-memory issue store for Beads command semantics.
 
+    Secondary indexes on parent, label, canonical status, and assignee, plus a
+    reverse-dependency index, keep ``list`` and ``ready`` proportional to the
+    matching issues instead of the whole store. Exported payloads are cached
+    per issue and invalidated on mutation, so large seeded stores stay cheap
+    to query.
+
     Args:
         issues: Initial issue payloads to seed into the store.
         prefix: Prefix used for generated numeric ids.
@@ -113,6 +131,13 @@ class InMemoryIssueStore:
         self._prefix = prefix.strip() or "at"
         self._issues: dict[str, StoredIssue] = {}
         self._order: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._by_parent: dict[str, set[str]] = {}
+        self._by_label: dict[str, set[str]] = {}
+        self._by_status: dict[str | None, set[str]] = {}
+        self._by_assignee: dict[str, set[str]] = {}
+        self._dependents: dict[str, set[str]] = {}
+        self._exports: dict[str, dict[str, object]] = {}
         self._slots: dict[str, dict[str, str]] = {
             issue_id: _clean_slot_map(slot_map) for issue_id, slot_map in (slots or {}).items()
         }
@@ -129,6 +154,14 @@ class InMemoryIssueStore:
         with self._lock:
             return self._export_issue(self._require_issue(issue_id).id)
 
+    def show_many(self, issue_ids: Iterable[str]) -> list[dict[str, object]]:
+        """Return payloads for every known id, skipping ids that are missing."""
+
+        with self._lock:
+            return [
+                self._export_issue(issue_id) for issue_id in issue_ids if issue_id in self._issues
+            ]
+
     def list(
         self,
         *,
@@ -140,45 +173,60 @@ class InMemoryIssueStore:
         labels: tuple[str, ...] = (),
         include_closed: bool = False,
         limit: int | None = None,
+        updated_after: str | None = None,
     ) -> list[dict[str, object]]:
         """Return issues filtered with the current in-memory list semantics."""
 
         with self._lock:
             title_filter = title_query.lower() if title_query else None
+            updated_after_at = _parse_timestamp(updated_after) if updated_after else None
             status_filter = lifecycle.canonical_lifecycle_status(status)
             requested_labels = _dedupe_strings(labels)
+            candidate_sets: list[set[str]] = []
+            if parent_id is not None:
+                candidate_sets.append(self._by_parent.get(parent_id, set()))
+            if status_filter is not None:
+                candidate_sets.append(self._by_status.get(status_filter, set()))
+            if assignee is not None:
+                candidate_sets.append(self._by_assignee.get(assignee, set()))
+            for label in requested_labels:
+                candidate_sets.append(self._by_label.get(label, set()))
+            if status_filter is None and not include_closed:
+                candidate_sets.append(
+                    self._ids_with_statuses(
+                        status_key for status_key in self._by_status if status_key != "closed"
+                    )
+                )
+            if limit is None or limit == 0:
+                remaining: int | None = None
+            else:
+                remaining = max(0, limit)
             items: list[dict[str, object]] = []
-            for issue_id in self._order:
+            for issue_id in self._ordered(candidate_sets):
+                if remaining is not None and len(items) >= remaining:
+                    break
                 issue = self._issues[issue_id]
-                issue_status = lifecycle.canonical_lifecycle_status(issue.status)
-                if parent_id is not None and issue.parent_id != parent_id:
-                    continue
-                if status_filter is not None and issue_status != status_filter:
-                    continue
-                if status_filter is None and not include_closed and issue_status == "closed":
-                    continue
-                if assignee is not None and (issue.assignee or "") != assignee:
-                    continue
                 if title is not None and issue.title != title:
                     continue
                 if title_filter is not None and title_filter not in issue.title.lower():
                     continue
-                if requested_labels and not set(requested_labels).issubset(issue.labels):
-                    continue
+                if updated_after_at is not None:
+                    updated_at = _parse_timestamp(issue.extra_fields.get("updated_at"))
+                    if updated_at is None or updated_at <= updated_after_at:
+                        continue
                 items.append(self._export_issue(issue_id))
-            if limit is None or limit == 0:
-                return items
-            return items[: max(0, limit)]
+            return items
 
     def ready(self, *, parent_id: str | None = None) -> list[dict[str, object]]:
         """Return runnable leaf work beads with satisfied dependencies."""
 
         with self._lock:
+            candidate_sets = [self._ids_with_statuses(lifecycle.ACTIVE_LIFECYCLE_STATUSES)]
+            if parent_id is not None:
+                candidate_sets.append(self._by_parent.get(parent_id, set()))
             ready_items: list[dict[str, object]] = []
-            for issue_id in self._order:
+            for issue_id in self._ordered(candidate_sets):
                 issue = self._issues[issue_id]
-                if parent_id is not None and issue.parent_id != parent_id:
-                    continue
                 evaluation = lifecycle.evaluate_runnable_leaf(
                     status=issue.status,
                     labels=set(issue.labels),
@@ -227,8 +275,7 @@ class InMemoryIssueStore:
                 estimate=estimate,
                 extra_fields={"created_at": timestamp, "updated_at": timestamp, "metadata": {}},
             )
-            self._issues[issue_id] = stored
-            self._order.append(issue_id)
+            self._add_issue(stored)
             if parent_id is not None:
                 self._append_child(parent_id, issue_id)
             return self._export_issue(issue_id)
@@ -254,6 +301,8 @@ class InMemoryIssueStore:
 
         with self._lock:
             issue = self._require_issue(issue_id)
+            previous_title = issue.title
+            self._unindex_issue(issue)
             if title is not None:
                 issue.title = title
             if description is not None:
@@ -280,6 +329,8 @@ class InMemoryIssueStore:
             if append_notes:
                 issue.description = _append_issue_notes(issue.description, append_notes)
             issue.extra_fields["updated_at"] = self._next_timestamp()
+            self._index_issue(issue)
+            self._invalidate_export(issue, title_changed=issue.title != previous_title)
             return self._export_issue(issue_id)
 
     def claim(self, issue_id: str, *, actor: str) -> dict[str, object]:
@@ -292,8 +343,11 @@ class InMemoryIssueStore:
             issue = self._require_issue(issue_id)
             if issue.assignee not in {None, normalized_actor}:
                 raise ValueError(f"issue {issue_id} already has an assignee")
+            self._unindex_issue(issue)
             issue.assignee = normalized_actor
             issue.extra_fields["updated_at"] = self._next_timestamp()
+            self._index_issue(issue)
+            self._invalidate_export(issue)
             return self._export_issue(issue_id)
 
     def close(self, issue_id: str, *, reason: str | None = None) -> dict[str, object]:
@@ -301,10 +355,13 @@ class InMemoryIssueStore:
 
         with self._lock:
             issue = self._require_issue(issue_id)
+            self._unindex_issue(issue)
             issue.status = "closed"
             issue.extra_fields["updated_at"] = self._next_timestamp()
             if reason is not None:
                 issue.extra_fields["close_reason"] = reason
+            self._index_issue(issue)
+            self._invalidate_export(issue)
             return self._export_issue(issue_id)
 
     def show_slots(self, issue_id: str) -> dict[str, str]:
@@ -333,8 +390,17 @@ class InMemoryIssueStore:
 
     def _seed_issue(self, payload: Mapping[str, object]) -> None:
         issue = StoredIssue.from_payload(payload)
-        self._issues[issue.id] = issue
-        self._order.append(issue.id)
+        previous = self._issues.get(issue.id)
+        if previous is not None:
+            self._unindex_issue(previous)
+            self._unlink_dependencies(previous)
+            self._invalidate_export(previous, title_changed=True)
+            self._issues[issue.id] = issue
+            self._index_issue(issue)
+            self._link_dependencies(issue)
+            self._invalidate_export(issue, title_changed=True)
+        else:
+            self._add_issue(issue)
         match = _NUMERIC_ID_PATTERN.match(issue.id)
         if match and match.group("prefix") == self._prefix:
             self._next_numeric_id = max(self._next_numeric_id, int(match.group("value")) + 1)
@@ -348,6 +414,76 @@ class InMemoryIssueStore:
     def _append_child(self, parent_id: str, child_id: str) -> None:
         parent = self._require_issue(parent_id)
         parent.child_ids = _dedupe_strings((*parent.child_ids, child_id))
+        self._exports.pop(parent_id, None)
+
+    def _add_issue(self, issue: StoredIssue) -> None:
+        self._issues[issue.id] = issue
+        self._positions[issue.id] = len(self._order)
+        self._order.append(issue.id)
+        self._index_issue(issue)
+        self._link_dependencies(issue)
+
+    def _link_dependencies(self, issue: StoredIssue) -> None:
+        for dependency_id in issue.dependency_ids:
+            self._dependents.setdefault(dependency_id, set()).add(issue.id)
+
+    def _unlink_dependencies(self, issue: StoredIssue) -> None:
+        for dependency_id in issue.dependency_ids:
+            dependents = self._dependents.get(dependency_id)
+            if dependents is None:
+                continue
+            dependents.discard(issue.id)
+            if not dependents:
+                del self._dependents[dependency_id]
+
+    def _index_keys(self, issue: StoredIssue) -> list[tuple[dict, object]]:
+        keys: list[tuple[dict, object]] = [
+            (self._by_status, lifecycle.canonical_lifecycle_status(issue.status)),
+            (self._by_assignee, issue.assignee or ""),
+        ]
+        if issue.parent_id is not None:
+            keys.append((self._by_parent, issue.parent_id))
+        keys.extend((self._by_label, label) for label in issue.labels)
+        return keys
+
+    def _index_issue(self, issue: StoredIssue) -> None:
+        for index, key in self._index_keys(issue):
+            index.setdefault(key, set()).add(issue.id)
+
+    def _unindex_issue(self, issue: StoredIssue) -> None:
+        for index, key in self._index_keys(issue):
+            bucket = index.get(key)
+            if bucket is None:
+                continue
+            bucket.discard(issue.id)
+            if not bucket:
+                del index[key]
+
+    def _ids_with_statuses(self, statuses: Iterable[str | None]) -> set[str]:
+        ids: set[str] = set()
+        for status in statuses:
+            ids.update(self._by_status.get(status, ()))
+        return ids
+
+    def _ordered(self, candidate_sets: list[set[str]]) -> list[str]:
+        """Return ids present in every candidate set, in insertion order."""
+
+        if not candidate_sets:
+            return list(self._order)
+        smallest, *others = sorted(candidate_sets, key=len)
+        matches = [issue_id for issue_id in smallest if all(issue_id in other for other in others)]
+        return sorted(matches, key=self._positions.__getitem__)
+
+    def _invalidate_export(self, issue: StoredIssue, *, title_changed: bool = False) -> None:
+        self._exports.pop(issue.id, None)
+        if not title_changed:
+            return
+        # Parent, child, and dependency references embed this issue's title.
+        related = {*issue.child_ids, *self._dependents.get(issue.id, ())}
+        if issue.parent_id is not None:
+            related.add(issue.parent_id)
+        for related_id in related:
+            self._exports.pop(related_id, None)
 
     def _allocate_issue_id(self) -> str:
         issue_id = f"{self._prefix}-{self._next_numeric_id}"
@@ -394,6 +530,14 @@ class InMemoryIssueStore:
         return changeset_fields.review_state(self._export_issue(issue_id))
 
     def _export_issue(self, issue_id: str) -> dict[str, object]:
+        cached = self._exports.get(issue_id)
+        if cached is None:
+            cached = self._build_export(issue_id)
+            self._exports[issue_id] = cached
+        # Nested refs and metadata are shared with the cache; copy them too.
+        return copy.deepcopy(cached)
+
+    def _build_export(self, issue_id: str) -> dict[str, object]:
         issue = self._issues[issue_id]
         payload: dict[str, object] = dict(issue.extra_fields)
         payload.update(
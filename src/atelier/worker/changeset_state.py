@@ -275,11 +275,11 @@ def promote_planned_descendant_changesets(
         canonical_status = lifecycle.canonical_lifecycle_status(issue.get("status"))
         if canonical_status != "deferred":
             continue
-        worker_store.transition_lifecycle(
-            issue_id,
-            target_status="open",
-            beads_root=beads_root,
-            repo_root=repo_root,
-        )
         promoted.append(issue_id)
+    worker_store.transition_lifecycle_many(
+        promoted,
+        target_status="open",
+        beads_root=beads_root,
+        repo_root=repo_root,
+    )
     return promoted
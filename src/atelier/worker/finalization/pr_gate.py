@@ -128,6 +128,7 @@ def _resolve_epic_scope_id(
     *,
     repo_root: Path,
     beads_root: Path | None,
+    lookup_issue: Callable[[str], dict[str, object] | None] | None = None,
 ) -> str | None:
     if beads_root is None:
         return None
@@ -151,6 +152,11 @@ def _resolve_epic_scope_id(
         parent_id = _normalize_issue_id(boundary.parent_id)
         if not parent_id:
             return current_id
+        known_parent = lookup_issue(parent_id) if lookup_issue is not None else None
+        if known_parent is not None:
+            current_issue = known_parent
+            current_id = parent_id
+            continue
         try:
             parent_issues = beads.run_bd_json(
                 ["show", parent_id],
@@ -192,6 +198,12 @@ def _sequential_pr_creation_decision(*, parent_state: str | None) -> PrCreationD
     )
 
 
+def _issue_work_branch(issue: dict[str, object]) -> str | None:
+    description = issue.get("description")
+    fields = beads.parse_description_fields(description if isinstance(description, str) else "")
+    return _normalize_branch(fields.get("changeset.work_branch"))
+
+
 def _changeset_lifecycle_state(
     issue: dict[str, object],
     *,
@@ -227,27 +239,41 @@ def _active_epic_sibling_state(
     git_path: str | None,
     beads_root: Path | None,
     lookup_pr_payload: Callable[..., dict[str, object] | None],
+    lookup_issue: Callable[[str], dict[str, object] | None] | None = None,
+    list_epic_changesets: Callable[[str], list[dict[str, object]]] | None = None,
+    prefetch_pr_payloads: Callable[[str, list[str]], None] | None = None,
 ) -> tuple[str, str] | None:
     if beads_root is None:
         return None
     current_id = _normalize_issue_id(issue.get("id"))
     if not current_id:
         return None
-    epic_id = _resolve_epic_scope_id(issue, repo_root=repo_root, beads_root=beads_root)
+    epic_id = _resolve_epic_scope_id(
+        issue,
+        repo_root=repo_root,
+        beads_root=beads_root,
+        lookup_issue=lookup_issue,
+    )
     if not epic_id:
         return None
     try:
-        siblings = beads.list_descendant_changesets(
-            epic_id,
-            beads_root=beads_root,
-            cwd=repo_root,
-            include_closed=True,
-        )
+        if list_epic_changesets is not None:
+            siblings = list_epic_changesets(epic_id)
+        else:
+            siblings = beads.list_descendant_changesets(
+                epic_id,
+                beads_root=beads_root,
+                cwd=repo_root,
+                include_closed=True,
+            )
     except Exception as exc:  # pragma: no cover - defensive boundary
         atelier_log.warning(
             f"changeset={current_id} failed to evaluate sibling PR gate under {epic_id}: {exc}"
         )
         return None
+    if repo_slug and prefetch_pr_payloads is not None:
+        sibling_branches = [_issue_work_branch(sibling) for sibling in siblings]
+        prefetch_pr_payloads(repo_slug, [branch for branch in sibling_branches if branch])
     for sibling in siblings:
         sibling_id = _normalize_issue_id(sibling.get("id"))
         if not sibling_id or sibling_id == current_id:
@@ -609,6 +635,9 @@ def changeset_pr_creation_decision(
     lookup_pr_payload_diagnostic: Callable[..., tuple[dict[str, object] | None, str | None]]
     | None = None,
     lookup_dependency_issue: Callable[[str], dict[str, object] | None] | None = None,
+    list_epic_changesets: Callable[[str], list[dict[str, object]]] | None = None,
+    prefetch_pr_payloads: Callable[[str, list[str]], None] | None = None,
+    log_blocked: Callable[[str], None] | None = None,
 ) -> PrCreationDecision:
     preflight = sequential_stack_integrity_preflight(
         issue,
@@ -696,11 +725,14 @@ def changeset_pr_creation_decision(
             git_path=git_path,
             beads_root=beads_root,
             lookup_pr_payload=lookup_pr_payload,
+            lookup_issue=lookup_dependency_issue,
+            list_epic_changesets=list_epic_changesets,
+            prefetch_pr_payloads=prefetch_pr_payloads,
         )
         if active_sibling is not None:
             sibling_id, sibling_state = active_sibling
             issue_id = _normalize_issue_id(issue.get("id")) or "unknown-changeset"
-            atelier_log.info(
+            (log_blocked or atelier_log.info)(
                 "changeset="
                 f"{issue_id} blocked by active sibling PR lifecycle "
                 f"{sibling_id}:{sibling_state}"
@@ -791,6 +823,7 @@ def attempt_create_pr(
     if result.returncode != 0:
         detail = (result.stderr or result.stdout or "").strip()
         return False, detail or "gh pr create failed"
+    prs.invalidate_pr_lookup(repo_slug, work_branch)
     detail = (result.stdout or "").strip()
     if is_draft:
         return True, detail or "created draft PR"
@@ -854,6 +887,7 @@ def handle_pushed_without_pr(
     update_changeset_review_from_pr: Callable[..., None],
     emit: Callable[[str], None],
     attempt_create_pr_fn: Callable[..., tuple[bool, str]] | None = None,
+    prefetch_pr_payloads: Callable[[str, list[str]], None] | None = None,
 ) -> PrGateResult:
     decision = changeset_pr_creation_decision(
         issue,
@@ -862,6 +896,7 @@ def handle_pushed_without_pr(
         git_path=git_path,
         beads_root=beads_root,
         lookup_pr_payload=lookup_pr_payload,
+        prefetch_pr_payloads=prefetch_pr_payloads,
     )
     if not decision.allow_pr:
         set_changeset_review_pending_state(
@@ -220,17 +220,20 @@ def epic_root_integrated_into_parent(
         parent_branch = default_branch or parent_branch or root_branch
     if not root_branch or not parent_branch:
         return False
-    parent_ref = branch_ref_for_lookup(repo_root, parent_branch, git_path=git_path)
-    if not parent_ref:
-        return False
-    root_ref = branch_ref_for_lookup(repo_root, root_branch, git_path=git_path)
-    if not root_ref:
-        return True
-    is_ancestor = git.git_is_ancestor(repo_root, root_ref, parent_ref, git_path=git_path)
-    if is_ancestor is True:
-        return True
-    fully_applied = git.git_branch_fully_applied(repo_root, parent_ref, root_ref, git_path=git_path)
-    return fully_applied is True
+    with git.git_query_session(repo_root, git_path=git_path):
+        parent_ref = branch_ref_for_lookup(repo_root, parent_branch, git_path=git_path)
+        if not parent_ref:
+            return False
+        root_ref = branch_ref_for_lookup(repo_root, root_branch, git_path=git_path)
+        if not root_ref:
+            return True
+        is_ancestor = git.git_is_ancestor(repo_root, root_ref, parent_ref, git_path=git_path)
+        if is_ancestor is True:
+            return True
+        fully_applied = git.git_branch_fully_applied(
+            repo_root, parent_ref, root_ref, git_path=git_path
+        )
+        return fully_applied is True
 
 
 def changeset_integration_signal(
@@ -241,6 +244,26 @@ def changeset_integration_signal(
     lookup_pr_payload: Callable[[str | None, str], dict[str, object] | None],
     git_path: str | None = None,
     require_target_branch_proof: bool = False,
+) -> tuple[bool, str | None]:
+    with git.git_query_session(repo_root, git_path=git_path):
+        return _changeset_integration_signal(
+            issue,
+            repo_slug=repo_slug,
+            repo_root=repo_root,
+            lookup_pr_payload=lookup_pr_payload,
+            git_path=git_path,
+            require_target_branch_proof=require_target_branch_proof,
+        )
+
+
+def _changeset_integration_signal(
+    issue: dict[str, object],
+    *,
+    repo_slug: str | None,
+    repo_root: Path,
+    lookup_pr_payload: Callable[[str | None, str], dict[str, object] | None],
+    git_path: str | None = None,
+    require_target_branch_proof: bool = False,
 ) -> tuple[bool, str | None]:
     description = issue.get("description")
     description_text = description if isinstance(description, str) else ""
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import json
 import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
+from .. import command_trace
+
 _DEPENDENCY_ID_PATTERN = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)\b")
 _PARENT_CHILD_PATTERN = re.compile(r"parent[\s_-]*child", re.IGNORECASE)
 _PARENT_CHILD_KEYS = ("relation", "dependency_type", "dependencyType", "type")
 _DEPENDENCY_ID_KEYS = ("id", "depends_on_id", "dependsOnId")
 _DEPENDENCY_REF_KEYS = ("issue", "depends_on", "dependsOn")
+_THREAD_ISSUE_BOUNDARIES = threading.local()
 
 
 def _clean_str(value: object) -> str | None:
@@ -267,8 +274,51 @@ class ReviewFeedbackBoundary(BaseModel):
         return _clean_str(value)
 
 
+@contextmanager
+def issue_boundary_session() -> Iterator[None]:
+    """Reuse validated issue boundaries on this thread for the block.
+
+    Inside a session :func:`parse_issue_boundary` validates each distinct
+    issue payload once and returns the same model for later calls. Payloads
+    are keyed by their full content, because ``updated_at`` has only second
+    precision and two writes in one second would otherwise share a key. The
+    cache is also dropped whenever a ``bd`` write finishes. Nested sessions
+    share the outer cache.
+    """
+    active = getattr(_THREAD_ISSUE_BOUNDARIES, "cache", None)
+    if isinstance(active, dict):
+        yield
+        return
+    _THREAD_ISSUE_BOUNDARIES.cache = {}
+    _THREAD_ISSUE_BOUNDARIES.writes = command_trace.bd_write_count()
+    try:
+        yield
+    finally:
+        _THREAD_ISSUE_BOUNDARIES.cache = None
+        _THREAD_ISSUE_BOUNDARIES.writes = None
+
+
 def parse_issue_boundary(raw_issue: dict[str, object], *, source: str) -> BeadsIssueBoundary:
     """Validate a Beads issue payload for worker decision logic."""
+    cache = getattr(_THREAD_ISSUE_BOUNDARIES, "cache", None)
+    if not isinstance(cache, dict):
+        return _validate_issue_boundary(raw_issue, source=source)
+    writes = command_trace.bd_write_count()
+    if writes != getattr(_THREAD_ISSUE_BOUNDARIES, "writes", None):
+        cache.clear()
+        _THREAD_ISSUE_BOUNDARIES.writes = writes
+    try:
+        key = json.dumps(raw_issue, sort_keys=True)
+    except (TypeError, ValueError):
+        return _validate_issue_boundary(raw_issue, source=source)
+    boundary = cache.get(key)
+    if boundary is None:
+        boundary = _validate_issue_boundary(raw_issue, source=source)
+        cache[key] = boundary
+    return boundary
+
+
+def _validate_issue_boundary(raw_issue: dict[str, object], *, source: str) -> BeadsIssueBoundary:
     payload = dict(raw_issue)
     if "parent_id" not in payload:
         payload["parent_id"] = raw_issue.get("parent")
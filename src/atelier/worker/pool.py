@@ -0,0 +1,176 @@
+"""In-process worker pool supervisor for ``atelier work --pool``.
+
+A pool runs several worker sessions as threads of one process. Members
+share everything the process already caches (config, the ``bd``
+preflight/version checks, Beads store clients, and the PR lookup caches)
+and take epics from one ``WorkerPoolScheduler`` instead of racing each
+other through ``bd`` claims.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, replace
+
+from .. import agents
+from .. import log as atelier_log
+from .models import StartupContractResult
+from .ports import WorkerRuntimeDependencies
+from .runtime import WorkerLifecycleAdapter
+from .session.startup import StartupContractContext
+
+RunPoolMemberFn = Callable[[int, "WorkerPoolScheduler"], None]
+
+
+class WorkerPoolScheduler:
+    """Hand out epics to pool members one selection at a time.
+
+    Selection is serialized, and an epic chosen by one member is excluded
+    from every other member's selection until that member releases it, so
+    two members of the same pool never attempt to claim the same epic.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reserved: dict[str, str] = {}
+
+    def reserved_epics(self) -> dict[str, str]:
+        """Return a snapshot of reserved epic ids keyed to member keys."""
+        with self._lock:
+            return dict(self._reserved)
+
+    def select(
+        self,
+        member: str,
+        *,
+        context: StartupContractContext,
+        run_startup_contract: Callable[..., StartupContractResult],
+    ) -> StartupContractResult:
+        """Run one member's startup selection with pool reservations applied.
+
+        Args:
+            member: Pool member key (the member's session key).
+            context: Startup contract context for the member.
+            run_startup_contract: Underlying startup contract function.
+
+        Returns:
+            The startup contract result for the member.
+        """
+        with self._lock:
+            for epic_id in [epic for epic, owner in self._reserved.items() if owner == member]:
+                del self._reserved[epic_id]
+            held_elsewhere = set(self._reserved)
+            if held_elsewhere:
+                excluded = tuple(sorted(set(context.excluded_epic_ids) | held_elsewhere))
+                context = replace(context, excluded_epic_ids=excluded)
+            result = run_startup_contract(context=context)
+            if not result.should_exit and result.epic_id:
+                self._reserved[result.epic_id] = member
+            return result
+
+    def release(self, member: str) -> None:
+        """Drop every reservation held by ``member``."""
+        with self._lock:
+            for epic_id in [epic for epic, owner in self._reserved.items() if owner == member]:
+                del self._reserved[epic_id]
+
+
+class PooledWorkerLifecycleAdapter(WorkerLifecycleAdapter):
+    """Lifecycle adapter that routes startup selection through a scheduler."""
+
+    def __init__(self, *, scheduler: WorkerPoolScheduler, member: str) -> None:
+        self._scheduler = scheduler
+        self._member = member
+
+    def run_startup_contract(self, *, context: StartupContractContext) -> StartupContractResult:
+        return self._scheduler.select(
+            self._member,
+            context=context,
+            run_startup_contract=super().run_startup_contract,
+        )
+
+
+class _ThreadScopedAgents:
+    """Agents port that scopes identity to the calling thread."""
+
+    def scoped_agent_env(self, agent_id: str) -> AbstractContextManager[None]:
+        return agents.scoped_thread_agent_env(agent_id)
+
+
+def pool_member_dependencies(
+    deps: WorkerRuntimeDependencies,
+    *,
+    scheduler: WorkerPoolScheduler,
+    member: str,
+) -> WorkerRuntimeDependencies:
+    """Return runtime dependencies for one pool member.
+
+    Args:
+        deps: Dependencies built for a standalone worker.
+        scheduler: Scheduler shared by the pool.
+        member: Pool member key (the member's session key).
+
+    Returns:
+        Dependencies whose startup selection goes through ``scheduler`` and
+        whose agent identity is scoped to the member's thread.
+    """
+    return replace(
+        deps,
+        infra=replace(deps.infra, agents=_ThreadScopedAgents()),
+        lifecycle=PooledWorkerLifecycleAdapter(scheduler=scheduler, member=member),
+    )
+
+
+@dataclass(frozen=True)
+class WorkerPoolResult:
+    """Outcome of one pool run."""
+
+    size: int
+    failed_members: tuple[int, ...]
+
+    @property
+    def success(self) -> bool:
+        return not self.failed_members
+
+
+def run_worker_pool(size: int, *, run_member: RunPoolMemberFn) -> WorkerPoolResult:
+    """Run ``size`` pool members on threads and wait for all of them.
+
+    Args:
+        size: Number of members to start.
+        run_member: Callable that runs one member's session loop, given the
+            member index and the shared scheduler.
+
+    Returns:
+        Which members, if any, ended with an error or non-zero exit.
+    """
+    if size < 1:
+        raise ValueError("worker pool size must be at least 1")
+    scheduler = WorkerPoolScheduler()
+    failures: list[int] = []
+    failures_lock = threading.Lock()
+
+    def member_main(index: int) -> None:
+        try:
+            run_member(index, scheduler)
+        except SystemExit as exc:
+            if exc.code in (None, 0):
+                return
+            with failures_lock:
+                failures.append(index)
+        except Exception as exc:  # noqa: BLE001 - one member must not stop the pool
+            atelier_log.warning(f"worker pool member {index} failed: {type(exc).__name__}: {exc}")
+            with failures_lock:
+                failures.append(index)
+
+    threads = [
+        threading.Thread(target=member_main, args=(index,), name=f"atelier-worker-{index}")
+        for index in range(1, size + 1)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return WorkerPoolResult(size=size, failed_members=tuple(sorted(failures)))
@@ -5,9 +5,10 @@ from __future__ import annotations
 from collections.abc import Callable
 from pathlib import Path
 
-from .. import beads, config
+from .. import beads, config, git, process_table
 from . import reconcile as worker_reconcile
 from .models import FinalizeResult, ReconcileResult
+from .models_boundary import issue_boundary_session
 
 Issue = dict[str, object]
 
@@ -74,16 +75,21 @@ def list_reconcile_epic_candidates(
     is_closed_status: Callable[[object], bool],
     epic_root_integrated_into_parent: Callable[..., bool],
 ) -> dict[str, list[str]]:
-    return worker_reconcile.list_reconcile_epic_candidates(
-        project_config=project_config,
-        beads_root=beads_root,
-        repo_root=repo_root,
-        git_path=git_path,
-        changeset_integration_signal=changeset_integration_signal,
-        resolve_epic_id_for_changeset=resolve_epic_id_for_changeset,
-        is_closed_status=is_closed_status,
-        epic_root_integrated_into_parent=epic_root_integrated_into_parent,
-    )
+    with (
+        git.git_query_session(repo_root, git_path=git_path),
+        process_table.process_table_session(),
+        issue_boundary_session(),
+    ):
+        return worker_reconcile.list_reconcile_epic_candidates(
+            project_config=project_config,
+            beads_root=beads_root,
+            repo_root=repo_root,
+            git_path=git_path,
+            changeset_integration_signal=changeset_integration_signal,
+            resolve_epic_id_for_changeset=resolve_epic_id_for_changeset,
+            is_closed_status=is_closed_status,
+            epic_root_integrated_into_parent=epic_root_integrated_into_parent,
+        )
 
 
 def reconcile_blocked_merged_changesets(
@@ -106,22 +112,27 @@ def reconcile_blocked_merged_changesets(
     finalize_changeset: Callable[..., FinalizeResult],
     finalize_epic_if_complete: Callable[..., FinalizeResult],
 ) -> ReconcileResult:
-    return worker_reconcile.reconcile_blocked_merged_changesets(
-        agent_id=agent_id,
-        agent_bead_id=agent_bead_id,
-        project_config=project_config,
-        project_data_dir=project_data_dir,
-        beads_root=beads_root,
-        repo_root=repo_root,
-        git_path=git_path,
-        epic_filter=epic_filter,
-        changeset_filter=changeset_filter,
-        dry_run=dry_run,
-        log=log,
-        resolve_epic_id_for_changeset=resolve_epic_id_for_changeset,
-        changeset_integration_signal=changeset_integration_signal,
-        issue_dependency_ids=issue_dependency_ids,
-        issue_labels=issue_labels,
-        finalize_changeset=finalize_changeset,
-        finalize_epic_if_complete=finalize_epic_if_complete,
-    )
+    with (
+        git.git_query_session(repo_root, git_path=git_path),
+        process_table.process_table_session(),
+        issue_boundary_session(),
+    ):
+        return worker_reconcile.reconcile_blocked_merged_changesets(
+            agent_id=agent_id,
+            agent_bead_id=agent_bead_id,
+            project_config=project_config,
+            project_data_dir=project_data_dir,
+            beads_root=beads_root,
+            repo_root=repo_root,
+            git_path=git_path,
+            epic_filter=epic_filter,
+            changeset_filter=changeset_filter,
+            dry_run=dry_run,
+            log=log,
+            resolve_epic_id_for_changeset=resolve_epic_id_for_changeset,
+            changeset_integration_signal=changeset_integration_signal,
+            issue_dependency_ids=issue_dependency_ids,
+            issue_labels=issue_labels,
+            finalize_changeset=finalize_changeset,
+            finalize_epic_if_complete=finalize_epic_if_complete,
+        )
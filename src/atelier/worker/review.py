@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextvars
 import re
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -266,6 +267,12 @@ def _is_in_review_candidate(
     )
 
 
+def _prefetch_pr_lookups(repo_slug: str, records: list[beads.BeadsIssueRecord]) -> None:
+    """Warm PR lookup and review-thread caches for every record in one batch."""
+    branches = [changeset_fields.work_branch(record.raw) for record in records]
+    prs.lookup_github_pr_statuses(repo_slug, [branch for branch in branches if branch])
+
+
 def _selection_candidates(
     *,
     records: list[beads.BeadsIssueRecord],
@@ -274,6 +281,7 @@ def _selection_candidates(
     resolve_epic_id: Callable[[dict[str, object]], str | None],
 ) -> list[ReviewFeedbackSelection]:
     hydrated_records = [load_record(record.issue.id) or record for record in records]
+    _prefetch_pr_lookups(repo_slug, hydrated_records)
 
     def evaluate_record(record: beads.BeadsIssueRecord) -> ReviewFeedbackSelection | None:
         try:
@@ -342,7 +350,10 @@ def _selection_candidates(
                 candidates.append(candidate)
     else:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(evaluate_record, record) for record in hydrated_records]
+            futures = [
+                executor.submit(contextvars.copy_context().run, evaluate_record, record)
+                for record in hydrated_records
+            ]
             for future in as_completed(futures):
                 candidate = future.result()
                 if candidate is not None:
@@ -587,6 +598,7 @@ def _conflict_selection_candidates(
     resolve_epic_id: Callable[[dict[str, object]], str | None],
 ) -> list[MergeConflictSelection]:
     hydrated_records = [load_record(record.issue.id) or record for record in records]
+    _prefetch_pr_lookups(repo_slug, hydrated_records)
 
     def evaluate_record(record: beads.BeadsIssueRecord) -> MergeConflictSelection | None:
         try:
@@ -649,7 +661,10 @@ def _conflict_selection_candidates(
                 candidates.append(candidate)
     else:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(evaluate_record, record) for record in hydrated_records]
+            futures = [
+                executor.submit(contextvars.copy_context().run, evaluate_record, record)
+                for record in hydrated_records
+            ]
             for future in as_completed(futures):
                 candidate = future.result()
                 if candidate is not None:
@@ -57,6 +57,9 @@ NON_WATCH_EXIT_REASON_FAIL_CLOSED = "fail_closed"
 _EXPLICIT_NO_WORK_REASONS = {"explicit_epic_not_actionable", "explicit_epic_completed"}
 _GLOBAL_NO_WORK_REASONS = {"no_eligible_epics"}
 _IMPLICIT_FAIL_CLOSED_REASONS = {"missing_agent_bead", "no_epic_selected", "dry_run"}
+_WATCH_MAX_BACKOFF_FACTOR = 4
+_WATCH_SLEEP_MESSAGE = "No ready work; watching for updates (sleeping {interval}s)."
+_DRY_RUN_SLEEP_MESSAGE = "Watching for updates (sleeping {interval}s before next check)."
 
 
 @dataclass(frozen=True)
@@ -536,6 +539,8 @@ def run_worker_sessions(
     dry_run_log: Callable[[str], None],
     emit: Callable[[str], None],
     sleep_fn: Callable[[float], None] = time.sleep,
+    wait_for_change: Callable[[float], bool] | None = None,
+    mark_change_baseline: Callable[[], None] | None = None,
 ) -> None:
     normalized_args = build_worker_iteration_args(args)
     explicit_epic_id = normalized_args.epic_id
@@ -543,6 +548,25 @@ def run_worker_sessions(
     restart_on_update = normalized_args.restart_on_update
     startup_runtime = normalized_args.startup_runtime
     excluded_implicit_epics: set[str] = set()
+    idle_waits = 0
+
+    def wait_for_updates(log: Callable[[str], None], *, sleeping_message: str) -> None:
+        # Without a change watcher, keep the fixed-interval sleep. With one,
+        # wake on changes since the baseline marked before the readiness
+        # check, and back off the fallback recheck while idle; the caller's
+        # message then reports the recheck timeout.
+        nonlocal idle_waits
+        interval = watch_interval_seconds()
+        if wait_for_change is None:
+            log(sleeping_message.format(interval=interval))
+            sleep_fn(interval)
+            return
+        timeout = interval * min(2**idle_waits, _WATCH_MAX_BACKOFF_FACTOR)
+        log(sleeping_message.format(interval=timeout))
+        if wait_for_change(timeout):
+            idle_waits = 0
+        else:
+            idle_waits += 1
 
     def build_iteration_args() -> WorkerIterationArgs:
         try:
@@ -588,12 +612,15 @@ def run_worker_sessions(
 
     if dry_run:
         while True:
+            if mark_change_baseline is not None:
+                mark_change_baseline()
             iteration_args = build_iteration_args()
             summary = run_worker_once(
                 iteration_args, mode=mode, dry_run=True, session_key=session_key
             )
             report_worker_summary(summary, True)
             if summary.started:
+                idle_waits = 0
                 if run_mode == "once":
                     return
                 continue
@@ -613,9 +640,7 @@ def run_worker_sessions(
                 continue
             if summary.reason == "no_ready_changesets":
                 if run_mode == "watch":
-                    interval = watch_interval_seconds()
-                    dry_run_log(f"Watching for updates (sleeping {interval}s before next check).")
-                    sleep_fn(interval)
+                    wait_for_updates(dry_run_log, sleeping_message=_DRY_RUN_SLEEP_MESSAGE)
                 continue
             if run_mode != "watch":
                 outcome = classify_non_watch_exit_outcome(
@@ -626,12 +651,12 @@ def run_worker_sessions(
                 if not outcome.success:
                     raise SystemExit(1)
                 return
-            interval = watch_interval_seconds()
-            dry_run_log(f"Watching for updates (sleeping {interval}s before next check).")
-            sleep_fn(interval)
+            wait_for_updates(dry_run_log, sleeping_message=_DRY_RUN_SLEEP_MESSAGE)
         return
 
     while True:
+        if mark_change_baseline is not None:
+            mark_change_baseline()
         iteration_args = build_iteration_args()
         summary = run_worker_once(iteration_args, mode=mode, dry_run=False, session_key=session_key)
         report_worker_summary(summary, False)
@@ -641,6 +666,7 @@ def run_worker_sessions(
             emit=emit,
         )
         if summary.started:
+            idle_waits = 0
             if run_mode == "once":
                 return
             continue
@@ -660,14 +686,10 @@ def run_worker_sessions(
             continue
         if summary.reason == "no_ready_changesets":
             if run_mode == "watch":
-                interval = watch_interval_seconds()
-                emit(f"No ready work; watching for updates (sleeping {interval}s).")
-                sleep_fn(interval)
+                wait_for_updates(emit, sleeping_message=_WATCH_SLEEP_MESSAGE)
             continue
         if run_mode == "watch":
-            interval = watch_interval_seconds()
-            emit(f"No ready work; watching for updates (sleeping {interval}s).")
-            sleep_fn(interval)
+            wait_for_updates(emit, sleeping_message=_WATCH_SLEEP_MESSAGE)
             continue
         outcome = classify_non_watch_exit_outcome(
             summary,
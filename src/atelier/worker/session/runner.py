@@ -18,7 +18,7 @@ from .. import work_runtime_profile
 from ..context import ChangesetSelectionContext, WorkerRunContext
 from ..iteration_args import WorkerIterationArgs, build_worker_iteration_args
 from ..models import StartupContractResult, StartupFinalizePreflightResult, WorkerRunSummary
-from ..models_boundary import parse_issue_boundary
+from ..models_boundary import issue_boundary_session, parse_issue_boundary
 from ..ports import (
     BeadsService,
     WorkerControlService,
@@ -872,26 +872,28 @@ def run_worker_once(
         epic_issue: dict[str, object] = {}
         while True:
             finishstep = control.step("Select epic", timings=timings, trace=trace)
-            startup_result = lifecycle.run_startup_contract(
-                context=StartupContractContext(
-                    agent_id=agent.agent_id,
-                    agent_bead_id=agent_bead_id,
-                    beads_root=beads_root,
-                    repo_root=repo_root,
-                    mode=mode,
-                    explicit_epic_id=epic_id,
-                    queue_only=queue_only,
-                    dry_run=dry_run,
-                    assume_yes=assume_yes,
-                    repo_slug=repo_slug,
-                    branch_pr=project_config.branch.pr,
-                    git_path=git_path,
-                    worker_queue_name=_WORKER_QUEUE_NAME,
-                    select=startup_select,
-                    resume_review=explicit_resume_requested,
-                    excluded_epic_ids=tuple(sorted(claim_conflict_excluded_epics)),
+            # Selection re-reads the same epic and changeset payloads often.
+            with issue_boundary_session():
+                startup_result = lifecycle.run_startup_contract(
+                    context=StartupContractContext(
+                        agent_id=agent.agent_id,
+                        agent_bead_id=agent_bead_id,
+                        beads_root=beads_root,
+                        repo_root=repo_root,
+                        mode=mode,
+                        explicit_epic_id=epic_id,
+                        queue_only=queue_only,
+                        dry_run=dry_run,
+                        assume_yes=assume_yes,
+                        repo_slug=repo_slug,
+                        branch_pr=project_config.branch.pr,
+                        git_path=git_path,
+                        worker_queue_name=_WORKER_QUEUE_NAME,
+                        select=startup_select,
+                        resume_review=explicit_resume_requested,
+                        excluded_epic_ids=tuple(sorted(claim_conflict_excluded_epics)),
+                    )
                 )
-            )
             summary_note = startup_result.reason
             if startup_result.epic_id:
                 summary_note = f"{summary_note} ({startup_result.epic_id})"
@@ -33,6 +33,8 @@ class NextChangesetService(Protocol):
 
     def show_issue(self, issue_id: str) -> dict[str, object] | None: ...
 
+    def show_issues(self, issue_ids: tuple[str, ...]) -> dict[str, dict[str, object]]: ...
+
     def changeset_waiting_on_review_or_signals(
         self,
         issue: dict[str, object],
@@ -130,6 +132,30 @@ def _work_parent_ids(issues: list[dict[str, object]]) -> set[str]:
     return parent_ids
 
 
+def _prefetch_dependencies(
+    issues: list[dict[str, object]],
+    *,
+    epic_changesets_by_id: dict[str, dict[str, object]],
+    dependency_cache: dict[str, dict[str, object] | None],
+    service: NextChangesetService,
+) -> None:
+    pending: list[str] = []
+    for issue in issues:
+        for dependency_id in _dependency_ids(issue) or ():
+            if (
+                dependency_id in epic_changesets_by_id
+                or dependency_id in dependency_cache
+                or dependency_id in pending
+            ):
+                continue
+            pending.append(dependency_id)
+    if not pending:
+        return
+    found = service.show_issues(tuple(pending))
+    for dependency_id in pending:
+        dependency_cache[dependency_id] = found.get(dependency_id)
+
+
 def _dependencies_satisfied(
     *,
     issue: dict[str, object],
@@ -250,10 +276,17 @@ def next_changeset_service(
             bool(explicit_descendants) or context.epic_id in explicit_work_parent_ids
         )
         target_is_leaf = not target_has_work_children
+        target_dependency_cache: dict[str, dict[str, object] | None] = {}
+        _prefetch_dependencies(
+            [issue],
+            epic_changesets_by_id=explicit_descendants_by_id,
+            dependency_cache=target_dependency_cache,
+            service=service,
+        )
         target_dependencies_satisfied = _dependencies_satisfied(
             issue=issue,
             epic_changesets_by_id=explicit_descendants_by_id,
-            dependency_cache={},
+            dependency_cache=target_dependency_cache,
             work_parent_ids=explicit_work_parent_ids,
             dependency_children_cache={},
             context=context,
@@ -302,6 +335,12 @@ def next_changeset_service(
     changesets: list[dict[str, object]] = []
     dependency_cache: dict[str, dict[str, object] | None] = {}
     dependency_children_cache: dict[str, bool] = {}
+    _prefetch_dependencies(
+        descendants,
+        epic_changesets_by_id=descendants_by_id,
+        dependency_cache=dependency_cache,
+        service=service,
+    )
     for issue in descendants:
         issue_id = _issue_id(issue)
         if issue_id is None:
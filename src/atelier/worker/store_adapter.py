@@ -6,19 +6,24 @@ import asyncio
 import datetime as dt
 import json
 import subprocess
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import cast
+from typing import Any, TypeVar, cast
 
-from .. import beads, changeset_fields, lifecycle, messages
+from .. import agents, beads, changeset_fields, lifecycle, messages
 from ..io import die
 from ..lib.beads import (
+    BatchingBeadsTransport,
+    BeadsTransport,
     CreateIssueRequest,
     IssueRecord,
     ListIssuesRequest,
     ShowIssueRequest,
+    ShowManyIssuesRequest,
     SubprocessBeadsClient,
     SyncBeadsProtocol,
     UpdateIssueRequest,
@@ -53,6 +58,9 @@ _READY_JSON_ARGS = ("ready",)
 _LIST_JSON_PREFIX = ("list",)
 _EPIC_LABEL_SCAN_LIMIT = 10_000
 _AGENT_LABEL_SCAN_LIMIT = 10_000
+_THREAD_STORE_SESSION = threading.local()
+
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True)
@@ -61,17 +69,45 @@ class _StoreBundle:
     sync_client: SyncBeadsProtocol
 
 
-def _build_async_beads_client(*, beads_root: Path, repo_root: Path) -> SubprocessBeadsClient:
+def _run(coroutine: Coroutine[Any, Any, _T]) -> _T:
+    runner = getattr(_THREAD_STORE_SESSION, "runner", None)
+    if isinstance(runner, asyncio.Runner):
+        return runner.run(coroutine)
+    return asyncio.run(coroutine)
+
+
+def _build_async_beads_client(
+    *,
+    beads_root: Path,
+    repo_root: Path,
+    transport: BeadsTransport | None = None,
+    env: dict[str, str] | None = None,
+) -> SubprocessBeadsClient:
     return SubprocessBeadsClient(
+        transport=transport,
         cwd=repo_root,
         beads_root=beads_root,
-        env={"BEADS_DIR": str(beads_root)},
+        env={**(env or {}), "BEADS_DIR": str(beads_root)},
     )
 
 
-def _build_store_bundle(*, beads_root: Path, repo_root: Path) -> _StoreBundle:
-    async_client = _build_async_beads_client(beads_root=beads_root, repo_root=repo_root)
-    sync_client = build_sync_beads_client(cwd=repo_root, beads_root=beads_root)
+def _build_store_bundle(
+    *, beads_root: Path, repo_root: Path, env: dict[str, str] | None = None
+) -> _StoreBundle:
+    transport = BatchingBeadsTransport()
+    async_client = _build_async_beads_client(
+        beads_root=beads_root,
+        repo_root=repo_root,
+        transport=transport,
+        env=env,
+    )
+    sync_client = build_sync_beads_client(
+        cwd=repo_root,
+        beads_root=beads_root,
+        transport=transport,
+        env=env,
+        runner=_run,
+    )
     return _StoreBundle(
         store=build_atelier_store(beads=async_client),
         sync_client=sync_client,
@@ -79,12 +115,16 @@ def _build_store_bundle(*, beads_root: Path, repo_root: Path) -> _StoreBundle:
 
 
 @lru_cache(maxsize=None)
-def _cached_bundle(beads_root: str, repo_root: str) -> _StoreBundle:
-    return _build_store_bundle(beads_root=Path(beads_root), repo_root=Path(repo_root))
+def _cached_bundle(beads_root: str, repo_root: str, agent_id: str = "") -> _StoreBundle:
+    # Pool members run in one process with thread-scoped agent identity, so
+    # each identity gets clients whose bd subprocesses carry its actor.
+    env = agents.thread_agent_env() if agent_id else None
+    return _build_store_bundle(beads_root=Path(beads_root), repo_root=Path(repo_root), env=env)
 
 
 def _bundle(*, beads_root: Path, repo_root: Path) -> _StoreBundle:
-    return _cached_bundle(str(beads_root), str(repo_root))
+    agent_id = agents.thread_agent_env().get("ATELIER_AGENT_ID", "")
+    return _cached_bundle(str(beads_root), str(repo_root), agent_id)
 
 
 def clear_bundle_cache() -> None:
@@ -93,6 +133,31 @@ def clear_bundle_cache() -> None:
     _cached_bundle.cache_clear()
 
 
+@contextmanager
+def store_session(*, beads_root: Path, repo_root: Path) -> Iterator[None]:
+    """Reuse one event loop and one store read snapshot on this thread.
+
+    Without a session every adapter call builds a new event loop and reads
+    through fresh store caches. Inside one, calls share a long-lived loop and
+    ``AtelierStore.read_session`` caches, so repeated epic and changeset
+    listings are served from memory until a ``bd`` write invalidates them.
+    Nested sessions reuse the outer loop.
+    """
+
+    store = _bundle(beads_root=beads_root, repo_root=repo_root).store
+    if getattr(_THREAD_STORE_SESSION, "runner", None) is not None:
+        with store.read_session():
+            yield
+        return
+    with asyncio.Runner() as runner:
+        _THREAD_STORE_SESSION.runner = runner
+        try:
+            with store.read_session():
+                yield
+        finally:
+            _THREAD_STORE_SESSION.runner = None
+
+
 def _issue_payload(record: IssueRecord) -> dict[str, object]:
     return cast(
         dict[str, object],
@@ -126,18 +191,30 @@ def show_issue(
     return _show_issue(issue_id=issue_id, beads_root=beads_root, repo_root=repo_root)
 
 
+def show_issues(
+    issue_ids: tuple[str, ...],
+    *,
+    beads_root: Path,
+    repo_root: Path,
+) -> dict[str, dict[str, object]]:
+    """Return raw issue payloads keyed by id, fetched in bulk show calls."""
+
+    if not issue_ids:
+        return {}
+    records = _bundle(beads_root=beads_root, repo_root=repo_root).sync_client.show_many(
+        ShowManyIssuesRequest(issue_ids=issue_ids)
+    )
+    return {record.id: _issue_payload(record) for record in records}
+
+
 def _store_ids_to_payloads(
     issue_ids: list[str],
     *,
     beads_root: Path,
     repo_root: Path,
 ) -> list[dict[str, object]]:
-    payloads: list[dict[str, object]] = []
-    for issue_id in issue_ids:
-        payload = _show_issue(issue_id=issue_id, beads_root=beads_root, repo_root=repo_root)
-        if payload is not None:
-            payloads.append(payload)
-    return payloads
+    found = show_issues(tuple(issue_ids), beads_root=beads_root, repo_root=repo_root)
+    return [found[issue_id] for issue_id in dict.fromkeys(issue_ids) if issue_id in found]
 
 
 def list_epics(
@@ -182,7 +259,7 @@ def list_descendant_changesets(
     """List changesets under one epic through AtelierStore discovery."""
 
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
-    records = asyncio.run(
+    records = _run(
         bundle.store.list_changesets(
             ChangesetQuery(epic_id=parent_id, include_closed=include_closed)
         )
@@ -247,7 +324,7 @@ def ready_changesets_global(
     """List ready changesets via store-backed readiness discovery."""
 
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
-    records = asyncio.run(bundle.store.list_ready_changesets(ReadyChangesetQuery()))
+    records = _run(bundle.store.list_ready_changesets(ReadyChangesetQuery()))
     return _store_ids_to_payloads(
         [record.id for record in records],
         beads_root=beads_root,
@@ -401,7 +478,7 @@ def get_agent_hook(
 ) -> str | None:
     """Return the current hook id for one agent bead, when present."""
 
-    hook = asyncio.run(
+    hook = _run(
         _bundle(beads_root=beads_root, repo_root=repo_root).store.get_agent_bead_hook(agent_bead_id)
     )
     return None if hook is None else hook.epic_id
@@ -420,7 +497,7 @@ def agent_hook_observation(
         return worker_selection.AgentHookObservation.unknown("agent_bead_id_missing")
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
     try:
-        hook = asyncio.run(bundle.store.get_agent_bead_hook(agent_bead_id))
+        hook = _run(bundle.store.get_agent_bead_hook(agent_bead_id))
     except LookupError:
         return worker_selection.AgentHookObservation.unknown("hook_lookup_failed")
     except ValueError:
@@ -586,7 +663,7 @@ def transition_lifecycle(
                 expected_current=expected_current,
             )
             return
-        asyncio.run(
+        _run(
             bundle.store.transition_lifecycle(
                 LifecycleTransitionRequest(
                     issue_id=issue_id,
@@ -610,6 +687,64 @@ def transition_lifecycle(
         )
 
 
+def transition_lifecycle_many(
+    issue_ids: list[str],
+    *,
+    target_status: str,
+    beads_root: Path,
+    repo_root: Path,
+    reason: str | None = None,
+) -> None:
+    """Transition many work items to one lifecycle status in a single batch.
+
+    The store already retries items the batch cannot transition one at a
+    time. Non-work items still take the direct status update fallback, and any
+    other failure raises.
+    """
+
+    if not issue_ids:
+        return
+    if target_status == LifecycleStatus.CLOSED.value:
+        for issue_id in issue_ids:
+            transition_lifecycle(
+                issue_id,
+                target_status=target_status,
+                beads_root=beads_root,
+                repo_root=repo_root,
+                reason=reason,
+            )
+        return
+    bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
+    outcomes = _run(
+        bundle.store.transition_lifecycle_many(
+            tuple(
+                LifecycleTransitionRequest(
+                    issue_id=issue_id,
+                    target_status=LifecycleStatus(target_status),
+                    reason=reason,
+                )
+                for issue_id in issue_ids
+            )
+        )
+    )
+    failures: list[str] = []
+    for outcome in outcomes:
+        if outcome.ok:
+            continue
+        error = outcome.error or f"lifecycle transition failed for {outcome.issue_id}"
+        if "lifecycle transitions require work items" not in error:
+            failures.append(error)
+            continue
+        _fallback_issue_status_update(
+            outcome.issue_id,
+            target_status=target_status,
+            beads_root=beads_root,
+            repo_root=repo_root,
+        )
+    if failures:
+        raise RuntimeError("; ".join(failures))
+
+
 def append_notes(
     issue_id: str,
     *,
@@ -620,7 +755,7 @@ def append_notes(
     """Append durable notes to one work item through AtelierStore."""
 
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
-    asyncio.run(bundle.store.append_notes(AppendNotesRequest(issue_id=issue_id, notes=notes)))
+    _run(bundle.store.append_notes(AppendNotesRequest(issue_id=issue_id, notes=notes)))
 
 
 def mark_issue_blocked(
@@ -695,7 +830,7 @@ def update_changeset_review(
     """Persist normalized review metadata for one changeset through AtelierStore."""
 
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
-    asyncio.run(
+    _run(
         bundle.store.update_review(
             UpdateReviewRequest(
                 changeset_id=changeset_id,
@@ -726,7 +861,7 @@ def update_changeset_integrated_sha(
     if normalized_sha is None:
         die("integrated sha must not be empty")
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
-    existing = asyncio.run(bundle.store.get_changeset(changeset_id)).review.integrated_sha
+    existing = _run(bundle.store.get_changeset(changeset_id)).review.integrated_sha
     if existing and existing != normalized_sha and not allow_override:
         die("changeset integrated sha already set; override not permitted")
     if existing == normalized_sha:
@@ -942,7 +1077,7 @@ def set_agent_hook(
     """Bind an agent bead to an epic through AtelierStore hook mutations."""
 
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
-    asyncio.run(
+    _run(
         bundle.store.set_agent_bead_hook(
             SetAgentBeadHookRequest(agent_bead_id=agent_bead_id, epic_id=epic_id)
         )
@@ -959,7 +1094,7 @@ def clear_agent_hook(
     """Clear an agent hook through AtelierStore hook mutations."""
 
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
-    asyncio.run(
+    _run(
         bundle.store.clear_agent_bead_hook(
             ClearAgentBeadHookRequest(
                 agent_bead_id=agent_bead_id,
@@ -1012,7 +1147,7 @@ def create_message(
             cwd=repo_root,
         )
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
-    record = asyncio.run(
+    record = _run(
         bundle.store.create_message(
             CreateMessageRequest(
                 title=subject,
@@ -1041,7 +1176,7 @@ def _startup_messages(
 ) -> tuple[StartupMessageRecord, ...]:
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
     query = MessageQuery(queue=queue, unread_only=unread_only)
-    return asyncio.run(bundle.store.list_startup_messages(query))
+    return _run(bundle.store.list_startup_messages(query))
 
 
 def _startup_message_thread_is_terminal(
@@ -1163,7 +1298,7 @@ def claim_queue_message(
     """Claim a queued message through store-native message claim semantics."""
 
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
-    asyncio.run(
+    _run(
         bundle.store.claim_message(
             ClaimMessageRequest(message_id=message_id, claimed_by=agent_id, queue=queue)
         )
@@ -1179,7 +1314,7 @@ def mark_message_read(
     """Mark a message as read through AtelierStore."""
 
     bundle = _bundle(beads_root=beads_root, repo_root=repo_root)
-    asyncio.run(bundle.store.mark_message_read(MarkMessageReadRequest(message_id=message_id)))
+    _run(bundle.store.mark_message_read(MarkMessageReadRequest(message_id=message_id)))
 
 
 def epic_changeset_summary(
@@ -1267,22 +1402,16 @@ class WorkerStoreBeadsAdapter:
                 label in beads.issue_label_candidates("message", beads_root=beads_root)
                 for label in labels
             ):
-                queue = None
                 unread_only = any(
                     label in beads.issue_label_candidates("unread", beads_root=beads_root)
                     for label in labels
                 )
-                payloads = []
-                for record in _startup_messages(
+                return beads.list_message_beads(
                     beads_root=beads_root,
-                    repo_root=cwd,
-                    queue=queue,
+                    cwd=cwd,
                     unread_only=unread_only,
-                ):
-                    payload = show_issue(record.id, beads_root=beads_root, repo_root=cwd)
-                    if payload is not None:
-                        payloads.append(payload)
-                return payloads
+                    match_contract=True,
+                )
         return beads.run_bd_json(args, beads_root=beads_root, cwd=cwd)
 
     def ensure_agent_bead(
@@ -1414,7 +1543,9 @@ __all__ = [
     "resolve_hooked_epic",
     "set_agent_hook",
     "show_issue",
+    "store_session",
     "transition_lifecycle",
+    "transition_lifecycle_many",
     "update_changeset_integrated_sha",
     "update_changeset_review",
     "update_issue_labels",
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import os
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
+from .. import command_trace
 from .models import WorkerRunSummary
 
 
@@ -31,10 +32,12 @@ def step(
     say(f"-> {label}")
     if log_debug is not None:
         log_debug(f"step start label={label}")
+    previous_stage = command_trace.enter_stage(label)
     start = time.perf_counter()
 
     def finish(extra: str | None = None) -> None:
         elapsed = time.perf_counter() - start
+        command_trace.exit_stage(label, previous_stage)
         timings.append((label, elapsed))
         suffix = f" ({elapsed:.2f}s)" if trace or elapsed >= 0.5 else ""
         if extra:
@@ -65,6 +68,24 @@ def report_timings(
         say(f"- {label}: {elapsed:.2f}s")
 
 
+def report_command_summary(
+    summaries: Sequence[command_trace.CommandCategorySummary],
+    *,
+    say: Callable[[str], None],
+) -> None:
+    """Render external command counts and time per category."""
+    if not summaries:
+        return
+    say("Command summary:")
+    for summary in summaries:
+        failures = f", {summary.failures} failed" if summary.failures else ""
+        say(
+            f"- {summary.category}: {summary.count} calls, "
+            f"{summary.total_seconds:.2f}s total, "
+            f"{summary.max_seconds:.2f}s max{failures}"
+        )
+
+
 def report_worker_summary(
     summary: WorkerRunSummary,
     *,
@@ -0,0 +1,184 @@
+"""Change-driven idle waits for watch-mode workers.
+
+Watch mode used to sleep a fixed interval between readiness checks. The
+watcher here instead fingerprints the files that change when something a
+worker cares about changes, and wakes as soon as that fingerprint moves:
+
+- the Beads store (``metadata.json``, the SQLite database, and each Dolt
+  database's ``.dolt/noms`` directory, which every Dolt commit rewrites);
+- agent inbox messages, which live in the Beads store;
+- the worker's hook files.
+
+Fingerprints are plain ``stat`` calls, so one poll costs a handful of
+syscalls instead of a ``bd`` subprocess.
+
+The baseline is taken before each readiness check (:meth:`ChangeWatcher.mark`)
+so writes that land during the check still wake the worker. The worker's own
+``bd`` writes are filtered out explicitly instead.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from .. import command_trace
+
+DEFAULT_POLL_SECONDS = 1.0
+
+_BEADS_FILENAMES = ("metadata.json", "beads.db", "beads.db-wal")
+
+PathFingerprint = tuple[str, tuple[tuple[str, int, int], ...] | None]
+
+
+def beads_watch_paths(beads_root: Path) -> tuple[Path, ...]:
+    """Return the Beads files and directories that change on store writes.
+
+    Args:
+        beads_root: Beads root directory for the project.
+
+    Returns:
+        Paths to fingerprint. Paths that do not exist yet are included so
+        their creation counts as a change.
+    """
+    paths = [beads_root / name for name in _BEADS_FILENAMES]
+    dolt_root = beads_root / "dolt"
+    if dolt_root.is_dir():
+        paths.extend(sorted(dolt_root.glob("*/.dolt/noms")))
+        paths.extend(sorted(dolt_root.glob("*/.dolt/repo_state.json")))
+    return tuple(paths)
+
+
+def _fingerprint_path(path: Path) -> PathFingerprint:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path), None)
+    entries = [("", stat.st_mtime_ns, stat.st_size)]
+    if path.is_dir():
+        try:
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    try:
+                        child = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((entry.name, child.st_mtime_ns, child.st_size))
+        except OSError:
+            pass
+    return (str(path), tuple(sorted(entries)))
+
+
+def fingerprint(paths: Iterable[Path]) -> tuple[PathFingerprint, ...]:
+    """Return a comparable ``stat`` fingerprint for ``paths``.
+
+    Directories contribute their immediate children, so files appended to
+    or replaced inside them are noticed without walking whole trees.
+
+    Args:
+        paths: Files or directories to fingerprint.
+
+    Returns:
+        Tuple of per-path fingerprints; equal tuples mean nothing changed.
+    """
+    return tuple(_fingerprint_path(path) for path in paths)
+
+
+class ChangeWatcher:
+    """Block until watched paths change or a timeout expires.
+
+    Args:
+        paths: Files or directories whose changes should wake the worker,
+            or a callable returning them. A callable is resolved on every
+            fingerprint, so paths created later are picked up.
+        poll_seconds: Delay between fingerprint checks.
+        sleep_fn: Sleep function, injectable for tests.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path] | Callable[[], Iterable[Path]],
+        *,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        sleep_fn: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if poll_seconds <= 0:
+            raise ValueError("watch poll_seconds must be positive")
+        if callable(paths):
+            self._resolve_paths = paths
+        else:
+            fixed_paths = tuple(paths)
+            self._resolve_paths = lambda: fixed_paths
+        self.poll_seconds = poll_seconds
+        self._sleep = sleep_fn
+        self._clock = clock
+        self._baseline: tuple[PathFingerprint, ...] | None = None
+        self._own_write_depth = 0
+        self._before_own_write: tuple[PathFingerprint, ...] | None = None
+
+    @property
+    def paths(self) -> tuple[Path, ...]:
+        """Return the paths watched right now."""
+        return tuple(self._resolve_paths())
+
+    def mark(self) -> None:
+        """Take the baseline that the next :meth:`wait` compares against.
+
+        Call it before each readiness check. Changes that land between the
+        check and the wait then still count.
+        """
+        self._baseline = fingerprint(self.paths)
+
+    @contextmanager
+    def ignoring_own_writes(self) -> Iterator[None]:
+        """Keep the calling thread's own ``bd`` writes from waking it.
+
+        Around each such write the baseline moves forward, but only when
+        nothing else changed since the baseline was taken. Writes from
+        other threads, such as pool members, still count as changes.
+        """
+        with command_trace.bd_write_hooks(
+            before=self._own_write_started, after=self._own_write_finished
+        ):
+            yield
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a watched path to change.
+
+        Compares against the baseline from :meth:`mark`, or against the
+        paths as they are now when no baseline was marked.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            ``True`` when a change was observed, ``False`` on timeout.
+        """
+        baseline = self._baseline if self._baseline is not None else fingerprint(self.paths)
+        self._baseline = None
+        deadline = self._clock() + max(timeout, 0.0)
+        while True:
+            if fingerprint(self.paths) != baseline:
+                return True
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                return False
+            self._sleep(min(self.poll_seconds, remaining))
+
+    def _own_write_started(self) -> None:
+        if self._own_write_depth == 0 and self._baseline is not None:
+            self._before_own_write = fingerprint(self.paths)
+        self._own_write_depth += 1
+
+    def _own_write_finished(self) -> None:
+        self._own_write_depth = max(self._own_write_depth - 1, 0)
+        if self._own_write_depth:
+            return
+        before, self._before_own_write = self._before_own_write, None
+        if before is not None and before == self._baseline:
+            self._baseline = fingerprint(self.paths)
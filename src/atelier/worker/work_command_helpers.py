@@ -34,6 +34,7 @@ from .work_runtime_common import (
     trace_enabled,
     watch_interval_seconds,
     with_codex_exec,
+    worker_pool_size,
 )
 from .work_startup_runtime import (
     capture_review_feedback_snapshot,
@@ -84,4 +85,5 @@ __all__ = [
     "watch_interval_seconds",
     "with_codex_exec",
     "worker_opening_prompt",
+    "worker_pool_size",
 ]
@@ -310,6 +310,19 @@ def lookup_pr_payload(repo_slug: str | None, branch: str) -> dict[str, object] |
     return prs.read_github_pr_status(repo_slug, branch)
 
 
+def prefetch_pr_payloads(repo_slug: str, branches: list[str]) -> None:
+    """Warm PR lookups for many branches with one batched query.
+
+    Args:
+        repo_slug: GitHub owner/repo slug.
+        branches: Branch names used for PR lookup.
+
+    Returns:
+        None.
+    """
+    prs.lookup_github_pr_statuses(repo_slug, branches)
+
+
 def lookup_pr_payload_diagnostic(
     repo_slug: str | None, branch: str
 ) -> tuple[dict[str, object] | None, str | None]:
@@ -742,6 +755,7 @@ def align_existing_pr_base(
     if edit_result.returncode != 0:
         detail = (edit_result.stderr or edit_result.stdout or "").strip()
         return False, detail or "gh pr edit failed"
+    prs.invalidate_pr_lookup(repo_slug, work_branch)
 
     root_branch = changeset_root_branch(issue)
     parent_base = git.git_rev_parse(repo_root, expected_branch, git_path=git_path)
@@ -1009,6 +1023,7 @@ def handle_pushed_without_pr(
         update_changeset_review_from_pr=update_changeset_review_from_pr,
         emit=say,
         attempt_create_pr_fn=attempt_create_pr,
+        prefetch_pr_payloads=prefetch_pr_payloads,
     )
     return gate_result.finalize_result
 
@@ -1203,6 +1218,7 @@ def changeset_pr_creation_decision(
         git_path=git_path,
         beads_root=beads_root,
         lookup_pr_payload=lookup_pr_payload,
+        prefetch_pr_payloads=prefetch_pr_payloads,
     )
 
 
@@ -1801,6 +1817,7 @@ __all__ = [
     "mark_changeset_closed",
     "mark_changeset_in_progress",
     "mark_changeset_merged",
+    "prefetch_pr_payloads",
     "promote_planned_descendant_changesets",
     "recover_premature_merged_changeset",
     "release_epic_assignment",
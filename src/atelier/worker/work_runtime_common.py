@@ -331,6 +331,22 @@ def watch_interval_seconds(value: int | None) -> int:
     return value
 
 
+def worker_pool_size(value: int | None) -> int | None:
+    """Return the requested in-process worker pool size.
+
+    Args:
+        value: Optional explicit ``--pool`` value from CLI args.
+
+    Returns:
+        Positive pool size, or ``None`` when no pool was requested.
+    """
+    if value is None:
+        return None
+    if value <= 0:
+        die("pool size must be a positive number of workers")
+    return value
+
+
 def issue_labels(issue: dict[str, object]) -> set[str]:
     """Return normalized label set for a bead issue.
 
@@ -430,4 +446,5 @@ __all__ = [
     "trace_enabled",
     "watch_interval_seconds",
     "with_codex_exec",
+    "worker_pool_size",
 ]
@@ -180,6 +180,13 @@ class _NextChangesetService(worker_startup.NextChangesetService):
             repo_root=self._repo_root,
         )
 
+    def show_issues(self, issue_ids: tuple[str, ...]) -> dict[str, dict[str, object]]:
+        return worker_store.show_issues(
+            issue_ids,
+            beads_root=self._beads_root,
+            repo_root=self._repo_root,
+        )
+
     def changeset_waiting_on_review_or_signals(
         self,
         issue: dict[str, object],
@@ -383,7 +390,8 @@ def next_changeset(
         resume_review=resume_review,
     )
     service = _NextChangesetService(beads_root=beads_root, repo_root=repo_root)
-    return worker_startup.next_changeset_service(context=context, service=service)
+    with worker_store.store_session(beads_root=beads_root, repo_root=repo_root):
+        return worker_startup.next_changeset_service(context=context, service=service)
 
 
 def persist_review_feedback_cursor(
@@ -994,7 +1002,10 @@ def run_startup_contract(
         repo_root=context.repo_root,
         dry_run=context.dry_run,
     )
-    return worker_startup.run_startup_contract_service(context=context, service=service)
+    # Selection re-lists the same epics and changesets many times; share one
+    # store snapshot until a bd write invalidates it.
+    with worker_store.store_session(beads_root=context.beads_root, repo_root=context.repo_root):
+        return worker_startup.run_startup_contract_service(context=context, service=service)
 
 
 __all__ = [
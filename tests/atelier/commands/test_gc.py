@@ -1,10 +1,11 @@
 """Tests for gc command orchestration."""
 
+import contextlib
 import subprocess
 import tempfile
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -443,6 +444,71 @@ def test_gc_logs_action_lifecycle_in_dry_run() -> None:
     assert any("gc action dry-run description=Test action" in message for message in debug_messages)
 
 
+def _status_update_action(issue_id: str, status: str) -> gc_cmd.GcAction:
+    def _apply() -> None:
+        gc_cmd.beads.update_issue(
+            issue_id, ("--status", status), beads_root=Path("/beads"), cwd=Path("/repo")
+        )
+
+    return gc_cmd.GcAction(
+        description=f"Normalize {issue_id}", apply=_apply, queues_issue_updates=True
+    )
+
+
+def test_gc_flushes_queued_updates_before_direct_writes(_patch_gc_prime) -> None:
+    def _release() -> None:
+        gc_cmd.beads.run_bd_command(
+            ["update", "at-1", "--assignee", "", "--status", "open"],
+            beads_root=Path("/beads"),
+            cwd=Path("/repo"),
+        )
+
+    actions = [
+        _status_update_action("at-1", "blocked"),
+        _status_update_action("at-2", "blocked"),
+        gc_cmd.GcAction(description="Release at-1", apply=_release),
+        _status_update_action("at-3", "open"),
+    ]
+
+    with patch("atelier.commands.gc.say") as say:
+        skipped = gc_cmd._apply_actions(
+            actions, dry_run=False, yes=True, beads_root=Path("/beads"), repo_root=Path("/repo")
+        )
+
+    assert skipped is False
+    assert [call.args[0] for call in _patch_gc_prime.call_args_list] == [
+        ["update", "at-1", "at-2", "--status", "blocked"],
+        ["update", "at-1", "--assignee", "", "--status", "open"],
+        ["update", "at-3", "--status", "open"],
+    ]
+    messages = [call.args[0] for call in say.call_args_list]
+    assert messages.index("Done: Normalize at-1") < messages.index("Running: Release at-1")
+
+
+def test_gc_exits_when_a_queued_update_fails(_patch_gc_prime) -> None:
+    _patch_gc_prime.return_value = subprocess.CompletedProcess(
+        args=["bd", "update"], returncode=1, stdout="", stderr="no issue found"
+    )
+    released: list[str] = []
+    actions = [
+        _status_update_action("at-1", "blocked"),
+        gc_cmd.GcAction(description="Release at-1", apply=lambda: released.append("at-1")),
+    ]
+
+    with (
+        patch("atelier.commands.gc.say") as say,
+        patch("atelier.commands.gc.die", side_effect=SystemExit(1)) as die,
+        pytest.raises(SystemExit),
+    ):
+        gc_cmd._apply_actions(
+            actions, dry_run=False, yes=True, beads_root=Path("/beads"), repo_root=Path("/repo")
+        )
+
+    die.assert_called_once_with("GC update failed for at-1: no issue found")
+    assert released == []
+    assert "Done: Normalize at-1" not in [call.args[0] for call in say.call_args_list]
+
+
 def test_gc_renders_report_only_actions_in_dry_run() -> None:
     project_root = Path("/project")
     repo_root = Path("/repo")
@@ -511,3 +577,131 @@ def test_gc_renders_report_only_actions_in_dry_run() -> None:
         "gc action report-only description=Diagnostic action" in message
         for message in debug_messages
     )
+
+
+@pytest.mark.parametrize(
+    ("dry_run", "confirmed", "update_fails", "expect_saved", "expect_cursor"),
+    [
+        (False, True, False, True, True),
+        (False, False, False, True, False),
+        (True, True, False, False, False),
+        (False, True, True, False, False),
+    ],
+)
+def test_gc_incremental_checks_changed_changesets_and_saves_checkpoint(
+    _patch_gc_prime,
+    dry_run: bool,
+    confirmed: bool,
+    update_fails: bool,
+    expect_saved: bool,
+    expect_cursor: bool,
+) -> None:
+    project_root = Path("/project")
+    repo_root = Path("/repo")
+    project_config = config.ProjectConfig()
+    changed = [{"id": "at-1", "status": "closed"}]
+    changed_issues = [*changed, {"id": "at-epic", "labels": ["at:epic"], "status": "hooked"}]
+    candidates = MagicMock(return_value=changed)
+    action = _status_update_action("at-1", "closed")
+    if update_fails:
+        _patch_gc_prime.side_effect = lambda args, **_kwargs: subprocess.CompletedProcess(
+            args=["bd", *args], returncode=1 if args[0] == "update" else 0, stdout="", stderr=""
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        with (
+            patch(
+                "atelier.commands.gc.resolve_current_project_with_repo_root",
+                return_value=(project_root, project_config, "/repo", repo_root),
+            ),
+            patch(
+                "atelier.commands.gc.config.resolve_project_data_dir",
+                return_value=data_dir,
+            ),
+            patch(
+                "atelier.commands.gc.config.resolve_beads_root",
+                return_value=Path("/beads"),
+            ),
+            patch.multiple(
+                "atelier.gc.incremental",
+                changed_issues=MagicMock(return_value=changed_issues),
+                changeset_candidates=candidates,
+            ),
+            patch(
+                "atelier.gc.labels.collect_normalize_changeset_labels",
+                return_value=[action],
+            ) as normalize,
+            patch(
+                "atelier.gc.labels.collect_remove_deprecated_label",
+                return_value=[],
+            ) as remove_label,
+            patch(
+                "atelier.gc.labels.collect_normalize_epic_labels",
+                return_value=[],
+            ) as normalize_epics,
+            patch(
+                "atelier.gc.labels.collect_report_epic_identity_guardrails",
+                return_value=[],
+            ),
+            patch("atelier.gc.hooks.collect_hooks", return_value=[]),
+            patch("atelier.gc.worktrees.collect_orphan_worktrees", return_value=[]),
+            patch(
+                "atelier.gc.worktrees.collect_resolved_epic_artifacts",
+                return_value=[],
+            ),
+            patch(
+                "atelier.gc.worktrees.collect_closed_workspace_branches_without_mapping",
+                return_value=[],
+            ) as closed_workspace,
+            patch("atelier.gc.messages.collect_message_claims", return_value=[]),
+            patch("atelier.gc.messages.collect_message_retention", return_value=[]),
+            patch("atelier.gc.agents.collect_agent_homes", return_value=[]),
+            patch("atelier.commands.gc.git.git_query_session"),
+            patch("atelier.commands.gc.confirm", return_value=confirmed),
+            patch("atelier.commands.gc.say"),
+            pytest.raises(SystemExit) if update_fails else contextlib.nullcontext(),
+        ):
+            gc_cmd.gc(
+                SimpleNamespace(
+                    stale_hours=24.0,
+                    stale_if_missing_heartbeat=False,
+                    dry_run=dry_run,
+                    reconcile=False,
+                    yes=False,
+                    incremental=False,
+                    budget="50",
+                )
+            )
+
+        checkpoint = candidates.call_args.args[0]
+        assert candidates.call_args.kwargs["changed"] == changed_issues
+        assert remove_label.call_count == 8
+        assert all(call.kwargs["issues"] == changed_issues for call in remove_label.call_args_list)
+        assert normalize_epics.call_args.kwargs["issues"] == changed_issues
+        assert normalize.call_args.kwargs["issues"] == changed
+        assert closed_workspace.call_args.kwargs["issues"] == changed
+        assert closed_workspace.call_args.kwargs["checkpoint"] is checkpoint
+        assert closed_workspace.call_args.kwargs["budget"].items == 50
+        assert gc_cmd.gc_incremental.checkpoint_path(data_dir).exists() is expect_saved
+        saved = gc_cmd.gc_incremental.load_checkpoint(data_dir)
+        assert (saved.scanned_at is not None) is expect_cursor
+
+
+def test_gc_rejects_invalid_budget() -> None:
+    with (
+        patch(
+            "atelier.commands.gc.resolve_current_project_with_repo_root",
+            return_value=(Path("/project"), config.ProjectConfig(), "/repo", Path("/repo")),
+        ),
+        patch(
+            "atelier.commands.gc.config.resolve_project_data_dir",
+            return_value=Path("/data"),
+        ),
+        patch(
+            "atelier.commands.gc.config.resolve_beads_root",
+            return_value=Path("/beads"),
+        ),
+        pytest.raises(SystemExit),
+    ):
+        gc_cmd.gc(SimpleNamespace(budget="later"))
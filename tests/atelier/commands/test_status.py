@@ -6,6 +6,8 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+
 import atelier.config as config
 from atelier.commands import status as status_cmd
 from atelier.worktrees import WorktreeMapping
@@ -14,6 +16,21 @@ from tests.atelier.helpers import NORMALIZED_ORIGIN, RAW_ORIGIN, DummyResult
 status_module = importlib.import_module("atelier.commands.status")
 
 
+@pytest.fixture(autouse=True)
+def _batch_pr_lookups_delegate_to_single_lookup() -> object:
+    def lookup_many(repo: str, heads: list[str], *, refresh: bool = False) -> dict[str, object]:
+        return {
+            head: status_module.prs.lookup_github_pr_status(repo, head, refresh=refresh)
+            for head in heads
+        }
+
+    with patch(
+        "atelier.commands.status.prs.lookup_github_pr_statuses",
+        side_effect=lookup_many,
+    ):
+        yield
+
+
 def _lookup_status_payload(payload_fn):
     def _lookup(repo: str, branch: str, refresh: bool = False) -> SimpleNamespace:
         _ = refresh
@@ -28,6 +45,32 @@ def _lookup_status_payload(payload_fn):
     return _lookup
 
 
+def _snapshot_run_bd_json(
+    *,
+    epics: list[dict[str, object]],
+    changesets_by_parent: dict[str, list[dict[str, object]]] | None = None,
+    agents: list[dict[str, object]] | None = None,
+    ready_ids: set[str] | None = None,
+):
+    children = [
+        {**changeset, "parent": parent_id}
+        for parent_id, changesets in (changesets_by_parent or {}).items()
+        for changeset in changesets
+    ]
+    issues = [*epics, *children, *(agents or [])]
+
+    def fake_run_bd_json(
+        args: list[str], *, beads_root: Path, cwd: Path
+    ) -> list[dict[str, object]]:
+        if args[:2] == ["list", "--all"]:
+            return list(issues)
+        if args[:1] == ["ready"]:
+            return [issue for issue in children if issue["id"] in (ready_ids or set())]
+        return []
+
+    return fake_run_bd_json
+
+
 def test_status_json_summary() -> None:
     with tempfile.TemporaryDirectory() as tmp:
         root = Path(tmp)
@@ -90,26 +133,12 @@ def test_status_json_summary() -> None:
             },
         ]
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic_one, epic_two]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return [agent_one]
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                epic_id = args[args.index("--parent") + 1]
-                if epic_id == "epic-1":
-                    return list(changesets)
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                epic_id = args[args.index("--parent") + 1]
-                if epic_id == "epic-1":
-                    return [changesets[1]]
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(
+            epics=[epic_one, epic_two],
+            changesets_by_parent={"epic-1": changesets},
+            agents=[agent_one],
+            ready_ids={"cs-2"},
+        )
 
         def fake_load_mapping(path: Path) -> WorktreeMapping | None:
             if path.name == "epic-1.json":
@@ -183,22 +212,7 @@ def test_status_json_includes_prefix_migration_drift_report() -> None:
             "labels": ["at:epic"],
         }
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return []
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                return []
-            if args[:2] == ["show", "epic-1"]:
-                return [epic]
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(epics=[epic])
 
         drift_report = [
             {
@@ -258,23 +272,9 @@ def test_status_includes_changeset_signals() -> None:
         }
         changesets = [{"id": "cs-1", "title": "Changeset", "labels": [], "type": "task"}]
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return []
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                parent_id = args[args.index("--parent") + 1]
-                if parent_id == "epic-1":
-                    return list(changesets)
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(
+            epics=[epic], changesets_by_parent={"epic-1": changesets}
+        )
 
         def fake_load_mapping(path: Path) -> WorktreeMapping | None:
             if path.name == "epic-1.json":
@@ -358,23 +358,9 @@ def test_status_blocks_pr_allowed_for_closed_changeset_with_active_pr_lifecycle(
             }
         ]
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return []
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                parent_id = args[args.index("--parent") + 1]
-                if parent_id == "epic-1":
-                    return list(changesets)
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(
+            epics=[epic], changesets_by_parent={"epic-1": changesets}
+        )
 
         def fake_load_mapping(path: Path) -> WorktreeMapping | None:
             if path.name == "epic-1.json":
@@ -413,6 +399,199 @@ def test_status_blocks_pr_allowed_for_closed_changeset_with_active_pr_lifecycle(
         assert detail["pr_gate_reason"] == "blocked:closed-changeset-pr-lifecycle-active"
 
 
+def test_status_uses_constant_bd_reads_and_one_batched_pr_lookup() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        project_root = root / "project"
+        repo_root = root / "repo"
+        project_root.mkdir(parents=True, exist_ok=True)
+        repo_root.mkdir(parents=True, exist_ok=True)
+
+        project_config = config.ProjectConfig.model_validate(
+            {"project": {"enlistment": str(repo_root), "origin": "github.com/org/repo"}}
+        )
+        epics = [
+            {"id": f"epic-{index}", "title": "Epic", "status": "open", "labels": ["at:epic"]}
+            for index in range(12)
+        ]
+        changesets_by_parent = {
+            str(epic["id"]): [
+                {"id": f"{epic['id']}.1", "title": "Changeset", "labels": [], "type": "task"}
+            ]
+            for epic in epics
+        }
+        snapshot_json = _snapshot_run_bd_json(
+            epics=epics, changesets_by_parent=changesets_by_parent
+        )
+        bd_calls: list[list[str]] = []
+        batch_calls: list[tuple[str, list[str]]] = []
+
+        def fake_run_bd_json(
+            args: list[str], *, beads_root: Path, cwd: Path
+        ) -> list[dict[str, object]]:
+            bd_calls.append(args)
+            return snapshot_json(args, beads_root=beads_root, cwd=cwd)
+
+        def fake_load_mapping(path: Path) -> WorktreeMapping | None:
+            epic_id = path.stem
+            return WorktreeMapping(
+                epic_id=epic_id,
+                worktree_path=f"worktrees/{epic_id}",
+                root_branch="alpha",
+                changesets={f"{epic_id}.1": f"alpha-{epic_id}"},
+                changeset_worktrees={},
+            )
+
+        def fake_lookup_many(
+            repo: str, heads: list[str], *, refresh: bool = False
+        ) -> dict[str, SimpleNamespace]:
+            _ = refresh
+            batch_calls.append((repo, list(heads)))
+            return {
+                head: SimpleNamespace(
+                    found=True,
+                    payload={"state": "OPEN", "isDraft": False},
+                    failed=False,
+                    error=None,
+                )
+                for head in heads
+            }
+
+        with (
+            patch(
+                "atelier.commands.status.resolve_current_project_with_repo_root",
+                return_value=(project_root, project_config, str(repo_root), repo_root),
+            ),
+            patch("atelier.commands.status.beads.run_bd_command", return_value=DummyResult()),
+            patch("atelier.commands.status.beads.run_bd_json", side_effect=fake_run_bd_json),
+            patch(
+                "atelier.commands.status.worktrees.load_mapping",
+                side_effect=fake_load_mapping,
+            ),
+            patch("atelier.commands.status.git.git_ref_exists", return_value=True),
+            patch(
+                "atelier.commands.status.prs.lookup_github_pr_statuses",
+                side_effect=fake_lookup_many,
+            ),
+            patch(
+                "atelier.commands.status.prs.lookup_github_pr_status",
+                side_effect=AssertionError("status should batch PR lookups"),
+            ),
+            patch(
+                "atelier.commands.status.prefix_migration_drift.scan_prefix_migration_drift",
+                return_value=[],
+            ),
+        ):
+            buffer = io.StringIO()
+            with patch("sys.stdout", buffer):
+                status_cmd(SimpleNamespace(format="json"))
+
+        payload = json.loads(buffer.getvalue())
+        assert payload["counts"]["epics"] == 12
+        assert payload["counts"]["changesets"] == 12
+        assert [args[0] for args in bd_calls] == ["list", "ready"]
+        assert len(batch_calls) == 1
+        repo, heads = batch_calls[0]
+        assert repo == "org/repo"
+        assert sorted(heads) == sorted(f"alpha-epic-{index}" for index in range(12))
+
+
+def test_status_batches_work_branch_heads_used_by_pr_gate() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        project_root = root / "project"
+        repo_root = root / "repo"
+        project_root.mkdir(parents=True, exist_ok=True)
+        repo_root.mkdir(parents=True, exist_ok=True)
+
+        project_config = config.ProjectConfig.model_validate(
+            {"project": {"enlistment": str(repo_root), "origin": "github.com/org/repo"}}
+        )
+        epics = [
+            {"id": f"epic-{index}", "title": "Epic", "status": "open", "labels": ["at:epic"]}
+            for index in range(3)
+        ]
+        changesets_by_parent = {
+            str(epic["id"]): [
+                {
+                    "id": f"{epic['id']}.{number}",
+                    "title": "Changeset",
+                    "labels": [],
+                    "type": "task",
+                    "status": "open",
+                    "description": (
+                        "changeset.root_branch: main\n"
+                        f"changeset.work_branch: feat-{epic['id']}-{number}\n"
+                    ),
+                }
+                for number in range(1, 4)
+            ]
+            for epic in epics
+        }
+        snapshot_json = _snapshot_run_bd_json(
+            epics=epics, changesets_by_parent=changesets_by_parent
+        )
+        batch_calls: list[tuple[str, list[str]]] = []
+
+        def fake_load_mapping(path: Path) -> WorktreeMapping | None:
+            epic_id = path.stem
+            return WorktreeMapping(
+                epic_id=epic_id,
+                worktree_path=f"worktrees/{epic_id}",
+                root_branch="main",
+                changesets={f"{epic_id}.1": f"feat-{epic_id}-1"},
+                changeset_worktrees={},
+            )
+
+        def fake_lookup_many(
+            repo: str, heads: list[str], *, refresh: bool = False
+        ) -> dict[str, SimpleNamespace]:
+            _ = refresh
+            batch_calls.append((repo, list(heads)))
+            return {
+                head: SimpleNamespace(found=False, payload=None, failed=False, error=None)
+                for head in heads
+            }
+
+        with (
+            patch(
+                "atelier.commands.status.resolve_current_project_with_repo_root",
+                return_value=(project_root, project_config, str(repo_root), repo_root),
+            ),
+            patch("atelier.commands.status.beads.run_bd_command", return_value=DummyResult()),
+            patch("atelier.commands.status.beads.run_bd_json", side_effect=snapshot_json),
+            patch(
+                "atelier.commands.status.worktrees.load_mapping",
+                side_effect=fake_load_mapping,
+            ),
+            patch("atelier.commands.status.git.git_ref_exists", return_value=False),
+            patch(
+                "atelier.commands.status.prs.lookup_github_pr_statuses",
+                side_effect=fake_lookup_many,
+            ),
+            patch(
+                "atelier.commands.status.prs.lookup_github_pr_status",
+                side_effect=AssertionError("status should batch PR lookups"),
+            ),
+            patch(
+                "atelier.commands.status.prefix_migration_drift.scan_prefix_migration_drift",
+                return_value=[],
+            ),
+        ):
+            buffer = io.StringIO()
+            with patch("sys.stdout", buffer):
+                status_cmd(SimpleNamespace(format="json"))
+
+        payload = json.loads(buffer.getvalue())
+        assert payload["counts"]["changesets"] == 9
+        assert len(batch_calls) == 1
+        repo, heads = batch_calls[0]
+        assert repo == "org/repo"
+        assert sorted(heads) == sorted(
+            f"feat-epic-{index}-{number}" for index in range(3) for number in range(1, 4)
+        )
+
+
 def test_build_changeset_details_scopes_pr_payload_cache_by_repo_slug() -> None:
     changesets = [{"id": "cs-1", "title": "Changeset", "labels": [], "type": "task"}]
     mapping = WorktreeMapping(
@@ -510,23 +689,9 @@ def test_status_resolves_dependency_lineage_for_sequential_gate() -> None:
             },
         ]
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return []
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                parent_id = args[args.index("--parent") + 1]
-                if parent_id == "epic-1":
-                    return list(changesets)
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(
+            epics=[epic], changesets_by_parent={"epic-1": changesets}
+        )
 
         def fake_load_mapping(path: Path) -> WorktreeMapping | None:
             if path.name == "epic-1.json":
@@ -623,23 +788,9 @@ def test_status_sequential_blocks_when_dependency_parent_pr_closed() -> None:
             },
         ]
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return []
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                parent_id = args[args.index("--parent") + 1]
-                if parent_id == "epic-1":
-                    return list(changesets)
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(
+            epics=[epic], changesets_by_parent={"epic-1": changesets}
+        )
 
         def fake_load_mapping(path: Path) -> WorktreeMapping | None:
             if path.name == "epic-1.json":
@@ -746,23 +897,9 @@ def test_status_sequential_uses_dependency_frontier_for_non_top_level_changeset(
             },
         ]
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return []
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                parent_id = args[args.index("--parent") + 1]
-                if parent_id == "epic-1":
-                    return list(changesets)
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(
+            epics=[epic], changesets_by_parent={"epic-1": changesets}
+        )
 
         def fake_load_mapping(path: Path) -> WorktreeMapping | None:
             if path.name == "epic-1.json":
@@ -867,23 +1004,9 @@ def test_status_sequential_collapses_transitive_duplicate_dependency_parents() -
             },
         ]
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return []
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                parent_id = args[args.index("--parent") + 1]
-                if parent_id == "epic-1":
-                    return list(changesets)
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(
+            epics=[epic], changesets_by_parent={"epic-1": changesets}
+        )
 
         def fake_load_mapping(path: Path) -> WorktreeMapping | None:
             if path.name == "epic-1.json":
@@ -994,23 +1117,9 @@ def test_status_sequential_blocks_when_non_parent_dependency_not_integrated() ->
             },
         ]
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return []
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                parent_id = args[args.index("--parent") + 1]
-                if parent_id == "epic-1":
-                    return list(changesets)
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(
+            epics=[epic], changesets_by_parent={"epic-1": changesets}
+        )
 
         def fake_load_mapping(path: Path) -> WorktreeMapping | None:
             if path.name == "epic-1.json":
@@ -1129,23 +1238,9 @@ def test_status_at_kid_dag_allows_only_frontier_changeset_after_parent_merge() -
             },
         ]
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return []
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                parent_id = args[args.index("--parent") + 1]
-                if parent_id == "at-kid":
-                    return list(changesets)
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(
+            epics=[epic], changesets_by_parent={"at-kid": changesets}
+        )
 
         def fake_load_mapping(path: Path) -> WorktreeMapping | None:
             if path.name == "at-kid.json":
@@ -1246,20 +1341,7 @@ def test_status_marks_stale_sessions_and_reclaimable_epics() -> None:
             ),
         }
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return [agent]
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] == "list" and "--parent" in args:
-                return []
-            if args and args[0] == "ready" and "--parent" in args:
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(epics=[epic], agents=[agent])
 
         with (
             patch(
@@ -1315,18 +1397,7 @@ def test_status_flags_planner_owned_executable_epic() -> None:
             "labels": ["at:epic"],
         }
 
-        def fake_run_bd_json(
-            args: list[str], *, beads_root: Path, cwd: Path
-        ) -> list[dict[str, object]]:
-            if args[:3] == ["list", "--label", "at:epic"]:
-                return [epic]
-            if args[:3] == ["list", "--label", "at:agent"]:
-                return []
-            if args[:3] == ["list", "--label", "at:message"]:
-                return []
-            if args and args[0] in {"list", "ready"} and "--parent" in args:
-                return []
-            return []
+        fake_run_bd_json = _snapshot_run_bd_json(epics=[epic])
 
         with (
             patch(
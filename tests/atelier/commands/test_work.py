@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
@@ -88,6 +89,47 @@ def test_start_worker_non_dry_run_previews_and_cleans_agent_home(
     cleanup_agent_home.assert_called_once_with(session_agent, project_dir=tmp_path)
 
 
+def test_start_worker_watch_mode_waits_on_store_and_hook_changes(tmp_path: Path) -> None:
+    project_root = tmp_path / "project"
+    repo_root = tmp_path / "repo"
+    project_root.mkdir()
+    repo_root.mkdir()
+    session_agent = AgentHome(
+        name="worker",
+        agent_id="atelier/worker/codex/p1",
+        role="worker",
+        path=tmp_path / "agents" / "worker" / "codex" / "p1",
+        session_key="p1",
+    )
+
+    with (
+        patch(
+            "atelier.commands.work.resolve_current_project_with_repo_root",
+            return_value=(project_root, _project_config(), str(repo_root), repo_root),
+        ),
+        patch("atelier.commands.work.config.resolve_project_data_dir", return_value=tmp_path),
+        patch(
+            "atelier.commands.work.agent_home.preview_agent_home",
+            return_value=session_agent,
+        ),
+        patch(
+            "atelier.commands.work.beads.ensure_agent_bead",
+            return_value={"id": "at-agent"},
+        ),
+        patch("atelier.commands.work.worker_runtime.run_worker_sessions") as run_sessions,
+        patch("atelier.commands.work.agent_teardown.teardown_agent_runtime"),
+        patch("atelier.commands.work.agent_home.cleanup_agent_home"),
+    ):
+        work_cmd.start_worker(
+            SimpleNamespace(epic_id=None, mode="auto", run_mode="watch", dry_run=False)
+        )
+
+    wait_for_change = run_sessions.call_args.kwargs["wait_for_change"]
+    watched = wait_for_change.__self__.paths
+    assert tmp_path / ".beads" / "metadata.json" in watched
+    assert session_agent.path / "hooks" in watched
+
+
 def test_start_worker_ignores_ambient_agent_id_role_mismatch(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -422,3 +464,59 @@ def test_start_worker_cli_select_overrides_project_default_non_dry_run(tmp_path:
 
     assert captured["args"].select == "first-eligible"
     assert captured["args"].agent_bead_id == "at-agent"
+
+
+def test_start_worker_pool_runs_members_with_shared_scheduler() -> None:
+    args = SimpleNamespace(epic_id=None, mode="auto", run_mode="watch", dry_run=True, pool=3)
+    with (
+        patch.dict(os.environ, {"ATELIER_WORK_YES": "1"}),
+        patch("atelier.commands.work.worker_runtime.run_worker_sessions") as run_sessions,
+    ):
+        work_cmd.start_worker(args)
+
+    assert run_sessions.call_count == 3
+    calls = run_sessions.call_args_list
+    member_args = {id(call.kwargs["args"]) for call in calls}
+    session_keys = {call.kwargs["session_key"] for call in calls}
+    schedulers = {id(call.kwargs["run_worker_once"].keywords["scheduler"]) for call in calls}
+    assert len(member_args) == 3
+    assert len(session_keys) == 3
+    assert len(schedulers) == 1
+    assert all(call.kwargs["args"].restart_on_update is False for call in calls)
+    assert all(call.kwargs["args"].yes is True for call in calls)
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"mode": "prompt"}, "--pool requires --mode auto"),
+        ({"queue": True}, "--pool cannot be combined with --queue"),
+        ({"epic_id": "at-epic"}, "--pool cannot be combined with an explicit epic id"),
+        ({"pool": 0}, "pool size must be a positive number of workers"),
+        ({"yes": False}, "--pool requires --yes (pool members cannot answer prompts)"),
+    ],
+)
+def test_start_worker_pool_rejects_incompatible_args(
+    overrides: dict[str, object], message: str
+) -> None:
+    values: dict[str, object] = {
+        "epic_id": None,
+        "mode": "auto",
+        "run_mode": "once",
+        "dry_run": True,
+        "pool": 2,
+        "yes": True,
+    }
+    values.update(overrides)
+    with (
+        patch.dict(os.environ, {"ATELIER_WORK_YES": ""}),
+        patch("atelier.commands.work.worker_runtime.run_worker_sessions") as run_sessions,
+        pytest.raises(SystemExit),
+        patch("atelier.worker.work_runtime_common.die", side_effect=SystemExit) as die_common,
+        patch("atelier.commands.work.die", side_effect=SystemExit) as die_work,
+    ):
+        work_cmd.start_worker(SimpleNamespace(**values))
+
+    run_sessions.assert_not_called()
+    reported = [call.args[0] for call in (*die_common.call_args_list, *die_work.call_args_list)]
+    assert reported == [message]
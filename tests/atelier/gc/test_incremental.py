@@ -0,0 +1,229 @@
+import datetime as dt
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import atelier.gc.incremental as gc_incremental
+import atelier.gc.worktrees as gc_worktrees
+from atelier.lib.beads import IssueRecord, ShowManyIssuesRequest
+
+_NOW = dt.datetime(2026, 3, 1, 12, 0, tzinfo=dt.timezone.utc)
+
+
+def _merged_changeset(issue_id: str, branch: str) -> dict[str, object]:
+    return {
+        "id": issue_id,
+        "status": "closed",
+        "labels": [f"workspace:{branch}"],
+        "description": (
+            f"workspace.root_branch: {branch}\n"
+            "workspace.parent_branch: main\n"
+            f"changeset.root_branch: {branch}\n"
+            f"changeset.work_branch: {branch}\n"
+            "pr_state: merged\n"
+        ),
+    }
+
+
+def test_parse_budget_accepts_counts_and_durations() -> None:
+    assert gc_incremental.parse_budget("200").items == 200
+    assert gc_incremental.parse_budget("90s").seconds == 90.0
+    assert gc_incremental.parse_budget("5M").seconds == 300.0
+
+
+@pytest.mark.parametrize("value", ["", "0", "-3", "2.5", "10h", "soon"])
+def test_parse_budget_rejects_invalid_values(value: str) -> None:
+    with pytest.raises(ValueError, match="invalid --budget"):
+        gc_incremental.parse_budget(value)
+
+
+def test_budget_stops_after_item_limit() -> None:
+    budget = gc_incremental.GcBudget(items=2)
+
+    assert [budget.take() for _ in range(3)] == [True, True, False]
+
+
+def test_checkpoint_round_trips_and_ignores_corrupt_files() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        checkpoint = gc_incremental.GcCheckpoint(
+            scanned_at=_NOW,
+            full_scan_at=_NOW - dt.timedelta(hours=2),
+            pending_changesets={"at-2", "at-1"},
+            integrated_branches={"main": {"feat/a": ["abc123"]}},
+        )
+
+        gc_incremental.save_checkpoint(project_dir, checkpoint)
+
+        assert gc_incremental.load_checkpoint(project_dir) == checkpoint
+
+        gc_incremental.checkpoint_path(project_dir).write_text("{not json", encoding="utf-8")
+
+        assert gc_incremental.load_checkpoint(project_dir) == gc_incremental.GcCheckpoint()
+
+
+def test_changeset_candidates_full_scan_without_cursor() -> None:
+    checkpoint = gc_incremental.GcCheckpoint(pending_changesets={"at-2", "at-gone"})
+    issues = [{"id": "at-1"}, {"id": "at-2"}]
+
+    with (
+        patch("atelier.beads.list_all_changesets", return_value=issues) as list_all,
+        patch("atelier.beads.run_bd_json") as run_bd_json,
+    ):
+        candidates = gc_incremental.changeset_candidates(
+            checkpoint, beads_root=Path("/beads"), repo_root=Path("/repo"), now=_NOW
+        )
+
+    list_all.assert_called_once()
+    run_bd_json.assert_not_called()
+    assert [issue["id"] for issue in candidates] == ["at-2", "at-1"]
+    assert checkpoint.pending_changesets == {"at-2"}
+    assert checkpoint.full_scan_at == _NOW
+
+
+def test_changeset_candidates_lists_changes_since_cursor_and_pending() -> None:
+    checkpoint = gc_incremental.GcCheckpoint(
+        scanned_at=_NOW - dt.timedelta(minutes=5),
+        full_scan_at=_NOW - dt.timedelta(hours=1),
+        pending_changesets={"at-old", "at-gone"},
+    )
+    changed = [
+        {"id": "at-new", "issue_type": "task"},
+        {"id": "at-epic", "issue_type": "epic"},
+        {"id": "at-parent", "issue_type": "task"},
+        {"id": "at-msg", "issue_type": "message"},
+        {"id": "at-other", "issue_type": "epic"},
+        {"id": "at-other.1", "issue_type": "task", "parent": "at-other"},
+    ]
+    children = {
+        "at-epic": [{"id": "at-epic.1", "issue_type": "task", "parent": "at-epic"}],
+        "at-parent": [{"id": "at-parent.1", "issue_type": "task", "parent": "at-parent"}],
+        "at-new": [{"id": "at-new.note", "issue_type": "message", "parent": "at-new"}],
+    }
+
+    def _list(args: list[str], *, beads_root: Path, cwd: Path):
+        if "--updated-after" in args:
+            return changed
+        return children.get(args[args.index("--parent") + 1], [])
+
+    with (
+        patch("atelier.beads.list_all_changesets") as list_all,
+        patch("atelier.beads.run_bd_json", side_effect=_list) as run_bd_json,
+        patch("atelier.gc.incremental.build_sync_beads_client") as build_client,
+    ):
+        build_client.return_value.show_many.return_value = (IssueRecord(id="at-old", type="task"),)
+        candidates = gc_incremental.changeset_candidates(
+            checkpoint, beads_root=Path("/beads"), repo_root=Path("/repo"), now=_NOW
+        )
+
+    list_all.assert_not_called()
+    # at-other is proven a container by its changed child, so only the other
+    # changed work issues get a child listing, and no full listing runs.
+    assert [call.args[0] for call in run_bd_json.call_args_list] == [
+        ["list", "--all", "--updated-after", "2026-03-01T11:53:00Z", "--limit", "0"],
+        ["list", "--parent", "at-new", "--all"],
+        ["list", "--parent", "at-epic", "--all"],
+        ["list", "--parent", "at-parent", "--all"],
+        ["list", "--parent", "at-other.1", "--all"],
+    ]
+    build_client.return_value.show_many.assert_called_once_with(
+        ShowManyIssuesRequest(issue_ids=("at-gone", "at-old"))
+    )
+    assert [issue["id"] for issue in candidates] == ["at-old", "at-new", "at-other.1"]
+    assert checkpoint.pending_changesets == {"at-old"}
+
+
+def test_changed_issues_lists_since_cursor_unless_full_scan_due() -> None:
+    checkpoint = gc_incremental.GcCheckpoint(
+        scanned_at=_NOW - dt.timedelta(minutes=5),
+        full_scan_at=_NOW - dt.timedelta(hours=1),
+    )
+    changed = [{"id": "at-msg", "issue_type": "message", "labels": ["cs:ready"]}]
+
+    with patch("atelier.beads.run_bd_json", return_value=changed) as run_bd_json:
+        listed = gc_incremental.changed_issues(
+            checkpoint, beads_root=Path("/beads"), repo_root=Path("/repo"), now=_NOW
+        )
+        candidates = gc_incremental.changeset_candidates(
+            checkpoint,
+            beads_root=Path("/beads"),
+            repo_root=Path("/repo"),
+            now=_NOW,
+            changed=listed,
+        )
+        due = gc_incremental.changed_issues(
+            gc_incremental.GcCheckpoint(scanned_at=_NOW),
+            beads_root=Path("/beads"),
+            repo_root=Path("/repo"),
+            now=_NOW,
+        )
+
+    assert listed == changed
+    assert candidates == []
+    assert due is None
+    run_bd_json.assert_called_once_with(
+        ["list", "--all", "--updated-after", "2026-03-01T11:53:00Z", "--limit", "0"],
+        beads_root=Path("/beads"),
+        cwd=Path("/repo"),
+    )
+
+
+def test_closed_workspace_cleanup_tracks_pending_and_reuses_integrated_tips() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        project_dir = root / "data"
+        repo_root = root / "repo"
+        project_dir.mkdir(parents=True, exist_ok=True)
+        repo_root.mkdir(parents=True, exist_ok=True)
+        issues = [
+            _merged_changeset("at-1", "feat-one"),
+            _merged_changeset("at-2", "feat-two"),
+            _merged_changeset("at-3", "feat-three"),
+            {"id": "at-open", "status": "open"},
+        ]
+        refs = {"refs/heads/main", "refs/heads/feat-one", "refs/heads/feat-three"}
+        checkpoint = gc_incremental.GcCheckpoint(pending_changesets={"at-open"})
+
+        def _collect(budget: gc_incremental.GcBudget | None):
+            return gc_worktrees.collect_closed_workspace_branches_without_mapping(
+                project_dir=project_dir,
+                beads_root=Path("/beads"),
+                repo_root=repo_root,
+                git_path="git",
+                issues=issues,
+                checkpoint=checkpoint,
+                budget=budget,
+            )
+
+        with (
+            patch("atelier.git.git_default_branch", return_value="main"),
+            patch(
+                "atelier.git.git_ref_exists",
+                side_effect=lambda repo, ref, git_path=None: ref in refs,
+            ),
+            patch(
+                "atelier.git.git_rev_parse",
+                side_effect=lambda repo, ref, git_path=None: f"sha-{ref}",
+            ),
+            patch("atelier.git.git_is_ancestor", return_value=True) as is_ancestor,
+            patch("atelier.git.git_branch_fully_applied", return_value=False),
+        ):
+            actions = _collect(gc_incremental.GcBudget(items=2))
+
+            # at-1 has a prunable branch; at-2 has nothing left to prune;
+            # at-3 is over budget.
+            assert [action.description for action in actions] == [
+                "Prune closed workspace artifacts for at-1"
+            ]
+            assert checkpoint.pending_changesets == {"at-1", "at-3"}
+            assert checkpoint.integrated_branches == {"main": {"feat-one": ["sha-feat-one"]}}
+            assert is_ancestor.call_count == 1
+
+            is_ancestor.reset_mock()
+            actions = _collect(None)
+
+        assert len(actions) == 2
+        assert is_ancestor.call_count == 1
+        assert checkpoint.pending_changesets == {"at-1", "at-3"}
@@ -228,6 +228,37 @@ def test_gc_remove_deprecated_label_removes_cs_labels() -> None:
         assert calls == [["update", "at-1", "--remove-label", label]]
 
 
+def test_gc_label_migrations_check_only_given_issues() -> None:
+    issues = [
+        {"id": "at-2", "labels": ["cs:ready"], "status": "open", "issue_type": "task"},
+        {"id": "at-1", "labels": ["at:epic"], "status": "hooked", "issue_type": "epic"},
+    ]
+
+    with patch(
+        "atelier.beads.run_bd_json",
+        side_effect=AssertionError("given issues must not be relisted"),
+    ):
+        removals = gc_labels.collect_remove_deprecated_label(
+            label="cs:ready",
+            detail="readiness inferred from open status",
+            beads_root=Path("/beads"),
+            repo_root=Path("/repo"),
+            issues=issues,
+        )
+        normalized = gc_labels.collect_normalize_epic_labels(
+            beads_root=Path("/beads"),
+            repo_root=Path("/repo"),
+            issues=issues,
+        )
+
+    assert [action.description for action in removals] == [
+        "Remove deprecated cs:ready label from at-2"
+    ]
+    assert [action.description for action in normalized] == [
+        "Normalize lifecycle status for epic at-1"
+    ]
+
+
 def test_gc_report_epic_identity_guardrails_returns_report_only_actions() -> None:
     report = SimpleNamespace(
         missing_executable_identity=(
@@ -587,6 +587,67 @@ def test_collect_orphan_worktrees_skips_non_bead_planner_mapping() -> None:
         assert actions == []
 
 
+def test_mapping_collectors_share_one_lookup_index_per_session() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        project_dir = root / "data"
+        repo_root = root / "repo"
+        repo_root.mkdir(parents=True, exist_ok=True)
+        meta_dir = worktrees.worktrees_root(project_dir) / worktrees.METADATA_DIRNAME
+        meta_dir.mkdir(parents=True, exist_ok=True)
+        epic = {"id": "at-open", "status": "in_progress", "labels": ["at:epic"]}
+
+        with (
+            patch("atelier.beads.list_epics", return_value=[epic]) as list_epics,
+            patch("atelier.beads.list_descendant_changesets", return_value=[]),
+        ):
+            for collect in (
+                gc_worktrees.collect_orphan_worktrees,
+                gc_worktrees.collect_resolved_epic_artifacts,
+            ):
+                assert (
+                    collect(
+                        project_dir=project_dir,
+                        beads_root=Path("/beads"),
+                        repo_root=repo_root,
+                        git_path="git",
+                    )
+                    == []
+                )
+            # No mapping files means nothing to resolve and no epic listing.
+            list_epics.assert_not_called()
+
+            worktrees.write_mapping(
+                worktrees.mapping_path(project_dir, "at-open"),
+                worktrees.WorktreeMapping(
+                    epic_id="at-open",
+                    worktree_path="worktrees/at-open",
+                    root_branch="feat/at-open",
+                    changesets={},
+                    changeset_worktrees={},
+                ),
+            )
+            with (
+                gc_worktrees.mapping_lookup_session(),
+                patch("atelier.gc.worktrees.git.git_default_branch", return_value="main"),
+            ):
+                for collect in (
+                    gc_worktrees.collect_orphan_worktrees,
+                    gc_worktrees.collect_resolved_epic_artifacts,
+                ):
+                    assert (
+                        collect(
+                            project_dir=project_dir,
+                            beads_root=Path("/beads"),
+                            repo_root=repo_root,
+                            git_path="git",
+                        )
+                        == []
+                    )
+
+        list_epics.assert_called_once()
+
+
 def test_collect_closed_workspace_branches_without_mapping_prunes_integrated_root() -> None:
     with tempfile.TemporaryDirectory() as tmp:
         root = Path(tmp)
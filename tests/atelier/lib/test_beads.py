@@ -9,6 +9,7 @@ from pydantic import ValidationError
 from atelier.lib.beads import (
     DEFAULT_COMPATIBILITY_POLICY,
     AsyncBeadsClient,
+    BatchingBeadsTransport,
     Beads,
     BeadsCapability,
     BeadsCommandError,
@@ -36,6 +37,7 @@ from atelier.lib.beads import (
     ScriptedBeadsTransport,
     SemanticVersion,
     ShowIssueRequest,
+    ShowManyIssuesRequest,
     SubprocessBeadsClient,
     SubprocessBeadsTransport,
     SupportedOperation,
@@ -43,6 +45,7 @@ from atelier.lib.beads import (
     SyncBeadsProtocol,
     UnsupportedVersionError,
     UpdateIssueRequest,
+    UpdateManyIssuesRequest,
     build_sync_beads_client,
     decode_help_output,
     decode_version_output,
@@ -190,6 +193,10 @@ class _FakeClient:
         del request
         return IssueRecord(id="at-1")
 
+    async def show_many(self, request: object) -> tuple[IssueRecord, ...]:
+        del request
+        return (IssueRecord(id="at-1"),)
+
     async def list(self, request: object) -> tuple[IssueRecord, ...]:
         del request
         return (IssueRecord(id="at-1"),)
@@ -206,6 +213,10 @@ class _FakeClient:
         del request
         return IssueRecord(id="at-1")
 
+    async def update_many(self, request: object) -> tuple[object, ...]:
+        del request
+        return ()
+
     async def close(self, request: object) -> IssueRecord:
         del request
         return IssueRecord(id="at-1")
@@ -801,6 +812,275 @@ def test_scripted_transport_replays_sequential_outcomes() -> None:
     ) == 2
 
 
+def test_subprocess_client_show_many_uses_one_bulk_show() -> None:
+    responses = _probe_responses()
+    responses[("bd", "show", "at-1", "at-2", "--json")] = BeadsCommandResult(
+        argv=("bd", "show", "at-1", "at-2", "--json"),
+        returncode=0,
+        stdout='[{"id":"at-1","issue_type":"task"},{"id":"at-2","issue_type":"task"}]',
+    )
+    transport = ScriptedBeadsTransport(responses)
+    client = SubprocessBeadsClient(transport=transport)
+
+    issues = _run(client.show_many(ShowManyIssuesRequest(issue_ids=("at-1", "at-2", "at-1"))))
+
+    assert [issue.id for issue in issues] == ["at-1", "at-2"]
+    assert [
+        request.argv
+        for request in transport.requests
+        if request.argv[1] == "show" and request.argv[-1] == "--json"
+    ] == [("bd", "show", "at-1", "at-2", "--json")]
+
+
+def test_subprocess_client_show_many_skips_missing_ids_after_bulk_failure() -> None:
+    responses = _probe_responses()
+    responses.update(
+        dict(
+            [
+                _result(
+                    ("bd", "show", "at-1", "at-missing", "--json"),
+                    stdout="",
+                    returncode=1,
+                    stderr="Error: no issue found matching at-missing",
+                ),
+                _result(
+                    ("bd", "show", "at-1", "--json"),
+                    stdout='[{"id":"at-1","issue_type":"task"}]',
+                ),
+                _result(
+                    ("bd", "show", "at-missing", "--json"),
+                    stdout="",
+                    returncode=1,
+                    stderr="Error: no issue found matching at-missing",
+                ),
+            ]
+        )
+    )
+    client = SubprocessBeadsClient(transport=ScriptedBeadsTransport(responses))
+
+    issues = _run(client.show_many(ShowManyIssuesRequest(issue_ids=("at-1", "at-missing"))))
+
+    assert [issue.id for issue in issues] == ["at-1"]
+
+
+def test_subprocess_client_show_many_raises_bulk_failures_that_are_not_missing_ids() -> None:
+    responses = _probe_responses()
+    responses.update(
+        dict(
+            [
+                _result(
+                    ("bd", "show", "at-1", "at-2", "--json"),
+                    stdout="",
+                    returncode=1,
+                    stderr="Error: failed to connect to dolt server",
+                ),
+            ]
+        )
+    )
+    transport = ScriptedBeadsTransport(responses)
+    client = SubprocessBeadsClient(transport=transport)
+
+    with pytest.raises(BeadsCommandError, match="failed to connect to dolt server"):
+        _run(client.show_many(ShowManyIssuesRequest(issue_ids=("at-1", "at-2"))))
+
+    assert ("bd", "show", "at-1", "--json") not in [request.argv for request in transport.requests]
+
+
+def test_subprocess_client_update_many_groups_identical_flags() -> None:
+    responses = _probe_responses()
+    responses.update(
+        [
+            _result(
+                ("bd", "update", "at-1", "at-2", "--json", "--status", "open"),
+                stdout='[{"id":"at-1","status":"open","issue_type":"task"}]',
+            ),
+            _result(
+                ("bd", "update", "at-2", "--json", "--status", "open"),
+                stdout="",
+                returncode=1,
+                stderr="Error: no issue found matching at-2",
+            ),
+            _result(
+                ("bd", "update", "at-3", "--json", "--status", "blocked"),
+                stdout='[{"id":"at-3","status":"blocked","issue_type":"task"}]',
+            ),
+        ]
+    )
+    transport = ScriptedBeadsTransport(responses)
+    client = SubprocessBeadsClient(transport=transport)
+
+    results = _run(
+        client.update_many(
+            UpdateManyIssuesRequest(
+                updates=(
+                    UpdateIssueRequest(issue_id="at-1", status="open"),
+                    UpdateIssueRequest(issue_id="at-3", status="blocked"),
+                    UpdateIssueRequest(issue_id="at-2", status="open"),
+                )
+            )
+        )
+    )
+
+    assert [(result.issue_id, result.ok) for result in results] == [
+        ("at-1", True),
+        ("at-3", True),
+        ("at-2", False),
+    ]
+    assert results[2].error is not None and "at-2" in results[2].error
+    assert [
+        request.argv
+        for request in transport.requests
+        if request.argv[1] == "update" and request.argv[-1] != "--help"
+    ] == [
+        ("bd", "update", "at-1", "at-2", "--json", "--status", "open"),
+        ("bd", "update", "at-2", "--json", "--status", "open"),
+        ("bd", "update", "at-3", "--json", "--status", "blocked"),
+    ]
+
+
+def test_batching_transport_merges_concurrent_shows_into_one_invocation() -> None:
+    responses = _probe_responses()
+    responses[("bd", "show", "at-1", "at-2", "--json")] = BeadsCommandResult(
+        argv=("bd", "show", "at-1", "at-2", "--json"),
+        returncode=0,
+        stdout='[{"id":"at-2","issue_type":"task"},{"id":"at-1","issue_type":"epic"}]',
+    )
+    inner = ScriptedBeadsTransport(responses)
+    client = SubprocessBeadsClient(transport=BatchingBeadsTransport(inner))
+
+    async def show_both() -> list[IssueRecord]:
+        await client.inspect_environment()
+        return list(
+            await asyncio.gather(
+                client.show(ShowIssueRequest(issue_id="at-1")),
+                client.show(ShowIssueRequest(issue_id="at-2")),
+                client.show(ShowIssueRequest(issue_id="at-1")),
+            )
+        )
+
+    first, second, repeated = _run(show_both())
+
+    assert (first.id, first.type) == ("at-1", "epic")
+    assert (second.id, second.type) == ("at-2", "task")
+    assert repeated == first
+    show_requests = [
+        request.argv for request in inner.requests if request.operation is SupportedOperation.SHOW
+    ]
+    assert show_requests == [("bd", "show", "at-1", "at-2", "--json")]
+
+
+def test_batching_transport_falls_back_to_single_shows_on_partial_failure() -> None:
+    responses = _probe_responses()
+    responses.update(
+        dict(
+            [
+                _result(
+                    ("bd", "show", "at-1", "at-missing", "--json"),
+                    stdout="",
+                    returncode=1,
+                    stderr="Error: issue not found: at-missing",
+                ),
+                _result(
+                    ("bd", "show", "at-1", "--json"),
+                    stdout='[{"id":"at-1","issue_type":"task"}]',
+                ),
+                _result(
+                    ("bd", "show", "at-missing", "--json"),
+                    stdout="",
+                    returncode=1,
+                    stderr="Error: issue not found: at-missing",
+                ),
+            ]
+        )
+    )
+    client = SubprocessBeadsClient(
+        transport=BatchingBeadsTransport(ScriptedBeadsTransport(responses))
+    )
+
+    async def show_both() -> list[IssueRecord | BaseException]:
+        await client.inspect_environment()
+        return list(
+            await asyncio.gather(
+                client.show(ShowIssueRequest(issue_id="at-1")),
+                client.show(ShowIssueRequest(issue_id="at-missing")),
+                return_exceptions=True,
+            )
+        )
+
+    found, missing = _run(show_both())
+
+    assert isinstance(found, IssueRecord) and found.id == "at-1"
+    assert isinstance(missing, BeadsCommandError)
+    assert "at-missing" in str(missing)
+
+
+def test_batching_transport_passes_mutations_through() -> None:
+    inner = RecordingBeadsTransport()
+    transport = BatchingBeadsTransport(inner)
+    request = BeadsCommandRequest(
+        operation=SupportedOperation.UPDATE,
+        argv=("bd", "update", "at-1", "--json", "--status", "closed"),
+    )
+
+    async def run_twice() -> None:
+        await asyncio.gather(transport.execute(request), transport.execute(request))
+
+    _run(run_twice())
+
+    assert inner.requests == [request, request]
+
+
+def test_batching_transport_does_not_share_reads_across_writes() -> None:
+    list_request = BeadsCommandRequest(
+        operation=SupportedOperation.LIST,
+        argv=("bd", "list", "--json"),
+    )
+    update_request = BeadsCommandRequest(
+        operation=SupportedOperation.UPDATE,
+        argv=("bd", "update", "at-1", "--json", "--status", "closed"),
+    )
+
+    class _GatedTransport(BeadsTransport):
+        def __init__(self) -> None:
+            self.requests: list[BeadsCommandRequest] = []
+            self.release_first_list = asyncio.Event()
+
+        async def execute(self, request: BeadsCommandRequest) -> BeadsCommandResult:
+            self.requests.append(request)
+            lists = sum(item.operation is SupportedOperation.LIST for item in self.requests)
+            if request.operation is SupportedOperation.LIST and lists == 1:
+                await self.release_first_list.wait()
+                return BeadsCommandResult(argv=request.argv, returncode=0, stdout="stale")
+            return BeadsCommandResult(argv=request.argv, returncode=0, stdout="fresh")
+
+    inner = _GatedTransport()
+    transport = BatchingBeadsTransport(inner)
+
+    async def interleave() -> tuple[BeadsCommandResult, BeadsCommandResult]:
+        before = asyncio.create_task(transport.execute(list_request))
+        await asyncio.sleep(0)
+
+        async def write_then_read() -> BeadsCommandResult:
+            await transport.execute(update_request)
+            return await transport.execute(list_request)
+
+        after = asyncio.create_task(write_then_read())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        inner.release_first_list.set()
+        return await before, await after
+
+    before, after = _run(interleave())
+
+    assert before.stdout == "stale"
+    assert after.stdout == "fresh"
+    assert [request.operation for request in inner.requests] == [
+        SupportedOperation.LIST,
+        SupportedOperation.UPDATE,
+        SupportedOperation.LIST,
+    ]
+
+
 def test_sync_beads_client_wraps_async_client() -> None:
     responses = _probe_responses()
     responses[("bd", "show", "at-1", "--json")] = BeadsCommandResult(
@@ -825,8 +1105,9 @@ def test_build_sync_beads_client_sets_beads_root_and_readonly(
     created: dict[str, object] = {}
 
     class _FakeSyncClient:
-        def __init__(self, async_client: object) -> None:
+        def __init__(self, async_client: object, *, runner: object = None) -> None:
             created["async_client"] = async_client
+            created["runner"] = runner
 
     def fake_subprocess_client(**kwargs: object) -> object:
         created["kwargs"] = kwargs
@@ -843,11 +1124,13 @@ def test_build_sync_beads_client_sets_beads_root_and_readonly(
 
     assert isinstance(client, _FakeSyncClient)
     assert created["kwargs"] == {
+        "transport": None,
         "cwd": Path("/repo"),
         "beads_root": Path("/repo/.beads"),
         "env": {"BEADS_DIR": "/repo/.beads"},
         "global_args": ("--readonly",),
     }
+    assert created["runner"] is None
 
 
 def test_subprocess_client_inspects_startup_state_from_configured_beads_root(
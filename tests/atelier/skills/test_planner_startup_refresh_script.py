@@ -7,6 +7,8 @@ from types import SimpleNamespace
 
 import pytest
 
+from atelier.planner_startup_check import StartupDeferredScan
+
 
 def _load_script():
     scripts_dir = (
@@ -37,12 +39,14 @@ def _startup_result(
     queued: list[dict[str, object]],
     epics: list[dict[str, object]],
     parity: object,
+    deferred_scan: object | None = None,
 ):
     return module.StartupCommandResult(
         inbox_messages=inbox,
         queued_messages=queued,
         epics=epics,
         parity_report=parity,
+        deferred_scan=deferred_scan or StartupDeferredScan(scan_limit=25),
     )
 
 
@@ -60,11 +64,6 @@ def test_render_startup_overview_reports_empty_sections(monkeypatch) -> None:
             parity=_parity_ok(),
         ),
     )
-    monkeypatch.setattr(
-        module.StartupBeadsInvocationHelper,
-        "list_descendant_changesets",
-        lambda *_args, **_kwargs: [],
-    )
     monkeypatch.setattr(
         module.planner_overview,
         "render_epics",
@@ -113,27 +112,6 @@ def test_render_startup_overview_lists_claim_state_and_sorts_messages(monkeypatc
             "claimed_by": "",
         },
     ]
-    calls: dict[str, object] = {}
-
-    def _fake_list_descendant_changesets(_self, parent_id: str, *, include_closed: bool):
-        calls.setdefault("descendant_calls", []).append((parent_id, include_closed))
-        if parent_id == "at-1":
-            return [
-                {"id": "at-1.2", "title": "Second deferred", "status": "deferred"},
-                {"id": "at-1.1", "title": "First deferred", "status": "deferred"},
-                {"id": "at-1.3", "title": "Ready now", "status": "open"},
-            ]
-        if parent_id == "at-2":
-            return [
-                {"id": "at-2.1", "title": "Blocked epic child", "status": "deferred"},
-            ]
-        return []
-
-    monkeypatch.setattr(
-        module.StartupBeadsInvocationHelper,
-        "list_descendant_changesets",
-        _fake_list_descendant_changesets,
-    )
     monkeypatch.setattr(
         module,
         "execute_startup_command_plan",
@@ -153,6 +131,22 @@ def test_render_startup_overview_lists_claim_state_and_sorts_messages(monkeypatc
                 missing_from_index=(),
                 in_parity=True,
             ),
+            deferred_scan=StartupDeferredScan(
+                groups=[
+                    (
+                        {"id": "at-2", "title": "Epic blocked", "status": "blocked"},
+                        [{"id": "at-2.1", "title": "Blocked epic child", "status": "deferred"}],
+                    ),
+                    (
+                        {"id": "at-1", "title": "Epic one", "status": "open"},
+                        [
+                            {"id": "at-1.2", "title": "Second deferred", "status": "deferred"},
+                            {"id": "at-1.1", "title": "First deferred", "status": "deferred"},
+                        ],
+                    ),
+                ],
+                scan_limit=25,
+            ),
         ),
     )
     monkeypatch.setattr(
@@ -190,20 +184,17 @@ def test_render_startup_overview_lists_claim_state_and_sorts_messages(monkeypatc
         "Open epics:",
         "- at-1 [open] Example",
     ]
-    assert calls["descendant_calls"] == [
-        ("at-1", False),
-        ("at-2", False),
-    ]
 
 
 def test_render_startup_overview_caps_deferred_epic_scan(monkeypatch) -> None:
     module = _load_script()
     monkeypatch.setattr(module, "_planner_runtime_preflight", lambda **_kwargs: ())
     monkeypatch.setenv("ATELIER_STARTUP_DEFERRED_EPIC_SCAN_LIMIT", "1")
-    monkeypatch.setattr(
-        module,
-        "execute_startup_command_plan",
-        lambda *_args, **_kwargs: _startup_result(
+    scan_limits: list[int] = []
+
+    def _fake_execute(*_args, deferred_scan_limit: int, **_kwargs):
+        scan_limits.append(deferred_scan_limit)
+        return _startup_result(
             module,
             inbox=[],
             queued=[],
@@ -219,17 +210,19 @@ def test_render_startup_overview_caps_deferred_epic_scan(monkeypatch) -> None:
                 missing_from_index=(),
                 in_parity=True,
             ),
-        ),
-    )
-    monkeypatch.setattr(
-        module.StartupBeadsInvocationHelper,
-        "list_descendant_changesets",
-        lambda _self, parent_id, *, include_closed: (
-            scanned_epics.append(parent_id)
-            or [{"id": f"{parent_id}.1", "title": "Deferred child", "status": "deferred"}]
-        ),
-    )
-    scanned_epics: list[str] = []
+            deferred_scan=StartupDeferredScan(
+                groups=[
+                    (
+                        {"id": "at-1", "title": "Epic one", "status": "open"},
+                        [{"id": "at-1.1", "title": "Deferred child", "status": "deferred"}],
+                    )
+                ],
+                scan_limit=deferred_scan_limit,
+                skipped_epics=2,
+            ),
+        )
+
+    monkeypatch.setattr(module, "execute_startup_command_plan", _fake_execute)
     monkeypatch.setattr(
         module.planner_overview,
         "render_epics",
@@ -242,7 +235,7 @@ def test_render_startup_overview_caps_deferred_epic_scan(monkeypatch) -> None:
         repo_root=Path("/repo"),
     )
 
-    assert scanned_epics == ["at-1"]
+    assert scan_limits == [1]
     assert rendered.splitlines() == [
         "Planner startup overview",
         "- Beads root: /beads",
@@ -347,11 +340,6 @@ def test_render_startup_overview_reports_identity_guardrail_remediation(monkeypa
             ),
         ),
     )
-    monkeypatch.setattr(
-        module.StartupBeadsInvocationHelper,
-        "list_descendant_changesets",
-        lambda *_args, **_kwargs: [],
-    )
     monkeypatch.setattr(
         module.planner_overview,
         "render_epics",
@@ -385,11 +373,6 @@ def test_render_startup_overview_passes_agent_id_to_command_plan(monkeypatch) ->
         )
 
     monkeypatch.setattr(module, "execute_startup_command_plan", _fake_execute)
-    monkeypatch.setattr(
-        module.StartupBeadsInvocationHelper,
-        "list_descendant_changesets",
-        lambda *_args, **_kwargs: [],
-    )
     monkeypatch.setattr(
         module.planner_overview,
         "render_epics",
@@ -501,11 +484,6 @@ def test_render_startup_overview_includes_runtime_preflight(monkeypatch) -> None
             parity=_parity_ok(),
         ),
     )
-    monkeypatch.setattr(
-        module.StartupBeadsInvocationHelper,
-        "list_descendant_changesets",
-        lambda *_args, **_kwargs: [],
-    )
     monkeypatch.setattr(
         module.planner_overview,
         "render_epics",
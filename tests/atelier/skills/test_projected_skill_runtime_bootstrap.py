@@ -836,6 +836,8 @@ def test_projected_refresh_overview_reorders_repo_src_ahead_of_installed_package
                     "    status: str",
                     "    detail: str",
                     "",
+                    "DEFAULT_DEFERRED_EPIC_SCAN_LIMIT = 25",
+                    "",
                     "def build_startup_triage_failure_model(**_kwargs):",
                     "    return None",
                     "",
@@ -877,6 +879,8 @@ def test_projected_refresh_overview_reorders_repo_src_ahead_of_installed_package
                     "class StartupCommandResult:",
                     "    pass",
                     "",
+                    "DEFAULT_DEFERRED_EPIC_SCAN_LIMIT = 25",
+                    "",
                     "def build_startup_triage_failure_model(**_kwargs):",
                     "    return None",
                     "",
@@ -995,6 +999,8 @@ def test_projected_refresh_overview_fails_closed_when_repo_runtime_is_dependency
                     "    status: str",
                     "    detail: str",
                     "",
+                    "DEFAULT_DEFERRED_EPIC_SCAN_LIMIT = 25",
+                    "",
                     "def build_startup_triage_failure_model(**_kwargs):",
                     "    return None",
                     "",
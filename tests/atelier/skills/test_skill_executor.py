@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+import atelier.skills as packaged_skills
+from atelier import skill_executor
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork") or not hasattr(socket, "send_fds"),
+    reason="warm skill executor needs fork and SCM_RIGHTS",
+)
+
+_PROBE_SCRIPT = """\
+import json
+import os
+import sys
+from pathlib import Path
+
+_SHARED = Path(__file__).resolve().parents[2] / "shared" / "scripts"
+sys.path.insert(0, str(_SHARED))
+
+from projected_bootstrap import bootstrap_projected_atelier_script
+
+bootstrap_projected_atelier_script(
+    script_path=Path(__file__).resolve(),
+    argv=sys.argv[1:],
+    require_runtime_health=__name__ == "__main__",
+)
+
+import atelier  # noqa: F401
+
+print(json.dumps({"pid": os.getpid(), "argv": sys.argv[1:], "cwd": os.getcwd(),
+                  "marker": os.environ.get("PROBE_MARKER")}))
+print("probe stderr", file=sys.stderr)
+sys.exit(3)
+"""
+
+_SIGNAL_PROBE_SCRIPT = """\
+import json
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+
+_SHARED = Path(__file__).resolve().parents[2] / "shared" / "scripts"
+sys.path.insert(0, str(_SHARED))
+
+from projected_bootstrap import bootstrap_projected_atelier_script
+
+bootstrap_projected_atelier_script(
+    script_path=Path(__file__).resolve(),
+    argv=sys.argv[1:],
+    require_runtime_health=__name__ == "__main__",
+)
+
+
+def _stop(signum, _frame):
+    os.write(1, f"got {signum}\\n".encode())
+    sys.exit(7)
+
+
+signal.signal(signal.SIGTERM, _stop)
+print(json.dumps({"pid": os.getpid()}), flush=True)
+time.sleep(60)
+"""
+
+
+def _project_repo_root() -> Path:
+    return Path(__file__).resolve().parents[3]
+
+
+def _load_projected_bootstrap(agent_home: Path) -> ModuleType:
+    path = agent_home / "skills" / "shared" / "scripts" / "projected_bootstrap.py"
+    spec = importlib.util.spec_from_file_location("projected_bootstrap_under_test", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run_probe(probe: Path, *, env: dict[str, str], cwd: Path) -> subprocess.Popen[str]:
+    return subprocess.Popen(
+        [sys.executable, str(probe), "--flag", "value"],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def test_projected_bootstrap_socket_path_matches_executor(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    agent_home = tmp_path / "agent-home"
+    packaged_skills.install_workspace_skills(agent_home)
+    bootstrap = _load_projected_bootstrap(agent_home)
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    monkeypatch.setattr("tempfile.tempdir", None)
+
+    assert bootstrap._executor_socket_path("/work/project") == skill_executor.socket_path(
+        "/work/project"
+    )
+    assert skill_executor.socket_path("/work/project").parent.parent == tmp_path
+
+
+def test_projected_bootstrap_source_identity_matches_executor(tmp_path: Path) -> None:
+    agent_home = tmp_path / "agent-home"
+    packaged_skills.install_workspace_skills(agent_home)
+    bootstrap = _load_projected_bootstrap(agent_home)
+    package_dir = Path(skill_executor.__file__).resolve().parent
+
+    assert bootstrap._executor_package_dir() == package_dir
+    assert bootstrap._executor_package_version(package_dir) == skill_executor.package_version(
+        package_dir
+    )
+    assert bootstrap._executor_package_fingerprint(
+        package_dir
+    ) == skill_executor.package_fingerprint(package_dir)
+
+
+def test_executor_refuses_requests_for_other_atelier_source(tmp_path: Path) -> None:
+    package_dir = tmp_path / "atelier"
+    package_dir.mkdir()
+    (package_dir / "_version.py").write_text("__version__ = version = '1.2.3'\n")
+    (package_dir / "__init__.py").write_text("")
+    script = tmp_path / "probe.py"
+    script.write_text("")
+    source = skill_executor._ServedSource(
+        package_dir=package_dir,
+        version=skill_executor.package_version(package_dir),
+        digest=skill_executor.package_fingerprint(package_dir),
+    )
+    request = {
+        "protocol": skill_executor.PROTOCOL_VERSION,
+        "script": str(script),
+        "argv": [],
+        "env": {},
+        "repo_root": None,
+        "version": "1.2.3",
+        "source_digest": source.digest,
+    }
+
+    def refusal(**changes: object) -> str | None:
+        return skill_executor._refusal_reason(
+            {**request, **changes}, fds=(0, 1, 2), repo_root=None, source=source
+        )
+
+    assert source.version == "1.2.3"
+    assert refusal() is None
+    assert "executor serves atelier '1.2.3'" in str(refusal(version="1.2.4"))
+    assert "source changed" in str(refusal(source_digest="0" * 16))
+    assert source.stale() is False
+    (package_dir / "__init__.py").write_text("VALUE = 1\n")
+    assert source.stale() is True
+
+
+def _executor_env(tmp_path: Path, probe_script: str) -> tuple[Path, Path, dict[str, str], Path]:
+    agent_home = tmp_path / "agent-home"
+    packaged_skills.install_workspace_skills(agent_home)
+    probe = agent_home / "skills" / "probe" / "scripts" / "probe.py"
+    probe.parent.mkdir(parents=True)
+    probe.write_text(probe_script, encoding="utf-8")
+    temp_root = tmp_path / "tmp"
+    temp_root.mkdir()
+    repo_root = _project_repo_root()
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith("ATELIER_") and key != "PYTHONPATH"
+    }
+    env.update(
+        {
+            "TMPDIR": str(temp_root),
+            "ATELIER_PROJECT": str(repo_root),
+            "PROBE_MARKER": "warm",
+        }
+    )
+    socket_file = (
+        temp_root / f"atelier-{os.getuid()}" / skill_executor.socket_path(str(repo_root)).name
+    )
+    return agent_home, probe, env, socket_file
+
+
+def _start_executor(
+    agent_home: Path, env: dict[str, str], socket_file: Path
+) -> subprocess.Popen[str]:
+    launcher = agent_home / "skills" / "shared" / "scripts" / "skill_executor.py"
+    executor = subprocess.Popen(
+        [sys.executable, str(launcher), "--idle-seconds", "60"],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    deadline = time.monotonic() + 30
+    while not socket_file.exists():
+        assert executor.poll() is None, executor.communicate()
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    return executor
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_warm_executor_runs_projected_script_and_falls_back_when_stopped(
+    tmp_path: Path,
+) -> None:
+    agent_home, probe, env, socket_file = _executor_env(tmp_path, _PROBE_SCRIPT)
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    executor = _start_executor(agent_home, env, socket_file)
+    try:
+        warm = _run_probe(probe, env=env, cwd=workdir)
+        stdout, stderr = warm.communicate(timeout=30)
+        assert warm.returncode == 3, stderr
+        report = json.loads(stdout)
+        assert report["pid"] != warm.pid
+        assert report["argv"] == ["--flag", "value"]
+        assert Path(report["cwd"]) == workdir.resolve()
+        assert report["marker"] == "warm"
+        assert "probe stderr" in stderr
+
+        disabled = _run_probe(probe, env={**env, "ATELIER_SKILL_EXECUTOR": "0"}, cwd=workdir)
+        stdout, stderr = disabled.communicate(timeout=30)
+        assert disabled.returncode == 3, stderr
+        assert json.loads(stdout)["pid"] == disabled.pid
+    finally:
+        executor.terminate()
+        executor.wait(timeout=30)
+
+    assert not socket_file.exists()
+    socket_file.touch()
+    cold = _run_probe(probe, env=env, cwd=workdir)
+    stdout, stderr = cold.communicate(timeout=30)
+    assert cold.returncode == 3, stderr
+    assert json.loads(stdout)["pid"] == cold.pid
+
+
+def test_warm_executor_forwards_signals_and_stops_orphaned_scripts(tmp_path: Path) -> None:
+    agent_home, probe, env, socket_file = _executor_env(tmp_path, _SIGNAL_PROBE_SCRIPT)
+    executor = _start_executor(agent_home, env, socket_file)
+    try:
+        signaled = _run_probe(probe, env=env, cwd=tmp_path)
+        assert signaled.stdout is not None
+        ready = json.loads(signaled.stdout.readline())
+        assert ready["pid"] != signaled.pid
+        signaled.send_signal(signal.SIGTERM)
+        stdout, stderr = signaled.communicate(timeout=30)
+        assert signaled.returncode == 7, stderr
+        assert f"got {int(signal.SIGTERM)}" in stdout
+
+        orphaned = _run_probe(probe, env=env, cwd=tmp_path)
+        assert orphaned.stdout is not None
+        child_pid = json.loads(orphaned.stdout.readline())["pid"]
+        orphaned.kill()
+        orphaned.communicate(timeout=30)
+        deadline = time.monotonic() + 10
+        while _pid_alive(child_pid):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+    finally:
+        executor.terminate()
+        executor.wait(timeout=30)
+
+
+def test_warm_executor_exits_when_its_atelier_source_changes(tmp_path: Path) -> None:
+    agent_home, probe, env, socket_file = _executor_env(tmp_path, _PROBE_SCRIPT)
+    edited = Path(skill_executor.__file__).resolve()
+    original = edited.stat()
+    executor = _start_executor(agent_home, env, socket_file)
+    try:
+        os.utime(edited, ns=(original.st_atime_ns, original.st_mtime_ns + 1_000_000_000))
+        cold = _run_probe(probe, env=env, cwd=tmp_path)
+        stdout, stderr = cold.communicate(timeout=30)
+        assert cold.returncode == 3, stderr
+        assert json.loads(stdout)["pid"] == cold.pid
+        executor.wait(timeout=30)
+    finally:
+        os.utime(edited, ns=(original.st_atime_ns, original.st_mtime_ns))
+        if executor.poll() is None:
+            executor.terminate()
+            executor.wait(timeout=30)
+
+    assert executor.returncode == 0
+    assert not socket_file.exists()
@@ -370,3 +370,29 @@ class TestAgentSpec:
         assert len(warnings) == 1
         assert "ATELIER_AGENT_ID" in warnings[0]
         assert env["ATELIER_AGENT_ID"] == "planner/test-session"
+
+
+def test_scoped_thread_agent_env_is_isolated_per_thread() -> None:
+    import threading
+
+    seen: dict[str, dict[str, str]] = {}
+
+    def member(agent_id: str, ready: threading.Barrier) -> None:
+        with agents.scoped_thread_agent_env(agent_id):
+            ready.wait()
+            seen[agent_id] = agents.thread_agent_env()
+
+    ready = threading.Barrier(2)
+    threads = [
+        threading.Thread(target=member, args=(agent_id, ready))
+        for agent_id in ("atelier/worker/codex/p1", "atelier/worker/codex/p2")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen["atelier/worker/codex/p1"]["BD_ACTOR"] == "atelier/worker/codex/p1"
+    assert seen["atelier/worker/codex/p2"]["BEADS_AGENT_NAME"] == "atelier/worker/codex/p2"
+    assert agents.thread_agent_env() == {}
+    assert "ATELIER_AGENT_ID" not in os.environ or os.environ["ATELIER_AGENT_ID"] not in seen
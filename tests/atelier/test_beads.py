@@ -917,6 +917,105 @@ def test_run_bd_json_read_only_returns_payload_without_error() -> None:
     assert error is None
 
 
+def test_update_issues_groups_identical_flags_and_retries_failed_groups() -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str], **_kwargs: object) -> CompletedProcess[str]:
+        calls.append(list(args))
+        failed = "at-bad" in args
+        return CompletedProcess(
+            args=["bd", *args],
+            returncode=1 if failed else 0,
+            stdout="",
+            stderr="no issue found" if failed else "",
+        )
+
+    with patch("atelier.beads.run_bd_command", side_effect=fake_run):
+        outcomes = beads.update_issues(
+            [
+                ("at-1", ("--remove-label", "at:unread")),
+                ("at-bad", ("--remove-label", "at:unread")),
+                ("at-2", ("--status", "open")),
+                ("at-3", ("--remove-label", "at:unread")),
+            ],
+            beads_root=Path("/beads"),
+            cwd=Path("/repo"),
+        )
+
+    assert calls == [
+        ["update", "at-1", "at-bad", "at-3", "--remove-label", "at:unread"],
+        ["update", "at-1", "--remove-label", "at:unread"],
+        ["update", "at-bad", "--remove-label", "at:unread"],
+        ["update", "at-3", "--remove-label", "at:unread"],
+        ["update", "at-2", "--status", "open"],
+    ]
+    assert [(outcome.issue_id, outcome.ok) for outcome in outcomes] == [
+        ("at-1", True),
+        ("at-bad", False),
+        ("at-2", True),
+        ("at-3", True),
+    ]
+    assert outcomes[1].detail == "no issue found"
+
+
+def test_update_issue_queues_on_active_batch_until_flush() -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str], **_kwargs: object) -> CompletedProcess[str]:
+        calls.append(list(args))
+        return CompletedProcess(args=["bd", *args], returncode=0, stdout="", stderr="")
+
+    with patch("atelier.beads.run_bd_command", side_effect=fake_run):
+        with beads.issue_update_batch(beads_root=Path("/beads"), cwd=Path("/repo")) as batch:
+            for issue_id in ("at-1", "at-2"):
+                beads.update_issue(
+                    issue_id,
+                    ("--status", "open"),
+                    beads_root=Path("/beads"),
+                    cwd=Path("/repo"),
+                )
+            assert calls == []
+        beads.update_issue(
+            "at-3",
+            ("--status", "open"),
+            beads_root=Path("/beads"),
+            cwd=Path("/repo"),
+        )
+
+    assert calls == [
+        ["update", "at-1", "at-2", "--status", "open"],
+        ["update", "at-3", "--status", "open"],
+    ]
+    assert batch.failures == ()
+
+
+def test_issue_update_batch_keeps_per_issue_order_and_discards_on_error() -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str], **_kwargs: object) -> CompletedProcess[str]:
+        calls.append(list(args))
+        return CompletedProcess(args=["bd", *args], returncode=0, stdout="", stderr="")
+
+    with patch("atelier.beads.run_bd_command", side_effect=fake_run):
+        with beads.issue_update_batch(beads_root=Path("/beads"), cwd=Path("/repo")):
+            for flags in (("--status", "blocked"), ("--status", "open")):
+                beads.update_issue("at-1", flags, beads_root=Path("/beads"), cwd=Path("/repo"))
+        assert calls == [
+            ["update", "at-1", "--status", "blocked"],
+            ["update", "at-1", "--status", "open"],
+        ]
+
+        calls.clear()
+        with pytest.raises(RuntimeError):
+            with beads.issue_update_batch(beads_root=Path("/beads"), cwd=Path("/repo")):
+                beads.update_issue(
+                    "at-2", ("--status", "open"), beads_root=Path("/beads"), cwd=Path("/repo")
+                )
+                raise RuntimeError("boom")
+
+    assert calls == []
+
+
 def test_run_bd_json_read_only_includes_command_and_stream_details_on_failure() -> None:
     with patch(
         "atelier.beads.run_bd_command",
@@ -1131,6 +1230,42 @@ def test_run_bd_command_preflight_recovers_dolt_server_before_command(
     assert restart.call_count == 1
 
 
+def test_run_bd_command_reuses_healthy_preflight_until_command_fails(
+    tmp_path: Path,
+) -> None:
+    beads_root = tmp_path / ".beads"
+    (beads_root / "dolt").mkdir(parents=True)
+    cwd = tmp_path / "repo"
+    cwd.mkdir()
+    returncodes = [0, 1, 0]
+
+    def fake_run_with_runner(
+        request: exec_util.CommandRequest,
+    ) -> exec_util.CommandResult | None:
+        return exec_util.CommandResult(
+            argv=request.argv,
+            returncode=returncodes.pop(0),
+            stdout="[]",
+            stderr="",
+        )
+
+    with (
+        patch("atelier.beads.bd_invocation.ensure_supported_bd_version") as version_check,
+        patch(
+            "atelier.beads._probe_dolt_server_health",
+            return_value=(True, None),
+        ) as probe_health,
+        patch("atelier.beads._startup_state_diagnostics", return_value="startup-diag"),
+        patch("atelier.beads.exec.run_with_runner", side_effect=fake_run_with_runner),
+    ):
+        beads.run_bd_command(["list", "--json"], beads_root=beads_root, cwd=cwd)
+        beads.run_bd_command(["list", "--json"], beads_root=beads_root, cwd=cwd, allow_failure=True)
+        beads.run_bd_command(["list", "--json"], beads_root=beads_root, cwd=cwd)
+
+    assert probe_health.call_count == 2
+    assert version_check.call_count == 2
+
+
 def test_run_bd_command_preflight_fails_closed_for_wrong_active_database(
     tmp_path: Path,
 ) -> None:
@@ -4621,6 +4756,167 @@ def test_claim_queue_message_and_mark_read_with_in_memory_backend(
     assert all_messages[0]["claimed_by"] == agent_id
 
 
+def test_message_inbox_session_fetches_only_changed_message_beads(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    beads_root = tmp_path / ".beads"
+    repo_root = tmp_path / "repo"
+    beads_root.mkdir()
+    repo_root.mkdir()
+    builder = IssueFixtureBuilder()
+    backend = InMemoryBeadsBackend(
+        seeded_issues=(
+            builder.issue(
+                "msg-1",
+                labels=("at:message", "at:unread"),
+                description="---\nqueue: triage\n---\n\nFirst\n",
+            ),
+            builder.issue(
+                "msg-2",
+                labels=("at:message", "at:unread"),
+                description="---\nqueue: triage\n---\n\nSecond\n",
+            ),
+        )
+    )
+    monkeypatch.setenv("BD_ACTOR", "atelier/planner/codex/p1")
+    list_calls: list[list[str]] = []
+    real_run_bd_json = beads.run_bd_json
+
+    def recording_run_bd_json(args: list[str], **kwargs: object) -> list[dict[str, object]]:
+        if args[:1] == ["list"]:
+            list_calls.append(list(args))
+        return real_run_bd_json(args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(beads, "run_bd_json", recording_run_bd_json)
+
+    with (
+        patch_in_memory_beads(backend),
+        beads.message_inbox_session(beads_root=beads_root),
+        patch("atelier.beads.messages.parse_message", wraps=beads.messages.parse_message) as parse,
+    ):
+        first = beads.list_queue_messages(beads_root=beads_root, cwd=repo_root)
+        beads.mark_message_read("msg-1", beads_root=beads_root, cwd=repo_root)
+        third = backend.state.create(
+            title="Third",
+            issue_type="task",
+            labels=("at:message", "at:unread"),
+            description="---\nqueue: triage\n---\n\nThird\n",
+        )
+        second = beads.list_queue_messages(beads_root=beads_root, cwd=repo_root)
+
+    assert [item["id"] for item in first] == ["msg-1", "msg-2"]
+    assert [item["id"] for item in second] == ["msg-2", third["id"]]
+    assert list_calls[0] == ["list", "--label", "at:message", "--label", "at:unread"]
+    assert list_calls[1][:7] == [
+        "list",
+        "--label",
+        "at:message",
+        "--limit",
+        "0",
+        "--all",
+        "--updated-after",
+    ]
+    # msg-2 did not change, so only the two new payloads were parsed again.
+    parsed_bodies = [call.args[0] for call in parse.call_args_list]
+    assert sum("Second" in body for body in parsed_bodies) == 1
+
+
+def test_message_inbox_session_refresh_lists_every_changed_message(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    beads_root = tmp_path / ".beads"
+    repo_root = tmp_path / "repo"
+    beads_root.mkdir()
+    repo_root.mkdir()
+    backend = InMemoryBeadsBackend(
+        seeded_issues=(
+            IssueFixtureBuilder().issue(
+                "msg-0",
+                labels=("at:message", "at:unread"),
+                description="---\nqueue: triage\n---\n\nSeed\n",
+            ),
+        )
+    )
+    real_run_bd_json = beads.run_bd_json
+    default_limit = 50
+
+    def capped_run_bd_json(args: list[str], **kwargs: object) -> list[dict[str, object]]:
+        issues = real_run_bd_json(args, **kwargs)  # type: ignore[arg-type]
+        if args[:1] == ["list"] and "--limit" not in args:
+            return issues[:default_limit]
+        return issues
+
+    monkeypatch.setattr(beads, "run_bd_json", capped_run_bd_json)
+
+    with (
+        patch_in_memory_beads(backend),
+        beads.message_inbox_session(beads_root=beads_root),
+    ):
+        first = beads.list_queue_messages(beads_root=beads_root, cwd=repo_root)
+        created = [
+            backend.state.create(
+                title=f"Message {index}",
+                issue_type="task",
+                labels=("at:message", "at:unread"),
+                description=f"---\nqueue: triage\n---\n\nBody {index}\n",
+            )
+            for index in range(default_limit + 10)
+        ]
+        second = beads.list_queue_messages(beads_root=beads_root, cwd=repo_root)
+
+    assert [item["id"] for item in first] == ["msg-0"]
+    assert sorted(str(item["id"]) for item in second) == sorted(
+        ["msg-0", *(str(item["id"]) for item in created)]
+    )
+
+
+def test_message_inbox_session_drops_reassigned_and_matches_store_message_kinds(
+    tmp_path: Path,
+) -> None:
+    beads_root = tmp_path / ".beads"
+    repo_root = tmp_path / "repo"
+    beads_root.mkdir()
+    repo_root.mkdir()
+    builder = IssueFixtureBuilder()
+    backend = InMemoryBeadsBackend(
+        seeded_issues=(
+            builder.issue("msg-1", labels=("at:message", "at:unread"), assignee="agent-a"),
+            builder.issue("msg-plain", labels=("message", "unread")),
+            builder.issue("msg-foreign", labels=("ext:message", "ext:unread")),
+            builder.issue("msg-typed", issue_type="message", labels=("at:unread",)),
+            builder.issue("task-1", labels=("at:unread",)),
+        )
+    )
+
+    with patch_in_memory_beads(backend), beads.message_inbox_session(beads_root=beads_root):
+        inbox = beads.list_inbox_messages("agent-a", beads_root=beads_root, cwd=repo_root)
+        contract = beads.list_message_beads(
+            beads_root=beads_root, cwd=repo_root, match_contract=True
+        )
+        backend.state.update("msg-1", assignee="agent-b")
+        backend.state.update("msg-plain", remove_labels=("unread",))
+        reassigned = beads.list_inbox_messages("agent-a", beads_root=beads_root, cwd=repo_root)
+        contract_delta = beads.list_message_beads(
+            beads_root=beads_root, cwd=repo_root, match_contract=True
+        )
+
+    assert [item["id"] for item in inbox] == ["msg-1"]
+    assert reassigned == []
+    assert sorted(str(item["id"]) for item in contract) == [
+        "msg-1",
+        "msg-foreign",
+        "msg-plain",
+        "msg-typed",
+    ]
+    assert sorted(str(item["id"]) for item in contract_delta) == [
+        "msg-1",
+        "msg-foreign",
+        "msg-typed",
+    ]
+
+
 def test_close_epic_if_complete_clears_hook_with_in_memory_backend(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -5346,6 +5642,42 @@ def test_list_descendant_changesets_walks_tree() -> None:
     assert set(calls) == {"epic-1", "epic-1.1", "epic-1.2", "epic-1.1.1"}
 
 
+def test_issue_snapshot_answers_tree_queries_from_two_bd_calls() -> None:
+    calls: list[list[str]] = []
+
+    def work(issue_id: str, parent: str, status: str = "open") -> dict[str, object]:
+        return {"id": issue_id, "labels": [], "type": "task", "parent": parent, "status": status}
+
+    issues = [
+        {"id": "epic-1", "labels": ["at:epic"], "type": "epic", "status": "open"},
+        {"id": "epic-2", "labels": ["at:epic"], "type": "epic", "status": "closed"},
+        work("epic-1.1", "epic-1"),
+        work("epic-1.2", "epic-1"),
+        work("epic-1.1.1", "epic-1.1"),
+        {"id": "agent-1", "labels": ["at:agent"], "status": "closed"},
+    ]
+
+    def fake_json(args: list[str], *, beads_root: Path, cwd: Path) -> list[dict[str, object]]:
+        calls.append(args)
+        if args[0] == "ready":
+            return [{"id": "epic-1.1.1"}, {"id": "epic-2"}]
+        return list(issues)
+
+    with patch("atelier.beads.run_bd_json", side_effect=fake_json):
+        snapshot = beads.load_issue_snapshot(beads_root=Path("/beads"), cwd=Path("/repo"))
+
+    assert calls == [["list", "--all", "--limit", "0"], ["ready", "--limit", "0"]]
+    assert [issue["id"] for issue in snapshot.epics()] == ["epic-1", "epic-2"]
+    assert [issue["id"] for issue in snapshot.descendant_changesets("epic-1")] == [
+        "epic-1.2",
+        "epic-1.1.1",
+    ]
+    assert [issue["id"] for issue in snapshot.changesets_for_epic(issues[1])] == ["epic-2"]
+    assert [issue["id"] for issue in snapshot.ready_descendants("epic-1")] == ["epic-1.1.1"]
+    assert snapshot.labeled("agent") == []
+    assert [issue["id"] for issue in snapshot.labeled("agent", include_closed=True)] == ["agent-1"]
+
+
 def test_list_child_changesets_uses_graph_inference() -> None:
     """list_child_changesets infers leaf work beads from graph."""
     with patch("atelier.beads.run_bd_json", return_value=[]) as run_json:
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def _load_script_module():
+    script_path = Path(__file__).resolve().parents[2] / "scripts" / "benchmark_scale.py"
+    spec = importlib.util.spec_from_file_location("benchmark_scale", script_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_synthetic_issues_build_dependency_dags_and_inboxes() -> None:
+    module = _load_script_module()
+    profile = module.ScaleProfile(epics=2, changesets_per_epic=6, messages=3, agents=2)
+
+    issues, slots = module.build_synthetic_issues(profile)
+
+    by_id = {issue["id"]: issue for issue in issues}
+    assert len(by_id) == 2 + 2 * 6 + 2 + 3
+    assert [ref["id"] for ref in by_id["at-1.6"]["dependencies"]] == ["at-1.3", "at-1.5"]
+    assert [ref["id"] for ref in by_id["at-1.5"]["dependencies"]] == ["at-1.2"]
+    assert slots == {"at-agent-1": {"hook": "at-1"}, "at-agent-2": {"hook": "at-2"}}
+    assert {by_id[f"at-msg-{index}"]["assignee"] for index in range(1, 4)} == {
+        "atelier/worker/codex/p1",
+        "atelier/worker/codex/p2",
+    }
+
+
+def test_run_benchmarks_records_command_counts_offline() -> None:
+    module = _load_script_module()
+    profile = module.ScaleProfile(epics=2, changesets_per_epic=4, messages=2, agents=1)
+
+    results = module.run_benchmarks(
+        profile,
+        repeat=1,
+        operations=["select_global_startup_candidates", "next_changeset_service"],
+    )
+
+    assert [result.name for result in results] == [
+        "select_global_startup_candidates",
+        "next_changeset_service",
+    ]
+    assert all(result.commands.get("bd", 0) > 0 for result in results)
+    assert all(len(result.seconds) == 1 for result in results)
+
+    baseline = {"operations": [result.to_payload() for result in results]}
+    assert module.compare_to_baseline(results, baseline) == []
+    baseline["operations"][0]["commands"]["bd"] = 0
+    assert module.compare_to_baseline(results, baseline) == [
+        "select_global_startup_candidates: bd commands "
+        f"{results[0].commands['bd']} exceed baseline 0"
+    ]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def _load_script_module():
+    script_path = Path(__file__).resolve().parents[2] / "scripts" / "benchmark_startup.py"
+    spec = importlib.util.spec_from_file_location("benchmark_startup", script_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_hook_help_and_version_do_not_import_deferred_modules() -> None:
+    module = _load_script_module()
+
+    results = module.measure_startup(repeat=1)
+
+    assert [result.name for result in results] == ["hook --help", "--version"]
+    assert {result.name: result.deferred_imports for result in results} == {
+        "hook --help": [],
+        "--version": [],
+    }
+    assert all(result.best_import_seconds > 0 for result in results)
+
+
+def test_find_regressions_reports_deferred_imports_budget_and_baseline() -> None:
+    module = _load_script_module()
+    result = module.StartupResult(
+        name="hook --help",
+        seconds=[0.2],
+        import_seconds=[0.1],
+        deferred_imports=module.deferred_imports(["atelier.cli", "atelier.worker.runtime"]),
+    )
+
+    assert module.find_regressions(
+        [result],
+        budget_ms=50.0,
+        baseline={"invocations": [{"name": "hook --help", "best_import_seconds": 0.05}]},
+    ) == [
+        "hook --help: imports deferred modules atelier.worker",
+        "hook --help: import time 100.0ms exceeds budget 50.0ms",
+        "hook --help: import time 100.0ms exceeds baseline 50.0ms by more than 25%",
+    ]
+    result.deferred_imports = []
+    assert module.find_regressions([result], budget_ms=250.0) == []
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from atelier import command_trace
+from atelier import exec as exec_util
+from atelier.lib.beads import BeadsCommandRequest, SubprocessBeadsTransport, SupportedOperation
+from atelier.worker import telemetry as worker_telemetry
+
+
+class _FakeRunner:
+    def run(self, request: exec_util.CommandRequest) -> exec_util.CommandResult | None:
+        if request.argv[0] == "dolt":
+            return None
+        return exec_util.CommandResult(
+            argv=request.argv,
+            returncode=1 if request.argv[0].endswith("gh") else 0,
+            stdout="",
+            stderr="",
+        )
+
+
+def test_run_with_runner_records_category_stage_and_exit_code() -> None:
+    runner = _FakeRunner()
+    exec_util.run_with_runner(exec_util.CommandRequest(argv=("git", "status")), runner=runner)
+
+    with command_trace.recording() as recorder:
+        with command_trace.command_stage("Select changeset"):
+            exec_util.run_with_runner(exec_util.CommandRequest(argv=("bd", "ready")), runner=runner)
+        exec_util.run_with_runner(
+            exec_util.CommandRequest(argv=("/usr/bin/gh", "api")), runner=runner
+        )
+        exec_util.run_with_runner(exec_util.CommandRequest(argv=("dolt", "sql")), runner=runner)
+        exec_util.run_with_runner(exec_util.CommandRequest(argv=("jq", ".")), runner=runner)
+
+    records = recorder.records()
+    assert [(record.category, record.stage, record.returncode) for record in records] == [
+        ("bd", "Select changeset", 0),
+        ("gh", None, 1),
+        ("dolt", None, None),
+        ("other", None, 0),
+    ]
+    summaries = {summary.category: summary for summary in recorder.summary()}
+    assert summaries["gh"].failures == 1
+    assert summaries["bd"].count == 1
+    assert not command_trace.recording_active()
+
+
+def test_worker_steps_set_stage_and_report_command_summary() -> None:
+    lines: list[str] = []
+    timings: list[tuple[str, float]] = []
+
+    with command_trace.recording() as recorder:
+        finish = worker_telemetry.step(
+            "Prime beads", timings=timings, trace=False, say=lines.append
+        )
+        exec_util.run_with_runner(
+            exec_util.CommandRequest(argv=("bd", "prime")), runner=_FakeRunner()
+        )
+        finish()
+        exec_util.run_with_runner(
+            exec_util.CommandRequest(argv=("git", "fetch")), runner=_FakeRunner()
+        )
+
+    assert [record.stage for record in recorder.records()] == ["Prime beads", None]
+    lines.clear()
+    worker_telemetry.report_command_summary(recorder.summary(), say=lines.append)
+    assert lines[0] == "Command summary:"
+    assert sorted(line.split(":")[0] for line in lines[1:]) == ["- bd", "- git"]
+    assert all("1 calls" in line for line in lines[1:])
+
+
+def test_scoped_recording_ignores_other_threads_but_follows_copied_contexts() -> None:
+    runner = _FakeRunner()
+
+    def _run(*argv: str) -> None:
+        exec_util.run_with_runner(exec_util.CommandRequest(argv=argv), runner=runner)
+
+    with command_trace.recording() as everything:
+        with command_trace.recording(scoped=True) as member:
+            _run("bd", "ready")
+            other = threading.Thread(target=_run, args=("git", "fetch"))
+            other.start()
+            other.join()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(contextvars.copy_context().run, _run, "gh", "api").result()
+
+    assert [record.category for record in member.records()] == ["bd", "gh"]
+    assert [record.category for record in everything.records()] == ["bd", "git", "gh"]
+
+
+def test_async_beads_transport_records_spawned_commands() -> None:
+    class _Process:
+        returncode = 0
+
+        async def communicate(self) -> tuple[bytes, bytes]:
+            return b"[]", b""
+
+        def kill(self) -> None:
+            return None
+
+    async def spawn(*_argv: str, cwd: str | None, env: object) -> _Process:
+        return _Process()
+
+    transport = SubprocessBeadsTransport(spawn=spawn)
+    request = BeadsCommandRequest(operation=SupportedOperation.LIST, argv=("bd", "list", "--json"))
+
+    with command_trace.recording() as recorder:
+        asyncio.run(transport.execute(request))
+
+    assert [(record.category, record.argv) for record in recorder.records()] == [
+        ("bd", ("bd", "list", "--json"))
+    ]
+
+
+def test_trace_file_from_env_writes_chrome_and_jsonl_traces(tmp_path: Path, monkeypatch) -> None:
+    for name in ("trace.json", "trace.jsonl"):
+        target = tmp_path / name
+        monkeypatch.setenv(command_trace.TRACE_FILE_ENV, str(target))
+        with command_trace.trace_file_from_env():
+            with command_trace.command_stage("gc"):
+                exec_util.run_with_runner(
+                    exec_util.CommandRequest(argv=("git", "worktree", "list")),
+                    runner=_FakeRunner(),
+                )
+
+    chrome = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))
+    assert [event["name"] for event in chrome["traceEvents"]] == ["git worktree"]
+    assert chrome["traceEvents"][0]["ph"] == "X"
+    assert chrome["traceEvents"][0]["args"]["stage"] == "gc"
+    lines = (tmp_path / "trace.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["argv"] for line in lines] == [["git", "worktree", "list"]]
+
+
+def test_bd_write_count_advances_only_for_bd_commands_that_may_write() -> None:
+    runner = _FakeRunner()
+    before = command_trace.bd_write_count()
+
+    for argv in (
+        ("bd", "--db", "/tmp/beads.db", "show", "at-1", "--json"),
+        ("bd", "list", "--parent", "at-1", "--json"),
+        ("bd", "--readonly", "update", "at-1"),
+        ("bd", "slot", "show", "at-agent", "--json"),
+        ("git", "commit", "-m", "update"),
+    ):
+        exec_util.run_with_runner(exec_util.CommandRequest(argv=argv), runner=runner)
+    unchanged = command_trace.bd_write_count()
+    exec_util.run_with_runner(
+        exec_util.CommandRequest(argv=("bd", "update", "at-1", "--status", "blocked")),
+        runner=runner,
+    )
+    exec_util.run_with_runner(
+        exec_util.CommandRequest(argv=("bd", "slot", "set", "at-agent", "hook", "at-1")),
+        runner=runner,
+    )
+    after = command_trace.bd_write_count()
+
+    assert unchanged == before
+    assert after.process - before.process == 2
+    assert after.thread - before.thread == 2
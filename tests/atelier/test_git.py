@@ -175,3 +175,92 @@ def test_resolve_repo_enlistment_forwards_git_path_to_enlistment_resolution() ->
     assert enlistment_path == str(repo_root)
     assert origin_raw is None
     assert origin is None
+
+
+def _seed_repo(repo_root: Path) -> str:
+    repo_root.mkdir(parents=True)
+    _run_git(repo_root, "init", "-b", "main")
+    _run_git(repo_root, "config", "user.email", "test@example.com")
+    _run_git(repo_root, "config", "user.name", "Test User")
+    _run_git(repo_root, "commit", "--allow-empty", "-m", "seed")
+    return _run_git(repo_root, "rev-parse", "HEAD").stdout.strip()
+
+
+def test_git_query_session_answers_refs_and_ancestry_without_spawning(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    seed = _seed_repo(repo_root)
+    _run_git(repo_root, "checkout", "-b", "feature")
+    _run_git(repo_root, "commit", "--allow-empty", "-m", "feature")
+    feature = _run_git(repo_root, "rev-parse", "HEAD").stdout.strip()
+
+    with git.git_query_session(repo_root):
+        assert git.git_rev_parse(repo_root, "feature") == feature
+        assert git.git_rev_parse(repo_root, "missing-branch") is None
+        assert git.git_ref_exists(repo_root, "refs/heads/main") is True
+        assert git.git_ref_exists(repo_root, "refs/heads/missing-branch") is False
+        assert git.git_is_ancestor(repo_root, "main", "feature") is True
+        assert git.git_is_ancestor(repo_root, "feature", "main") is False
+        assert git.git_is_ancestor(repo_root, "missing-branch", "main") is None
+        with patch("atelier.git._run_git_or_die") as run_git:
+            assert git.git_rev_parse(repo_root, "main") == seed
+            assert git.git_ref_exists(repo_root, "refs/heads/feature") is True
+            assert git.git_is_ancestor(repo_root, "main", "feature") is True
+            assert git.git_is_ancestor(repo_root, "feature", "feature") is True
+        run_git.assert_not_called()
+
+
+def test_git_query_session_reads_live_refs(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    seed = _seed_repo(repo_root)
+
+    with git.git_query_session(repo_root):
+        assert git.git_ref_exists(repo_root, "refs/heads/later") is False
+        _run_git(repo_root, "commit", "--allow-empty", "-m", "next")
+        _run_git(repo_root, "branch", "later")
+        head = _run_git(repo_root, "rev-parse", "HEAD").stdout.strip()
+
+        assert git.git_ref_exists(repo_root, "refs/heads/later") is True
+        assert git.git_rev_parse(repo_root, "later") == head
+        assert git.git_is_ancestor(repo_root, seed, "later") is True
+
+
+def test_git_query_session_falls_back_when_co_process_is_unavailable(tmp_path: Path) -> None:
+    missing_repo = tmp_path / "missing"
+    with (
+        git.git_query_session(missing_repo),
+        patch(
+            "atelier.git._run_git_or_die",
+            return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout="abc\n"),
+        ) as run_git,
+    ):
+        assert git.git_rev_parse(missing_repo, "HEAD") == "abc"
+
+    run_git.assert_called_once()
+
+
+def test_git_query_session_indexes_reachability_for_repeated_tips(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    _seed_repo(repo_root)
+    branches = []
+    for index in range(5):
+        branch = f"topic-{index}"
+        _run_git(repo_root, "commit", "--allow-empty", "-m", branch)
+        _run_git(repo_root, "branch", branch)
+        branches.append(branch)
+    _run_git(repo_root, "checkout", "-b", "unmerged", "topic-0")
+    _run_git(repo_root, "commit", "--allow-empty", "-m", "unmerged")
+
+    with git.git_query_session(repo_root):
+        with patch("atelier.git._run_git_or_die", wraps=git._run_git_or_die) as run_git:
+            assert all(git.git_is_ancestor(repo_root, branch, "main") for branch in branches)
+            assert git.git_is_ancestor(repo_root, "unmerged", "main") is False
+        commands = [call.args[0] for call in run_git.call_args_list]
+        # Early checks use merge-base; after that, main's tip is walked once.
+        assert sum("rev-list" in command for command in commands) == 1
+        assert sum("merge-base" in command for command in commands) == (
+            git._REACHABILITY_INDEX_MIN_QUERIES - 1
+        )
+
+        _run_git(repo_root, "checkout", "main")
+        _run_git(repo_root, "merge", "--no-edit", "unmerged")
+        assert git.git_is_ancestor(repo_root, "unmerged", "main") is True
@@ -33,6 +33,20 @@ def test_parse_message_without_frontmatter() -> None:
     assert payload.body == "No frontmatter here\n"
 
 
+def test_parse_message_returns_independent_metadata_for_memoized_descriptions() -> None:
+    rendered = messages.render_message({"queue": "triage", "cc": ["a", "b"]}, "Body")
+
+    first = messages.parse_message(rendered)
+    first.metadata["claimed_by"] = "atelier/worker/alice"
+    cc = first.metadata["cc"]
+    assert isinstance(cc, list)
+    cc.append("c")
+    second = messages.parse_message(rendered)
+
+    assert second.metadata == {"queue": "triage", "cc": ["a", "b"]}
+    assert second.body == "Body"
+
+
 def test_parse_message_contract_normalizes_work_threaded_metadata() -> None:
     rendered = messages.render_message(
         {
@@ -40,6 +40,7 @@ def test_startup_command_plan_order_is_fixed() -> None:
         ("list_queue_unread_messages", (), "queued_messages"),
         ("list_indexed_epics", (), "epics"),
         ("compute_epic_discovery_parity", ("epics",), "parity_report"),
+        ("group_deferred_changesets", ("epics",), "deferred_scan"),
     ]
 
 
@@ -64,36 +65,137 @@ def test_validate_startup_list_invocation_rejects_unsupported_flag() -> None:
         )
 
 
-def test_execute_startup_command_plan_runs_steps_in_order() -> None:
-    calls: list[str] = []
-
-    class _FakeHelper:
-        def list_inbox_messages(self, *_args, **_kwargs):
-            calls.append("inbox")
-            return [{"id": "at-msg-1", "title": "Message"}]
-
-        def list_queue_messages(self, *_args, **_kwargs):
-            calls.append("queue")
-            return [{"id": "at-q-1", "title": "Queued", "queue": "planner", "claimed_by": ""}]
-
-        def list_epics(self, *_args, **_kwargs):
-            calls.append("epics")
-            return [{"id": "at-1", "title": "Epic", "status": "open"}]
+def test_execute_startup_command_plan_runs_every_step_against_one_snapshot(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    helper = planner_startup_check.StartupBeadsInvocationHelper(
+        beads_root=tmp_path / ".beads",
+        cwd=tmp_path / "repo",
+    )
+    builder = IssueFixtureBuilder()
+    client, _store = build_in_memory_beads_client(
+        issues=(
+            builder.issue(
+                "at-msg-routed",
+                title="Planner note",
+                issue_type="message",
+                labels=("at:message", "at:unread"),
+                description=messages.render_message(
+                    {
+                        "from": "atelier/worker/codex/p100",
+                        "thread": "at-a.1",
+                        "thread_kind": "changeset",
+                        "audience": ["planner"],
+                    },
+                    "Check the deferred work.",
+                ),
+            ),
+            builder.issue(
+                "at-a",
+                title="Epic A",
+                issue_type="epic",
+                labels=("at:epic",),
+                status="in_progress",
+            ),
+            builder.issue(
+                "at-a.1",
+                title="Container",
+                parent="at-a",
+                issue_type="task",
+                status="in_progress",
+            ),
+            builder.issue(
+                "at-a.1.1",
+                title="Deferred leaf",
+                parent="at-a.1",
+                issue_type="task",
+                status="deferred",
+            ),
+            builder.issue(
+                "at-a.2",
+                title="Open leaf",
+                parent="at-a",
+                issue_type="task",
+                status="open",
+            ),
+            builder.issue(
+                "at-a.3",
+                title="Deferred container with closed work",
+                parent="at-a",
+                issue_type="task",
+                status="deferred",
+            ),
+            builder.issue(
+                "at-a.3.1",
+                title="Closed leaf",
+                parent="at-a.3",
+                issue_type="task",
+                status="closed",
+            ),
+            builder.issue(
+                "at-b",
+                title="Epic B",
+                issue_type="epic",
+                labels=("at:epic",),
+                status="blocked",
+            ),
+            builder.issue(
+                "at-b.1",
+                title="Deferred B",
+                parent="at-b",
+                issue_type="task",
+                status="deferred",
+            ),
+            builder.issue(
+                "at-c",
+                title="Epic C",
+                issue_type="epic",
+                labels=("at:epic",),
+                status="open",
+            ),
+            builder.issue(
+                "at-c.1",
+                title="Deferred C",
+                parent="at-c",
+                issue_type="task",
+                status="deferred",
+            ),
+        )
+    )
+    list_requests = []
+    list_issues = client.list
 
-        def epic_discovery_parity_report(self, *_args, **_kwargs):
-            calls.append("parity")
-            return _parity()
+    async def _counting_list(request):
+        list_requests.append(request)
+        return await list_issues(request)
 
-    helper = _FakeHelper()
+    monkeypatch.setattr(client, "list", _counting_list)
+    monkeypatch.setattr(
+        planner_startup_check,
+        "_build_store",
+        lambda **_kwargs: build_atelier_store(beads=client),
+    )
 
     result = planner_startup_check.execute_startup_command_plan(
         "atelier/planner/example",
-        helper=helper,  # type: ignore[arg-type]
+        helper=helper,
+        deferred_scan_limit=2,
     )
 
-    assert calls == ["inbox", "queue", "epics", "parity"]
-    assert [issue["id"] for issue in result.inbox_messages] == ["at-msg-1"]
-    assert [issue["id"] for issue in result.epics] == ["at-1"]
+    assert [issue["id"] for issue in result.inbox_messages] == ["at-msg-routed"]
+    assert [issue["id"] for issue in result.epics] == ["at-a", "at-b", "at-c"]
+    assert result.parity_report.indexed_active_epic_count == 3
+    assert [
+        (epic["id"], [issue["id"] for issue in changesets])
+        for epic, changesets in result.deferred_scan.groups
+    ] == [("at-a", ["at-a.1.1"]), ("at-b", ["at-b.1"])]
+    assert result.deferred_scan.scan_limit == 2
+    assert result.deferred_scan.skipped_epics == 1
+    assert [(request.parent_id, request.include_closed) for request in list_requests] == [
+        (None, False),
+        (None, True),
+    ]
 
 
 def test_startup_helper_surfaces_threaded_planner_decisions_without_assignee() -> None:
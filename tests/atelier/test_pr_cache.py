@@ -0,0 +1,65 @@
+import json
+import time
+from pathlib import Path
+
+from atelier import pr_cache
+
+
+def test_pr_cache_entries_are_shared_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "github-prs.json"
+    writer = pr_cache.PrLookupDiskCache(path)
+    key = pr_cache.cache_key("lookup", "org/repo", "feat/a")
+
+    writer.put(key, {"outcome": "not_found"}, etag='W/"abc"')
+    entry = pr_cache.PrLookupDiskCache(path).get(key)
+
+    assert entry is not None
+    assert entry.value == {"outcome": "not_found"}
+    assert entry.etag == 'W/"abc"'
+    assert entry.fresh(60.0)
+    assert not entry.fresh(60.0, now=entry.stored_at + 61.0)
+
+
+def test_pr_cache_evicts_oldest_entries_beyond_size_bound(tmp_path: Path) -> None:
+    cache = pr_cache.PrLookupDiskCache(tmp_path / "prs.json", max_entries=2)
+    keys = [pr_cache.cache_key("lookup", "org/repo", f"feat/{index}") for index in range(3)]
+
+    for key in keys:
+        cache.put(key, {"outcome": "not_found"})
+        time.sleep(0.001)
+    cache.touch(keys[1])
+    cache.put(pr_cache.cache_key("lookup", "org/repo", "feat/new"), {"outcome": "not_found"})
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None
+    assert cache.get(keys[2]) is None
+
+
+def test_pr_cache_invalidate_drops_matching_prefix_only(tmp_path: Path) -> None:
+    cache = pr_cache.PrLookupDiskCache(tmp_path / "prs.json")
+    cache.put(pr_cache.cache_key("threads", "org/repo", 7), 1)
+    cache.put(pr_cache.cache_key("threads", "org/repo", 70), 2)
+    cache.put(pr_cache.cache_key("inline", "org/repo", 7), None)
+
+    cache.invalidate("threads", "org/repo", 7)
+
+    assert cache.get(pr_cache.cache_key("threads", "org/repo", 7)) is None
+    assert cache.get(pr_cache.cache_key("threads", "org/repo", 70)) is not None
+    assert cache.get(pr_cache.cache_key("inline", "org/repo", 7)) is not None
+
+
+def test_pr_cache_ignores_unreadable_or_foreign_payloads(tmp_path: Path) -> None:
+    path = tmp_path / "prs.json"
+    key = pr_cache.cache_key("lookup", "org/repo", "feat/a")
+    path.write_text("{not json", encoding="utf-8")
+    assert pr_cache.PrLookupDiskCache(path).get(key) is None
+
+    path.write_text(
+        json.dumps({"version": 999, "entries": {key: {"value": 1, "stored_at": 1.0}}}),
+        encoding="utf-8",
+    )
+    cache = pr_cache.PrLookupDiskCache(path)
+    assert cache.get(key) is None
+
+    cache.put(key, {"outcome": "not_found"})
+    assert json.loads(path.read_text(encoding="utf-8"))["version"] == 1
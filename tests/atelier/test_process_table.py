@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from atelier import exec, process_table
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="requires /proc")
+def test_proc_snapshot_reports_process_start_time_and_command() -> None:
+    before_ns = time.time_ns()
+    child = subprocess.Popen(["sleep", "30"])
+    try:
+        after_ns = time.time_ns()
+        table = process_table.read_process_table()
+
+        info = table.get(child.pid)
+
+        assert info is not None
+        assert info.command == "sleep 30"
+        assert info.started_ns is not None
+        assert before_ns - 2_000_000_000 <= info.started_ns <= after_ns + 2_000_000_000
+        assert any(process.pid == os.getpid() for process in table.processes())
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_process_table_session_reads_the_table_once() -> None:
+    snapshot = [
+        process_table.ProcessInfo(pid=10, started_ns=1_000, command="codex"),
+        process_table.ProcessInfo(pid=11, started_ns=2_000, command="codex"),
+    ]
+    late = process_table.ProcessInfo(pid=12, started_ns=3_000, command="codex")
+    with (
+        patch("atelier.process_table._read_all_processes", return_value=snapshot) as read_all,
+        patch("atelier.process_table._read_process", return_value=late) as read_one,
+    ):
+        with process_table.process_table_session():
+            assert process_table.process_started_ns(10) == 1_000
+            assert process_table.process_started_ns(11) == 2_000
+            assert process_table.process_started_ns(12) == 3_000
+            assert process_table.process_started_ns(12) == 3_000
+
+    assert read_all.call_count == 1
+    read_one.assert_called_once_with(12)
+
+
+def test_process_table_falls_back_to_one_ps_snapshot() -> None:
+    requests: list[exec.CommandRequest] = []
+
+    def fake_run(request: exec.CommandRequest) -> exec.CommandResult:
+        requests.append(request)
+        return exec.CommandResult(
+            argv=request.argv,
+            returncode=0,
+            stdout=(
+                "  10 Mon Mar  2 09:15:30 2026 dolt sql-server --port 3307\n"
+                "  11 Mon Mar  2 09:16:00 2026 codex exec\n"
+            ),
+            stderr="",
+        )
+
+    with (
+        patch("atelier.process_table._proc_available", return_value=False),
+        patch("atelier.process_table.exec.run_with_runner", side_effect=fake_run),
+    ):
+        processes = process_table.read_process_table().processes()
+
+    assert [request.argv for request in requests] == [("ps", "-o", "pid=,lstart=,command=", "-ax")]
+    assert [(process.pid, process.command) for process in processes] == [
+        (10, "dolt sql-server --port 3307"),
+        (11, "codex exec"),
+    ]
+    assert processes[1].started_ns is not None and processes[0].started_ns is not None
+    assert processes[1].started_ns - processes[0].started_ns == 30_000_000_000
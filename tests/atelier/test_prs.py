@@ -1,3 +1,4 @@
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -412,3 +413,356 @@ def test_unresolved_review_thread_count_paginates() -> None:
         patch("atelier.prs._run_json", side_effect=[payload_page_1, payload_page_2]),
     ):
         assert prs.unresolved_review_thread_count("org/repo", 42) == 2
+
+
+def _graphql_pr_node(number: int, head: str, **overrides: object) -> dict[str, object]:
+    node: dict[str, object] = {
+        "number": number,
+        "url": f"https://github.com/org/repo/pull/{number}",
+        "state": "OPEN",
+        "headRefName": head,
+        "isDraft": False,
+        "updatedAt": "2026-02-20T10:00:00Z",
+        "labels": {"nodes": [{"name": "atelier"}]},
+        "reviewRequests": {
+            "nodes": [{"requestedReviewer": {"__typename": "User", "login": "alice"}}]
+        },
+        "comments": {"nodes": [], "pageInfo": {"hasPreviousPage": False}},
+        "reviews": {"nodes": [], "pageInfo": {"hasPreviousPage": False}},
+        "reviewThreads": {"nodes": [], "pageInfo": {"hasNextPage": False}},
+    }
+    node.update(overrides)
+    return node
+
+
+def _fake_batch_graphql(nodes_by_head: dict[str, list[dict[str, object]]], calls: list[list[str]]):
+    def run_json(cmd: list[str]) -> object:
+        calls.append(cmd)
+        heads = {
+            arg.split("=", 1)[0]: arg.split("=", 1)[1]
+            for arg in cmd
+            if arg.startswith("h") and "=" in arg
+        }
+        return {
+            "data": {
+                "repository": {
+                    alias: {
+                        "nodes": nodes_by_head.get(head, []),
+                        "pageInfo": {"hasNextPage": False},
+                    }
+                    for alias, head in heads.items()
+                }
+            }
+        }
+
+    return run_json
+
+
+def test_lookup_github_pr_statuses_resolves_heads_in_paginated_batches() -> None:
+    heads = [f"feat/{index}" for index in range(60)]
+    nodes_by_head = {
+        head: [_graphql_pr_node(index + 1, head)] for index, head in enumerate(heads[:-1])
+    }
+    calls: list[list[str]] = []
+
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs._run_json", side_effect=_fake_batch_graphql(nodes_by_head, calls)),
+    ):
+        results = prs.lookup_github_pr_statuses("org/repo", heads)
+        cached = prs.lookup_github_pr_status("org/repo", "feat/0")
+
+    assert len(calls) == 2
+    assert calls[0][:3] == ["gh", "api", "graphql"]
+    assert list(results) == heads
+    assert results["feat/0"].found is True
+    assert results["feat/0"].payload["number"] == 1
+    assert results["feat/0"].payload["labels"] == [{"name": "atelier"}]
+    assert prs.has_review_requests(results["feat/0"].payload) is True
+    assert results["feat/59"].outcome == "not_found"
+    assert cached is results["feat/0"]
+
+
+def test_lookup_github_pr_statuses_keeps_single_lookup_selection_rules() -> None:
+    nodes_by_head = {
+        "feat/open": [
+            _graphql_pr_node(5, "feat/open", state="CLOSED", updatedAt="2026-02-21T00:00:00Z"),
+            _graphql_pr_node(4, "feat/open"),
+        ],
+        "feat/ambiguous": [
+            _graphql_pr_node(7, "feat/ambiguous"),
+            _graphql_pr_node(8, "feat/ambiguous"),
+        ],
+    }
+
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs._run_json", side_effect=_fake_batch_graphql(nodes_by_head, [])),
+    ):
+        results = prs.lookup_github_pr_statuses("org/repo", ["feat/open", "feat/ambiguous"])
+
+    assert results["feat/open"].payload["number"] == 4
+    assert results["feat/ambiguous"].failed is True
+    assert "multiple open PRs (#7, #8)" in (results["feat/ambiguous"].error or "")
+
+
+def test_lookup_github_pr_statuses_seeds_review_thread_caches() -> None:
+    threads = {
+        "nodes": [
+            {
+                "isResolved": False,
+                "comments": {
+                    "nodes": [
+                        {
+                            "author": {"__typename": "User", "login": "alice"},
+                            "createdAt": "2026-02-20T11:00:00Z",
+                            "updatedAt": "2026-02-20T11:00:00Z",
+                        },
+                        {
+                            "author": {"__typename": "Bot", "login": "ci"},
+                            "createdAt": "2026-02-20T12:00:00Z",
+                            "updatedAt": "2026-02-20T12:00:00Z",
+                        },
+                    ],
+                    "pageInfo": {"hasPreviousPage": False},
+                },
+            },
+            {
+                "isResolved": True,
+                "comments": {"nodes": [], "pageInfo": {"hasPreviousPage": False}},
+            },
+        ],
+        "pageInfo": {"hasNextPage": False},
+    }
+    nodes_by_head = {"feat/a": [_graphql_pr_node(9, "feat/a", reviewThreads=threads)]}
+
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch(
+            "atelier.prs._run_json", side_effect=_fake_batch_graphql(nodes_by_head, [])
+        ) as run_json,
+    ):
+        prs.lookup_github_pr_statuses("org/repo", ["feat/a"])
+        payload = prs.read_github_pr_status("org/repo", "feat/a")
+        unresolved = prs.unresolved_review_thread_count("org/repo", 9)
+        feedback_at = prs.latest_feedback_timestamp_with_inline_comments(payload, repo="org/repo")
+
+    assert payload is not None
+    assert "reviewThreads" not in payload
+    assert run_json.call_count == 1
+    assert unresolved == 1
+    assert feedback_at == "2026-02-20T11:00:00Z"
+
+
+def test_lookup_github_pr_statuses_falls_back_for_truncated_heads() -> None:
+    truncated = _graphql_pr_node(
+        3,
+        "feat/busy",
+        comments={"nodes": [], "pageInfo": {"hasPreviousPage": True}},
+    )
+
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch(
+            "atelier.prs._run_json",
+            side_effect=_fake_batch_graphql({"feat/busy": [truncated]}, []),
+        ),
+        patch(
+            "atelier.prs.lookup_github_pr_status",
+            return_value=prs.GithubPrLookup(outcome="found", payload={"number": 3}),
+        ) as single_lookup,
+    ):
+        prs.lookup_github_pr_statuses("org/repo", ["feat/busy"])
+
+    single_lookup.assert_called_once_with("org/repo", "feat/busy", refresh=True)
+
+
+def test_lookup_github_pr_statuses_records_query_errors_per_head() -> None:
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs._run_json", side_effect=RuntimeError("rate limit exceeded")),
+    ):
+        results = prs.lookup_github_pr_statuses("org/repo", ["feat/a", "feat/b"])
+
+    assert [result.error for result in results.values()] == [
+        "rate limit exceeded",
+        "rate limit exceeded",
+    ]
+
+
+def _use_stale_persistent_lookup(tmp_path: Path, payload: dict[str, object]) -> Path:
+    cache_path = tmp_path / "github-prs.json"
+    prs.use_persistent_cache(cache_path)
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs._find_latest_pr_number", return_value=payload["number"]),
+        patch("atelier.prs._run_json", return_value=payload),
+    ):
+        prs.lookup_github_pr_status("org/repo", "feat/a")
+    prs.clear_runtime_cache()
+    disk = prs._PERSISTENT_CACHE
+    assert disk is not None
+    disk.ttl_seconds = 0.0
+    return cache_path
+
+
+_MERGE_STATE = {"mergeable": "MERGEABLE", "mergeStateStatus": "CLEAN"}
+
+
+def _merge_state_only(cmd: list[str]) -> dict[str, object]:
+    assert cmd[-1] == "mergeable,mergeStateStatus", cmd
+    return dict(_MERGE_STATE)
+
+
+def test_persistent_cache_serves_fresh_lookups_across_processes(tmp_path: Path) -> None:
+    prs.use_persistent_cache(tmp_path / "github-prs.json")
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs._find_latest_pr_number", return_value=5),
+        patch("atelier.prs._run_json", return_value={"number": 5, "state": "MERGED"}),
+    ):
+        prs.lookup_github_pr_status("org/repo", "feat/a")
+    prs.clear_runtime_cache()
+    prs.use_persistent_cache(None)
+    prs.use_persistent_cache(tmp_path / "github-prs.json")
+
+    with patch("atelier.prs._gh_available", side_effect=AssertionError("gh should not run")):
+        result = prs.lookup_github_pr_status("org/repo", "feat/a")
+        batch = prs.lookup_github_pr_statuses("org/repo", ["feat/a"])
+
+    assert result.payload == {"number": 5, "state": "MERGED"}
+    assert batch["feat/a"].payload == {"number": 5, "state": "MERGED"}
+
+
+def test_persistent_cache_refetches_merge_state_for_open_prs(tmp_path: Path) -> None:
+    cache_path = tmp_path / "github-prs.json"
+    prs.use_persistent_cache(cache_path)
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs._find_latest_pr_number", return_value=5),
+        patch(
+            "atelier.prs._run_json",
+            return_value={"number": 5, "state": "OPEN", "mergeStateStatus": "CLEAN"},
+        ),
+    ):
+        prs.lookup_github_pr_status("org/repo", "feat/a")
+    prs.clear_runtime_cache()
+    disk = prs._PERSISTENT_CACHE
+    assert disk is not None
+    lookup_entry = disk.get(prs.pr_cache.cache_key("lookup", "org/repo", "feat/a"))
+    assert isinstance(lookup_entry.value, dict)
+    assert "mergeStateStatus" not in lookup_entry.value["payload"]
+
+    with patch("atelier.prs._gh_available", side_effect=AssertionError("gh should not run")):
+        cached = prs.lookup_github_pr_status("org/repo", "feat/a")
+        batch = prs.lookup_github_pr_statuses("org/repo", ["feat/a"])
+
+    assert cached.payload == {"number": 5, "state": "OPEN", "mergeStateStatus": "CLEAN"}
+    assert batch["feat/a"].payload == cached.payload
+
+    prs.clear_runtime_cache()
+    disk.invalidate("merge", "org/repo", 5)
+    assert prs._fresh_persisted_lookup("org/repo", "feat/a") is None
+    dirty = {"mergeable": "CONFLICTING", "mergeStateStatus": "DIRTY"}
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs._run_json", return_value=dirty) as run_json,
+    ):
+        result = prs.lookup_github_pr_status("org/repo", "feat/a")
+
+    assert result.payload == {"number": 5, "state": "OPEN", **dirty}
+    assert run_json.call_args.args[0][-1] == "mergeable,mergeStateStatus"
+    assert prs.default_branch_has_merge_conflict(result.payload) is True
+    assert prs._fresh_persisted_lookup("org/repo", "feat/a") == result
+
+
+def test_persistent_cache_revalidates_stale_lookup_with_etag(tmp_path: Path) -> None:
+    payload = {"number": 5, "state": "OPEN", "updatedAt": "2026-02-20T10:00:00Z"}
+    _use_stale_persistent_lookup(tmp_path, payload)
+    requests: list[tuple[str, ...]] = []
+    responses = [
+        exec_util.CommandResult(
+            argv=(),
+            returncode=0,
+            stdout=(
+                'HTTP/2.0 200 OK\r\nEtag: W/"v1"\r\n\r\n'
+                '[{"number": 5, "state": "open", "updated_at": "2026-02-20T10:00:00Z"}]'
+            ),
+            stderr="",
+        ),
+        exec_util.CommandResult(
+            argv=(),
+            returncode=1,
+            stdout='HTTP/2.0 304 Not Modified\r\nEtag: W/"v1"\r\n\r\n',
+            stderr="gh: HTTP 304",
+        ),
+    ]
+
+    def fake_runner(request: exec_util.CommandRequest) -> exec_util.CommandResult:
+        requests.append(request.argv)
+        return responses[len(requests) - 1]
+
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs.exec_util.run_with_runner", side_effect=fake_runner),
+        patch("atelier.prs._run_json", side_effect=_merge_state_only),
+    ):
+        first = prs.lookup_github_pr_status("org/repo", "feat/a")
+        prs.clear_runtime_cache()
+        second = prs.lookup_github_pr_status("org/repo", "feat/a")
+
+    assert first.payload == {**payload, **_MERGE_STATE}
+    assert second.payload == {**payload, **_MERGE_STATE}
+    assert 'If-None-Match: W/"v1"' not in requests[0]
+    assert 'If-None-Match: W/"v1"' in requests[1]
+    assert "head=org:feat/a" in requests[0]
+
+
+def test_persistent_cache_refetches_when_pr_updated(tmp_path: Path) -> None:
+    stale = {"number": 5, "state": "OPEN", "updatedAt": "2026-02-20T10:00:00Z"}
+    _use_stale_persistent_lookup(tmp_path, stale)
+    prs._PERSISTENT_CACHE.put(prs.pr_cache.cache_key("threads", "org/repo", 5), 2)
+    revalidation = exec_util.CommandResult(
+        argv=(),
+        returncode=0,
+        stdout=(
+            'HTTP/2.0 200 OK\r\nEtag: W/"v2"\r\n\r\n'
+            '[{"number": 5, "state": "open", "updated_at": "2026-02-21T10:00:00Z"}]'
+        ),
+        stderr="",
+    )
+    fresh = {"number": 5, "state": "OPEN", "updatedAt": "2026-02-21T10:00:00Z"}
+
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs.exec_util.run_with_runner", return_value=revalidation),
+        patch("atelier.prs._find_latest_pr_number", return_value=5),
+        patch("atelier.prs._run_json", return_value=fresh) as run_json,
+    ):
+        result = prs.lookup_github_pr_status("org/repo", "feat/a")
+
+    assert result.payload == fresh
+    run_json.assert_called_once()
+    entry = prs._PERSISTENT_CACHE.get(prs.pr_cache.cache_key("lookup", "org/repo", "feat/a"))
+    assert entry is not None and entry.etag == 'W/"v2"'
+    assert prs._PERSISTENT_CACHE.get(prs.pr_cache.cache_key("threads", "org/repo", 5)) is None
+
+
+def test_invalidate_pr_lookup_drops_persisted_and_runtime_entries(tmp_path: Path) -> None:
+    prs.use_persistent_cache(tmp_path / "github-prs.json")
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs._find_latest_pr_number", return_value=None),
+    ):
+        prs.lookup_github_pr_status("org/repo", "feat/a")
+
+    prs.invalidate_pr_lookup("org/repo", "feat/a")
+
+    with (
+        patch("atelier.prs._gh_available", return_value=True),
+        patch("atelier.prs._find_latest_pr_number", return_value=8),
+        patch("atelier.prs._run_json", return_value={"number": 8, "state": "OPEN"}),
+    ):
+        result = prs.lookup_github_pr_status("org/repo", "feat/a")
+
+    assert result.found is True
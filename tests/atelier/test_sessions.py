@@ -4,9 +4,18 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 import atelier.sessions as sessions_mod
 
 
+@pytest.fixture(autouse=True)
+def _isolated_session_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    index_path = tmp_path / "codex-sessions.json"
+    monkeypatch.setattr(sessions_mod.paths, "codex_session_index_path", lambda: index_path)
+    return index_path
+
+
 class TestFindCodexSession:
     def test_returns_most_recent_match(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
@@ -200,3 +209,59 @@ class TestFindCodexSession:
                 session = sessions_mod.find_codex_session("01TEST", "feat-demo", workspace_uid)
 
             assert session == "session-uid"
+
+    def test_index_reads_only_new_or_changed_transcripts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            home = Path(tmp)
+            sessions = home / ".codex" / "sessions" / "2026" / "02"
+            sessions.mkdir(parents=True)
+            target = "atelier:01TEST:feat-demo"
+            stable = sessions / "session-stable.json"
+            changing = sessions / "session-changing.json"
+            for path in (stable, changing):
+                path.write_text(
+                    json.dumps({"messages": [{"role": "user", "content": "unrelated"}]}),
+                    encoding="utf-8",
+                )
+            reads: list[str] = []
+            read_first = sessions_mod.read_first_user_message
+
+            def counting_read(path: Path) -> str | None:
+                reads.append(path.name)
+                return read_first(path)
+
+            with (
+                patch("atelier.sessions.Path.home", return_value=home),
+                patch("atelier.sessions.read_first_user_message", side_effect=counting_read),
+            ):
+                assert sessions_mod.find_codex_sessions("01TEST", "feat-demo") == ()
+                assert sorted(reads) == ["session-changing.json", "session-stable.json"]
+
+                reads.clear()
+                assert sessions_mod.find_codex_sessions("01TEST", "feat-demo") == ()
+                assert reads == []
+
+                changing.write_text(
+                    json.dumps({"messages": [{"role": "user", "content": f"go {target}"}]}),
+                    encoding="utf-8",
+                )
+                matches = sessions_mod.find_codex_sessions("01TEST", "feat-demo")
+
+            assert reads == ["session-changing.json"]
+            assert [match.session_id for match in matches] == ["session-changing"]
+
+    def test_jsonl_head_read_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            session_file = Path(tmp) / "session.jsonl"
+            padding = json.dumps({"type": "response_item", "payload": {"pad": "x" * 200}})
+            message = json.dumps(
+                {
+                    "type": "event_msg",
+                    "payload": {"type": "user_message", "message": "late"},
+                }
+            )
+            session_file.write_text(f"{padding}\n{message}\n", encoding="utf-8")
+
+            assert sessions_mod.read_first_user_message(session_file) == "late"
+            monkeypatch.setattr(sessions_mod, "_SESSION_HEAD_MAX_CHARS", 128)
+            assert sessions_mod.read_first_user_message(session_file) is None
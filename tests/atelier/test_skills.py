@@ -363,3 +363,51 @@ def test_workspace_skill_state_accepts_legacy_underscore_metadata_keys() -> None
 
         assert state.needs_install is False
         assert state.needs_metadata is False
+
+
+def test_workspace_skill_state_rehashes_only_skills_with_stat_changes(monkeypatch) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace_dir = Path(tmp)
+        metadata = skills.install_workspace_skills(workspace_dir)
+        hashed: list[str] = []
+        original_hash_dir = skills._hash_dir
+
+        def counting_hash_dir(root: Path) -> str:
+            hashed.append(root.name)
+            return original_hash_dir(root)
+
+        monkeypatch.setattr(skills, "_hash_dir", counting_hash_dir)
+
+        state = skills.workspace_skill_state(workspace_dir, metadata)
+        assert state.needs_install is False
+        assert hashed == []
+
+        skill_doc = workspace_dir / "skills" / "heartbeat" / "SKILL.md"
+        skill_doc.write_text(skill_doc.read_text(encoding="utf-8") + "\nlocal edit\n")
+
+        state = skills.workspace_skill_state(workspace_dir, metadata)
+        assert hashed == ["heartbeat"]
+        assert state.modified == ["heartbeat"]
+        assert state.needs_install is True
+
+        hashed.clear()
+        state = skills.workspace_skill_state(workspace_dir, metadata)
+        assert hashed == []
+        assert state.modified == ["heartbeat"]
+
+
+def test_packaged_skill_definitions_are_loaded_once_per_version(monkeypatch) -> None:
+    skills._packaged_skill_tree_definitions()
+    loads: list[str] = []
+    monkeypatch.setattr(
+        skills,
+        "_load_definition",
+        lambda name, root: loads.append(name),
+    )
+
+    first = skills._packaged_skill_tree_definitions()
+    second = skills._packaged_skill_tree_definitions()
+
+    assert loads == []
+    assert first == second
+    assert first is not second
@@ -9,6 +9,7 @@ import pytest
 from pydantic import ValidationError
 
 import atelier.store as public_store
+from atelier import command_trace
 from atelier.lib.beads import (
     Beads,
     BeadsCommandError,
@@ -25,6 +26,7 @@ from atelier.store import (
     AppendNotesRequest,
     AtelierStore,
     ChangesetBranches,
+    ChangesetQuery,
     ChangesetRecord,
     ClaimMessageRequest,
     ClearAgentBeadHookRequest,
@@ -99,6 +101,7 @@ _STORE_METHOD_NAMES = (
     "update_external_tickets",
     "update_review",
     "transition_lifecycle",
+    "transition_lifecycle_many",
 )
 
 
@@ -870,6 +873,174 @@ def test_epic_discovery_parity_avoids_child_lookup_per_scanned_issue(monkeypatch
     assert all(request.parent_id is None for request in recorded_requests)
 
 
+def _fan_out_seed_issues(epic_count: int) -> tuple[dict[str, object], ...]:
+    issues: list[dict[str, object]] = [BUILDER.issue("at-shared", title="Shared dependency")]
+    for index in range(epic_count):
+        epic_id = f"at-epic-{index}"
+        issues.append(
+            BUILDER.issue(epic_id, title=f"Epic {index}", issue_type="epic", labels=("at:epic",))
+        )
+        issues.append(
+            BUILDER.issue(
+                f"{epic_id}.1",
+                title=f"Changeset {index}",
+                parent=epic_id,
+                dependencies=("at-shared",),
+            )
+        )
+    return tuple(issues)
+
+
+def test_list_epics_fans_out_reads_up_to_the_configured_concurrency(monkeypatch) -> None:
+    client, _ = build_in_memory_beads_client(issues=_fan_out_seed_issues(6))
+    original_list = client.list
+    active = 0
+    peak = 0
+
+    async def _slow_list(request: ListIssuesRequest):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(0.01)
+            return await original_list(request)
+        finally:
+            active -= 1
+
+    serial = _RUN(build_atelier_store(beads=client, read_concurrency=1).list_epics())
+    monkeypatch.setattr(client, "list", _slow_list)
+    store = build_atelier_store(beads=client, read_concurrency=3)
+
+    epics = _RUN(store.list_epics())
+
+    assert epics == serial
+    assert tuple(epic.id for epic in epics) == tuple(f"at-epic-{index}" for index in range(6))
+    assert peak == 3
+
+
+def test_failed_fan_out_read_cancels_sibling_reads(monkeypatch) -> None:
+    client, _ = build_in_memory_beads_client(issues=_fan_out_seed_issues(4))
+    original_list = client.list
+    cancelled: list[str] = []
+
+    async def _failing_list(request: ListIssuesRequest):
+        if request.parent_id is None:
+            return await original_list(request)
+        if request.parent_id == "at-epic-0":
+            await asyncio.sleep(0)
+            raise BeadsCommandError("bd list failed")
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.append(request.parent_id)
+            raise
+        return await original_list(request)
+
+    monkeypatch.setattr(client, "list", _failing_list)
+    store = build_atelier_store(beads=client, read_concurrency=4)
+
+    async def _scenario() -> set[asyncio.Task[object]]:
+        with pytest.raises(BeadsCommandError, match="bd list failed"):
+            await store.list_epics()
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    leftover = _RUN(_scenario())
+
+    assert leftover == set()
+    assert sorted(set(cancelled)) == ["at-epic-1", "at-epic-2", "at-epic-3"]
+
+
+def test_list_changesets_coalesces_duplicate_reads_across_concurrent_branches(monkeypatch) -> None:
+    client, _ = build_in_memory_beads_client(issues=_fan_out_seed_issues(5))
+    recorded_requests: list[ListIssuesRequest] = []
+    shown_ids: list[str] = []
+    original_list = client.list
+    original_show = client.show
+
+    async def _recording_list(request: ListIssuesRequest):
+        recorded_requests.append(request)
+        await asyncio.sleep(0)
+        return await original_list(request)
+
+    async def _recording_show(request):
+        shown_ids.append(request.issue_id)
+        await asyncio.sleep(0)
+        return await original_show(request)
+
+    monkeypatch.setattr(client, "list", _recording_list)
+    monkeypatch.setattr(client, "show", _recording_show)
+    store = build_atelier_store(beads=client)
+
+    changesets = _RUN(store.list_changesets())
+
+    child_listings = [
+        (request.parent_id, request.include_closed)
+        for request in recorded_requests
+        if request.parent_id is not None
+    ]
+    assert len(changesets) == 5
+    assert child_listings.count(("at-shared", True)) == 1
+    assert len(child_listings) == len(set(child_listings))
+    assert shown_ids == []
+
+
+def test_read_session_reuses_listings_until_a_write_touches_them(monkeypatch) -> None:
+    client, _ = build_in_memory_beads_client(issues=_fan_out_seed_issues(2))
+    child_listings: list[str] = []
+    original_list = client.list
+
+    async def _recording_list(request: ListIssuesRequest):
+        if request.parent_id is not None:
+            child_listings.append(request.parent_id)
+        return await original_list(request)
+
+    monkeypatch.setattr(client, "list", _recording_list)
+    store = build_atelier_store(beads=client)
+
+    with store.read_session():
+        _RUN(store.list_changesets(ChangesetQuery(epic_id="at-epic-0")))
+        _RUN(store.list_changesets(ChangesetQuery(epic_id="at-epic-0")))
+        _RUN(store.list_changesets(ChangesetQuery(epic_id="at-epic-1")))
+        assert child_listings.count("at-epic-0") == 1
+
+        _RUN(store.append_notes(AppendNotesRequest(issue_id="at-epic-0.1", notes=("note: one",))))
+        _RUN(store.list_changesets(ChangesetQuery(epic_id="at-epic-0")))
+        _RUN(store.list_changesets(ChangesetQuery(epic_id="at-epic-1")))
+        assert child_listings.count("at-epic-0") == 2
+        assert child_listings.count("at-epic-1") == 1
+
+        with command_trace.timed_command(("bd", "update", "at-epic-1.1", "--status", "blocked")):
+            pass
+        _RUN(store.list_changesets(ChangesetQuery(epic_id="at-epic-1")))
+        assert child_listings.count("at-epic-1") == 2
+
+    _RUN(store.list_changesets(ChangesetQuery(epic_id="at-epic-0")))
+    assert child_listings.count("at-epic-0") == 3
+
+
+def test_store_rejects_non_positive_read_concurrency() -> None:
+    client, _ = build_in_memory_beads_client(issues=())
+
+    with pytest.raises(ValueError, match="read_concurrency"):
+        build_atelier_store(beads=client, read_concurrency=0)
+
+
+def test_store_read_concurrency_defaults_from_environment(monkeypatch) -> None:
+    client, _ = build_in_memory_beads_client(issues=())
+
+    assert build_atelier_store(beads=client).read_concurrency == 8
+    monkeypatch.setenv("ATELIER_STORE_READ_CONCURRENCY", "3")
+    assert build_atelier_store(beads=client).read_concurrency == 3
+    assert build_atelier_store(beads=client, read_concurrency=5).read_concurrency == 5
+    warnings: list[str] = []
+    monkeypatch.setattr("atelier.log.warning", lambda message, **_kwargs: warnings.append(message))
+    for invalid in ("0", "many"):
+        monkeypatch.setenv("ATELIER_STORE_READ_CONCURRENCY", invalid)
+        assert build_atelier_store(beads=client).read_concurrency == 8
+    assert len(warnings) == 2
+    assert all("ATELIER_STORE_READ_CONCURRENCY" in message for message in warnings)
+
+
 @pytest.mark.parametrize("backend", _BACKENDS)
 def test_store_dual_backend_mutation_snapshot_matches_expected_contract(backend: str) -> None:
     assert _mutation_snapshot(backend) == {
@@ -1285,6 +1456,54 @@ def test_beads_store_append_notes_fails_for_non_work_items() -> None:
         )
 
 
+def test_beads_store_transition_lifecycle_many_reports_each_issue() -> None:
+    store = _store_for(
+        BUILDER.issue("at-epic", issue_type="epic", labels=("at:epic",)),
+        BUILDER.issue("at-epic.1", parent="at-epic", status="deferred"),
+        BUILDER.issue("at-epic.2", parent="at-epic", status="deferred"),
+        BUILDER.issue("at-epic.3", parent="at-epic", status="open"),
+        BUILDER.issue("at-epic.4", parent="at-epic", status="blocked"),
+    )
+
+    outcomes = _RUN(
+        store.transition_lifecycle_many(
+            (
+                LifecycleTransitionRequest(
+                    issue_id="at-epic.1", target_status=LifecycleStatus.OPEN
+                ),
+                LifecycleTransitionRequest(
+                    issue_id="at-epic.2", target_status=LifecycleStatus.OPEN
+                ),
+                LifecycleTransitionRequest(
+                    issue_id="at-epic.3", target_status=LifecycleStatus.OPEN
+                ),
+                LifecycleTransitionRequest(
+                    issue_id="at-epic.4",
+                    target_status=LifecycleStatus.OPEN,
+                    expected_current=LifecycleStatus.DEFERRED,
+                ),
+            )
+        )
+    )
+
+    assert [outcome.issue_id for outcome in outcomes] == [
+        "at-epic.1",
+        "at-epic.2",
+        "at-epic.3",
+        "at-epic.4",
+    ]
+    assert [outcome.ok for outcome in outcomes] == [True, True, True, False]
+    assert outcomes[0].transition is not None
+    assert outcomes[0].transition.from_status is LifecycleStatus.DEFERRED
+    assert outcomes[3].error is not None and "lifecycle mismatch" in outcomes[3].error
+    for issue_id, status in (
+        ("at-epic.1", "open"),
+        ("at-epic.2", "open"),
+        ("at-epic.4", "blocked"),
+    ):
+        assert _RUN(store._show_issue(issue_id)).status == status
+
+
 def test_beads_store_fails_closed() -> None:
     store = _store_for(
         BUILDER.issue("at-epic", issue_type="epic", labels=("at:epic",)),
@@ -18,6 +18,7 @@ from atelier.lib.beads import (
     ListIssuesRequest,
     ReadyIssuesRequest,
     ShowIssueRequest,
+    ShowManyIssuesRequest,
     SupportedOperation,
     SyncBeadsClient,
     UpdateIssueRequest,
@@ -250,6 +251,7 @@ def test_dispatcher_implements_tier_zero_core_issue_commands() -> None:
     shown = dispatcher.run(["bd", "show", created_issue.id, "--json"])
     closed = dispatcher.run(["bd", "close", "at-2", "--reason", "done", "--json"])
     ready_after = dispatcher.run(["bd", "ready", "--parent", "at-1", "--json"])
+    ready_limited = dispatcher.run(["bd", "ready", "--limit", "1", "--json"])
 
     listed_ids = [item["id"] for item in json.loads(listed.stdout)]
     ready_before_ids = [item["id"] for item in json.loads(ready_before.stdout)]
@@ -269,6 +271,7 @@ def test_dispatcher_implements_tier_zero_core_issue_commands() -> None:
     assert shown_issue.id == created_issue.id
     assert closed_issue.status == "closed"
     assert ready_after_ids == ["at-3", created_issue.id]
+    assert [item["id"] for item in json.loads(ready_limited.stdout)] == ["at-3"]
 
 
 def test_in_memory_client_supports_representative_planner_flow() -> None:
@@ -330,6 +333,25 @@ def test_in_memory_client_supports_representative_planner_flow() -> None:
     assert [issue.id for issue in listed_all] == ["at-2", "at-3", "at-4"]
 
 
+def test_in_memory_show_many_returns_known_issues_in_request_order() -> None:
+    builder = IssueFixtureBuilder()
+    client, _store = build_in_memory_beads_client(
+        issues=(
+            builder.issue(1, title="Epic", issue_type="epic", status="open"),
+            builder.issue(2, title="Slice", parent=1, status="open"),
+        )
+    )
+    dispatcher = InMemoryBeadsBackend(issue_store=_store)
+
+    shown = SyncBeadsClient(client).show_many(
+        ShowManyIssuesRequest(issue_ids=("at-2", "at-missing", "at-1", "at-2"))
+    )
+    command = dispatcher.run(["bd", "show", "at-1", "at-2", "--json"])
+
+    assert [issue.id for issue in shown] == ["at-2", "at-1"]
+    assert [item["id"] for item in json.loads(command.stdout)] == ["at-1", "at-2"]
+
+
 def test_in_memory_client_reports_configured_startup_state_directly() -> None:
     startup_state = BeadsStartupState(
         classification="ready",
@@ -376,6 +398,66 @@ def test_typed_client_mutates_the_store_directly() -> None:
     assert closed.status == "closed"
 
 
+def test_store_indexes_track_mutations_and_invalidate_cached_exports() -> None:
+    builder = IssueFixtureBuilder()
+    store = build_in_memory_issue_store(
+        issues=(
+            builder.issue(1, title="Epic", issue_type="epic", labels=("at:epic",)),
+            builder.issue(2, title="First", parent=1, labels=("at:changeset",)),
+            builder.issue(3, title="Second", parent=1, labels=("at:changeset", "hot")),
+            builder.issue(4, title="Follow-up", dependencies=(2,)),
+        )
+    )
+
+    store.update("at-2", title="First (renamed)", add_labels=("hot",))
+    store.claim("at-3", actor="agent-1")
+    store.close("at-2", reason="done")
+    created = store.create(title="Third", issue_type="task", parent_id="at-1")
+
+    def ids(items: list[dict[str, object]]) -> list[object]:
+        return [item["id"] for item in items]
+
+    assert ids(store.list(parent_id="at-1")) == ["at-3", created["id"]]
+    assert ids(store.list(parent_id="at-1", include_closed=True)) == [
+        "at-2",
+        "at-3",
+        created["id"],
+    ]
+    assert ids(store.list(labels=("hot",), include_closed=True)) == ["at-2", "at-3"]
+    assert ids(store.list(status="closed")) == ["at-2"]
+    assert ids(store.list(assignee="agent-1")) == ["at-3"]
+    assert ids(store.list(parent_id="at-1", limit=1)) == ["at-3"]
+    assert store.show("at-4")["dependencies"][0]["title"] == "First (renamed)"
+    epic_children = {child["id"]: child for child in store.show("at-1")["children"]}
+    assert epic_children["at-2"]["title"] == "First (renamed)"
+    assert created["id"] in epic_children
+
+    exported = store.show("at-3")
+    exported["labels"].append("mutated")
+    exported["parent"]["title"] = "mutated"
+    assert "mutated" not in store.show("at-3")["labels"]
+    assert store.show("at-3")["parent"]["title"] == "Epic"
+
+
+def test_store_reseeding_an_issue_rebuilds_dependents_and_exports() -> None:
+    builder = IssueFixtureBuilder()
+    store = build_in_memory_issue_store(
+        issues=(
+            builder.issue(1, title="Base"),
+            builder.issue(2, title="Other"),
+            builder.issue(3, title="Follow-up", dependencies=(1,)),
+        )
+    )
+    assert store.show("at-3")["dependencies"][0]["id"] == "at-1"
+
+    store._seed_issue(builder.issue(3, title="Follow-up", dependencies=(2,)))  # pyright: ignore[reportPrivateUsage]
+    store.update("at-2", title="Other (renamed)")
+
+    dependencies = store.show("at-3")["dependencies"]
+    assert [dependency["id"] for dependency in dependencies] == ["at-2"]
+    assert dependencies[0]["title"] == "Other (renamed)"
+
+
 def test_ready_requires_integrated_evidence_for_closed_changeset_dependencies() -> None:
     builder = IssueFixtureBuilder()
     client, _store = build_in_memory_beads_client(
@@ -20,6 +20,13 @@ class _NextChangesetMatrixService(startup.NextChangesetService):
             return self._issue
         return None
 
+    def show_issues(self, issue_ids: tuple[str, ...]) -> dict[str, dict[str, object]]:
+        return {
+            issue_id: issue
+            for issue_id in issue_ids
+            if (issue := self.show_issue(issue_id)) is not None
+        }
+
     def changeset_waiting_on_review_or_signals(
         self,
         issue: dict[str, object],
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import pytest
 
+from atelier import command_trace
 from atelier.worker.models_boundary import (
+    issue_boundary_session,
     parse_issue_boundary,
     parse_pr_boundary,
     parse_review_feedback_boundary,
@@ -139,6 +141,62 @@ def test_parse_issue_boundary_rejects_missing_issue_id() -> None:
         parse_issue_boundary({"status": "open"}, source="test")
 
 
+def test_issue_boundary_session_reuses_models_until_payload_changes() -> None:
+    issue: dict[str, object] = {
+        "id": "at-1.2",
+        "status": "open",
+        "updated_at": "2026-03-01T10:00:00Z",
+        "dependencies": ["at-1.1"],
+    }
+
+    with issue_boundary_session():
+        first = parse_issue_boundary(issue, source="test")
+        with issue_boundary_session():
+            again = parse_issue_boundary(dict(issue), source="test")
+        changed = parse_issue_boundary(
+            {**issue, "status": "closed", "updated_at": "2026-03-01T10:00:05Z"},
+            source="test",
+        )
+
+    assert again is first
+    assert changed.status == "closed"
+    assert parse_issue_boundary(issue, source="test") is not first
+
+
+def test_issue_boundary_session_separates_writes_within_one_second() -> None:
+    issue: dict[str, object] = {
+        "id": "at-1.2",
+        "status": "open",
+        "labels": ["at:changeset"],
+        "updated_at": "2026-03-01T10:00:00Z",
+    }
+
+    with issue_boundary_session():
+        first = parse_issue_boundary(issue, source="test")
+        claimed = parse_issue_boundary(
+            {**issue, "status": "in_progress", "labels": ["at:changeset", "cs:merged"]},
+            source="test",
+        )
+
+    assert first.status == "open"
+    assert claimed.status == "in_progress"
+    assert claimed.labels == ("at:changeset", "cs:merged")
+
+
+def test_issue_boundary_session_drops_models_after_bd_writes() -> None:
+    issue: dict[str, object] = {"id": "at-1.2", "status": "open"}
+
+    with issue_boundary_session():
+        first = parse_issue_boundary(issue, source="test")
+        assert parse_issue_boundary(dict(issue), source="test") is first
+        with command_trace.timed_command(("bd", "update", "at-1.2", "--status", "blocked")):
+            pass
+        after_write = parse_issue_boundary(dict(issue), source="test")
+
+    assert after_write is not first
+    assert after_write == first
+
+
 def test_parse_pr_boundary_normalizes_numeric_string_number() -> None:
     payload = {
         "number": "204",
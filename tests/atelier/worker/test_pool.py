@@ -0,0 +1,76 @@
+import threading
+from pathlib import Path
+
+from atelier.worker import pool
+from atelier.worker.models import StartupContractResult
+from atelier.worker.session.startup import StartupContractContext
+
+
+def _context(*, excluded: tuple[str, ...] = ()) -> StartupContractContext:
+    return StartupContractContext(
+        agent_id="atelier/worker/codex/p1",
+        agent_bead_id="at-agent",
+        beads_root=Path("/beads"),
+        repo_root=Path("/repo"),
+        mode="auto",
+        explicit_epic_id=None,
+        queue_only=False,
+        dry_run=False,
+        assume_yes=True,
+        repo_slug=None,
+        branch_pr=False,
+        git_path=None,
+        worker_queue_name="worker",
+        excluded_epic_ids=excluded,
+    )
+
+
+def _first_unexcluded(*, context: StartupContractContext) -> StartupContractResult:
+    for epic_id in ("at-1", "at-2", "at-3"):
+        if epic_id not in context.excluded_epic_ids:
+            return StartupContractResult(
+                epic_id=epic_id, changeset_id=None, should_exit=False, reason="selected"
+            )
+    return StartupContractResult(
+        epic_id=None, changeset_id=None, should_exit=True, reason="no_eligible_epics"
+    )
+
+
+def test_scheduler_excludes_epics_reserved_by_other_members() -> None:
+    scheduler = pool.WorkerPoolScheduler()
+
+    first = scheduler.select("m1", context=_context(), run_startup_contract=_first_unexcluded)
+    second = scheduler.select(
+        "m2", context=_context(excluded=("at-3",)), run_startup_contract=_first_unexcluded
+    )
+
+    assert first.epic_id == "at-1"
+    assert second.epic_id == "at-2"
+    assert scheduler.reserved_epics() == {"at-1": "m1", "at-2": "m2"}
+
+    scheduler.release("m1")
+    third = scheduler.select("m3", context=_context(), run_startup_contract=_first_unexcluded)
+
+    assert third.epic_id == "at-1"
+
+
+def test_run_worker_pool_runs_every_member_and_reports_failures() -> None:
+    started: list[int] = []
+    lock = threading.Lock()
+    schedulers: set[int] = set()
+
+    def run_member(index: int, scheduler: pool.WorkerPoolScheduler) -> None:
+        with lock:
+            started.append(index)
+            schedulers.add(id(scheduler))
+        if index == 2:
+            raise SystemExit(1)
+        if index == 3:
+            raise SystemExit(0)
+
+    result = pool.run_worker_pool(3, run_member=run_member)
+
+    assert sorted(started) == [1, 2, 3]
+    assert len(schedulers) == 1
+    assert result.failed_members == (2,)
+    assert result.success is False
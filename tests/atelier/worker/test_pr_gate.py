@@ -608,20 +608,32 @@ def test_changeset_pr_creation_decision_blocks_no_parent_when_sibling_pr_active(
         ),
     )
     monkeypatch.setattr(pr_gate.git, "git_ref_exists", lambda *_args, **_kwargs: True)
+    info_lines: list[str] = []
+    quiet_lines: list[str] = []
+    monkeypatch.setattr(pr_gate.atelier_log, "info", info_lines.append)
+
+    def decide(**kwargs: object) -> pr_gate.PrCreationDecision:
+        return pr_gate.changeset_pr_creation_decision(
+            issue,
+            repo_slug="org/repo",
+            repo_root=Path("/repo"),
+            git_path="git",
+            beads_root=Path("/beads"),
+            lookup_pr_payload=lambda _repo_slug, branch: (
+                {"state": "OPEN", "isDraft": False} if branch == "feature-kid-1" else None
+            ),
+            **kwargs,  # type: ignore[arg-type]
+        )
 
-    decision = pr_gate.changeset_pr_creation_decision(
-        issue,
-        repo_slug="org/repo",
-        repo_root=Path("/repo"),
-        git_path="git",
-        beads_root=Path("/beads"),
-        lookup_pr_payload=lambda _repo_slug, branch: (
-            {"state": "OPEN", "isDraft": False} if branch == "feature-kid-1" else None
-        ),
-    )
+    decision = decide()
+    quiet = decide(log_blocked=quiet_lines.append)
 
     assert decision.allow_pr is False
     assert decision.reason == "blocked:epic-pr-in-flight"
+    assert quiet == decision
+    expected = "changeset=at-epic.2 blocked by active sibling PR lifecycle at-epic.1:pr-open"
+    assert info_lines == [expected]
+    assert quiet_lines == [expected]
 
 
 def test_changeset_pr_creation_decision_allows_no_parent_when_sibling_integrated(
@@ -674,6 +686,59 @@ def test_changeset_pr_creation_decision_allows_no_parent_when_sibling_integrated
     assert decision.reason == "no-parent"
 
 
+def test_changeset_pr_creation_decision_prefetches_sibling_pr_lookups_once(
+    monkeypatch,
+) -> None:
+    issue = {
+        "id": "at-epic.3",
+        "parent": "at-epic",
+        "description": (
+            "changeset.parent_branch: feature-root\n"
+            "changeset.root_branch: feature-root\n"
+            "changeset.work_branch: feature-kid-3\n"
+        ),
+    }
+    siblings = [
+        {"id": f"at-epic.{index}", "description": f"changeset.work_branch: feature-kid-{index}\n"}
+        for index in (1, 2)
+    ]
+    prefetch_calls: list[tuple[str, list[str]]] = []
+
+    monkeypatch.setattr(
+        pr_gate.beads,
+        "list_descendant_changesets",
+        lambda *_args, **_kwargs: [*siblings, issue],
+    )
+    monkeypatch.setattr(
+        pr_gate.beads,
+        "run_bd_json",
+        lambda args, **_kwargs: (
+            [{"id": "at-epic", "labels": ["at:epic"], "issue_type": "epic"}]
+            if args == ["show", "at-epic"]
+            else []
+        ),
+    )
+    monkeypatch.setattr(pr_gate.git, "git_ref_exists", lambda *_args, **_kwargs: True)
+
+    decision = pr_gate.changeset_pr_creation_decision(
+        issue,
+        repo_slug="org/repo",
+        repo_root=Path("/repo"),
+        git_path="git",
+        beads_root=Path("/beads"),
+        lookup_pr_payload=lambda _repo_slug, _branch: {
+            "state": "CLOSED",
+            "mergedAt": "2026-03-05T00:00:00Z",
+        },
+        prefetch_pr_payloads=lambda repo_slug, branches: prefetch_calls.append(
+            (repo_slug, branches)
+        ),
+    )
+
+    assert decision.allow_pr is True
+    assert prefetch_calls == [("org/repo", ["feature-kid-1", "feature-kid-2", "feature-kid-3"])]
+
+
 def test_changeset_pr_creation_decision_blocks_no_parent_when_nested_epic_descendant_pr_active(
     monkeypatch,
 ) -> None:
@@ -11,6 +11,12 @@ from atelier.worker import review
 from atelier.worker.models_boundary import parse_issue_boundary
 
 
+@pytest.fixture(autouse=True)
+def _skip_batched_pr_prefetch() -> object:
+    with patch("atelier.worker.review.prs.lookup_github_pr_statuses", return_value={}):
+        yield
+
+
 def _run_git(repo: Path, *args: str, check: bool = True) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
         ["git", "-C", str(repo), *args],
@@ -235,6 +241,56 @@ def test_select_review_feedback_changeset_picks_oldest_unseen() -> None:
     assert selection.changeset_id == "at-1.2"
 
 
+def test_select_review_feedback_changeset_prefetches_pr_lookups_in_one_batch() -> None:
+    issues = [
+        {
+            "id": f"at-1.{index}",
+            "labels": [],
+            "status": "in_progress",
+            "description": f"changeset.work_branch: feat/{index}\npr_state: in-review\n",
+        }
+        for index in range(1, 4)
+    ]
+    record_by_id = {
+        record.issue.id: record for record in _parse_issue_records(issues, source="review_test")
+    }
+    batch_calls: list[tuple[str, list[str]]] = []
+
+    def fake_lookup_many(
+        repo: str, heads: list[str], *, refresh: bool = False
+    ) -> dict[str, prs.GithubPrLookup]:
+        batch_calls.append((repo, list(heads)))
+        return {head: prs.GithubPrLookup(outcome="not_found") for head in heads}
+
+    with (
+        patch(
+            "atelier.worker.review.beads.list_descendant_changesets",
+            return_value=issues,
+        ),
+        patch(
+            "atelier.worker.review.beads.BeadsClient.show_issue",
+            side_effect=lambda issue_id, *, source: record_by_id.get(issue_id),
+        ),
+        patch(
+            "atelier.worker.review.prs.lookup_github_pr_statuses",
+            side_effect=fake_lookup_many,
+        ),
+        patch(
+            "atelier.worker.review.prs.lookup_github_pr_status",
+            return_value=prs.GithubPrLookup(outcome="not_found"),
+        ),
+    ):
+        selection = review.select_review_feedback_changeset(
+            epic_id="at-1",
+            repo_slug="org/repo",
+            beads_root=Path("/beads"),
+            repo_root=Path("/repo"),
+        )
+
+    assert selection is None
+    assert batch_calls == [("org/repo", ["feat/1", "feat/2", "feat/3"])]
+
+
 def test_select_review_feedback_changeset_tie_breaks_by_ids_after_parallel_scan() -> None:
     issues = [
         {
@@ -574,6 +574,53 @@ def test_run_worker_sessions_watch_logs_and_sleeps_on_no_ready() -> None:
     assert emitted == ["No ready work; watching for updates (sleeping 9s)."]
 
 
+def test_run_worker_sessions_watch_backs_off_until_change_detected() -> None:
+    calls = 0
+    emitted: list[str] = []
+    timeouts: list[float] = []
+    events: list[str] = []
+    changes = iter([False, False, False, False, True, False])
+
+    def run_once(args: object, *, mode: str, dry_run: bool, session_key: str) -> WorkerRunSummary:
+        del args, mode, dry_run, session_key
+        nonlocal calls
+        calls += 1
+        events.append("check")
+        if calls > 6:
+            raise RuntimeError("stop-loop")
+        return WorkerRunSummary(started=False, reason="no_ready_changesets")
+
+    def wait_for_change(timeout: float) -> bool:
+        timeouts.append(timeout)
+        events.append("wait")
+        return next(changes)
+
+    with pytest.raises(RuntimeError, match="stop-loop"):
+        runtime.run_worker_sessions(
+            args=type("Args", (), {"queue": False})(),
+            mode="auto",
+            run_mode="watch",
+            dry_run=False,
+            session_key="sess",
+            run_worker_once=run_once,
+            report_worker_summary=lambda _summary, _dry: None,
+            watch_interval_seconds=lambda: 5,
+            dry_run_log=lambda _message: None,
+            emit=emitted.append,
+            sleep_fn=lambda _seconds: pytest.fail("watcher runs must not sleep blindly"),
+            wait_for_change=wait_for_change,
+            mark_change_baseline=lambda: events.append("mark"),
+        )
+
+    assert timeouts == [5, 10, 20, 20, 20, 5]
+    assert events[:6] == ["mark", "check", "wait", "mark", "check", "wait"]
+    assert emitted[:3] == [
+        "No ready work; watching for updates (sleeping 5s).",
+        "No ready work; watching for updates (sleeping 10s).",
+        "No ready work; watching for updates (sleeping 20s).",
+    ]
+
+
 def test_run_worker_sessions_watch_reexecs_before_sleep_when_update_detected(
     tmp_path: Path,
 ) -> None:
@@ -1001,6 +1048,38 @@ def test_run_worker_sessions_dry_watch_uses_dry_run_log() -> None:
     assert logs == ["Watching for updates (sleeping 7s before next check)."]
 
 
+def test_run_worker_sessions_dry_watch_with_watcher_keeps_dry_run_message() -> None:
+    calls = 0
+    logs: list[str] = []
+    emitted: list[str] = []
+
+    def run_once(args: object, *, mode: str, dry_run: bool, session_key: str) -> WorkerRunSummary:
+        del args, mode, dry_run, session_key
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return WorkerRunSummary(started=False, reason="no_ready_changesets")
+        raise RuntimeError("stop-loop")
+
+    with pytest.raises(RuntimeError, match="stop-loop"):
+        runtime.run_worker_sessions(
+            args=type("Args", (), {"queue": False})(),
+            mode="auto",
+            run_mode="watch",
+            dry_run=True,
+            session_key="sess",
+            run_worker_once=run_once,
+            report_worker_summary=lambda _summary, _dry: None,
+            watch_interval_seconds=lambda: 7,
+            dry_run_log=logs.append,
+            emit=emitted.append,
+            wait_for_change=lambda _timeout: True,
+        )
+
+    assert logs == ["Watching for updates (sleeping 7s before next check)."]
+    assert emitted == []
+
+
 def test_build_worker_runtime_dependencies_wires_port_groups() -> None:
     deps = runtime.build_worker_runtime_dependencies(
         resolve_current_project_with_repo_root=lambda: (
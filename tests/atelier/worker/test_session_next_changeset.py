@@ -24,10 +24,21 @@ class FakeNextChangesetService:
         self._waiting_by_id = waiting_by_id or {}
         self._integrated_by_id = integrated_by_id or {}
         self._work_children_by_id = work_children_by_id or {}
+        self.show_issue_calls: list[str] = []
+        self.show_issues_calls: list[tuple[str, ...]] = []
 
     def show_issue(self, issue_id: str) -> dict[str, object] | None:
+        self.show_issue_calls.append(issue_id)
         return self._issues_by_id.get(issue_id)
 
+    def show_issues(self, issue_ids: tuple[str, ...]) -> dict[str, dict[str, object]]:
+        self.show_issues_calls.append(issue_ids)
+        return {
+            issue_id: issue
+            for issue_id in issue_ids
+            if (issue := self._issues_by_id.get(issue_id)) is not None
+        }
+
     def ready_changesets(self, *, epic_id: str) -> list[dict[str, object]]:
         del epic_id
         return list(self._ready_changesets)
@@ -186,6 +197,33 @@ def test_next_changeset_service_blocks_stacked_dependency_until_blocker_terminal
     assert selected is None
 
 
+def test_next_changeset_service_prefetches_external_dependencies_in_one_bulk_read() -> None:
+    external_a = _changeset("at-other.1", status="closed")
+    external_b = _changeset("at-other.2", status="closed")
+    first = _changeset("at-epic.1", dependencies=["at-other.1", "at-other.2"])
+    second = _changeset("at-epic.2", dependencies=["at-other.2"])
+    service = FakeNextChangesetService(
+        issues_by_id={
+            "at-epic": _epic(),
+            external_a["id"]: external_a,
+            external_b["id"]: external_b,
+            first["id"]: first,
+            second["id"]: second,
+        },
+        ready_changesets=[],
+        descendants=[first, second],
+        integrated_by_id={"at-other.1": True, "at-other.2": True},
+    )
+
+    selected = startup.next_changeset_service(context=_context(), service=service)
+
+    assert selected is not None
+    assert selected["id"] == "at-epic.1"
+    assert service.show_issues_calls == [("at-other.1", "at-other.2")]
+    assert "at-other.1" not in service.show_issue_calls
+    assert "at-other.2" not in service.show_issue_calls
+
+
 def test_next_changeset_service_allows_downstream_when_dependency_is_integrated() -> None:
     blocker = _changeset("at-epic.1", status="in_progress", work_branch="feat/at-epic.1")
     downstream = _changeset(
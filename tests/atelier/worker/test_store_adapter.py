@@ -1,4 +1,6 @@
+import asyncio
 import datetime as dt
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import patch
 
@@ -606,6 +608,46 @@ def test_get_agent_hook_uses_agent_bead_store_method(monkeypatch) -> None:
     worker_store.clear_bundle_cache()
 
 
+def test_store_session_runs_adapter_calls_on_one_loop_inside_one_read_session(
+    monkeypatch,
+) -> None:
+    loops: list[asyncio.AbstractEventLoop] = []
+    sessions: list[str] = []
+
+    class _FakeStore:
+        @contextmanager
+        def read_session(self):
+            sessions.append("open")
+            yield
+            sessions.append("close")
+
+        async def get_agent_bead_hook(self, _agent_bead_id):
+            loops.append(asyncio.get_running_loop())
+            return HookRecord(agent_id="atelier/worker/codex/p100", epic_id="at-epic")
+
+    monkeypatch.setattr(
+        worker_store,
+        "_build_store_bundle",
+        lambda **_kwargs: worker_store._StoreBundle(  # pyright: ignore[reportPrivateUsage]
+            store=_FakeStore(),
+            sync_client=SyncBeadsClient(build_in_memory_beads_client()[0]),
+        ),
+    )
+    worker_store.clear_bundle_cache()
+    roots = {"beads_root": Path("/beads"), "repo_root": Path("/repo")}
+
+    with worker_store.store_session(**roots):
+        with worker_store.store_session(**roots):
+            worker_store.get_agent_hook("at-agent", **roots)
+        worker_store.get_agent_hook("at-agent", **roots)
+    worker_store.get_agent_hook("at-agent", **roots)
+
+    assert loops[0] is loops[1]
+    assert loops[2] is not loops[0]
+    assert sessions == ["open", "open", "close", "close"]
+    worker_store.clear_bundle_cache()
+
+
 def test_agent_hook_mutations_use_agent_bead_store_methods(monkeypatch) -> None:
     seen: list[tuple[str, str, str | None]] = []
 
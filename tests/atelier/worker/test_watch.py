@@ -0,0 +1,114 @@
+import threading
+from pathlib import Path
+
+from atelier import exec as exec_util
+from atelier.worker import watch
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_beads_watch_paths_include_dolt_manifests(tmp_path: Path) -> None:
+    noms = tmp_path / "dolt" / "beads_at" / ".dolt" / "noms"
+    noms.mkdir(parents=True)
+
+    paths = watch.beads_watch_paths(tmp_path)
+
+    assert tmp_path / "metadata.json" in paths
+    assert tmp_path / "beads.db" in paths
+    assert noms in paths
+
+
+def test_change_watcher_wakes_when_directory_entry_changes(tmp_path: Path) -> None:
+    watched = tmp_path / "noms"
+    watched.mkdir()
+    (watched / "manifest").write_text("a", encoding="utf-8")
+    clock = _FakeClock()
+    polls = 0
+
+    def sleep(seconds: float) -> None:
+        nonlocal polls
+        polls += 1
+        clock.sleep(seconds)
+        if polls == 3:
+            (watched / "manifest").write_text("ab", encoding="utf-8")
+
+    watcher = watch.ChangeWatcher([watched], poll_seconds=1.0, sleep_fn=sleep, clock=clock)
+
+    assert watcher.wait(30) is True
+    assert polls == 3
+
+
+def test_change_watcher_times_out_without_changes(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    watcher = watch.ChangeWatcher(
+        [tmp_path / "metadata.json"], poll_seconds=2.0, sleep_fn=clock.sleep, clock=clock
+    )
+
+    assert watcher.wait(5) is False
+    assert clock.now == 5.0
+
+
+def test_change_watcher_wakes_for_changes_after_mark(tmp_path: Path) -> None:
+    watched = tmp_path / "metadata.json"
+    clock = _FakeClock()
+    watcher = watch.ChangeWatcher([watched], sleep_fn=clock.sleep, clock=clock)
+
+    watcher.mark()
+    watched.write_text("{}", encoding="utf-8")
+
+    assert watcher.wait(30) is True
+    assert clock.now == 0.0
+
+
+def test_change_watcher_ignores_own_bd_writes_only(tmp_path: Path) -> None:
+    watched = tmp_path / "metadata.json"
+    clock = _FakeClock()
+    watcher = watch.ChangeWatcher([watched], sleep_fn=clock.sleep, clock=clock)
+    writes = 0
+
+    class _WritingRunner:
+        def run(self, request: exec_util.CommandRequest) -> exec_util.CommandResult:
+            nonlocal writes
+            writes += 1
+            watched.write_text("x" * writes, encoding="utf-8")
+            return exec_util.CommandResult(argv=request.argv, returncode=0, stdout="", stderr="")
+
+    def _update() -> None:
+        exec_util.run_with_runner(
+            exec_util.CommandRequest(argv=("bd", "update", "at-1", "--status", "blocked")),
+            runner=_WritingRunner(),
+        )
+
+    with watcher.ignoring_own_writes():
+        watcher.mark()
+        _update()
+        assert watcher.wait(3) is False
+
+        watcher.mark()
+        other = threading.Thread(target=_update)
+        other.start()
+        other.join()
+        _update()
+        assert watcher.wait(3) is True
+
+
+def test_change_watcher_resolves_path_callables_on_each_check(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    watcher = watch.ChangeWatcher(
+        lambda: watch.beads_watch_paths(tmp_path), sleep_fn=clock.sleep, clock=clock
+    )
+
+    watcher.mark()
+    (tmp_path / "dolt" / "beads_at" / ".dolt" / "noms").mkdir(parents=True)
+
+    assert watcher.wait(30) is True
+    assert tmp_path / "dolt" / "beads_at" / ".dolt" / "noms" in watcher.paths
@@ -15,6 +15,7 @@ sys.path.insert(0, str(SRC))
 
 import atelier.agents as agents
 import atelier.io as io
+import atelier.prs as prs
 
 DOCTEST_MODULES = {
     ROOT / "src" / "atelier" / "__init__.py",
@@ -37,6 +38,12 @@ def _default_agent_patches(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(builtins, "input", fail_input)
 
 
+@pytest.fixture(autouse=True)
+def _no_persistent_pr_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Command entry points enable the on-disk PR cache; keep tests isolated.
+    monkeypatch.setattr(prs, "_PERSISTENT_CACHE", None)
+
+
 @pytest.fixture(autouse=True)
 def _git_non_interactive(monkeypatch: pytest.MonkeyPatch) -> None:
     # Avoid hanging git network prompts in tests (e.g., ls-remote over SSH).